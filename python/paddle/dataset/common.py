@@ -16,12 +16,14 @@ import errno
 import glob
 import hashlib
 import importlib
+import itertools
 import os
 import pickle
 import shutil
 import sys
 import tempfile
 
+import numpy as np
 import requests
 
 import paddle
@@ -221,3 +223,127 @@ def _check_exists_and_download(path, url, md5, module_name, download=True):
         return paddle.dataset.common.download(url, module_name, md5)
     else:
         raise ValueError(f'{path} not exists and auto download disabled')
+
+
+# NOTE: bump the version when the layout of preprocessing caches changes
+_CACHE_VERSION = 1
+_CACHE_SAMPLE_SIZE = 1 << 20
+
+
+def _cache_path(module_name, data_file, **options):
+    """
+    Returns the directory of the preprocessing cache of ``data_file``, keyed
+    by a hash of the archive and the preprocessing options. Only the size,
+    head and tail of the archive are hashed so that looking up the cache does
+    not read the whole archive.
+    """
+    size = os.path.getsize(data_file)
+    md5 = hashlib.md5()
+    md5.update(repr((_CACHE_VERSION, size, sorted(options.items()))).encode())
+    with open(data_file, 'rb') as f:
+        md5.update(f.read(_CACHE_SAMPLE_SIZE))
+        if size > _CACHE_SAMPLE_SIZE:
+            f.seek(max(size - _CACHE_SAMPLE_SIZE, _CACHE_SAMPLE_SIZE))
+            md5.update(f.read())
+    return os.path.join(DATA_HOME, module_name, 'cache', md5.hexdigest())
+
+
+def _load_cache(path):
+    """
+    Loads the cache saved by ``_save_cache``, numpy arrays are memory-mapped.
+    Returns None if the cache does not exist or is broken.
+    """
+    meta_file = os.path.join(path, 'meta.pkl')
+    if not os.path.exists(meta_file):
+        return None
+    try:
+        with open(meta_file, 'rb') as f:
+            cache = pickle.load(f)
+        for name in cache.pop('__arrays__'):
+            cache[name] = np.load(
+                os.path.join(path, name + '.npy'), mmap_mode='r'
+            )
+    except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+        return None
+    return cache
+
+
+def _save_cache(path, cache):
+    """
+    Saves ``cache``, a dict of numpy arrays and picklable objects, to ``path``
+    and returns the memory-mapped cache. The cache is written to a temporary
+    directory and renamed, so concurrent builds never see a partial cache.
+    If the cache can not be written, ``cache`` is returned as it is.
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = tempfile.mkdtemp(prefix='.tmp', dir=os.path.dirname(path))
+    except OSError:
+        return cache
+
+    try:
+        arrays = [k for k, v in cache.items() if isinstance(v, np.ndarray)]
+        for name in arrays:
+            np.save(os.path.join(tmp_path, name + '.npy'), cache[name])
+        meta = {k: v for k, v in cache.items() if k not in arrays}
+        meta['__arrays__'] = arrays
+        with open(os.path.join(tmp_path, 'meta.pkl'), 'wb') as f:
+            pickle.dump(meta, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # fails if the cache has been written by another process
+        os.rename(tmp_path, path)
+    except OSError:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+    return _load_cache(path) or cache
+
+
+def _tokens_to_ids(docs, word_idx, unk_id, prefix=(), suffix=()):
+    """
+    Maps tokens of all documents to ids in one pass, and packs ids of the
+    i-th document, with ``prefix`` and ``suffix`` ids added, into
+    ``values[offsets[i]:offsets[i + 1]]``.
+
+    Returns:
+        tuple: values and offsets, int64 numpy arrays.
+    """
+    lengths = np.fromiter(map(len, docs), dtype=np.int64, count=len(docs))
+    offsets = np.zeros(len(docs) + 1, dtype=np.int64)
+    np.cumsum(lengths + len(prefix) + len(suffix), out=offsets[1:])
+
+    values = np.empty(offsets[-1], dtype=np.int64)
+    is_token = np.ones(offsets[-1], dtype=bool)
+    for i, token_id in enumerate(prefix):
+        values[offsets[:-1] + i] = token_id
+        is_token[offsets[:-1] + i] = False
+    for i, token_id in enumerate(suffix):
+        values[offsets[1:] - len(suffix) + i] = token_id
+        is_token[offsets[1:] - len(suffix) + i] = False
+    values[is_token] = np.fromiter(
+        map(
+            word_idx.get,
+            itertools.chain.from_iterable(docs),
+            itertools.repeat(unk_id),
+        ),
+        dtype=np.int64,
+        count=lengths.sum(),
+    )
+    return values, offsets
+
+
+class _PackedSequences:
+    """
+    A read-only list of int64 sequences packed in a flat array, the i-th
+    sequence is ``values[starts[i]:ends[i]]``.
+    """
+
+    def __init__(self, values, starts, ends):
+        self.values = values
+        self.starts = starts
+        self.ends = ends
+
+    def __getitem__(self, idx):
+        return np.array(
+            self.values[self.starts[idx] : self.ends[idx]], dtype=np.int64
+        )
+
+    def __len__(self):
+        return len(self.starts)
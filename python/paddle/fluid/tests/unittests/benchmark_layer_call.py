@@ -0,0 +1,101 @@
+#   Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+
+import paddle
+
+# Micro benchmarks of the python overhead of nn.Layer.__call__. The forward
+# functions are trivial, so the measured time is dominated by the dispatch in
+# __call__ rather than by the kernels.
+
+
+class EmptyLayer(paddle.nn.Layer):
+    def forward(self, x):
+        return x
+
+
+class NestedLayer(paddle.nn.Layer):
+    def __init__(self, depth, width):
+        super().__init__()
+        self.layers = paddle.nn.LayerList(
+            [
+                paddle.nn.Sequential(*[EmptyLayer() for _ in range(width)])
+                for _ in range(depth)
+            ]
+        )
+
+    def forward(self, x):
+        for layer in self.layers:
+            x = layer(x)
+        return x
+
+
+class BenchmarkLayerCall(unittest.TestCase):
+    iters = 10000
+
+    def setUp(self):
+        paddle.disable_static()
+        self.x = paddle.ones([1])
+
+    def timeit_function(self, callback, iters, *args, **kwargs):
+        assert iters != 0, "Iters should >= 1"
+        # warm up to build the layer
+        callback(*args, **kwargs)
+        start = time.perf_counter()
+        for i in range(iters):
+            callback(*args, **kwargs)
+        elapse = time.perf_counter() - start
+        return elapse / iters
+
+    def report(self, name, elapse, baseline):
+        print(
+            "{}: {:.3f} us/call, overhead {:.3f} us/call".format(
+                name, elapse * 1e6, (elapse - baseline) * 1e6
+            )
+        )
+
+    def test_call_overhead(self):
+        layer = EmptyLayer()
+        baseline = self.timeit_function(layer.forward, self.iters, self.x)
+        elapse = self.timeit_function(layer, self.iters, self.x)
+        self.assertTrue(layer._fast_forward)
+        self.report("built layer without hooks", elapse, baseline)
+
+        handle = layer.register_forward_post_hook(lambda *args: None)
+        elapse = self.timeit_function(layer, self.iters, self.x)
+        self.assertFalse(layer._fast_forward)
+        self.report("built layer with a post hook", elapse, baseline)
+
+        handle.remove()
+        elapse = self.timeit_function(layer, self.iters, self.x)
+        self.assertTrue(layer._fast_forward)
+        self.report("built layer after removing hook", elapse, baseline)
+
+    def test_nested_call_overhead(self):
+        depth, width = 24, 8
+        # number of __call__ invocations in one forward of NestedLayer
+        num_calls = 1 + depth * (width + 1)
+        layer = NestedLayer(depth, width)
+        elapse = self.timeit_function(layer, self.iters // num_calls, self.x)
+        print(
+            "nested layers: {:.3f} us/call over {} calls".format(
+                elapse / num_calls * 1e6, num_calls
+            )
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -932,5 +932,136 @@ class TestAdamWOpLayerwiseLR(TestAdamWOp):
         paddle.disable_static()
 
 
+class TestMultiTensorAdamW(unittest.TestCase):
+    def _adamw_optimize_dygraph(
+        self,
+        place,
+        use_param_attr=False,
+        use_param_group=False,
+        use_amp=False,
+        use_multi_tensor=False,
+    ):
+        paddle.disable_static()
+        paddle.seed(10)
+        paddle.set_device(place)
+
+        input = paddle.randn((5, 5))
+
+        weight_attr = paddle.ParamAttr(learning_rate=0.5, trainable=True)
+        if use_param_attr:
+            model = paddle.nn.Linear(5, 5, weight_attr=weight_attr)
+        else:
+            model = paddle.nn.Linear(5, 5)
+
+        if not use_param_group:
+            optimizer = paddle.optimizer.AdamW(
+                parameters=model.parameters(),
+                weight_decay=0.1,
+                apply_decay_param_fun=lambda name: 'b_' not in name,
+                use_multi_tensor=use_multi_tensor,
+                multi_precision=use_amp,
+            )
+        else:
+            parameters = list(model.parameters())
+            param_num = len(parameters)
+            optimizer = paddle.optimizer.AdamW(
+                parameters=[
+                    {
+                        'params': parameters[: int(param_num / 2)],
+                        'weight_decay': 0.1,
+                        'beta1': 0.1,
+                        'beta2': 0.99,
+                    },
+                    {
+                        'params': parameters[int(param_num / 2) :],
+                        'weight_decay': 0.01,
+                        'learning_rate': 0.1,
+                    },
+                ],
+                use_multi_tensor=use_multi_tensor,
+                multi_precision=use_amp,
+            )
+
+        if place == 'gpu' and use_amp:
+            model = paddle.amp.decorate(models=model, level='O2')
+            scaler = paddle.amp.GradScaler(init_loss_scaling=1024)
+
+        for idx in range(2):
+            if place == 'gpu' and use_amp:
+                with paddle.amp.auto_cast(level='O2'):
+                    output = model(input)
+                    loss = paddle.mean(output)
+                scaled = scaler.scale(loss)
+                scaled.backward()
+                scaler.step(optimizer)
+                optimizer.clear_grad()
+            else:
+                output = model(input)
+                loss = paddle.mean(output)
+                loss.backward()
+                optimizer.step()
+                optimizer.clear_grad()
+
+        return output, model.parameters()
+
+    def _adamw_optimize_static(self, place, use_multi_tensor=False):
+        paddle.enable_static()
+        paddle.seed(10)
+        np.random.seed(10)
+        exe = paddle.static.Executor(place=place)
+        train_program = paddle.static.Program()
+        startup_program = paddle.static.Program()
+        optimizer = paddle.optimizer.AdamW(
+            weight_decay=0.1, use_multi_tensor=use_multi_tensor
+        )
+        with paddle.static.program_guard(train_program, startup_program):
+            data = paddle.static.data(shape=[2, 2], name='X', dtype='float32')
+            hidden = paddle.static.nn.fc(x=data, size=10)
+            loss = paddle.mean(hidden)
+            optimizer.minimize(loss)
+        exe.run(startup_program)
+        x = np.random.random(size=(2, 2)).astype('float32')
+        out = []
+        for idx in range(5):
+            (loss_data,) = exe.run(
+                train_program, feed={"X": x}, fetch_list=[loss.name]
+            )
+            out.append(loss_data)
+        paddle.disable_static()
+        return out
+
+    def _get_places(self):
+        places = ['cpu']
+        if paddle.is_compiled_with_cuda():
+            places.append('gpu')
+        return places
+
+    def _check_dygraph(self, place, **kwargs):
+        output1, params1 = self._adamw_optimize_dygraph(
+            place=place, use_multi_tensor=True, **kwargs
+        )
+        output2, params2 = self._adamw_optimize_dygraph(
+            place=place, use_multi_tensor=False, **kwargs
+        )
+        np.testing.assert_allclose(output1, output2, rtol=1e-05)
+        for idx in range(len(params1)):
+            np.testing.assert_allclose(params1[idx], params2[idx], rtol=1e-05)
+
+    def test_main(self):
+        for place in self._get_places():
+            for use_amp in [True, False]:
+                self._check_dygraph(place, use_amp=use_amp)
+                self._check_dygraph(place, use_amp=use_amp, use_param_attr=True)
+                self._check_dygraph(
+                    place, use_amp=use_amp, use_param_group=True
+                )
+            output1 = self._adamw_optimize_static(place, use_multi_tensor=True)
+            output2 = self._adamw_optimize_static(place, use_multi_tensor=False)
+            for idx in range(len(output1)):
+                np.testing.assert_allclose(
+                    output1[idx], output2[idx], rtol=1e-05
+                )
+
+
 if __name__ == "__main__":
     unittest.main()
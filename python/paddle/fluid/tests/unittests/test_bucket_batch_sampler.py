@@ -0,0 +1,186 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+from paddle.io import BucketBatchSampler
+
+
+class TestBucketBatchSampler(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(2023)
+        self.lengths = np.random.randint(1, 64, size=[1000])
+        self.max_tokens = 256
+        self.batch_size = None
+        self.mega_batch_size = 128
+        self.shuffle = False
+        self.drop_last = False
+        self.nranks = 1
+
+    def get_sampler(self, rank=0):
+        return BucketBatchSampler(
+            self.lengths,
+            max_tokens=self.max_tokens,
+            batch_size=self.batch_size,
+            mega_batch_size=self.mega_batch_size,
+            num_replicas=self.nranks,
+            rank=rank,
+            shuffle=self.shuffle,
+            drop_last=self.drop_last,
+        )
+
+    def check_batch(self, batch_indices):
+        self.assertGreater(len(batch_indices), 0)
+        lengths = self.lengths[batch_indices]
+        if self.batch_size is not None:
+            self.assertLessEqual(len(batch_indices), self.batch_size)
+        if self.max_tokens is not None and len(batch_indices) > 1:
+            self.assertLessEqual(
+                len(batch_indices) * lengths.max(), self.max_tokens
+            )
+
+    def test_main(self):
+        all_indices = []
+        batch_nums = []
+        for rank in range(self.nranks):
+            sampler = self.get_sampler(rank)
+            batches = list(sampler)
+            self.assertEqual(len(batches), len(sampler))
+            batch_nums.append(len(batches))
+            for batch_indices in batches:
+                self.check_batch(batch_indices)
+                all_indices.extend(batch_indices)
+
+        # all ranks get the same batch number
+        self.assertEqual(len(set(batch_nums)), 1)
+        if not self.drop_last:
+            self.assertEqual(
+                set(all_indices), set(range(self.lengths.shape[0]))
+            )
+        if self.nranks == 1:
+            self.assertEqual(len(all_indices), self.lengths.shape[0])
+
+    def test_padding(self):
+        sampler = self.get_sampler()
+        padded = sum(
+            len(batch_indices) * self.lengths[batch_indices].max()
+            for batch_indices in sampler
+        )
+        batch_num = len(sampler)
+
+        # padding of bucketing batches should be less than batching the
+        # same number of samples in random order
+        indices = np.random.permutation(self.lengths.shape[0])
+        random_padded = sum(
+            len(batch_indices) * self.lengths[batch_indices].max()
+            for batch_indices in np.array_split(indices, batch_num)
+        )
+        self.assertLess(padded, random_padded)
+
+
+class TestBucketBatchSamplerBatchSize(TestBucketBatchSampler):
+    def setUp(self):
+        super().setUp()
+        self.max_tokens = None
+        self.batch_size = 16
+
+
+class TestBucketBatchSamplerBoth(TestBucketBatchSampler):
+    def setUp(self):
+        super().setUp()
+        self.max_tokens = 512
+        self.batch_size = 16
+        self.mega_batch_size = None
+
+
+class TestBucketBatchSamplerLongSample(TestBucketBatchSampler):
+    def setUp(self):
+        super().setUp()
+        self.lengths[::100] = 1000
+
+    def test_long_sample(self):
+        for batch_indices in self.get_sampler():
+            if self.lengths[batch_indices].max() > self.max_tokens:
+                self.assertEqual(len(batch_indices), 1)
+
+
+class TestBucketBatchSamplerShuffle(TestBucketBatchSampler):
+    def setUp(self):
+        super().setUp()
+        self.shuffle = True
+
+    def test_epoch(self):
+        sampler = self.get_sampler()
+        epoch_0 = list(sampler)
+        epoch_1 = list(sampler)
+        self.assertNotEqual(epoch_0, epoch_1)
+
+        sampler.set_epoch(0)
+        self.assertEqual(list(sampler), epoch_0)
+
+
+class TestBucketBatchSamplerDistributed(TestBucketBatchSamplerShuffle):
+    def setUp(self):
+        super().setUp()
+        self.nranks = 3
+
+
+class TestBucketBatchSamplerDistributedDropLast(
+    TestBucketBatchSamplerDistributed
+):
+    def setUp(self):
+        super().setUp()
+        self.drop_last = True
+
+
+class TestBucketBatchSamplerStateDict(unittest.TestCase):
+    def test_main(self):
+        lengths = np.random.randint(1, 64, size=[500])
+        sampler = BucketBatchSampler(
+            lengths, max_tokens=256, mega_batch_size=64, shuffle=True
+        )
+        sampler.set_epoch(5)
+        batches = list(sampler)
+
+        sampler.set_epoch(5)
+        sampler_iter = iter(sampler)
+        for _ in range(4):
+            next(sampler_iter)
+        state = sampler.state_dict()
+        self.assertEqual(state, {'epoch': 5, 'num_batches': 4})
+
+        sampler = BucketBatchSampler(
+            lengths, max_tokens=256, mega_batch_size=64, shuffle=True
+        )
+        sampler.set_state_dict(state)
+        self.assertEqual(list(sampler), batches[4:])
+        self.assertEqual(sampler.epoch, 6)
+
+
+class TestBucketBatchSamplerAssert(unittest.TestCase):
+    def test_assert(self):
+        with self.assertRaises(AssertionError):
+            BucketBatchSampler([1, 2, 3])
+        with self.assertRaises(AssertionError):
+            BucketBatchSampler([1, 2, 3], max_tokens=-1)
+        with self.assertRaises(AssertionError):
+            BucketBatchSampler([1, 2, 3], batch_size=0)
+        with self.assertRaises(AssertionError):
+            BucketBatchSampler([], batch_size=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,6 +16,7 @@ import json
 import os
 import sys
 import tempfile
+import time
 import unittest
 import warnings
 
@@ -98,6 +99,51 @@ class TestAutoTune(unittest.TestCase):
         )
 
 
+class SlowDataset(RandomDataset):
+    def __getitem__(self, idx):
+        time.sleep(0.005)
+        return super().__getitem__(idx)
+
+
+class TestOnlineAutoTune(unittest.TestCase):
+    def setUp(self):
+        paddle.incubate.autotune.set_config(
+            config={"dataloader": {"enable": True, "online": True}}
+        )
+
+    def tearDown(self):
+        paddle.io.reader.set_autotune_config(False)
+
+    def test_online_autotune(self):
+        loader = DataLoader(SlowDataset(40), batch_size=1, num_workers=0)
+        for epoch in range(3):
+            for data in loader:
+                pass
+
+        config = loader.get_autotune_config()
+        self.assertEqual(len(config['history']), 2)
+        # waiting for data is the bottleneck without computing
+        self.assertGreater(config['history'][0]['reader_ratio'], 0.5)
+        self.assertEqual(config['history'][0]['num_workers'], 0)
+        if sys.platform == 'darwin' or sys.platform == 'win32':
+            self.assertEqual(config['num_workers'], 0)
+        elif loader._autotuner.max_num_workers > 0:
+            self.assertGreater(config['history'][1]['num_workers'], 0)
+
+    def test_short_epoch(self):
+        loader = DataLoader(SlowDataset(10), batch_size=1, num_workers=0)
+        for data in loader:
+            pass
+        config = loader.get_autotune_config()
+        self.assertEqual(config['num_workers'], 0)
+        self.assertEqual(len(config['history']), 0)
+
+    def test_disable_online_autotune(self):
+        paddle.io.reader.set_autotune_config(False)
+        loader = DataLoader(RandomDataset(10), batch_size=1)
+        self.assertIsNone(loader.get_autotune_config())
+
+
 class TestAutoTuneAPI(unittest.TestCase):
     def test_set_config_warnings(self):
         with warnings.catch_warnings(record=True) as w:
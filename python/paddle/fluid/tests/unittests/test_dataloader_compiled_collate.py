@@ -0,0 +1,155 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+from paddle.io.dataloader.collate import CompiledCollateFn, default_collate_fn
+
+
+def make_sample(idx, seq_len=4):
+    return {
+        'image': np.random.random([3, 8, 8]).astype('float32'),
+        'fields': [
+            idx,
+            1.5 * idx,
+            'name_{}'.format(idx),
+            (np.arange(seq_len).astype('int64') + idx, np.array([idx])),
+        ],
+        'label': np.array([idx % 2]).astype('int64'),
+    }
+
+
+class SparseDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __getitem__(self, idx):
+        sample = {
+            'slot_{}'.format(i): np.array([idx + i]).astype('int64')
+            for i in range(200)
+        }
+        sample['label'] = idx % 2
+        return sample
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestCompiledCollateFn(unittest.TestCase):
+    def check_same(self, output, expected):
+        if isinstance(expected, dict):
+            self.assertEqual(set(output.keys()), set(expected.keys()))
+            for key in expected:
+                self.check_same(output[key], expected[key])
+        elif isinstance(expected, np.ndarray):
+            self.assertEqual(output.dtype, expected.dtype)
+            np.testing.assert_array_equal(output, expected)
+        elif isinstance(expected, (list, tuple)):
+            self.assertEqual(len(output), len(expected))
+            for out, exp in zip(output, expected):
+                self.check_same(out, exp)
+        else:
+            self.assertEqual(output, expected)
+
+    def test_nested_sample(self):
+        collate_fn = CompiledCollateFn()
+        for _ in range(3):
+            batch = [make_sample(i) for i in range(8)]
+            self.check_same(collate_fn(batch), default_collate_fn(batch))
+
+    def test_last_batch(self):
+        collate_fn = CompiledCollateFn()
+        batch = [make_sample(i) for i in range(8)]
+        collate_fn(batch)
+        batch = batch[:3]
+        self.check_same(collate_fn(batch), default_collate_fn(batch))
+
+    def test_single_field(self):
+        batch = [np.ones([2, 3]) * i for i in range(4)]
+        self.check_same(CompiledCollateFn()(batch), default_collate_fn(batch))
+        batch = list(range(4))
+        self.check_same(CompiledCollateFn()(batch), default_collate_fn(batch))
+
+    def test_tensor_field(self):
+        batch = [paddle.full([2], i, dtype='float32') for i in range(4)]
+        output = CompiledCollateFn()(batch)
+        np.testing.assert_array_equal(
+            output.numpy(), default_collate_fn(batch).numpy()
+        )
+
+    def test_schema_change(self):
+        collate_fn = CompiledCollateFn()
+        collate_fn([make_sample(i) for i in range(4)])
+        # sequence length changed among samples of the same batch
+        batch = [make_sample(i, seq_len=4 + i % 2) for i in range(4)]
+        with self.assertRaises(ValueError):
+            collate_fn(batch)
+
+        # sequence length changed among batches
+        batch = [make_sample(i, seq_len=6) for i in range(4)]
+        self.check_same(collate_fn(batch), default_collate_fn(batch))
+
+        # keys changed
+        batch = [{'image': np.ones([2]) * i} for i in range(4)]
+        self.check_same(collate_fn(batch), default_collate_fn(batch))
+
+    def test_dtype_drift(self):
+        collate_fn = CompiledCollateFn()
+        batch = [{'x': np.array([i]), 'y': i} for i in range(4)]
+        self.check_same(collate_fn(batch), default_collate_fn(batch))
+
+        # float data must not be truncated to the int dtype of first batch
+        batch = [{'x': np.array([i + 0.5]), 'y': i + 0.5} for i in range(4)]
+        output = collate_fn(batch)
+        self.assertEqual(output['x'].dtype, np.float64)
+        self.check_same(output, default_collate_fn(batch))
+
+        # a single drifted sample in the batch
+        batch = [{'x': np.array([i]), 'y': i} for i in range(4)]
+        batch[-1] = {'x': np.array([0.5]), 'y': 0.5}
+        self.check_same(collate_fn(batch), default_collate_fn(batch))
+
+    def test_extra_key(self):
+        collate_fn = CompiledCollateFn()
+        batch = [{'x': np.array([i]), 'y': [i, i]} for i in range(4)]
+        self.check_same(collate_fn(batch), default_collate_fn(batch))
+
+        # keys and list items only in later samples are not dropped
+        batch = [
+            {'x': np.array([i]), 'y': [i, i, i], 'z': np.array([-i])}
+            for i in range(4)
+        ]
+        self.check_same(collate_fn(batch), default_collate_fn(batch))
+
+    def test_dataloader(self):
+        paddle.disable_static()
+        dataset = SparseDataset(40)
+        expected_loader = DataLoader(dataset, batch_size=8)
+        compiled_loader = DataLoader(
+            dataset, batch_size=8, collate_fn=CompiledCollateFn()
+        )
+        for expected, output in zip(expected_loader, compiled_loader):
+            self.assertEqual(set(output.keys()), set(expected.keys()))
+            for key in expected:
+                np.testing.assert_array_equal(
+                    output[key].numpy(), expected[key].numpy()
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
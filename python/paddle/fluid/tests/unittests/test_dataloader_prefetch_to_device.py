@@ -0,0 +1,142 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+
+SAMPLE_NUM = 40
+BATCH_SIZE = 4
+
+
+class RandomDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __getitem__(self, idx):
+        np.random.seed(idx)
+        image = np.random.random([16]).astype('float32')
+        label = np.array([idx]).astype('int64')
+        return image, label
+
+    def __len__(self):
+        return self.sample_num
+
+
+class ErrorDataset(RandomDataset):
+    def __getitem__(self, idx):
+        if idx == SAMPLE_NUM // 2:
+            raise ValueError("error sample")
+        return super().__getitem__(idx)
+
+
+class TestDataLoaderPrefetchToDevice(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.place = (
+            paddle.CUDAPlace(0)
+            if paddle.is_compiled_with_cuda()
+            else paddle.CPUPlace()
+        )
+
+    def run_loader(self, num_workers, prefetch_to_device, epochs=2, **kwargs):
+        loader = DataLoader(
+            RandomDataset(SAMPLE_NUM),
+            places=self.place,
+            batch_size=BATCH_SIZE,
+            num_workers=num_workers,
+            prefetch_to_device=prefetch_to_device,
+            **kwargs,
+        )
+        results = []
+        for _ in range(epochs):
+            for image, label in loader:
+                self.assertTrue(image.place._equals(self.place))
+                results.append((image.numpy(), label.numpy()))
+        return loader, results
+
+    def check_loader(self, num_workers, **kwargs):
+        _, expected = self.run_loader(num_workers, 0, **kwargs)
+        loader, results = self.run_loader(num_workers, 2, **kwargs)
+        self.assertEqual(len(results), len(expected))
+        for res, exp in zip(results, expected):
+            np.testing.assert_allclose(res[0], exp[0])
+            np.testing.assert_array_equal(res[1], exp[1])
+
+        stats = loader.device_prefetch_stats()
+        self.assertEqual(stats['num_batches'], len(expected))
+        self.assertGreaterEqual(stats['wait_time'], 0.0)
+        self.assertGreaterEqual(stats['max_wait_time'], stats['avg_wait_time'])
+        self.assertTrue(0.0 <= stats['empty_ratio'] <= 1.0)
+
+    def test_single_process(self):
+        self.check_loader(0)
+
+    def test_multi_process(self):
+        self.check_loader(2)
+
+    def test_persistent_workers(self):
+        self.check_loader(2, persistent_workers=True)
+
+    def test_break(self):
+        loader = DataLoader(
+            RandomDataset(SAMPLE_NUM),
+            places=self.place,
+            batch_size=BATCH_SIZE,
+            num_workers=2,
+            prefetch_to_device=2,
+        )
+        for i, _ in enumerate(loader):
+            if i == 2:
+                break
+        self.assertEqual(loader.device_prefetch_stats()['num_batches'], 3)
+
+    def test_exception(self):
+        loader = DataLoader(
+            ErrorDataset(SAMPLE_NUM),
+            places=self.place,
+            batch_size=BATCH_SIZE,
+            num_workers=2,
+            prefetch_to_device=2,
+        )
+        with self.assertRaises(Exception):
+            for _ in loader:
+                pass
+
+    def test_disabled_in_static_mode(self):
+        paddle.enable_static()
+        try:
+            image = paddle.static.data(
+                name='image', shape=[None, 16], dtype='float32'
+            )
+            label = paddle.static.data(
+                name='label', shape=[None, 1], dtype='int64'
+            )
+            loader = DataLoader(
+                RandomDataset(SAMPLE_NUM),
+                feed_list=[image, label],
+                places=self.place,
+                batch_size=BATCH_SIZE,
+                prefetch_to_device=2,
+            )
+            self.assertEqual(loader.prefetch_to_device, 0)
+        finally:
+            paddle.disable_static()
+
+
+if __name__ == '__main__':
+    unittest.main()
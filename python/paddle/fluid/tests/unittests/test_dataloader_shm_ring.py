@@ -0,0 +1,139 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import DataLoader, Dataset
+from paddle.io.dataloader.shm_ring import _SharedMemoryBatch, _SharedMemoryRing
+
+IMAGE_SIZE = 32
+SAMPLE_NUM = 40
+BATCH_SIZE = 4
+
+
+class RandomDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __getitem__(self, idx):
+        np.random.seed(idx)
+        image = np.random.random([3, IMAGE_SIZE, IMAGE_SIZE]).astype('float32')
+        label = np.array([idx]).astype('int64')
+        return {'image': image, 'label': label, 'name': str(idx)}
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestSharedMemoryRing(unittest.TestCase):
+    def setUp(self):
+        self.ring = _SharedMemoryRing(num_slots=2, slot_size=1024)
+
+    def tearDown(self):
+        self.ring.release()
+
+    def write(self, flat_batch, timeout=30):
+        # free slot queue is fed by a background thread, wait until a slot
+        # arrives at the queue instead of failing on an empty queue
+        deadline = time.monotonic() + timeout
+        while True:
+            shm_batch = self.ring.write(0, flat_batch)
+            remaining = deadline - time.monotonic()
+            if shm_batch is not None or remaining <= 0:
+                return shm_batch
+            self.ring._free_slots._reader.poll(remaining)
+
+    def test_write_read(self):
+        flat_batch = [
+            np.arange(12).reshape([3, 4]).astype('float32'),
+            np.array([1, 2, 3]).astype('int64'),
+            np.array(7).astype('uint8'),
+        ]
+        shm_batch = self.write(flat_batch)
+        self.assertIsInstance(shm_batch, _SharedMemoryBatch)
+        self.assertEqual(shm_batch.worker_id, 0)
+        for meta in shm_batch.metas:
+            self.assertEqual(meta[0] % 64, 0)
+
+        tensor_list = self.ring.read(shm_batch)
+        self.assertEqual(len(tensor_list), len(flat_batch))
+        for tensor, arr in zip(tensor_list, flat_batch):
+            np.testing.assert_array_equal(np.array(tensor), arr)
+
+    def test_batch_exceed_slot_size(self):
+        flat_batch = [np.zeros([1024], dtype='float32')]
+        self.assertIsNone(self.ring.write(0, flat_batch))
+
+    def test_object_array(self):
+        flat_batch = [np.array(['a', None], dtype=object)]
+        self.assertIsNone(self.ring.write(0, flat_batch))
+
+    def test_no_free_slot(self):
+        flat_batch = [np.ones([4], dtype='float32')]
+        batches = [self.write(flat_batch) for _ in range(2)]
+        self.assertTrue(all(b is not None for b in batches))
+        # both slots are taken, so the queue stays empty
+        self.assertIsNone(self.ring.write(0, flat_batch))
+
+        self.ring.read(batches[0])
+        self.assertIsNotNone(self.write(flat_batch))
+
+
+class TestDataLoaderWithShmRing(unittest.TestCase):
+    def run_loader(self, shm_slot_size, persistent_workers=False):
+        paddle.disable_static()
+        dataset = RandomDataset(SAMPLE_NUM)
+        loader = DataLoader(
+            dataset,
+            batch_size=BATCH_SIZE,
+            num_workers=2,
+            shm_slot_size=shm_slot_size,
+            persistent_workers=persistent_workers,
+        )
+        results = []
+        for _ in range(2):
+            for data in loader:
+                results.append(
+                    (data['image'].numpy(), data['label'].numpy(), data['name'])
+                )
+        return results
+
+    def check_same(self, results, expected):
+        self.assertEqual(len(results), len(expected))
+        for res, exp in zip(results, expected):
+            np.testing.assert_allclose(res[0], exp[0])
+            np.testing.assert_array_equal(res[1], exp[1])
+            self.assertEqual(res[2], exp[2])
+
+    def test_main(self):
+        expected = self.run_loader(0)
+        self.assertEqual(len(expected), 2 * SAMPLE_NUM // BATCH_SIZE)
+        self.check_same(self.run_loader(1 << 20), expected)
+        self.check_same(
+            self.run_loader(1 << 20, persistent_workers=True), expected
+        )
+
+    def test_fall_back(self):
+        # slot is smaller than a batch, all batches fall back to the
+        # default shared memory path
+        expected = self.run_loader(0)
+        self.check_same(self.run_loader(128), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
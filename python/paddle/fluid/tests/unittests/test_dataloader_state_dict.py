@@ -0,0 +1,188 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.io import (
+    BatchSampler,
+    DataLoader,
+    Dataset,
+    DistributedBatchSampler,
+    IterableDataset,
+    RandomSampler,
+)
+
+SAMPLE_NUM = 50
+BATCH_SIZE = 4
+
+
+class IndexDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+        self.read_indices = []
+
+    def __getitem__(self, idx):
+        self.read_indices.append(idx)
+        return np.array([idx]).astype('int64')
+
+    def __len__(self):
+        return self.sample_num
+
+
+class IndexIterableDataset(IterableDataset):
+    def __iter__(self):
+        for i in range(SAMPLE_NUM):
+            yield np.array([i]).astype('int64')
+
+
+class TestRandomSamplerState(unittest.TestCase):
+    def test_resume(self):
+        sampler = RandomSampler(data_source=list(range(SAMPLE_NUM)))
+        sampler_iter = iter(sampler)
+        for _ in range(7):
+            next(sampler_iter)
+        state = sampler.state_dict()
+        self.assertEqual(state['num_yielded'], 7)
+        expected = list(sampler_iter)
+
+        resumed = RandomSampler(data_source=list(range(SAMPLE_NUM)))
+        resumed.set_state_dict(state)
+        self.assertEqual(resumed.state_dict()['num_yielded'], 7)
+        self.assertEqual(list(resumed), expected)
+
+    def test_generator(self):
+        sampler = RandomSampler(
+            data_source=list(range(10)), generator=iter(range(10))
+        )
+        sampler.set_state_dict({'rng_state': None, 'num_yielded': 4})
+        self.assertEqual(list(sampler), list(range(4, 10)))
+
+
+class TestBatchSamplerState(unittest.TestCase):
+    def check_resume(self, shuffle):
+        dataset = list(range(SAMPLE_NUM))
+        bs = BatchSampler(dataset=dataset, shuffle=shuffle, batch_size=4)
+        bs_iter = iter(bs)
+        for _ in range(3):
+            next(bs_iter)
+        state = bs.state_dict()
+        self.assertEqual(state['num_batches'], 3)
+        expected = list(bs_iter)
+
+        resumed = BatchSampler(dataset=dataset, shuffle=shuffle, batch_size=4)
+        resumed.set_state_dict(state)
+        self.assertEqual(list(resumed), expected)
+        # resume state only takes effect in the next iteration
+        self.assertEqual(len(list(resumed)), len(resumed))
+
+    def test_resume(self):
+        self.check_resume(shuffle=False)
+        self.check_resume(shuffle=True)
+
+
+class TestDistributedBatchSamplerState(unittest.TestCase):
+    def check_resume(self, shuffle):
+        dataset = list(range(SAMPLE_NUM))
+        sampler = DistributedBatchSampler(
+            dataset, batch_size=4, num_replicas=2, rank=1, shuffle=shuffle
+        )
+        sampler.set_epoch(5)
+        sampler_iter = iter(sampler)
+        for _ in range(2):
+            next(sampler_iter)
+        state = sampler.state_dict()
+        self.assertEqual(state, {'epoch': 5, 'num_batches': 2})
+        expected = list(sampler_iter)
+
+        resumed = DistributedBatchSampler(
+            dataset, batch_size=4, num_replicas=2, rank=1, shuffle=shuffle
+        )
+        resumed.set_state_dict(state)
+        self.assertEqual(list(resumed), expected)
+        self.assertEqual(resumed.epoch, sampler.epoch)
+
+    def test_resume(self):
+        self.check_resume(shuffle=False)
+        self.check_resume(shuffle=True)
+
+
+class TestDataLoaderState(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def run_resume(self, num_workers, stop_batch=3):
+        np.random.seed(2023)
+        dataset = IndexDataset(SAMPLE_NUM)
+        loader = DataLoader(
+            dataset,
+            batch_size=BATCH_SIZE,
+            shuffle=True,
+            num_workers=num_workers,
+        )
+        results = []
+        for i, data in enumerate(loader):
+            results.append(data.numpy())
+            if i + 1 == stop_batch:
+                state = loader.state_dict()
+        self.assertEqual(state['num_batches'], stop_batch)
+        path = os.path.join(self.temp_dir.name, 'loader.pdstate')
+        paddle.save(state, path)
+
+        dataset = IndexDataset(SAMPLE_NUM)
+        resumed = DataLoader(
+            dataset,
+            batch_size=BATCH_SIZE,
+            shuffle=True,
+            num_workers=num_workers,
+        )
+        resumed.set_state_dict(paddle.load(path))
+        resumed_results = [data.numpy() for data in resumed]
+        self.assertEqual(len(resumed_results), len(results) - stop_batch)
+        for res, exp in zip(resumed_results, results[stop_batch:]):
+            np.testing.assert_array_equal(res, exp)
+        if num_workers == 0:
+            # skipped samples are not read
+            read_indices = set(dataset.read_indices)
+            for batch in results[:stop_batch]:
+                for idx in batch.flatten().tolist():
+                    self.assertNotIn(idx, read_indices)
+
+        # resume state only takes effect in the next epoch
+        self.assertEqual(len(list(resumed)), len(resumed))
+
+    def test_single_process(self):
+        self.run_resume(0)
+
+    def test_multi_process(self):
+        self.run_resume(2)
+
+    def test_iterable_dataset(self):
+        loader = DataLoader(IndexIterableDataset(), batch_size=BATCH_SIZE)
+        loader_iter = iter(loader)
+        next(loader_iter)
+        with self.assertRaises(RuntimeError):
+            loader.state_dict()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,6 +17,7 @@ import unittest
 import numpy as np
 from test_imperative_lod_tensor_to_selected_rows import SimpleNet
 
+import paddle
 from paddle import fluid
 from paddle.fluid import core
 from paddle.fluid.dygraph import base
@@ -210,5 +211,42 @@ class Test_Forward_Hook(unittest.TestCase):
                 self.assertFalse(call_forward_pre_hook)
 
 
+class TestForwardDispatch(unittest.TestCase):
+    def test_fast_forward(self):
+        with fluid.dygraph.guard():
+            linear = paddle.nn.Linear(4, 4)
+            x = paddle.ones([2, 4])
+            self.assertFalse(linear._fast_forward)
+            out = linear(x)
+            self.assertTrue(linear._built)
+            self.assertTrue(linear._fast_forward)
+
+            # registering a hook falls back to _dygraph_call_func
+            post_hook_handle = linear.register_forward_post_hook(
+                forward_post_hook1
+            )
+            self.assertFalse(linear._fast_forward)
+            np.testing.assert_allclose(
+                linear(x).numpy(), out.numpy() * 2, rtol=1e-05
+            )
+            pre_hook_handle = linear.register_forward_pre_hook(
+                lambda layer, input: input[0] * 0
+            )
+            post_hook_handle.remove()
+            self.assertFalse(linear._fast_forward)
+            np.testing.assert_allclose(
+                linear(x).numpy(), linear.bias.numpy()[None].repeat(2, 0)
+            )
+
+            # removing the last hook restores the fast path
+            pre_hook_handle.remove()
+            self.assertTrue(linear._fast_forward)
+            np.testing.assert_allclose(linear(x).numpy(), out.numpy())
+
+            # removing a hook twice is harmless
+            pre_hook_handle.remove()
+            self.assertTrue(linear._fast_forward)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,139 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from paddle import fluid
+from paddle.io import DataLoader, RecordDataset
+
+
+def decode(record):
+    return np.array([int(record)], dtype='int64')
+
+
+class TestRecordDataset(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.num_files = 4
+        self.num_records = 50
+        self.record_format = 'record'
+        self.files = []
+        for i in range(self.num_files):
+            path = os.path.join(self.temp_dir.name, 'shard-{}'.format(i))
+            records = [
+                str(i * self.num_records + j).encode()
+                for j in range(self.num_records)
+            ]
+            if self.record_format == 'record':
+                RecordDataset.write(path, records)
+            else:
+                with open(path, 'wb') as f:
+                    f.write(b'\n'.join(records) + b'\n')
+            self.files.append(path)
+        self.total = self.num_files * self.num_records
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def get_dataset(self, **kwargs):
+        kwargs.setdefault('num_replicas', 1)
+        kwargs.setdefault('rank', 0)
+        return RecordDataset(
+            self.files,
+            transform=int,
+            record_format=self.record_format,
+            **kwargs
+        )
+
+    def test_sequential(self):
+        for read_ahead in [0, 7]:
+            dataset = self.get_dataset(read_ahead=read_ahead)
+            self.assertEqual(list(dataset), list(range(self.total)))
+
+    def test_shuffle(self):
+        dataset = self.get_dataset(shuffle_buffer_size=16)
+        epoch_0 = list(dataset)
+        self.assertNotEqual(epoch_0, list(range(self.total)))
+        self.assertEqual(sorted(epoch_0), list(range(self.total)))
+
+        dataset.set_epoch(1)
+        epoch_1 = list(dataset)
+        self.assertNotEqual(epoch_0, epoch_1)
+        dataset.set_epoch(0)
+        self.assertEqual(list(dataset), epoch_0)
+
+    def test_distributed(self):
+        # shard number is more than, equal to, and less than rank number
+        for nranks in [3, 4, 6]:
+            rets = []
+            for rank in range(nranks):
+                dataset = self.get_dataset(
+                    num_replicas=nranks, rank=rank, shuffle_buffer_size=8
+                )
+                rets.extend(dataset)
+            self.assertEqual(sorted(rets), list(range(self.total)))
+
+    def test_break(self):
+        dataset = self.get_dataset(read_ahead=4)
+        for i, record in enumerate(dataset):
+            if i == 10:
+                break
+        self.assertEqual(record, 10)
+
+    def test_dataloader(self):
+        place = fluid.CPUPlace()
+        with fluid.dygraph.guard(place):
+            for num_workers in [0, 2, 8]:
+                dataset = RecordDataset(
+                    self.files,
+                    transform=decode,
+                    record_format=self.record_format,
+                    shuffle_buffer_size=16,
+                    num_replicas=1,
+                    rank=0,
+                )
+                dataloader = DataLoader(
+                    dataset,
+                    places=place,
+                    num_workers=num_workers,
+                    batch_size=1,
+                )
+                rets = [d.numpy()[0][0] for d in dataloader]
+                self.assertEqual(sorted(rets), list(range(self.total)))
+
+
+class TestRecordDatasetLine(TestRecordDataset):
+    def setUp(self):
+        self.record_format = 'line'
+        super().setUp()
+
+
+class TestRecordDatasetTruncated(unittest.TestCase):
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'shard')
+            RecordDataset.write(path, [b'abc', b'defg'])
+            with open(path, 'rb+') as f:
+                f.truncate(os.path.getsize(path) - 1)
+            dataset = RecordDataset(path, num_replicas=1, rank=0)
+            with self.assertRaises(ValueError):
+                list(dataset)
+
+
+if __name__ == '__main__':
+    unittest.main()
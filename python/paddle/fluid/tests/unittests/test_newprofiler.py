@@ -195,6 +195,24 @@ class TestProfiler(unittest.TestCase):
             simple_net.clear_gradients()
             prof.step()
         prof.stop()
+        prof = None
+        with profiler.Profiler(
+            targets=[profiler.ProfilerTarget.CPU],
+            scheduler=profiler.make_scheduler(
+                closed=1, ready=0, record=2, repeat=3
+            ),
+            on_trace_ready=lambda prof: None,
+            streaming_summary=True,
+        ) as prof:
+            for i in range(10):
+                y = x / 2.0
+                prof.step()
+        time_range_summary = prof._statistic_data.time_range_summary
+        self.assertEqual(
+            time_range_summary.call_times[profiler.TracerEventType.ProfileStep],
+            6,
+        )
+        prof.summary(op_detail=False)
 
 
 class TestGetProfiler(unittest.TestCase):
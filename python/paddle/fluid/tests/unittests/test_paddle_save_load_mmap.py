@@ -0,0 +1,136 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+import numpy as np
+
+import paddle
+
+
+class TestSaveLoadMmapFormat(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'model.pdparams')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def build_obj(self):
+        paddle.seed(2023)
+        layer = paddle.nn.Linear(13, 7)
+        return {
+            'model': layer.state_dict(),
+            'int': paddle.arange(10, dtype='int64'),
+            'bool': paddle.to_tensor([True, False]),
+            'scalar': paddle.to_tensor(3.0),
+            'empty': paddle.zeros([0, 3]),
+            'list': [paddle.ones([2, 2]), 'str', 1.5],
+            'ndarray': np.arange(6).reshape([2, 3]),
+            'epoch': 10,
+        }
+
+    def check_obj(self, obj, load_obj, return_numpy=False):
+        if isinstance(obj, dict):
+            self.assertEqual(sorted(obj.keys()), sorted(load_obj.keys()))
+            for key in obj:
+                self.check_obj(obj[key], load_obj[key], return_numpy)
+        elif isinstance(obj, list):
+            self.assertEqual(len(obj), len(load_obj))
+            for value, load_value in zip(obj, load_obj):
+                self.check_obj(value, load_value, return_numpy)
+        elif isinstance(obj, (paddle.Tensor, np.ndarray)):
+            if return_numpy:
+                self.assertIsInstance(load_obj, np.ndarray)
+            else:
+                self.assertIsInstance(load_obj, paddle.Tensor)
+            np.testing.assert_array_equal(np.array(obj), np.array(load_obj))
+            self.assertEqual(np.array(obj).dtype, np.array(load_obj).dtype)
+        else:
+            self.assertEqual(obj, load_obj)
+
+    def test_save_load(self):
+        obj = self.build_obj()
+        paddle.save(obj, self.path, use_mmap_format=True)
+        for mmap in [False, True]:
+            for return_numpy in [False, True]:
+                load_obj = paddle.load(
+                    self.path, mmap=mmap, return_numpy=return_numpy
+                )
+                self.check_obj(obj, load_obj, return_numpy)
+
+    def test_parameter_name(self):
+        layer = paddle.nn.Linear(3, 4)
+        paddle.save(layer.state_dict(), self.path, use_mmap_format=True)
+        state_dict = paddle.load(self.path, mmap=True)
+        for key, param in layer.state_dict().items():
+            self.assertEqual(state_dict[key].name, param.name)
+
+        new_layer = paddle.nn.Linear(3, 4)
+        new_layer.set_state_dict(state_dict)
+        np.testing.assert_array_equal(
+            new_layer.weight.numpy(), layer.weight.numpy()
+        )
+
+    def test_modify_mmap_tensor(self):
+        tensor = paddle.ones([4, 4])
+        paddle.save(tensor, self.path, use_mmap_format=True)
+        load_tensor = paddle.load(self.path, mmap=True)
+        load_tensor.add_(paddle.ones([4, 4]))
+        np.testing.assert_array_equal(load_tensor.numpy(), np.full([4, 4], 2))
+        # file is not changed
+        np.testing.assert_array_equal(
+            paddle.load(self.path, mmap=True).numpy(), np.ones([4, 4])
+        )
+
+    def test_memory_buffer(self):
+        obj = self.build_obj()
+        tensor = paddle.randn([2, 3])
+        byio = BytesIO()
+        paddle.save(obj, byio, use_mmap_format=True)
+        paddle.save(tensor, byio, use_mmap_format=True)
+        byio.seek(0)
+        self.check_obj(obj, paddle.load(byio))
+        self.check_obj(tensor, paddle.load(byio))
+
+        byio.seek(0)
+        with self.assertRaises(ValueError):
+            paddle.load(byio, mmap=True)
+
+    def test_error(self):
+        paddle.save(paddle.ones([2]), self.path)
+        # not saved in mmap format
+        with self.assertRaises(ValueError):
+            paddle.load(self.path, mmap=True)
+        with self.assertRaises(TypeError):
+            paddle.load(self.path, mmap=1)
+        with self.assertRaises(TypeError):
+            paddle.save(paddle.ones([2]), self.path, use_mmap_format=1)
+        with self.assertRaises(ValueError):
+            paddle.save(
+                paddle.ones([2]),
+                self.path,
+                use_mmap_format=True,
+                use_binary_format=True,
+            )
+        with self.assertRaises(ValueError):
+            paddle.save(paddle.nn.Linear(3, 4), self.path, use_mmap_format=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
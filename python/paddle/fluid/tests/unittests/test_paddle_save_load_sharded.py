@@ -0,0 +1,115 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+import numpy as np
+
+import paddle
+
+
+class TestSaveLoadSharded(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'model.pdparams')
+        paddle.seed(2023)
+        self.layer = paddle.nn.Sequential(
+            paddle.nn.Linear(16, 32),
+            paddle.nn.Linear(32, 32),
+            paddle.nn.Linear(32, 8),
+        )
+        self.state_dict = self.layer.state_dict()
+        self.state_dict['step'] = 100
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def check_state_dict(self, state_dict, keys):
+        self.assertEqual(list(state_dict.keys()), keys)
+        for key in keys:
+            if key == 'step':
+                self.assertEqual(state_dict[key], 100)
+            else:
+                np.testing.assert_array_equal(
+                    state_dict[key].numpy(), self.state_dict[key].numpy()
+                )
+                self.assertEqual(
+                    state_dict[key].name, self.state_dict[key].name
+                )
+
+    def test_save_load(self):
+        # 32 * 32 float32 tensor is 4096 bytes
+        paddle.save(self.state_dict, self.path, max_shard_size=4096)
+        shard_files = [
+            name
+            for name in os.listdir(self.temp_dir.name)
+            if name.startswith('model.pdparams.shard-')
+        ]
+        self.assertEqual(len(shard_files), 3)
+
+        keys = list(self.state_dict.keys())
+        for mmap in [False, True]:
+            for num_threads in [1, 4]:
+                state_dict = paddle.load(
+                    self.path, mmap=mmap, num_threads=num_threads
+                )
+                self.check_state_dict(state_dict, keys)
+
+        self.layer.set_state_dict(paddle.load(self.path))
+
+    def test_key_filter(self):
+        paddle.save(self.state_dict, self.path, max_shard_size=4096)
+        state_dict = paddle.load(self.path, key_filter=['1.weight', 'step'])
+        self.check_state_dict(state_dict, ['1.weight', 'step'])
+
+        state_dict = paddle.load(
+            self.path, key_filter=lambda key: key.endswith('bias')
+        )
+        self.check_state_dict(state_dict, ['0.bias', '1.bias', '2.bias'])
+
+        state_dict = paddle.load(self.path, key_filter=[])
+        self.assertEqual(len(state_dict), 0)
+
+    def test_key_filter_mmap_format(self):
+        paddle.save(self.state_dict, self.path, use_mmap_format=True)
+        state_dict = paddle.load(self.path, key_filter=['2.weight'])
+        self.check_state_dict(state_dict, ['2.weight'])
+
+    def test_error(self):
+        with self.assertRaises(TypeError):
+            paddle.save(paddle.ones([2]), self.path, max_shard_size=1024)
+        with self.assertRaises(ValueError):
+            paddle.save(self.state_dict, BytesIO(), max_shard_size=1024)
+        with self.assertRaises(ValueError):
+            paddle.save(self.state_dict, self.path, max_shard_size=0)
+        with self.assertRaises(ValueError):
+            paddle.save(
+                self.state_dict, self.path, max_shard_size=1024, num_threads=0
+            )
+
+        paddle.save(self.state_dict, self.path)
+        with self.assertRaises(ValueError):
+            paddle.load(self.path, key_filter=['0.weight'])
+
+        paddle.save(self.state_dict, self.path, max_shard_size=1024)
+        with self.assertRaises(TypeError):
+            paddle.load(self.path, key_filter='0.weight')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1044,6 +1044,164 @@ class TestProfilerStatistic(unittest.TestCase):
                 )
             )
 
+    def build_step_tree(self, step, offset):
+        root_node = HostPythonNode(
+            'Root Node',
+            profiler.TracerEventType.UserDefined,
+            0,
+            float('inf'),
+            1000,
+            1001,
+        )
+        profilerstep_node = HostPythonNode(
+            'ProfileStep#{}'.format(step),
+            profiler.TracerEventType.ProfileStep,
+            offset,
+            offset + 100,
+            1000,
+            1001,
+        )
+        forward_node = HostPythonNode(
+            'Forward',
+            profiler.TracerEventType.Forward,
+            offset + 10,
+            offset + 60,
+            1000,
+            1001,
+        )
+        conv2d_node = HostPythonNode(
+            'conv2d',
+            profiler.TracerEventType.Operator,
+            offset + 15,
+            offset + 30,
+            1000,
+            1001,
+        )
+        allreduce_node = HostPythonNode(
+            'allreduce',
+            profiler.TracerEventType.Operator,
+            offset + 35,
+            offset + 55,
+            1000,
+            1001,
+        )
+        conv2d_launchkernel = HostPythonNode(
+            'cudalaunchkernel',
+            profiler.TracerEventType.CudaRuntime,
+            offset + 20,
+            offset + 25,
+            1000,
+            1001,
+        )
+        allreduce_launchkernel = HostPythonNode(
+            'cudalaunchkernel',
+            profiler.TracerEventType.CudaRuntime,
+            offset + 40,
+            offset + 45,
+            1000,
+            1001,
+        )
+        conv2d_kernel = DevicePythonNode(
+            'conv2d_kernel',
+            profiler.TracerEventType.Kernel,
+            offset + 30,
+            offset + 70,
+            step % 2,
+            0,
+            0,
+        )
+        allreduce_kernel = DevicePythonNode(
+            'nccl_allreduce_kernel',
+            profiler.TracerEventType.Kernel,
+            offset + 50,
+            offset + 90,
+            step % 2,
+            0,
+            0,
+        )
+        root_node.children_node.append(profilerstep_node)
+        profilerstep_node.children_node.append(forward_node)
+        forward_node.children_node.extend([conv2d_node, allreduce_node])
+        conv2d_node.runtime_node.append(conv2d_launchkernel)
+        allreduce_node.runtime_node.append(allreduce_launchkernel)
+        conv2d_launchkernel.device_node.append(conv2d_kernel)
+        allreduce_launchkernel.device_node.append(allreduce_kernel)
+        return root_node
+
+    def test_statistic_add(self):
+        extra_info = {
+            'Process Cpu Utilization': '1.02',
+            'System Cpu Utilization': '0.68',
+        }
+        statistic_data = profiler.profiler_statistic.StatisticData()
+        for step in range(4):
+            statistic_data.add(
+                {'thread1001': self.build_step_tree(step, step * 1000)},
+                extra_info,
+            )
+        time_range_summary = statistic_data.time_range_summary
+        event_summary = statistic_data.event_summary
+        distributed_summary = statistic_data.distributed_summary
+
+        self.assertEqual(
+            time_range_summary.get_cpu_range_sum(
+                profiler.TracerEventType.ProfileStep
+            ),
+            400,
+        )
+        self.assertEqual(
+            time_range_summary.get_cpu_range_sum(
+                profiler.TracerEventType.Operator
+            ),
+            140,
+        )
+        self.assertEqual(
+            time_range_summary.get_gpu_range_sum(
+                0, profiler.TracerEventType.Kernel
+            ),
+            120,
+        )
+        self.assertEqual(
+            time_range_summary.GPUTimeRangeSumAllDevices[
+                profiler.TracerEventType.Kernel
+            ],
+            240,
+        )
+        self.assertEqual(
+            time_range_summary.call_times[profiler.TracerEventType.Kernel], 8
+        )
+        # only ranges of the last added result are kept
+        self.assertEqual(
+            time_range_summary.CPUTimeRange[
+                profiler.TracerEventType.ProfileStep
+            ],
+            [(3000, 3100)],
+        )
+        self.assertEqual(event_summary.items['conv2d'].call, 4)
+        self.assertEqual(event_summary.items['conv2d'].cpu_time, 60)
+        self.assertEqual(event_summary.items['conv2d'].gpu_time, 160)
+        self.assertEqual(event_summary.kernel_items['conv2d_kernel'].call, 4)
+        self.assertEqual(
+            event_summary.model_perspective_items['Forward'].call, 4
+        )
+        self.assertEqual(
+            event_summary.model_perspective_items['Forward'].cpu_time, 200
+        )
+        self.assertEqual(distributed_summary.cpu_calls, 4)
+        self.assertEqual(distributed_summary.gpu_calls, 4)
+        self.assertEqual(distributed_summary.communication_time, 4 * 55)
+        self.assertEqual(distributed_summary.computation_time, 4 * 40)
+        self.assertEqual(distributed_summary.overlap_time, 4 * 35)
+        print(
+            profiler.profiler_statistic._build_table(
+                statistic_data,
+                sorted_by=profiler.SortedKeys.CPUTotal,
+                op_detail=True,
+                thread_sep=False,
+                time_unit='ms',
+            )
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,121 @@
+#   Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle import profiler
+from paddle.io import DataLoader, Dataset
+from paddle.profiler import utils
+
+
+class RandomDataset(Dataset):
+    def __init__(self, num_samples):
+        self.num_samples = num_samples
+
+    def __getitem__(self, idx):
+        image = np.random.random([10]).astype('float32')
+        label = np.random.randint(0, 10, (1,)).astype('int64')
+        return image, label
+
+    def __len__(self):
+        return self.num_samples
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def train(self, prof, num_steps):
+        linear = paddle.nn.Linear(10, 10)
+        opt = paddle.optimizer.SGD(
+            learning_rate=1e-3, parameters=linear.parameters()
+        )
+        loader = DataLoader(RandomDataset(num_steps * 4), batch_size=4)
+        for i, (image, label) in enumerate(loader()):
+            self.assertEqual(
+                utils.in_profiler_mode(), i % prof.sample_interval == 0
+            )
+            loss = paddle.nn.functional.cross_entropy(linear(image), label)
+            loss.backward()
+            opt.step()
+            opt.clear_grad()
+            prof.step()
+
+    def test_sampling_profiler(self):
+        with profiler.SamplingProfiler(
+            dir_name=self.temp_dir.name,
+            worker_name='worker',
+            sample_interval=2,
+            flush_interval=3,
+        ) as prof:
+            self.train(prof, 10)
+        self.assertFalse(utils.in_profiler_mode())
+
+        samples = prof.samples()
+        np.testing.assert_array_equal(samples['step_id'], np.arange(10))
+        self.assertTrue(np.all(samples['step'] > 0))
+        self.assertTrue(np.all(samples['reader'] > 0))
+        for phase in ['forward', 'backward', 'optimizer']:
+            self.assertTrue(np.all(samples[phase][::2] > 0))
+            self.assertTrue(np.all(np.isnan(samples[phase][1::2])))
+
+        percentiles = prof.percentiles(q=[50, 99])
+        self.assertAlmostEqual(
+            percentiles['step'][50], np.median(samples['step'])
+        )
+        self.assertLessEqual(percentiles['step'][50], percentiles['step'][99])
+        self.assertEqual(percentiles['communication'][50], 0.0)
+        self.assertEqual(
+            list(prof.percentiles(90, phases=['forward']).keys()), ['forward']
+        )
+
+        loaded = profiler.load_samples(self.temp_dir.name)
+        for name, values in samples.items():
+            np.testing.assert_array_equal(loaded[name], values)
+
+    def test_rolling_files(self):
+        prof = profiler.SamplingProfiler(
+            dir_name=self.temp_dir.name,
+            worker_name='worker',
+            window_size=4,
+            flush_interval=1,
+            max_file_size=256,
+            max_files=2,
+        )
+        prof.start()
+        self.train(prof, 12)
+        prof.stop()
+
+        self.assertEqual(len(prof.samples()['step_id']), 4)
+        np.testing.assert_array_equal(
+            prof.samples()['step_id'], np.arange(8, 12)
+        )
+        filenames = sorted(os.listdir(self.temp_dir.name))
+        self.assertEqual(len(filenames), 2)
+        loaded = profiler.load_samples(
+            os.path.join(self.temp_dir.name, filenames[-1])
+        )
+        self.assertEqual(loaded['step_id'][-1], 11)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import collections
+import threading
+
 from .wrapped_decorator import signature_safe_contextmanager
 
 __all__ = ['generate', 'switch', 'guard']
@@ -76,6 +78,18 @@ dygraph_parameter_name_checker = DygraphParameterNameChecker()
 
 generator = UniqueNameGenerator()
 
+# NOTE: The generator set by `_thread_guard` takes precedence over the global
+# one in current thread only, it is used by the worker threads which should
+# neither share the counters with nor switch the namespace of other threads.
+_thread_local = threading.local()
+
+
+def _current_generator():
+    local_generator = getattr(_thread_local, 'generator', None)
+    if local_generator is not None:
+        return local_generator
+    return generator
+
 
 def generate(key):
     """
@@ -98,7 +112,7 @@ def generate(key):
             name2 = paddle.utils.unique_name.generate('fc')
             print(name1, name2) # fc_0, fc_1
     """
-    return generator(key)
+    return _current_generator()(key)
 
 
 # FIXME(zjl): The previous naming rule in static graph would
@@ -125,7 +139,7 @@ def generate_with_ignorable_key(key):
     if in_dygraph_mode():
         return _dygraph_tracer()._generate_unique_name()
 
-    return generator(key)
+    return _current_generator()(key)
 
 
 def switch(new_generator=None, new_para_name_checker=None):
@@ -223,3 +237,17 @@ def guard(new_generator=None):
         yield
     finally:
         switch(old_generator, old_para_name_checker)
+
+
+@signature_safe_contextmanager
+def _thread_guard(new_generator):
+    """
+    Like :code:`guard`, but generates names by new_generator in the context
+    of current thread only, the namespace of other threads is not changed.
+    """
+    old_generator = getattr(_thread_local, 'generator', None)
+    _thread_local.generator = new_generator
+    try:
+        yield
+    finally:
+        _thread_local.generator = old_generator
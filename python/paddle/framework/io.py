@@ -14,11 +14,15 @@
 
 import collections
 import copyreg
+import mmap
 import os
 import pickle
+import struct
 import sys
 import warnings
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 
 import numpy as np
 
@@ -34,6 +38,7 @@ from paddle.fluid.framework import (
     _create_tensor,
     _current_expected_place,
     _dygraph_tracer,
+    _set_expected_place,
     in_dygraph_mode,
 )
 
@@ -49,6 +54,21 @@ from .io_utils import (
 
 __all__ = []
 
+# NOTE: the file of mmap format starts with a header of magic number,
+# offset and size of index, followed by tensor buffers and the index,
+# see _mmap_save. The magic number never conflicts with pickle data,
+# which starts with b'\x80'.
+_MMAP_FORMAT_MAGIC = b'PDMMAP\x00\x01'
+_MMAP_FORMAT_HEADER = struct.Struct('<8sQQ')
+# each tensor buffer starts at a 64 bytes boundary, which satisfies the
+# alignment requirement of eigen and all numpy dtypes
+_MMAP_FORMAT_ALIGNMENT = 64
+# the index file of sharded checkpoint starts with the magic number,
+# followed by the pickled index, see _sharded_save
+_SHARDED_INDEX_MAGIC = b'PDSHARD\x01'
+# default thread number to save and load shards
+_SHARDED_DEFAULT_NUM_THREADS = 8
+
 
 def _build_saved_state_dict(state_dict):
     save_dict = {}
@@ -228,6 +248,9 @@ def _parse_load_config(configs):
         'params_filename',
         'keep_name_table',
         'return_numpy',
+        'mmap',
+        'key_filter',
+        'num_threads',
     ]
 
     # input check
@@ -248,12 +271,23 @@ def _parse_load_config(configs):
     inner_config.params_filename = configs.get('params_filename', None)
     inner_config.keep_name_table = configs.get('keep_name_table', None)
     inner_config.return_numpy = configs.get('return_numpy', False)
+    inner_config.mmap = configs.get('mmap', False)
+    inner_config.key_filter = configs.get('key_filter', None)
+    inner_config.num_threads = configs.get(
+        'num_threads', _SHARDED_DEFAULT_NUM_THREADS
+    )
 
     return inner_config
 
 
 def _parse_save_config(configs):
-    supported_configs = ['use_binary_format', 'pickle_protocol']
+    supported_configs = [
+        'use_binary_format',
+        'use_mmap_format',
+        'max_shard_size',
+        'num_threads',
+        'pickle_protocol',
+    ]
 
     # input check
     for key in configs:
@@ -270,6 +304,11 @@ def _parse_save_config(configs):
 
     inner_config = _SaveLoadConfig()
     inner_config.use_binary_format = configs.get('use_binary_format', False)
+    inner_config.use_mmap_format = configs.get('use_mmap_format', False)
+    inner_config.max_shard_size = configs.get('max_shard_size', None)
+    inner_config.num_threads = configs.get(
+        'num_threads', _SHARDED_DEFAULT_NUM_THREADS
+    )
     inner_config.pickle_protocol = configs.get('pickle_protocol', None)
 
     return inner_config
@@ -351,6 +390,309 @@ def _pickle_save(obj, f, protocol):
         pickler.dump(obj)
 
 
+def _mmap_align(offset):
+    return (
+        (offset + _MMAP_FORMAT_ALIGNMENT - 1)
+        // _MMAP_FORMAT_ALIGNMENT
+        * _MMAP_FORMAT_ALIGNMENT
+    )
+
+
+def _mmap_save(obj, f, protocol):
+    # The object is pickled with tensors replaced by persistent ids, and
+    # the data of each tensor is written into the file once it is met, so
+    # tensors are streamed to the file one by one without being pickled.
+    # The pickled object is small and written as the index at the end.
+    if not isinstance(protocol, int):
+        raise ValueError(
+            "The 'protocol' MUST be `int`, but received {}".format(
+                type(protocol)
+            )
+        )
+
+    if protocol < 2 or protocol > 4:
+        raise ValueError(
+            f"Expected 1<'protocol'<5, but received protocol={protocol}"
+        )
+
+    start = f.tell()
+    f.write(b'\0' * _mmap_align(_MMAP_FORMAT_HEADER.size))
+    # list of (offset, shape, dtype str, name) of each tensor
+    metas = []
+
+    def write_tensor(tensor, name):
+        data = np.array(tensor)
+        pos = f.tell() - start
+        offset = _mmap_align(pos)
+        f.write(b'\0' * (offset - pos))
+        f.write(np.ascontiguousarray(data).reshape([-1]).view(np.uint8))
+        metas.append((offset, data.shape, data.dtype.str, name))
+        return len(metas) - 1
+
+    class _MmapPickler(pickle.Pickler):
+        def persistent_id(self, obj):
+            if isinstance(obj, core.eager.Tensor):
+                return ('tensor', write_tensor(obj, obj.name))
+            if isinstance(obj, core.LoDTensor):
+                return ('tensor', write_tensor(obj, None))
+            if isinstance(obj, paddle.nn.Layer):
+                raise ValueError(
+                    "paddle do not support saving `paddle.nn.Layer` object."
+                )
+            return None
+
+    obj_buffer = BytesIO()
+    _MmapPickler(obj_buffer, protocol).dump(obj)
+    index = pickle.dumps(
+        {'obj': obj_buffer.getvalue(), 'metas': metas}, protocol
+    )
+
+    index_offset = f.tell() - start
+    f.write(index)
+    end = f.tell()
+    f.seek(start)
+    f.write(
+        _MMAP_FORMAT_HEADER.pack(_MMAP_FORMAT_MAGIC, index_offset, len(index))
+    )
+    f.seek(end)
+
+
+def _is_mmap_format(f):
+    pos = f.tell()
+    magic = f.read(len(_MMAP_FORMAT_MAGIC))
+    f.seek(pos)
+    return magic == _MMAP_FORMAT_MAGIC
+
+
+class _MmapTensorRef:
+    def __init__(self, idx):
+        self.idx = idx
+
+
+def _parse_key_filter(key_filter):
+    if key_filter is None or callable(key_filter):
+        return key_filter
+    if isinstance(key_filter, (list, tuple, set)):
+        keys = set(key_filter)
+        return lambda key: key in keys
+    raise TypeError(
+        "Type of `key_filter` should be callable, list, tuple or set, but "
+        "received {}.".format(type(key_filter))
+    )
+
+
+def _mmap_load(f, config):
+    start = f.tell()
+    _, index_offset, index_size = _MMAP_FORMAT_HEADER.unpack(
+        f.read(_MMAP_FORMAT_HEADER.size)
+    )
+    f.seek(start + index_offset)
+    index = pickle.loads(f.read(index_size))
+    end = f.tell()
+
+    if config.mmap:
+        # NOTE: pages are copy-on-write, tensors can be modified in place
+        # without changing the file, and only the modified pages are
+        # allocated in memory
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    def read_tensor(offset, shape, dtype, name):
+        dtype = np.dtype(dtype)
+        size = int(np.prod(shape)) if len(shape) > 0 else 1
+        if config.mmap:
+            data = np.frombuffer(
+                buffer, dtype=dtype, count=size, offset=start + offset
+            ).reshape(shape)
+            if config.return_numpy:
+                return data
+            if in_dygraph_mode():
+                # tensor holds the file-backed array without copying, so
+                # data is paged in lazily when it is accessed
+                return core.eager.Tensor(
+                    data, core.CPUPlace(), False, True, name, True
+                )
+            return _to_LodTensor(data)
+
+        data = np.empty(shape, dtype=dtype)
+        f.seek(start + offset)
+        f.readinto(data.reshape([-1]).view(np.uint8))
+        if name is not None:
+            return _tuple_to_tensor((name, data), config.return_numpy)
+        return _ndarray_to_tensor(data, config.return_numpy)
+
+    key_filter = _parse_key_filter(config.key_filter)
+
+    class _MmapUnpickler(pickle.Unpickler):
+        def persistent_load(self, pid):
+            kind, idx = pid
+            if kind != 'tensor':
+                raise pickle.UnpicklingError(
+                    "Unsupported persistent id {} in mmap format.".format(pid)
+                )
+            # NOTE: with key filter, tensors are read after filtering, so
+            # tensors of filtered out keys are never read
+            if key_filter is not None:
+                return _MmapTensorRef(idx)
+            return read_tensor(*index['metas'][idx])
+
+    load_result = _MmapUnpickler(
+        BytesIO(index['obj']), encoding='latin1'
+    ).load()
+    if key_filter is not None:
+        if not isinstance(load_result, dict):
+            raise ValueError(
+                "`key_filter` is only supported when loading dict, but "
+                "received {}.".format(type(load_result))
+            )
+        for key in list(load_result.keys()):
+            if not key_filter(key):
+                del load_result[key]
+        load_result = _parse_every_object(
+            load_result,
+            lambda v: isinstance(v, _MmapTensorRef),
+            lambda ref: read_tensor(*index['metas'][ref.idx]),
+        )
+    # other objects are restored in the same way as pickle format
+    load_result = _parse_load_result(load_result, config.return_numpy)
+    f.seek(end)
+    return load_result
+
+
+def _tensor_nbytes(value):
+    if isinstance(value, core.eager.Tensor):
+        return int(np.prod(value.shape)) * core.size_of_dtype(value.dtype)
+    if isinstance(value, core.LoDTensor):
+        return int(np.prod(value.shape())) * core.size_of_dtype(value._dtype())
+    return 0
+
+
+def _sharded_file_name(path, shard_id, num_shards):
+    return "{}.shard-{:05d}-of-{:05d}".format(
+        os.path.basename(path), shard_id, num_shards
+    )
+
+
+def _thread_pool(num_threads):
+    # NOTE: expected place is thread local, set it for the threads in
+    # pool as the same as the caller thread
+    return ThreadPoolExecutor(
+        max_workers=num_threads,
+        initializer=_set_expected_place,
+        initargs=(_current_expected_place(),),
+    )
+
+
+def _sharded_save(obj, path, protocol, max_shard_size, num_threads):
+    # Items of the dict are split into shards in order, each shard is a
+    # file in mmap format with items whose total size of tensors is not
+    # more than max_shard_size (except single tensor larger than it).
+    # The index file is written after all shards are saved, which maps
+    # each key to its shard.
+    if not isinstance(obj, dict):
+        raise TypeError(
+            "`max_shard_size` is only supported when saving dict, but "
+            "received {}.".format(type(obj))
+        )
+    if not _is_file_path(path):
+        raise ValueError(
+            "`max_shard_size` is only supported when saving to file, but "
+            "received {}.".format(type(path))
+        )
+    if not isinstance(max_shard_size, int) or max_shard_size <= 0:
+        raise ValueError(
+            "`max_shard_size` should be a positive integer, but received "
+            "{}.".format(max_shard_size)
+        )
+
+    shards = [[]]
+    shard_size = 0
+    for key, value in obj.items():
+        nbytes = _tensor_nbytes(value)
+        if shards[-1] and shard_size + nbytes > max_shard_size:
+            shards.append([])
+            shard_size = 0
+        shards[-1].append(key)
+        shard_size += nbytes
+
+    num_shards = len(shards)
+    shard_files = [
+        _sharded_file_name(path, i, num_shards) for i in range(num_shards)
+    ]
+    dirname = os.path.dirname(path)
+
+    def save_shard(shard_id):
+        shard = {key: obj[key] for key in shards[shard_id]}
+        with open(os.path.join(dirname, shard_files[shard_id]), 'wb') as f:
+            _mmap_save(shard, f, protocol)
+
+    with _thread_pool(min(num_threads, num_shards)) as pool:
+        # NOTE: list the results to raise the exception in saving
+        list(pool.map(save_shard, range(num_shards)))
+
+    key_to_shard = [
+        (key, shard_id)
+        for shard_id, shard in enumerate(shards)
+        for key in shard
+    ]
+    with open(path, 'wb') as f:
+        f.write(_SHARDED_INDEX_MAGIC)
+        pickle.dump(
+            {'shard_files': shard_files, 'key_to_shard': key_to_shard},
+            f,
+            protocol,
+        )
+
+
+def _is_sharded_index(f):
+    pos = f.tell()
+    magic = f.read(len(_SHARDED_INDEX_MAGIC))
+    f.seek(pos)
+    return magic == _SHARDED_INDEX_MAGIC
+
+
+def _sharded_load(path, f, config):
+    if not _is_file_path(path):
+        raise ValueError(
+            "Sharded checkpoint can only be loaded from file, but received "
+            "{}.".format(type(path))
+        )
+    if not isinstance(config.num_threads, int) or config.num_threads <= 0:
+        raise ValueError(
+            "`num_threads` should be a positive integer, but received "
+            "{}.".format(config.num_threads)
+        )
+
+    f.seek(len(_SHARDED_INDEX_MAGIC), os.SEEK_CUR)
+    index = pickle.load(f)
+    key_filter = _parse_key_filter(config.key_filter)
+    key_to_shard = [
+        (key, shard_id)
+        for key, shard_id in index['key_to_shard']
+        if key_filter is None or key_filter(key)
+    ]
+    # only shards containing the required keys are read
+    shard_ids = sorted({shard_id for _, shard_id in key_to_shard})
+    dirname = os.path.dirname(path)
+
+    def load_shard(shard_id):
+        shard_path = os.path.join(dirname, index['shard_files'][shard_id])
+        with open(shard_path, 'rb') as shard_file:
+            return _mmap_load(shard_file, config)
+
+    results = {}
+    if shard_ids:
+        with _thread_pool(min(config.num_threads, len(shard_ids))) as pool:
+            for shard_id, shard in zip(
+                shard_ids, pool.map(load_shard, shard_ids)
+            ):
+                results.update(shard)
+
+    # keep the order of keys in saved dict
+    return collections.OrderedDict(
+        (key, results[key]) for key, _ in key_to_shard
+    )
+
+
 def _contain_x(obj, condition_func):
     if isinstance(obj, core.SelectedRows):
         raise NotImplementedError(
@@ -669,6 +1011,13 @@ def save(obj, path, protocol=4, **configs):
           use_binary_format(bool): When the saved object is static graph variable, you can specify ``use_binary_for_var``.
           If True, save the file in the c++ binary format when saving a single static graph variable; otherwise, save it in pickle format.
           Default: False
+          use_mmap_format(bool): If True, save the file in mmap format, where each tensor is streamed to the file as an aligned
+          raw buffer instead of being pickled, and tensors can be loaded lazily by ``paddle.load(path, mmap=True)`` .
+          Default: False
+          max_shard_size(int): If specified, ``obj`` should be a dict, whose items are split into shard files in mmap format
+          with tensors of at most ``max_shard_size`` bytes in each shard, and ``path`` is written as the index file. Shard
+          files are named as ``path`` with suffix ``.shard-xxxxx-of-xxxxx`` in the same directory. Default: None
+          num_threads(int): The thread number to save shards in parallel. Default: 8
 
     Returns:
         None
@@ -772,6 +1121,17 @@ def save(obj, path, protocol=4, **configs):
             tensor = paddle.randn([2, 3], dtype='float32')
             paddle.save(tensor, byio)
 
+        .. code-block:: python
+            :name: code-example-6
+
+            # example 6: save state_dict in mmap format
+            import paddle
+
+            linear = paddle.nn.Linear(5, 10)
+            paddle.save(
+                linear.state_dict(), "linear.pdparams", use_mmap_format=True
+            )
+
     '''
     if _is_file_path(path):
         # 1. input check
@@ -803,8 +1163,41 @@ def save(obj, path, protocol=4, **configs):
             )
         )
 
+    if not isinstance(config.use_mmap_format, bool):
+        raise TypeError(
+            "Type of `use_mmap_format` should be bool, but received {}.".format(
+                type(config.use_mmap_format)
+            )
+        )
+
+    if config.use_binary_format and config.use_mmap_format:
+        raise ValueError(
+            "`use_binary_format` and `use_mmap_format` cannot be both True."
+        )
+
+    if config.max_shard_size is not None and config.use_binary_format:
+        raise ValueError(
+            "`use_binary_format` and `max_shard_size` cannot be both set."
+        )
+    if not isinstance(config.num_threads, int) or config.num_threads <= 0:
+        raise ValueError(
+            "`num_threads` should be a positive integer, but received "
+            "{}.".format(config.num_threads)
+        )
+
     if config.use_binary_format:
         _save_binary_var(obj, path)
+    elif config.max_shard_size is not None:
+        _sharded_save(
+            obj, path, protocol, config.max_shard_size, config.num_threads
+        )
+    elif config.use_mmap_format:
+        if isinstance(obj, Program):
+            raise ValueError(
+                "`use_mmap_format` does not support saving Program."
+            )
+        with _open_file_buffer(path, 'wb') as f:
+            _mmap_save(obj, f, protocol)
     else:
         # `protocol` need to be used, `pickle_protocol` is a deprecated arg.
         if config.pickle_protocol is not None:
@@ -930,6 +1323,13 @@ def load(path, **configs):
             by default.
             (3) return_numpy(bool): If specified as True, return tensor as numpy.ndarray, otherwise return tensor as paddle.Tensor.
             Default False.
+            (4) mmap(bool): If specified as True, memory-map the file saved by ``paddle.save`` with ``use_mmap_format=True`` ,
+            and return tensors (on CPU in dynamic graph mode) or numpy.ndarray backed by the file without copying, whose
+            data is read lazily when accessed. Modifying the returned tensors does not change the file. Default False.
+            (5) key_filter(callable|list|tuple|set): Keys of the dict to load, or a function which takes a key and returns
+            whether to load it, only supported for file saved in mmap format or sharded. Tensors of other keys are not read,
+            and shards without required keys are skipped. Default None, which means loading all keys.
+            (6) num_threads(int): The thread number to load shards in parallel. Default 8.
 
     Returns:
         Object(Object): a target object can be used in paddle
@@ -1048,13 +1448,67 @@ def load(path, **configs):
             # load state_dict
             dict_load = paddle.load(byio)
 
+        .. code-block:: python
+            :name: code-example-6
+
+            # example 6: load state_dict in mmap format without copying
+            import paddle
+
+            linear = paddle.nn.Linear(5, 10)
+            paddle.save(
+                linear.state_dict(), "linear.pdparams", use_mmap_format=True
+            )
+            state_dict = paddle.load("linear.pdparams", mmap=True)
+            linear.set_state_dict(state_dict)
+
+        .. code-block:: python
+            :name: code-example-7
+
+            # example 7: save and load sharded state_dict in parallel
+            import paddle
+
+            linear = paddle.nn.Linear(5, 10)
+            # each shard holds at most 128 bytes of tensors
+            paddle.save(linear.state_dict(), "linear.pdparams", max_shard_size=128)
+            # load weight only
+            state_dict = paddle.load(
+                "linear.pdparams", key_filter=lambda key: key.endswith('weight')
+            )
+
     '''
 
     if _is_memory_buffer(path) or os.path.isfile(path):
         config = _parse_load_config(configs)
         exception_type = pickle.UnpicklingError
+        if not isinstance(config.mmap, bool):
+            raise TypeError(
+                "Type of `mmap` should be bool, but received {}.".format(
+                    type(config.mmap)
+                )
+            )
+        if config.mmap and not _is_file_path(path):
+            raise ValueError(
+                "`mmap` is only supported when loading from file, but "
+                "received {}.".format(type(path))
+            )
         try:
             with _open_file_buffer(path, 'rb') as f:
+                if _is_sharded_index(f):
+                    return _sharded_load(path, f, config)
+                if _is_mmap_format(f):
+                    return _mmap_load(f, config)
+                if config.mmap:
+                    raise ValueError(
+                        "`mmap` is only supported for file saved by "
+                        "`paddle.save` with `use_mmap_format=True`, but "
+                        "{} is not.".format(path)
+                    )
+                if config.key_filter is not None:
+                    raise ValueError(
+                        "`key_filter` is only supported for file saved by "
+                        "`paddle.save` with `use_mmap_format=True` or "
+                        "`max_shard_size`, but {} is not.".format(path)
+                    )
                 # When value of dict is lager than 4GB ,there is a Bug on 'MAC python3'
                 if (
                     _is_file_path(path)
@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import numbers
 import os
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -547,6 +549,77 @@ class ProgBarLogger(Callback):
             print('Predict samples: %d' % (self.tested_samples))
 
 
+class _AsyncCheckpointSaver:
+    """
+    Save checkpoints of paddle.Model in a background thread.
+
+    States of model are copied to CPU on the calling thread, which is the
+    only blocking part, and then written by the background thread into
+    temporary files, which are renamed to the target path atomically
+    after written. At most :attr:`max_in_flight` checkpoints are pending
+    in saving, saving a new one waits for the oldest to finish if the
+    limit is reached.
+
+    Args:
+        max_in_flight(int): max number of checkpoints pending in saving.
+    """
+
+    def __init__(self, max_in_flight=1):
+        assert max_in_flight > 0, "max_in_flight should be a positive value"
+        self.max_in_flight = max_in_flight
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._futures = collections.deque()
+
+    @staticmethod
+    def _snapshot(state):
+        def _copy(value):
+            if isinstance(value, paddle.Tensor):
+                # NOTE: blocking copy, so the snapshot is consistent even
+                # if the tensor is updated in place by following steps
+                copied = value._copy_to(paddle.CPUPlace(), True)
+                copied.name = value.name
+                return copied
+            return value
+
+        return paddle.utils.map_structure(_copy, state)
+
+    @staticmethod
+    def _write(states, callback):
+        for path, state in states:
+            tmp_path = path + '.tmp'
+            paddle.save(state, tmp_path)
+            os.replace(tmp_path, path)
+        if callback is not None:
+            callback()
+
+    def save(self, model, path, callback=None):
+        """
+        Save states of :attr:`model` to files with prefix :attr:`path`
+        asynchronously, the same files as :code:`paddle.Model.save` are
+        written, and :attr:`callback` is called after all files written.
+        """
+        while len(self._futures) >= self.max_in_flight:
+            # raise the exception of saving if any
+            self._futures.popleft().result()
+
+        states = [
+            (p, self._snapshot(state))
+            for p, state in model._adapter._checkpoint_states(path)
+        ]
+
+        dirname = os.path.dirname(path)
+        if dirname and not os.path.exists(dirname):
+            os.makedirs(dirname, exist_ok=True)
+        self._futures.append(
+            self._executor.submit(self._write, states, callback)
+        )
+
+    def wait(self):
+        """Wait for all pending checkpoints saved."""
+        while self._futures:
+            self._futures.popleft().result()
+
+
 class ModelCheckpoint(Callback):
     """
     Model checkpoint callback function to save model weights and optimizer
@@ -558,6 +631,18 @@ class ModelCheckpoint(Callback):
             are saved. Default: 1.
         save_dir(str|None): The directory to save checkpoint during training.
             If None, will not save checkpoint. Default: None.
+        async_save(bool, optional): Whether to save checkpoint asynchronously.
+            If True, training only blocks for copying model states to CPU,
+            and states are written to files by a background thread, each file
+            is written to a temporary file and renamed after written, so an
+            incomplete checkpoint is never left with the final name. Only
+            supported in dynamic graph mode. Default: False.
+        max_in_flight(int, optional): The max number of checkpoints pending in
+            saving when :attr:`async_save` is True, training blocks until
+            the oldest one saved if the number is reached. Default: 1.
+        keep_last(int|None, optional): The number of latest epoch checkpoints
+            to keep, older ones are removed after a new one saved, the final
+            checkpoint is never removed. If None, keep all. Default: None.
 
     Examples:
         .. code-block:: python
@@ -587,11 +672,32 @@ class ModelCheckpoint(Callback):
 
             callback = paddle.callbacks.ModelCheckpoint(save_dir='./temp')
             model.fit(train_dataset, batch_size=64, callbacks=callback)
+
+            # save asynchronously and keep the latest 2 checkpoints
+            callback = paddle.callbacks.ModelCheckpoint(
+                save_dir='./temp', async_save=True, keep_last=2)
+            model.fit(train_dataset, batch_size=64, callbacks=callback)
     """
 
-    def __init__(self, save_freq=1, save_dir=None):
+    def __init__(
+        self,
+        save_freq=1,
+        save_dir=None,
+        async_save=False,
+        max_in_flight=1,
+        keep_last=None,
+    ):
         self.save_freq = save_freq
         self.save_dir = save_dir
+        self.async_save = async_save
+        self.max_in_flight = max_in_flight
+        assert keep_last is None or (
+            isinstance(keep_last, int) and keep_last > 0
+        ), "keep_last should be None or a positive integer"
+        self.keep_last = keep_last
+        # checkpoint path prefixes saved in order, for keep_last
+        self._saved_paths = collections.deque()
+        self._saver = None
 
     def on_epoch_begin(self, epoch=None, logs=None):
         self.epoch = epoch
@@ -603,17 +709,46 @@ class ModelCheckpoint(Callback):
             and paddle.distributed.ParallelEnv().local_rank == 0
         )
 
+    def _remove_checkpoint(self, path):
+        for suffix in ['.pdparams', '.pdopt', '.pdscaler']:
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+    def _on_saved(self, path):
+        if self.keep_last is None or os.path.basename(path) == 'final':
+            return
+        self._saved_paths.append(path)
+        while len(self._saved_paths) > self.keep_last:
+            self._remove_checkpoint(self._saved_paths.popleft())
+
+    def _save(self, path):
+        print(f'save checkpoint at {os.path.abspath(path)}')
+        if self.async_save and paddle.in_dynamic_mode():
+            if self._saver is None:
+                self._saver = _AsyncCheckpointSaver(self.max_in_flight)
+            self._saver.save(
+                self.model, path, callback=lambda: self._on_saved(path)
+            )
+        else:
+            if self.async_save:
+                warnings.warn(
+                    "async_save is only supported in dynamic graph mode, "
+                    "checkpoint will be saved synchronously."
+                )
+            self.model.save(path)
+            self._on_saved(path)
+
     def on_epoch_end(self, epoch, logs=None):
         if self._is_save() and self.epoch % self.save_freq == 0:
             path = f'{self.save_dir}/{epoch}'
-            print(f'save checkpoint at {os.path.abspath(path)}')
-            self.model.save(path)
+            self._save(path)
 
     def on_train_end(self, logs=None):
         if self._is_save():
             path = f'{self.save_dir}/final'
-            print(f'save checkpoint at {os.path.abspath(path)}')
-            self.model.save(path)
+            self._save(path)
+        if self._saver is not None:
+            self._saver.wait()
 
 
 class LRScheduler(Callback):
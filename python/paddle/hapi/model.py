@@ -40,6 +40,10 @@ from paddle.io import DataLoader, Dataset, DistributedBatchSampler
 from paddle.jit.translated_layer import INFER_MODEL_SUFFIX, INFER_PARAMS_SUFFIX
 from paddle.metric import Metric
 from paddle.static import InputSpec as Input
+from paddle.static.amp.amp_nn import (
+    check_finite_and_unscale,
+    update_loss_scaling,
+)
 
 from .callbacks import EarlyStopping, config_callbacks
 from .model_summary import summary
@@ -773,6 +777,88 @@ class StaticGraphAdapter:
         self._compiled_progs[mode] = compiled_prog
 
 
+def _forward_and_loss(network, loss_fn, inputs, labels):
+    outputs = network(*inputs)
+    losses = loss_fn(*(to_list(outputs) + labels))
+    return outputs, losses
+
+
+def _train_step(
+    network,
+    loss_fn,
+    optimizer,
+    inputs,
+    labels,
+    update,
+    accumulated_grads=None,
+    loss_scaling=None,
+    scaling_configs=None,
+):
+    """
+    Train step compiled by `paddle.jit.to_static`, one program is traced for
+    each `update` flag. If update is False, only backward is run and the
+    gradients summed with accumulated_grads are returned, which are passed
+    back as accumulated_grads of the next step. loss_scaling is the list of
+    scale, good steps and bad steps of GradScaler, and scaling_configs is
+    the tuple of its incr_every_n_steps, decr_every_n_nan_or_inf, incr_ratio,
+    decr_ratio and use_dynamic_loss_scaling.
+    """
+    outputs, losses = _forward_and_loss(network, loss_fn, inputs, labels)
+    final_loss = paddle.add_n(to_list(losses))
+    if loss_scaling is not None:
+        final_loss = final_loss * loss_scaling[0]
+    final_loss.backward()
+
+    # NOTE: parameters and gradients in the program are collected the same
+    # way as `Optimizer._declarative_step`
+    names = {p.name for p in optimizer._parameter_list}
+    params = [
+        p
+        for p in paddle.static.default_main_program()
+        .global_block()
+        .all_parameters()
+        if p.name in names and p.trainable and hasattr(p, 'grad')
+    ]
+    params = sorted(params, key=lambda p: p.name)
+    if accumulated_grads is None:
+        grads = [paddle.assign(p.grad) for p in params]
+    else:
+        grads = [p.grad + g for p, g in zip(params, accumulated_grads)]
+    if not update:
+        return outputs, losses, grads, None
+
+    if loss_scaling is not None:
+        # gradients are set to zero when any of them is infinite, the same
+        # as `paddle.static.amp.decorate`
+        scale, good_steps, bad_steps = loss_scaling
+        (
+            incr_every_n_steps,
+            decr_every_n_nan_or_inf,
+            incr_ratio,
+            decr_ratio,
+            use_dynamic_loss_scaling,
+        ) = scaling_configs
+        grads, found_inf = check_finite_and_unscale(grads, scale)
+        update_loss_scaling(
+            grads,
+            found_inf,
+            scale,
+            good_steps,
+            bad_steps,
+            incr_every_n_steps,
+            decr_every_n_nan_or_inf,
+            incr_ratio,
+            decr_ratio,
+            stop_update=not use_dynamic_loss_scaling,
+        )
+        loss_scaling = [paddle.assign(v) for v in loss_scaling]
+    for p, g in zip(params, grads):
+        p.grad = g
+    optimizer.step()
+    optimizer.clear_grad()
+    return outputs, losses, None, loss_scaling
+
+
 class DynamicGraphAdapter:
     def __init__(self, model):
         super().__init__()
@@ -792,6 +878,15 @@ class DynamicGraphAdapter:
         self._amp_custom_lists = {}
         self._use_fp16_guard = True
 
+        # train step compiled by `paddle.jit.to_static`, see `prepare`
+        self._to_static = False
+        self._static_forward = None
+        self._static_train_step = None
+        # gradients of the micro-batches and good and bad steps of
+        # GradScaler, which are kept between calls of `_static_train_step`
+        self._accumulated_grads = None
+        self._loss_scaling_steps = None
+
         if self._nranks > 1:
             dist.init_parallel_env()
             stradegy = paddle.distributed.parallel.ParallelStrategy()
@@ -815,6 +910,23 @@ class DynamicGraphAdapter:
 
     # TODO multi device in dygraph mode not implemented at present time
     def train_batch(self, inputs, labels=None, update=True):
+        losses, metric_outs = self._train_batch(inputs, labels, update)
+
+        metrics = []
+        for metric, outs in zip(self.model._metrics, metric_outs):
+            m = metric.update(*[to_numpy(m) for m in outs])
+            metrics.append(m)
+
+        return (
+            ([to_numpy(l) for l in losses], metrics)
+            if len(metrics) > 0
+            else [to_numpy(l) for l in losses]
+        )
+
+    def _train_batch(self, inputs, labels=None, update=True):
+        # NOTE: losses and outputs of metric.compute are returned as
+        # Tensors without copying to host, so the caller can decide when
+        # to synchronize with the device
         assert (
             self.model._optimizer
         ), "model not ready, please call `model.prepare()` first"
@@ -829,43 +941,90 @@ class DynamicGraphAdapter:
         if self._amp_level != "O0" and self.model._scaler is None:
             self.model._scaler = paddle.amp.GradScaler(**self._amp_configs)
 
-        with paddle.amp.auto_cast(
-            enable=self._amp_level != 'O0',
-            **self._amp_custom_lists,
-            level=self._amp_level,
-        ):
-            if self._nranks > 1:
-                outputs = self.ddp_model(*[to_variable(x) for x in inputs])
-            else:
-                outputs = self.model.network(*[to_variable(x) for x in inputs])
-
-        losses = self.model._loss(*(to_list(outputs) + labels))
-        losses = to_list(losses)
-        final_loss = paddle.add_n(losses)
-
-        if self._amp_level != "O0":
-            scaled = self.model._scaler.scale(final_loss)
-            scaled.backward()
-            if update:
-                self.model._scaler.minimize(self.model._optimizer, scaled)
-                self.model.network.clear_gradients()
+        inputs = [to_variable(x) for x in inputs]
+        if self._static_train_step is not None:
+            loss_scaling, scaling_configs = None, None
+            scaler = self.model._scaler
+            if scaler is not None and scaler.is_enable():
+                if self._loss_scaling_steps is None:
+                    self._loss_scaling_steps = [
+                        paddle.to_tensor([scaler._incr_count], dtype='int32'),
+                        paddle.to_tensor([scaler._decr_count], dtype='int32'),
+                    ]
+                loss_scaling = [scaler._scale] + self._loss_scaling_steps
+                scaling_configs = (
+                    scaler.get_incr_every_n_steps(),
+                    scaler.get_decr_every_n_nan_or_inf(),
+                    scaler.get_incr_ratio(),
+                    scaler.get_decr_ratio(),
+                    scaler.is_use_dynamic_loss_scaling(),
+                )
+            # forward, loss, backward and optimizer update in one program
+            with paddle.amp.auto_cast(
+                enable=self._amp_level != 'O0',
+                **self._amp_custom_lists,
+                level=self._amp_level,
+            ):
+                (
+                    outputs,
+                    losses,
+                    self._accumulated_grads,
+                    loss_scaling,
+                ) = self._static_train_step(
+                    self.model.network,
+                    self.model._loss,
+                    self.model._optimizer,
+                    inputs,
+                    labels,
+                    update,
+                    self._accumulated_grads,
+                    loss_scaling,
+                    scaling_configs,
+                )
+            if update and loss_scaling is not None:
+                scaler._scale = loss_scaling[0]
+                self._loss_scaling_steps = loss_scaling[1:]
+            losses = to_list(losses)
         else:
-            final_loss.backward()
-            if update:
-                self.model._optimizer.minimize(final_loss)
-                self.model.network.clear_gradients()
+            with paddle.amp.auto_cast(
+                enable=self._amp_level != 'O0',
+                **self._amp_custom_lists,
+                level=self._amp_level,
+            ):
+                if self._nranks > 1:
+                    outputs = self.ddp_model(*inputs)
+                elif self._static_forward is not None:
+                    outputs, losses = self._static_forward(
+                        self.model.network, self.model._loss, inputs, labels
+                    )
+                else:
+                    outputs = self.model.network(*inputs)
 
-        metrics = []
+            if self._static_forward is None:
+                losses = self.model._loss(*(to_list(outputs) + labels))
+            losses = to_list(losses)
+            final_loss = paddle.add_n(losses)
+
+            # backward of the compiled forward runs as one op, and gradients
+            # are accumulated to parameters
+            if self._amp_level != "O0":
+                scaled = self.model._scaler.scale(final_loss)
+                scaled.backward()
+                if update:
+                    self.model._scaler.minimize(self.model._optimizer, scaled)
+                    self.model.network.clear_gradients()
+            else:
+                final_loss.backward()
+                if update:
+                    self.model._optimizer.minimize(final_loss)
+                    self.model.network.clear_gradients()
+
+        metric_outs = []
         for metric in self.model._metrics:
-            metric_outs = metric.compute(*(to_list(outputs) + labels))
-            m = metric.update(*[to_numpy(m) for m in to_list(metric_outs)])
-            metrics.append(m)
+            outs = metric.compute(*(to_list(outputs) + labels))
+            metric_outs.append(to_list(outs))
 
-        return (
-            ([to_numpy(l) for l in losses], metrics)
-            if len(metrics) > 0
-            else [to_numpy(l) for l in losses]
-        )
+        return [l.detach() for l in losses], metric_outs
 
     def eval_batch(self, inputs, labels=None):
         self.model.network.eval()
@@ -943,17 +1102,28 @@ class DynamicGraphAdapter:
     def parameters(self, *args, **kwargs):
         return self.model.network.parameters(*args, **kwargs)
 
-    def save(self, path):
-        params = self.model.network.state_dict()
-        paddle.save(params, path + '.pdparams')
+    def _checkpoint_states(self, path):
+        # (file path, state dict) of each file in the checkpoint with prefix
+        # path, which is also used by the async saver of ModelCheckpoint
+        states = [(path + '.pdparams', self.model.network.state_dict())]
         if self.model._optimizer is not None:
             if self.model._optimizer.state_dict():
                 optim = self.model._optimizer.state_dict()
-                paddle.save(optim, path + '.pdopt')
+                states.append((path + '.pdopt', optim))
         if hasattr(self.model, '_scaler') and self.model._scaler is not None:
+            if self._loss_scaling_steps is not None:
+                # good and bad steps updated by the compiled train step
+                good_steps, bad_steps = self._loss_scaling_steps
+                self.model._scaler._incr_count = int(good_steps)
+                self.model._scaler._decr_count = int(bad_steps)
             if self.model._scaler.state_dict():
                 scaler = self.model._scaler.state_dict()
-                paddle.save(scaler, path + '.pdscaler')
+                states.append((path + '.pdscaler', scaler))
+        return states
+
+    def save(self, path):
+        for file_path, state in self._checkpoint_states(path):
+            paddle.save(state, file_path)
 
     def load(self, param_state_pairs, optim_state, scaler_state=None):
         # restore parameter states
@@ -963,6 +1133,7 @@ class DynamicGraphAdapter:
         if hasattr(self.model, '_scaler') and self.model._scaler is not None:
             if scaler_state:
                 self.model._scaler.load_state_dict(scaler_state)
+                self._loss_scaling_steps = None
 
         # resotre optimizer states
         if not self.model._optimizer or not optim_state:
@@ -1046,6 +1217,19 @@ class DynamicGraphAdapter:
         if self._amp_level != "O0":
             self.model._scaler = None
 
+        self._static_forward = None
+        self._static_train_step = None
+        self._accumulated_grads = None
+        self._loss_scaling_steps = None
+        if self._to_static and self._nranks == 1:
+            # NOTE: optimizers with parameter groups can not be used in the
+            # compiled program, which only computes the forward and loss
+            parameters = getattr(self.model._optimizer, '_parameter_list', None)
+            if parameters and not isinstance(parameters[0], dict):
+                self._static_train_step = paddle.jit.to_static(_train_step)
+            else:
+                self._static_forward = paddle.jit.to_static(_forward_and_loss)
+
 
 class Model:
     """
@@ -1170,6 +1354,7 @@ class Model:
         self._is_shape_inferred = False
         self._test_dataloader = None
         self.stop_training = False
+        self._log_sync_interval = 1
 
         if not in_dynamic_mode():
             if not isinstance(inputs, (list, tuple, dict, Input)):
@@ -1659,7 +1844,12 @@ class Model:
             self._adapter._amp_configs[key] = amp_configs[key]
 
     def prepare(
-        self, optimizer=None, loss=None, metrics=None, amp_configs=None
+        self,
+        optimizer=None,
+        loss=None,
+        metrics=None,
+        amp_configs=None,
+        to_static=False,
     ):
         """
 
@@ -1691,6 +1881,17 @@ class Model:
                 for details. For convenience, 'amp_configs' could be set to
                 'O1' or 'O2' if no more parameters are needed. 'amp_configs'
                 could be None in float32 training. Default: None.
+            to_static (bool, optional): Whether to compile the train step with
+                `paddle.jit.to_static` in dynamic graph mode. The forward,
+                loss, backward and optimizer update are traced once and later
+                steps run as one program, which removes the Python overhead
+                of small models. With gradient accumulation, micro-batches
+                only run backward, and the loss scaling of AMP is also done
+                in the program. With an optimizer with parameter groups,
+                only the forward and loss are compiled. Nothing is compiled
+                in distributed training.
+                The network should be convertible by `paddle.jit.to_static`.
+                It is ignored in static graph mode. Default: False.
 
         Returns:
             None
@@ -1736,6 +1937,8 @@ class Model:
         self._metrics = to_list(metrics)
         self._prepare_amp(amp_configs)
 
+        if in_dynamic_mode():
+            self._adapter._to_static = to_static
         self._adapter.prepare()
 
     def fit(
@@ -1755,6 +1958,7 @@ class Model:
         callbacks=None,
         accumulate_grad_batches=1,
         num_iters=None,
+        log_sync_interval=1,
     ):
         """
 
@@ -1803,6 +2007,13 @@ class Model:
             num_iters (int|None, optional): The number of iterations to evaluate the model.
                 If None, evaluate on whole input dataset, otherwise, evaluate `num_iters` times.
                 Default: None.
+            log_sync_interval (int, optional): The interval, in number of steps, to copy
+                losses and metric results from device to host for logging. Between two
+                synchronizations, losses and metric inputs are kept on device, so training
+                steps are not blocked by device synchronization, and the logs passed to
+                callbacks keep the values of the last synchronized step. Values are always
+                synchronized at the last step of each epoch. Only takes effect in dynamic
+                graph mode. Default: 1, which means synchronizing at every step.
 
         Returns:
             None
@@ -1940,6 +2151,10 @@ class Model:
         self._test_dataloader = eval_loader
 
         self._accumulate = accumulate_grad_batches
+        assert (
+            isinstance(log_sync_interval, int) and log_sync_interval > 0
+        ), "log_sync_interval should be a positive integer"
+        self._log_sync_interval = log_sync_interval
 
         steps = self._len_data_loader(train_loader)
         self.num_iters = num_iters
@@ -1988,6 +2203,7 @@ class Model:
 
         cbks.on_end('train', logs)
         self._test_dataloader = None
+        self._log_sync_interval = 1
 
     def evaluate(
         self,
@@ -2290,6 +2506,18 @@ class Model:
         logs={},
     ):
         outputs = []
+        # losses of the last step and metric inputs of steps not
+        # synchronized to host, see log_sync_interval of fit
+        deferred = (
+            mode == 'train'
+            and self._log_sync_interval > 1
+            and in_dynamic_mode()
+        )
+        pending_losses = None
+        pending_metric_outs = []
+        # NOTE: data_loader may have no length, e.g. with IterableDataset,
+        # then the last steps are synchronized after the loop
+        steps = self._len_data_loader(data_loader) if deferred else None
         for step, data in enumerate(data_loader):
             # data might come from different types of data_loader and have
             # different format, as following:
@@ -2322,23 +2550,38 @@ class Model:
                         or step + 1 == len(data_loader)
                     )
 
-                outs = getattr(self, mode + '_batch')(*_inputs)
-
-                if self._metrics and self._loss:
-                    metrics = [[float(l) for l in outs[0]]]
-                elif self._loss:
-                    metrics = [[float(l) for l in outs]]
+                if deferred:
+                    pending_losses, metric_outs = self._adapter._train_batch(
+                        *_inputs
+                    )
+                    if self._input_info is None:
+                        self._update_inputs()
+                    pending_metric_outs.append(metric_outs)
+                    if (step + 1) % self._log_sync_interval == 0 or (
+                        step + 1 == steps
+                    ):
+                        self._sync_deferred_logs(
+                            logs, pending_losses, pending_metric_outs
+                        )
+                        pending_losses = None
                 else:
-                    metrics = []
+                    outs = getattr(self, mode + '_batch')(*_inputs)
+
+                    if self._metrics and self._loss:
+                        metrics = [[float(l) for l in outs[0]]]
+                    elif self._loss:
+                        metrics = [[float(l) for l in outs]]
+                    else:
+                        metrics = []
 
-                # metrics
-                for metric in self._metrics:
-                    res = metric.accumulate()
-                    metrics.extend(to_list(res))
+                    # metrics
+                    for metric in self._metrics:
+                        res = metric.accumulate()
+                        metrics.extend(to_list(res))
 
-                assert len(self._metrics_name()) == len(metrics)
-                for k, v in zip(self._metrics_name(), metrics):
-                    logs[k] = v
+                    assert len(self._metrics_name()) == len(metrics)
+                    for k, v in zip(self._metrics_name(), metrics):
+                        logs[k] = v
             else:
                 if self._inputs is not None:
                     outs = self.predict_batch(data[: len(self._inputs)])
@@ -2365,12 +2608,30 @@ class Model:
                     self.stop_training = True
                     del self.num_iters
                     break
+        if pending_losses is not None:
+            self._sync_deferred_logs(logs, pending_losses, pending_metric_outs)
         self._reset_metrics()
 
         if mode == 'predict':
             return logs, outputs
         return logs
 
+    def _sync_deferred_logs(self, logs, losses, pending_metric_outs):
+        # NOTE: metrics are updated in order of steps, so the accumulated
+        # results are the same as updating at every step
+        for metric_outs in pending_metric_outs:
+            for metric, outs in zip(self._metrics, metric_outs):
+                metric.update(*[to_numpy(m) for m in outs])
+        pending_metric_outs.clear()
+
+        metrics = [[float(l) for l in losses]] if self._loss else []
+        for metric in self._metrics:
+            metrics.extend(to_list(metric.accumulate()))
+
+        assert len(self._metrics_name()) == len(metrics)
+        for k, v in zip(self._metrics_name(), metrics):
+            logs[k] = v
+
     def summary(self, input_size=None, dtype=None):
         """Prints a string summary of the network.
 
@@ -44,6 +44,10 @@ def set_config(config=None):
     the origin dataloader setting. Tuning parameters are as follows:
 
     - enable(bool): Whether to enable dataloader tuning.
+    - online(bool): Whether to tune num_workers, prefetch_factor and pin_memory
+      at the beginning of each epoch by the ratio of time waiting for data in
+      the last epoch, instead of tuning num_workers once on a subset of dataset
+      when the DataLoader is created. Default: False.
 
     Args:
         config (dict|str|None, optional): Configuration for auto-tuning. If it is a
@@ -145,14 +149,25 @@ def set_config(config=None):
                     "The auto-tuning configuration of the dataloader is incorrect."
                     "The `enable` should be bool. Use default parameter instead."
                 )
+        online = False
+        if "online" in dataloader_config:
+            if isinstance(dataloader_config['online'], bool):
+                online = dataloader_config['online']
+            else:
+                warnings.warn(
+                    "The auto-tuning configuration of the dataloader is incorrect."
+                    "The `online` should be bool. Use default parameter instead."
+                )
         if "tuning_steps" in dataloader_config:
             if isinstance(dataloader_config['tuning_steps'], int):
                 paddle.io.reader.set_autotune_config(
-                    use_autoune, dataloader_config['tuning_steps']
+                    use_autoune, dataloader_config['tuning_steps'], online
                 )
             else:
                 warnings.warn(
                     "The auto-tuning configuration of the dataloader is incorrect."
                     "The `tuning_steps` should be int. Use default parameter instead."
                 )
-                paddle.io.reader.set_autotune_config(use_autoune)
+                paddle.io.reader.set_autotune_config(use_autoune, online=online)
+        elif online:
+            paddle.io.reader.set_autotune_config(use_autoune, online=online)
@@ -19,9 +19,11 @@ from .dataset import ComposeDataset
 from .dataset import ChainDataset
 from .dataset import random_split
 from .dataset import Subset
+from .record_dataset import RecordDataset
 
 from .batch_sampler import BatchSampler
 from .batch_sampler import DistributedBatchSampler
+from .batch_sampler import BucketBatchSampler
 
 from .worker import get_worker_info
 
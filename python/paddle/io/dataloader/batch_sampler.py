@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
 import math
 
 import numpy as np
@@ -141,14 +142,46 @@ class BatchSampler(Sampler):
         )
         self.drop_last = drop_last
 
+        # batch number skipped on resuming and yielded in current
+        # iteration, see state_dict
+        self._num_skipped_batches = 0
+        self._num_batches = 0
+        self._resume_state = None
+
     def __iter__(self):
+        # NOTE: resume state is applied eagerly when the iterator is
+        # created instead of on the first batch drawing, so DataLoader
+        # iterator can get the skipped batch number on initialization
+        resume_state, self._resume_state = self._resume_state, None
+        num_skip = resume_state['num_batches'] if resume_state else 0
+        self._num_skipped_batches = num_skip
+        self._num_batches = num_skip
+
+        num_skip_samples = num_skip * self.batch_size
+        sampler_state = resume_state['sampler'] if resume_state else None
+        if sampler_state is not None and hasattr(
+            self.sampler, 'set_state_dict'
+        ):
+            sampler_state = dict(sampler_state, num_yielded=num_skip_samples)
+            self.sampler.set_state_dict(sampler_state)
+            sampler_iter = iter(self.sampler)
+        else:
+            # only indices are skipped, samples will not be read
+            sampler_iter = itertools.islice(
+                iter(self.sampler), num_skip_samples, None
+            )
+        return self._batch_indices_iter(sampler_iter)
+
+    def _batch_indices_iter(self, sampler_iter):
         batch_indices = []
-        for idx in self.sampler:
+        for idx in sampler_iter:
             batch_indices.append(idx)
             if len(batch_indices) == self.batch_size:
+                self._num_batches += 1
                 yield batch_indices
                 batch_indices = []
         if not self.drop_last and len(batch_indices) > 0:
+            self._num_batches += 1
             yield batch_indices
 
     def __len__(self):
@@ -156,6 +189,63 @@ class BatchSampler(Sampler):
         num_samples += int(not self.drop_last) * (self.batch_size - 1)
         return num_samples // self.batch_size
 
+    def state_dict(self):
+        """
+        Get the state of current iteration, which can be used to resume the
+        iteration by :code:`set_state_dict`.
+
+        .. note::
+            Batches are drawn ahead by :code:`paddle.io.DataLoader` for
+            prefetching, to resume from the last batch consumed by training,
+            please use :code:`paddle.io.DataLoader.state_dict` instead.
+
+        Returns:
+            dict: state with following keys:
+
+            - sampler: state of :attr:`sampler` if it supports
+              :code:`state_dict`, otherwise None.
+            - num_batches: batch number yielded in current iteration.
+
+        Examples:
+
+            .. code-block:: python
+
+                from paddle.io import BatchSampler
+
+                bs = BatchSampler(
+                    dataset=list(range(100)), shuffle=True, batch_size=8
+                )
+                bs_iter = iter(bs)
+                for _ in range(3):
+                    next(bs_iter)
+                state = bs.state_dict()
+
+                bs.set_state_dict(state)
+                # yield the last 10 batches of the same shuffled order
+                for batch_indices in bs:
+                    print(batch_indices)
+        """
+        if self._resume_state is not None:
+            return dict(self._resume_state)
+        sampler_state = None
+        if hasattr(self.sampler, 'state_dict'):
+            sampler_state = self.sampler.state_dict()
+        return {'sampler': sampler_state, 'num_batches': self._num_batches}
+
+    def set_state_dict(self, state_dict):
+        """
+        Set the state got by :code:`state_dict`, the next iteration will
+        skip the batches yielded before without reading the samples.
+
+        Args:
+            state_dict(dict): state got by :code:`state_dict`.
+        """
+        self._resume_state = {
+            'sampler': state_dict.get('sampler', None),
+            'num_batches': state_dict.get('num_batches', 0),
+        }
+        self._num_skipped_batches = self._resume_state['num_batches']
+
 
 class _InfiniteIterableSampler:
     def __init__(self, dataset, batch_size=1):
@@ -272,7 +362,26 @@ class DistributedBatchSampler(BatchSampler):
         self.num_samples = int(math.ceil(len(self.dataset) * 1.0 / self.nranks))
         self.total_size = self.num_samples * self.nranks
 
+        # epoch of current iteration, batch number skipped on resuming
+        # and yielded in current iteration, see state_dict
+        self._iter_epoch = self.epoch
+        self._num_skipped_batches = 0
+        self._num_batches = 0
+        self._resume_state = None
+
     def __iter__(self):
+        # NOTE: resume state is applied eagerly, see BatchSampler.__iter__
+        resume_state, self._resume_state = self._resume_state, None
+        num_skip = 0
+        if resume_state is not None:
+            self.epoch = resume_state['epoch']
+            num_skip = resume_state['num_batches']
+        self._iter_epoch = self.epoch
+        self._num_skipped_batches = num_skip
+        self._num_batches = num_skip
+        return self._batch_indices_iter(num_skip)
+
+    def _batch_indices_iter(self, num_skip):
         num_samples = len(self.dataset)
         indices = np.arange(num_samples).tolist()
         indices += indices[: (self.total_size - len(indices))]
@@ -309,15 +418,18 @@ class DistributedBatchSampler(BatchSampler):
             indices = _get_indices_by_batch_size(indices)
 
         assert len(indices) == self.num_samples
-        _sample_iter = iter(indices)
+        # only indices are skipped, samples will not be read
+        _sample_iter = iter(indices[num_skip * self.batch_size :])
 
         batch_indices = []
         for idx in _sample_iter:
             batch_indices.append(idx)
             if len(batch_indices) == self.batch_size:
+                self._num_batches += 1
                 yield batch_indices
                 batch_indices = []
         if not self.drop_last and len(batch_indices) > 0:
+            self._num_batches += 1
             yield batch_indices
 
     def __len__(self):
@@ -363,3 +475,325 @@ class DistributedBatchSampler(BatchSampler):
                     sampler.set_epoch(epoch)
         """
         self.epoch = epoch
+
+    def state_dict(self):
+        """
+        Get the state of current iteration, which can be used to resume the
+        iteration by :code:`set_state_dict`.
+
+        .. note::
+            Batches are drawn ahead by :code:`paddle.io.DataLoader` for
+            prefetching, to resume from the last batch consumed by training,
+            please use :code:`paddle.io.DataLoader.state_dict` instead.
+
+        Returns:
+            dict: state with following keys:
+
+            - epoch: epoch number of current iteration.
+            - num_batches: batch number yielded in current iteration.
+
+        Examples:
+            .. code-block:: python
+
+                from paddle.io import DistributedBatchSampler
+
+                sampler = DistributedBatchSampler(
+                    list(range(100)), batch_size=8, shuffle=True
+                )
+                sampler.set_epoch(3)
+                sampler_iter = iter(sampler)
+                for _ in range(2):
+                    next(sampler_iter)
+                state = sampler.state_dict()
+
+                sampler.set_state_dict(state)
+                # yield the remaining batches of epoch 3
+                for batch_indices in sampler:
+                    print(batch_indices)
+        """
+        if self._resume_state is not None:
+            return dict(self._resume_state)
+        return {'epoch': self._iter_epoch, 'num_batches': self._num_batches}
+
+    def set_state_dict(self, state_dict):
+        """
+        Set the state got by :code:`state_dict`, the next iteration will
+        use the epoch number in :attr:`state_dict` and skip the batches
+        yielded before without reading the samples.
+
+        Args:
+            state_dict(dict): state got by :code:`state_dict`.
+        """
+        self._resume_state = {
+            'epoch': state_dict.get('epoch', self.epoch),
+            'num_batches': state_dict.get('num_batches', 0),
+        }
+        self._num_skipped_batches = self._resume_state['num_batches']
+
+
+class BucketBatchSampler(BatchSampler):
+    """Sampler that groups samples of similar lengths into mini-batches.
+
+    For variable-length data (e.g. text or speech), samples in a
+    mini-batch are padded to the longest one. BucketBatchSampler splits
+    (shuffled) indices into mega-batches of :attr:`mega_batch_size`
+    samples, sorts the samples in each mega-batch by length and then
+    packs the sorted samples into mini-batches, so samples of similar
+    lengths are batched together and the padding is reduced.
+
+    A mini-batch is limited by :attr:`max_tokens`, the token number of
+    padded mini-batch (sample number multiplied by the max sample length
+    in it), and/or :attr:`batch_size`, the sample number in mini-batch.
+    A sample longer than :attr:`max_tokens` forms a mini-batch by itself.
+
+    In distributed training, each process gets exclusive mini-batches
+    and all processes get the same number of mini-batches.
+
+    .. note::
+        The mini-batch number may be different between epochs when
+        :attr:`shuffle` is True and :attr:`max_tokens` is set, as
+        mini-batches are packed after shuffling.
+
+    Args:
+        lengths(list|tuple|numpy.ndarray): the length of each sample in
+            dataset, sample number is the size of :attr:`lengths`.
+        max_tokens(int, optional): max token number of a padded
+            mini-batch. Default None, which means no token limit.
+        batch_size(int, optional): max sample number of a mini-batch.
+            Default None, which means no sample number limit. At least
+            one of :attr:`max_tokens` and :attr:`batch_size` should be set.
+        mega_batch_size(int, optional): sample number of the mega-batch
+            where samples are sorted by length, a larger value reduces
+            more padding but makes mini-batches less random. Default None,
+            which means sorting all samples.
+        num_replicas(int, optional): porcess number in distributed training.
+            If :attr:`num_replicas` is None, :attr:`num_replicas` will be
+            retrieved from :ref:`api_paddle_distributed_ParallelEnv` .
+            Default None.
+        rank(int, optional): the rank of the current process among :attr:`num_replicas`
+            processes. If :attr:`rank` is None, :attr:`rank` is retrieved from
+            :ref:`api_paddle_distributed_ParallelEnv`. Default None.
+        shuffle(bool, optional): whether to shuffle indices before splitting
+            mega-batches and shuffle the order of mini-batches. Default False.
+        drop_last(bool, optional): whether to drop the last mini-batches
+            which cannot be evenly distributed to all processes, if False,
+            some mini-batches are repeated to make all processes get the
+            same mini-batch number. Default False.
+
+    Returns:
+        BucketBatchSampler, return an iterable object for indices iterating.
+
+    Examples:
+        .. code-block:: python
+
+            import numpy as np
+
+            from paddle.io import BucketBatchSampler
+
+            lengths = np.random.randint(1, 100, size=[1000])
+            sampler = BucketBatchSampler(
+                lengths, max_tokens=1024, mega_batch_size=256, shuffle=True
+            )
+
+            for epoch in range(2):
+                sampler.set_epoch(epoch)
+                for batch_indices in sampler:
+                    # len(batch_indices) * max(lengths[batch_indices]) <= 1024
+                    pass
+    """
+
+    def __init__(
+        self,
+        lengths,
+        max_tokens=None,
+        batch_size=None,
+        mega_batch_size=None,
+        num_replicas=None,
+        rank=None,
+        shuffle=False,
+        drop_last=False,
+    ):
+        self.lengths = np.asarray(lengths, dtype='int64').reshape([-1])
+        assert self.lengths.size > 0, "lengths should not be empty"
+        assert (
+            max_tokens is not None or batch_size is not None
+        ), "at least one of max_tokens and batch_size should be set"
+        assert max_tokens is None or (
+            isinstance(max_tokens, int) and max_tokens > 0
+        ), "max_tokens should be a positive integer"
+        self.max_tokens = max_tokens
+        assert batch_size is None or (
+            isinstance(batch_size, int) and batch_size > 0
+        ), "batch_size should be a positive integer"
+        self.batch_size = batch_size
+        assert mega_batch_size is None or (
+            isinstance(mega_batch_size, int) and mega_batch_size > 0
+        ), "mega_batch_size should be a positive integer"
+        self.mega_batch_size = mega_batch_size
+        assert isinstance(shuffle, bool), "shuffle should be a boolean value"
+        self.shuffle = shuffle
+        assert isinstance(
+            drop_last, bool
+        ), "drop_last should be a boolean number"
+        self.drop_last = drop_last
+
+        from paddle.distributed import ParallelEnv
+
+        if num_replicas is not None:
+            assert (
+                isinstance(num_replicas, int) and num_replicas > 0
+            ), "num_replicas should be a positive integer"
+            self.nranks = num_replicas
+        else:
+            self.nranks = ParallelEnv().nranks
+
+        if rank is not None:
+            assert (
+                isinstance(rank, int) and rank >= 0
+            ), "rank should be a non-negative integer"
+            self.local_rank = rank
+        else:
+            self.local_rank = ParallelEnv().local_rank
+
+        self.epoch = 0
+        # cache of (epoch, local batches), batches are built once for
+        # each epoch as __len__ also needs them
+        self._batches_cache = None
+
+        # epoch of current iteration, batch number skipped on resuming
+        # and yielded in current iteration, see state_dict
+        self._iter_epoch = self.epoch
+        self._num_skipped_batches = 0
+        self._num_batches = 0
+        self._resume_state = None
+
+    def _pack_batches(self, indices):
+        # NOTE: indices are sorted by length, so the last sample of a
+        # mini-batch is the longest one and the token number of padded
+        # mini-batch is sample number multiplied by its length
+        lengths = self.lengths[indices]
+        batches = []
+        start = 0
+        num_samples = len(indices)
+        while start < num_samples:
+            end = num_samples
+            if self.batch_size is not None:
+                end = min(end, start + self.batch_size)
+            if self.max_tokens is not None:
+                # the largest end that (end - start) * lengths[end - 1]
+                # <= max_tokens, which is found by binary search as
+                # the padded token number increases with end
+                lo, hi = start + 1, end
+                while lo < hi:
+                    mid = (lo + hi + 1) // 2
+                    if (mid - start) * lengths[mid - 1] <= self.max_tokens:
+                        lo = mid
+                    else:
+                        hi = mid - 1
+                end = lo
+            batches.append(indices[start:end].tolist())
+            start = end
+        return batches
+
+    def _build_batches(self, epoch):
+        num_samples = self.lengths.size
+        if self.shuffle:
+            rng = np.random.RandomState(epoch)
+            indices = rng.permutation(num_samples)
+        else:
+            indices = np.arange(num_samples)
+
+        mega_batch_size = self.mega_batch_size or num_samples
+        batches = []
+        for start in range(0, num_samples, mega_batch_size):
+            mega_batch = indices[start : start + mega_batch_size]
+            # NOTE: use stable sort to make batches deterministic
+            order = np.argsort(self.lengths[mega_batch], kind='stable')
+            batches.extend(self._pack_batches(mega_batch[order]))
+
+        if self.shuffle:
+            batches = [batches[i] for i in rng.permutation(len(batches))]
+
+        # make all processes get the same mini-batch number
+        if self.drop_last:
+            total_size = len(batches) // self.nranks * self.nranks
+            batches = batches[:total_size]
+        else:
+            total_size = (
+                int(math.ceil(len(batches) * 1.0 / self.nranks)) * self.nranks
+            )
+            while len(batches) < total_size:
+                batches += batches[: (total_size - len(batches))]
+        assert len(batches) == total_size
+
+        return batches[self.local_rank : total_size : self.nranks]
+
+    def _local_batches(self, epoch):
+        if self._batches_cache is None or self._batches_cache[0] != epoch:
+            self._batches_cache = (epoch, self._build_batches(epoch))
+        return self._batches_cache[1]
+
+    def __iter__(self):
+        # NOTE: resume state is applied eagerly, see BatchSampler.__iter__
+        resume_state, self._resume_state = self._resume_state, None
+        num_skip = 0
+        if resume_state is not None:
+            self.epoch = resume_state['epoch']
+            num_skip = resume_state['num_batches']
+        self._iter_epoch = self.epoch
+        self._num_skipped_batches = num_skip
+        self._num_batches = num_skip
+        return self._batch_indices_iter(num_skip)
+
+    def _batch_indices_iter(self, num_skip):
+        batches = self._local_batches(self.epoch)
+        if self.shuffle:
+            self.epoch += 1
+        for batch_indices in batches[num_skip:]:
+            self._num_batches += 1
+            yield batch_indices
+
+    def __len__(self):
+        return len(self._local_batches(self.epoch))
+
+    def set_epoch(self, epoch):
+        """
+        Sets the epoch number. When :attr:`shuffle=True`, this number is used
+        as seeds of random numbers. See
+        :code:`paddle.io.DistributedBatchSampler.set_epoch` for details.
+
+        Arguments:
+            epoch (int): Epoch number.
+        """
+        self.epoch = epoch
+
+    def state_dict(self):
+        """
+        Get the state of current iteration, which can be used to resume the
+        iteration by :code:`set_state_dict`, see
+        :code:`paddle.io.DistributedBatchSampler.state_dict` for details.
+
+        Returns:
+            dict: state with following keys:
+
+            - epoch: epoch number of current iteration.
+            - num_batches: batch number yielded in current iteration.
+        """
+        if self._resume_state is not None:
+            return dict(self._resume_state)
+        return {'epoch': self._iter_epoch, 'num_batches': self._num_batches}
+
+    def set_state_dict(self, state_dict):
+        """
+        Set the state got by :code:`state_dict`, the next iteration will
+        use the epoch number in :attr:`state_dict` and skip the batches
+        yielded before without reading the samples.
+
+        Args:
+            state_dict(dict): state got by :code:`state_dict`.
+        """
+        self._resume_state = {
+            'epoch': state_dict.get('epoch', self.epoch),
+            'num_batches': state_dict.get('num_batches', 0),
+        }
+        self._num_skipped_batches = self._resume_state['num_batches']
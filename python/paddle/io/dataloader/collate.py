@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import numbers
+import operator
 from collections.abc import Mapping, Sequence
 
 import numpy as np
@@ -20,6 +21,7 @@ import numpy as np
 import paddle
 
 from ...framework import core
+from .flat import _flatten_batch, _restore_batch
 
 
 def default_collate_fn(batch):
@@ -109,3 +111,207 @@ def default_convert_fn(batch):
         return [default_convert_fn(d) for d in batch]
     else:
         return batch
+
+
+# field kinds in compiled collate plan
+_FIELD_NDARRAY = 0
+_FIELD_TENSOR = 1
+_FIELD_NUMBER = 2
+_FIELD_STRING = 3
+
+
+def _copy_structure(structure):
+    # NOTE: _restore_batch fills fields into structure inplace, structure
+    # only contains dict, list and str/bytes/number in compiled plan, so
+    # copy containers recursively here, which is much faster than deepcopy
+    if isinstance(structure, dict):
+        return {k: _copy_structure(v) for k, v in structure.items()}
+    elif isinstance(structure, list):
+        return [_copy_structure(v) for v in structure]
+    return structure
+
+
+def _make_getter(path):
+    getters = [operator.itemgetter(key) for key in path]
+    if len(getters) == 1:
+        return getters[0]
+
+    def getter(sample):
+        for get in getters:
+            sample = get(sample)
+        return sample
+
+    return getter
+
+
+class CompiledCollateFn:
+    """
+    Schema compiled batch collating function for :code:`paddle.io.DataLoader`.
+
+    :attr:`default_collate_fn` walks the nested sample structure for each
+    field of each batch and stacks each field by :code:`np.stack`. This
+    collate function infers the sample schema (nested structure, field
+    kinds, shapes and data types) from the first batch once, and compiles
+    it into a flat plan:
+
+    1. a getter which picks all fields of a sample into a flat tuple in one
+       call.
+    2. the structure of the sample flattened by :code:`_flatten_batch`,
+       which is used to restore the batch by :code:`_restore_batch`.
+
+    For following batches, fields of all samples are picked by the getter
+    and transposed in one pass, ndarray fields with same shape and data
+    type (and number fields with same type) are written into one output
+    array by a single numpy call. This is much faster than
+    :attr:`default_collate_fn` for samples with a large number of fields,
+    e.g. sparse features in recommendation tasks.
+
+    All samples are expected to share the schema of the first sample. If a
+    batch does not match the compiled schema, e.g. with different keys or
+    field shapes, it will be collated by :attr:`default_collate_fn`.
+
+    Returns:
+        Batched data: same as :attr:`default_collate_fn`.
+
+    Examples:
+
+        .. code-block:: python
+
+            import numpy as np
+            from paddle.io import DataLoader, Dataset
+            from paddle.io.dataloader.collate import CompiledCollateFn
+
+            class SparseDataset(Dataset):
+                def __getitem__(self, idx):
+                    sample = {
+                        'slot_{}'.format(i): np.array([idx + i]).astype('int64')
+                        for i in range(200)
+                    }
+                    sample['label'] = idx % 2
+                    return sample
+
+                def __len__(self):
+                    return 64
+
+            loader = DataLoader(
+                SparseDataset(), batch_size=16, collate_fn=CompiledCollateFn()
+            )
+            for data in loader:
+                print(data['slot_0'].shape, data['label'].shape)
+                # [16, 1] [16]
+    """
+
+    def __init__(self):
+        self._getter = None
+        self._containers = None
+        self._groups = None
+        self._num_fields = 0
+        self._structure = None
+
+    def _compile(self, sample):
+        fields = []
+        paths = []
+        containers = []
+
+        def _parse(field, path):
+            if isinstance(field, np.ndarray):
+                fields.append((_FIELD_NDARRAY, (field.shape, field.dtype)))
+            elif isinstance(field, (paddle.Tensor, core.eager.Tensor)):
+                fields.append((_FIELD_TENSOR, None))
+            elif isinstance(field, numbers.Number):
+                fields.append(
+                    (_FIELD_NUMBER, (type(field), np.array(field).dtype))
+                )
+            elif isinstance(field, (str, bytes)):
+                fields.append((_FIELD_STRING, None))
+            elif isinstance(field, Mapping):
+                containers.append((path, len(field)))
+                return {k: _parse(v, path + (k,)) for k, v in field.items()}
+            elif isinstance(field, Sequence):
+                containers.append((path, len(field)))
+                return [_parse(v, path + (i,)) for i, v in enumerate(field)]
+            else:
+                raise TypeError(
+                    "batch data con only contains: tensor, numpy.ndarray, "
+                    "dict, list, number, but got {}".format(type(field))
+                )
+            paths.append(path)
+            # placeholder to make each field flattened by _flatten_batch
+            return np.empty([0])
+
+        placeholder = _parse(sample, ())
+        _, structure = _flatten_batch(placeholder)
+
+        # NOTE: the getter picks all fields of a sample in one call, which
+        # is a single itemgetter if all fields are at the top level
+        if len(paths) > 1 and all(len(path) == 1 for path in paths):
+            getter = operator.itemgetter(*[path[0] for path in paths])
+        else:
+            field_getters = [_make_getter(path) for path in paths]
+
+            def getter(sample):
+                return tuple([get(sample) for get in field_getters])
+
+        # NOTE: ndarray fields with same shape and dtype, and number fields
+        # with same type are grouped, each group is collated into one
+        # array by a single numpy call
+        groups = {}
+        for idx, (kind, spec) in enumerate(fields):
+            groups.setdefault((kind, spec), []).append(idx)
+
+        self._getter = getter
+        self._containers = [
+            (_make_getter(path), length) for path, length in containers
+        ]
+        self._groups = [
+            (kind, spec, idxs) for (kind, spec), idxs in groups.items()
+        ]
+        self._num_fields = len(fields)
+        self._structure = structure
+
+    def _collate(self, batch):
+        # NOTE: keys or items only in later samples are not picked by the
+        # getter, so check the size of containers to find them
+        for get, length in self._containers:
+            for sample in batch:
+                if len(get(sample)) != length:
+                    raise ValueError("sample does not match the schema")
+
+        getter = self._getter
+        columns = list(zip(*[getter(sample) for sample in batch]))
+
+        flat_batch = [None] * self._num_fields
+        for kind, spec, idxs in self._groups:
+            if kind == _FIELD_NDARRAY:
+                # output shape: [len(idxs), batch_size] + field_shape, the
+                # dtype and shape are inferred by numpy to find any field
+                # which drifts from the schema
+                out = np.array([columns[i] for i in idxs])
+                if out.dtype != spec[1] or out.shape[2:] != spec[0]:
+                    raise ValueError("ndarray field does not match the schema")
+                for i, field in zip(idxs, out):
+                    flat_batch[i] = field
+            elif kind == _FIELD_NUMBER:
+                out = np.array([columns[i] for i in idxs])
+                if out.dtype != spec[1] or out.ndim != 2:
+                    raise ValueError("number field does not match the schema")
+                for i, field in zip(idxs, out):
+                    flat_batch[i] = field
+            elif kind == _FIELD_TENSOR:
+                for i in idxs:
+                    flat_batch[i] = paddle.stack(columns[i], axis=0)
+            else:
+                for i in idxs:
+                    flat_batch[i] = list(columns[i])
+        return _restore_batch(flat_batch, _copy_structure(self._structure))
+
+    def __call__(self, batch):
+        if self._getter is None:
+            self._compile(batch[0])
+        try:
+            return self._collate(batch)
+        except (KeyError, IndexError, TypeError, ValueError):
+            # batch does not match the compiled schema, collate it by
+            # default_collate_fn and recompile the plan on next batch
+            self._getter = None
+            return default_collate_fn(batch)
@@ -38,6 +38,8 @@ from ..multiprocess_utils import (
 from .batch_sampler import _InfiniteIterableSampler
 from .collate import default_collate_fn, default_convert_fn
 from .flat import _flatten_batch, _restore_batch
+from .prefetcher import _DevicePrefetcher
+from .shm_ring import _SharedMemoryBatch, _SharedMemoryRing
 from .worker import (
     _DatasetKind,
     _IterableDatasetStopIteration,
@@ -104,8 +106,20 @@ class _DataLoaderIterBase:
         self._worker_init_fn = loader.worker_init_fn
         self._dataset_kind = loader.dataset_kind
         self._pin_memory = loader.pin_memory
+        self._prefetch_to_device = loader.prefetch_to_device
+        self._prefetch_stats = loader._prefetch_stats
+        # ReaderRatioAverager of online auto-tuning, the cost of waiting
+        # for data is recorded into it by profiler.timer.ReaderRatioHook
+        self._reader_ratio_averager = (
+            loader._autotuner.averager
+            if loader._autotuner is not None
+            else None
+        )
 
         self._sampler_iter = iter(self._index_sampler)
+        # batch number output in current epoch, which starts from the
+        # batch number skipped if batch_sampler is resumed from a state
+        self._num_yielded_batches = self._num_skipped_batches()
         if self._auto_collate_batch:
             self._collate_fn = loader.collate_fn or default_collate_fn
         else:
@@ -120,6 +134,11 @@ class _DataLoaderIterBase:
         self._thread = None
         self._thread_done_event = threading.Event()
 
+        # _DevicePrefetcher instance to keep "self._prefetch_to_device"
+        # batches ready on target place, batches will be read from
+        # self._reader in prefetch thread if it is enabled
+        self._device_prefetcher = None
+
     @property
     def _index_sampler(self):
         if self._auto_collate_batch:
@@ -146,6 +165,62 @@ class _DataLoaderIterBase:
         if self._blocking_queue:
             self._blocking_queue.kill()
 
+    def _init_device_prefetcher(self):
+        if self._prefetch_to_device > 0:
+            self._device_prefetcher = _DevicePrefetcher(
+                self._read_next_data,
+                self._places[0],
+                self._prefetch_to_device,
+                self._prefetch_stats,
+            )
+
+    def _shutdown_device_prefetcher(self):
+        if self._device_prefetcher is not None:
+            self._device_prefetcher.shutdown()
+            self._device_prefetcher = None
+
+    def _read_next_data(self):
+        raise NotImplementedError(
+            f"'_read_next_data' not implement for class {self.__class__.__name__}"
+        )
+
+    def _next_data(self):
+        if self._device_prefetcher is not None:
+            data = self._device_prefetcher.next()
+        else:
+            data = self._read_next_data()
+        # NOTE: in static graph mode, len(self._places) batches compose
+        # as an output iteration
+        self._num_yielded_batches += (
+            1 if in_dynamic_mode() else len(self._places)
+        )
+        return data
+
+    def _num_skipped_batches(self):
+        if not self._auto_collate_batch:
+            return 0
+        return getattr(self._batch_sampler, '_num_skipped_batches', 0)
+
+    def state_dict(self):
+        """
+        Get the state of current epoch, which records the batch number
+        output by this iterator instead of the batch number drawn from
+        batch_sampler, as batches are prefetched.
+        """
+        if (
+            self._dataset_kind != _DatasetKind.MAP
+            or not self._auto_collate_batch
+            or not hasattr(self._batch_sampler, 'state_dict')
+        ):
+            raise RuntimeError(
+                "state_dict is only supported for map-style dataset with "
+                "batch_sampler which implements state_dict, but got "
+                "batch_sampler {}".format(type(self._batch_sampler))
+            )
+        state = self._batch_sampler.state_dict()
+        state['num_batches'] = self._num_yielded_batches
+        return state
+
 
 class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
     """
@@ -180,6 +255,7 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
         )
 
         self._init_thread()
+        self._init_device_prefetcher()
         self._shutdown = False
 
         global _loader
@@ -286,29 +362,7 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
         try:
             benchmark().check_if_need_record(self)
             benchmark().before_reader()
-            if in_dynamic_mode():
-                data = core.eager.read_next_tensor_list(
-                    self._reader.read_next_list()[0]
-                )
-                data = _restore_batch(data, self._structure_infos.pop(0))
-            else:
-                # in static graph mode
-                if self._return_list:
-                    data = self._reader.read_next_list()
-                    for i in range(len(data)):
-                        data[i] = data[i]._move_to_list()
-                    structs = [
-                        self._structure_infos.pop(0)
-                        for _ in range(len(self._places))
-                    ]
-                    data = [_restore_batch(d, s) for d, s in zip(data, structs)]
-                    # static graph organized data on multi-device with list, if
-                    # place number is 1, there is only 1 device, extra the data
-                    # from list for devices to be compatible with dygraph mode
-                    if len(self._places) == 1:
-                        data = data[0]
-                else:
-                    data = self._reader.read_next()
+            data = self._next_data()
             benchmark().after_reader()
 
             return data
@@ -320,6 +374,32 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
             if in_profiler_mode():
                 trace_event.end()
 
+    def _read_next_data(self):
+        if in_dynamic_mode():
+            data = core.eager.read_next_tensor_list(
+                self._reader.read_next_list()[0]
+            )
+            data = _restore_batch(data, self._structure_infos.pop(0))
+        else:
+            # in static graph mode
+            if self._return_list:
+                data = self._reader.read_next_list()
+                for i in range(len(data)):
+                    data[i] = data[i]._move_to_list()
+                structs = [
+                    self._structure_infos.pop(0)
+                    for _ in range(len(self._places))
+                ]
+                data = [_restore_batch(d, s) for d, s in zip(data, structs)]
+                # static graph organized data on multi-device with list, if
+                # place number is 1, there is only 1 device, extra the data
+                # from list for devices to be compatible with dygraph mode
+                if len(self._places) == 1:
+                    data = data[0]
+            else:
+                data = self._reader.read_next()
+        return data
+
     def _shutdown_thread(self):
         if self._thread:
             self._thread_done_event.set()
@@ -348,6 +428,7 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
                 # blocking queue read may hang and _thread_done_event
                 # cannot be checked
                 self._shutdown_thread()
+                self._shutdown_device_prefetcher()
             finally:
                 self._shutdown = True
 
@@ -418,12 +499,28 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             (self._worker_shm_buffer_size) * 2 * self._num_workers
         )
 
+        # NOTE: shm_slot_size is used for _SharedMemoryRing, each worker
+        # reuses a ring of pre-allocated shared memory slots to transport
+        # batch data, and only slot index is passed by _data_queue. Slot
+        # number of each ring covers the outstanding batches of a worker.
+        self._shm_slot_size = loader.shm_slot_size
+        self._shm_rings = None
+        if self._use_shared_memory and self._shm_slot_size > 0:
+            num_slots = (
+                self._outstanding_capacity + self._num_workers - 1
+            ) // self._num_workers + 1
+            self._shm_rings = [
+                _SharedMemoryRing(num_slots, self._shm_slot_size)
+                for _ in range(self._num_workers)
+            ]
+
         # init workers and indices queues and put 2 indices in each indices queue
         self._init_workers()
         for _ in range(self._outstanding_capacity):
             self._try_put_indices()
 
         self._init_thread()
+        self._init_device_prefetcher()
         self._shutdown = False
 
     def _init_workers(self):
@@ -464,6 +561,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._use_shared_memory,
                     self._base_seed,
                     self._worker_shm_buffer_size,
+                    self._shm_rings[i] if self._shm_rings else None,
                 ),
             )
             worker.daemon = True
@@ -519,6 +617,10 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         self._thread.start()
 
     def _reset(self):
+        # NOTE: prefetch thread reads data from blocking_queue, which
+        # should be stopped before blocking_queue caches clearing
+        self._shutdown_device_prefetcher()
+
         # resume iteration in following steps
         # 1. Resume workers, clear worker caches
         # put _ResumeIteration to all worker as resume iteration flag
@@ -558,9 +660,12 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         # 4. reset _sampler_iter and put prefetch indices to start next epoch
         # init workers and indices queues and put 2 indices in each indices queue
         self._sampler_iter = iter(self._index_sampler)
+        self._num_yielded_batches = self._num_skipped_batches()
         for _ in range(self._outstanding_capacity):
             self._try_put_indices()
 
+        self._init_device_prefetcher()
+
     def _shutdown_worker(self, worker_id, shutdown=False):
         if self._worker_status[worker_id] or (
             self._persistent_workers and shutdown
@@ -572,6 +677,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         if not self._shutdown:
             try:
                 self._exit_thread_expectedly()
+                self._shutdown_device_prefetcher()
                 self._clear_and_remove_data_queue()
 
                 # set _workers_done_event should be set before put None
@@ -587,6 +693,10 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     for q in self._indices_queues:
                         q.cancel_join_thread()
                         q.close()
+                    if self._shm_rings is not None:
+                        for ring in self._shm_rings:
+                            ring.release()
+                        self._shm_rings = None
             finally:
                 core._erase_process_pids(id(self))
                 self._shutdown = True
@@ -751,6 +861,12 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._exit_thread_unexpectedly()
                     batch.reraise()
 
+                # NOTE: copy batch out of the shared memory ring as soon
+                # as it is received, even if it is out of order, so slots
+                # will not be held by batches cached in _task_infos
+                if isinstance(batch, _SharedMemoryBatch):
+                    batch = self._shm_rings[batch.worker_id].read(batch)
+
                 if idx == self._rcvd_idx:
                     del self._task_infos[idx]
                     self._structure_infos.append(structure)
@@ -806,43 +922,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         try:
             benchmark().check_if_need_record(self)
             benchmark().before_reader()
-            # _batches_outstanding here record the total batch data number
-            # in 'from after _try_put_indices to beforeoutput data', this
-            # value should be _outstanding_capacity if data is not drained,
-            # if _batches_outstanding is less than _places number, there are
-            # no enough data to generate next output, close blocking_queue and
-            # set _thread_done_event here, py_reader will raise StopIteration,
-            # end workers and indices_queues in StopIteration handling
-            if self._batches_outstanding < len(self._places):
-                if self._persistent_workers:
-                    raise StopIteration
-                else:
-                    self._thread_done_event.set()
-                    self._blocking_queue.close()
-
-            if in_dynamic_mode():
-                data = core.eager.read_next_tensor_list(
-                    self._reader.read_next_list()[0]
-                )
-                data = _restore_batch(data, self._structure_infos.pop(0))
-            else:
-                if self._return_list:
-                    data = self._reader.read_next_list()
-                    for i in range(len(data)):
-                        data[i] = data[i]._move_to_list()
-                    structs = [
-                        self._structure_infos.pop(0)
-                        for _ in range(len(self._places))
-                    ]
-                    data = [_restore_batch(d, s) for d, s in zip(data, structs)]
-                    # static graph organized data on multi-device with list, if
-                    # place number is 1, there is only 1 device, extra the data
-                    # from list for devices to be compatible with dygraph mode
-                    if len(self._places) == 1:
-                        data = data[0]
-                else:
-                    data = self._reader.read_next()
-            self._on_output_batch()
+            data = self._next_data()
             benchmark().after_reader()
             return data
         except StopIteration:
@@ -854,6 +934,46 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             if in_profiler_mode():
                 trace_event.end()
 
+    def _read_next_data(self):
+        # _batches_outstanding here record the total batch data number
+        # in 'from after _try_put_indices to beforeoutput data', this
+        # value should be _outstanding_capacity if data is not drained,
+        # if _batches_outstanding is less than _places number, there are
+        # no enough data to generate next output, close blocking_queue and
+        # set _thread_done_event here, py_reader will raise StopIteration,
+        # end workers and indices_queues in StopIteration handling
+        if self._batches_outstanding < len(self._places):
+            if self._persistent_workers:
+                raise StopIteration
+            else:
+                self._thread_done_event.set()
+                self._blocking_queue.close()
+
+        if in_dynamic_mode():
+            data = core.eager.read_next_tensor_list(
+                self._reader.read_next_list()[0]
+            )
+            data = _restore_batch(data, self._structure_infos.pop(0))
+        else:
+            if self._return_list:
+                data = self._reader.read_next_list()
+                for i in range(len(data)):
+                    data[i] = data[i]._move_to_list()
+                structs = [
+                    self._structure_infos.pop(0)
+                    for _ in range(len(self._places))
+                ]
+                data = [_restore_batch(d, s) for d, s in zip(data, structs)]
+                # static graph organized data on multi-device with list, if
+                # place number is 1, there is only 1 device, extra the data
+                # from list for devices to be compatible with dygraph mode
+                if len(self._places) == 1:
+                    data = data[0]
+            else:
+                data = self._reader.read_next()
+        self._on_output_batch()
+        return data
+
     def _on_output_batch(self):
         for _ in range(len(self._places)):
             self._batches_outstanding -= 1
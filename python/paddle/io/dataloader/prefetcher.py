@@ -0,0 +1,182 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import queue
+import threading
+import time
+
+import paddle
+from paddle.fluid.framework import _current_expected_place, _set_expected_place
+
+from ...framework import core
+from ..multiprocess_utils import _ExceptionWrapper
+
+# interval to check whether prefetcher is shutdown when putting data
+_PREFETCH_CHECK_INTERVAL = 0.1
+# seconds to wait for prefetch thread exit on shutdown
+_PREFETCH_SHUTDOWN_TIMEOUT = 3
+
+
+class _PrefetchStopIteration:
+    pass
+
+
+class DevicePrefetchStats:
+    """
+    Statistics of the time the trainer waits on the device prefetch queue
+    of :code:`paddle.io.DataLoader`, which can be used to check whether
+    the training is input-bound.
+
+    Statistics are accumulated over all iterations of the DataLoader
+    until :code:`reset` is called.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.num_batches = 0
+        self.num_empty = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def update(self, wait_time, empty):
+        self.num_batches += 1
+        self.num_empty += int(empty)
+        self.wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    def summary(self):
+        """
+        Returns:
+            dict: statistics with following keys:
+
+            - num_batches: number of batches got from the prefetch queue.
+            - wait_time: total seconds the trainer waited on the queue.
+            - avg_wait_time: average seconds waited for each batch.
+            - max_wait_time: maximum seconds waited for a batch.
+            - empty_ratio: ratio of batches which were not ready when
+              the trainer asked for them, a value close to 1 means the
+              training is input-bound.
+        """
+        num_batches = max(self.num_batches, 1)
+        return {
+            'num_batches': self.num_batches,
+            'wait_time': self.wait_time,
+            'avg_wait_time': self.wait_time / num_batches,
+            'max_wait_time': self.max_wait_time,
+            'empty_ratio': self.num_empty / num_batches,
+        }
+
+
+class _DevicePrefetcher:
+    """
+    Prefetch stage of DataLoader iterator, which reads batches by
+    :attr:`read_fn` in a background thread, copies them to :attr:`place`
+    asynchronously and keeps at most :attr:`depth` batches ready in a
+    queue, so the host-to-device copy can be overlapped with computing.
+
+    Args:
+        read_fn(callable): function to read next batch, StopIteration
+            should be raised if data drained.
+        place(Place): target place to put batch data on.
+        depth(int): max batch number kept on target place.
+        stats(DevicePrefetchStats): statistics to record waiting time.
+    """
+
+    def __init__(self, read_fn, place, depth, stats):
+        assert depth > 0, "depth should be a positive value"
+        self._read_fn = read_fn
+        self._place = place
+        self._stats = stats
+        self._queue = queue.Queue(maxsize=depth)
+        self._done_event = threading.Event()
+        self._stopped = False
+
+        self._thread = threading.Thread(
+            target=self._thread_loop, args=(_current_expected_place(),)
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _to_place(self, data):
+        def _copy(field):
+            if isinstance(field, (paddle.Tensor, core.eager.Tensor)):
+                if not field.place._equals(self._place):
+                    return field._copy_to(self._place, False)
+            return field
+
+        return paddle.utils.map_structure(_copy, data)
+
+    def _put(self, item):
+        while not self._done_event.is_set():
+            try:
+                self._queue.put(item, timeout=_PREFETCH_CHECK_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _thread_loop(self, legacy_expected_place):
+        # NOTE: set the expected place for new thread as the same as
+        # father thread, see _DataLoaderIterSingleProcess._thread_loop
+        core.set_current_thread_name("DataLoaderPrefetch_" + str(id(self)))
+        _set_expected_place(legacy_expected_place)
+
+        while not self._done_event.is_set():
+            try:
+                data = self._to_place(self._read_fn())
+            except StopIteration:
+                self._put(_PrefetchStopIteration())
+                return
+            except Exception:
+                self._put(_ExceptionWrapper())
+                return
+            if not self._put(data):
+                return
+
+    def next(self):
+        if self._stopped:
+            raise StopIteration
+
+        empty = self._queue.empty()
+        start = time.time()
+        data = self._queue.get()
+        wait_time = time.time() - start
+
+        if isinstance(data, _PrefetchStopIteration):
+            self._stopped = True
+            raise StopIteration
+        if isinstance(data, _ExceptionWrapper):
+            self._stopped = True
+            data.reraise()
+        self._stats.update(wait_time, empty)
+        return data
+
+    def shutdown(self):
+        self._done_event.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        if (
+            self._thread is not None
+            and self._thread is not threading.current_thread()
+        ):
+            # NOTE: prefetch thread may be blocked in reading data, the
+            # reader should be closed before shutdown, and we only wait
+            # for a while here as the thread is a daemon thread
+            self._thread.join(_PREFETCH_SHUTDOWN_TIMEOUT)
+        self._thread = None
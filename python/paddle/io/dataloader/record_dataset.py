@@ -0,0 +1,351 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import queue
+import struct
+import threading
+
+import numpy as np
+
+from ..multiprocess_utils import _ExceptionWrapper
+from .dataset import IterableDataset
+from .worker import get_worker_info
+
+# each record in record file is a 8 bytes little-endian unsigned length
+# header followed by the record bytes
+_RECORD_HEADER = struct.Struct('<Q')
+# interval to check whether reading is stopped when putting records
+_READ_AHEAD_CHECK_INTERVAL = 0.1
+# buffer size of file object, which makes reading sequential in large
+# blocks, especially for network file systems
+_READ_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+class _ReadAheadStop:
+    pass
+
+
+def _read_records(path, record_format):
+    with open(path, 'rb', buffering=_READ_BUFFER_SIZE) as f:
+        if record_format == 'line':
+            for line in f:
+                yield line.rstrip(b'\r\n')
+            return
+
+        while True:
+            header = f.read(_RECORD_HEADER.size)
+            if not header:
+                return
+            if len(header) < _RECORD_HEADER.size:
+                raise ValueError(
+                    "Truncated record header in record file {}".format(path)
+                )
+            (length,) = _RECORD_HEADER.unpack(header)
+            record = f.read(length)
+            if len(record) < length:
+                raise ValueError(
+                    "Truncated record in record file {}".format(path)
+                )
+            yield record
+
+
+class RecordDataset(IterableDataset):
+    """
+    Iterable dataset which streams records from a list of shard files,
+    for corpora too large to be loaded into memory or indexed by a
+    map-style dataset.
+
+    Shards are partitioned automatically among all readers, where a
+    reader is a DataLoader worker (see :code:`paddle.io.get_worker_info`)
+    of a trainer process in distributed training, so each record is read
+    by exactly one reader in an epoch:
+
+    - if shard number is not less than the reader number, each reader
+      reads the whole shards assigned to it.
+    - otherwise several readers share one shard, and each of them takes
+      every n-th record of the shard.
+
+    Each reader reads its shards sequentially in a background thread and
+    keeps at most :attr:`read_ahead` records ahead of consuming. When
+    :attr:`shuffle_buffer_size` is positive, records are shuffled through
+    a buffer of at most :attr:`shuffle_buffer_size` records, and the order
+    of shards is also shuffled. So the memory held by each reader is
+    bounded by about :attr:`read_ahead` + :attr:`shuffle_buffer_size`
+    records, whatever the corpus size is.
+
+    Two record file formats are supported:
+
+    - 'record': each record is a 8 bytes little-endian unsigned integer
+      of the record length followed by the record bytes, files in this
+      format can be written by :code:`RecordDataset.write`.
+    - 'line': each line is a record, without the trailing newline.
+
+    Args:
+        files(list|tuple|str): path of shard files, a single path is also
+            supported.
+        transform(callable, optional): function to decode a record (bytes)
+            into a sample. Default None, which yields record bytes.
+        record_format(str, optional): format of shard files, 'record' or
+            'line'. Default 'record'.
+        shuffle_buffer_size(int, optional): record number of shuffle buffer,
+            0 means no shuffle. Default 0.
+        read_ahead(int, optional): max record number read ahead of
+            consuming by background thread, 0 means reading in the
+            consuming thread. Default 1024.
+        num_replicas(int, optional): porcess number in distributed training.
+            If :attr:`num_replicas` is None, :attr:`num_replicas` will be
+            retrieved from :ref:`api_paddle_distributed_ParallelEnv` .
+            Default None.
+        rank(int, optional): the rank of the current process among :attr:`num_replicas`
+            processes. If :attr:`rank` is None, :attr:`rank` is retrieved from
+            :ref:`api_paddle_distributed_ParallelEnv`. Default None.
+        seed(int, optional): random seed of shuffling, the seed of each
+            epoch is :attr:`seed` + epoch, see :code:`set_epoch`. Default 0.
+
+    Returns:
+        RecordDataset, an iterable dataset yields decoded records.
+
+    Examples:
+        .. code-block:: python
+
+            import os
+            import pickle
+            import tempfile
+
+            from paddle.io import DataLoader, RecordDataset
+
+            tmp_dir = tempfile.mkdtemp()
+            files = []
+            for i in range(4):
+                path = os.path.join(tmp_dir, 'shard-{}'.format(i))
+                RecordDataset.write(
+                    path,
+                    (pickle.dumps([i * 100 + j]) for j in range(100)),
+                )
+                files.append(path)
+
+            dataset = RecordDataset(
+                files, transform=pickle.loads, shuffle_buffer_size=64
+            )
+            loader = DataLoader(dataset, batch_size=8, num_workers=2)
+
+            for epoch in range(2):
+                dataset.set_epoch(epoch)
+                for data in loader:
+                    # do something
+                    pass
+    """
+
+    def __init__(
+        self,
+        files,
+        transform=None,
+        record_format='record',
+        shuffle_buffer_size=0,
+        read_ahead=1024,
+        num_replicas=None,
+        rank=None,
+        seed=0,
+    ):
+        if isinstance(files, str):
+            files = [files]
+        assert isinstance(
+            files, (list, tuple)
+        ), "files should be a list of file paths"
+        assert len(files) > 0, "files should not be empty"
+        self.files = list(files)
+        assert transform is None or callable(
+            transform
+        ), "transform should be callable"
+        self.transform = transform
+        assert record_format in [
+            'record',
+            'line',
+        ], "record_format should be 'record' or 'line'"
+        self.record_format = record_format
+        assert (
+            isinstance(shuffle_buffer_size, int) and shuffle_buffer_size >= 0
+        ), "shuffle_buffer_size should be a non-negative integer"
+        self.shuffle_buffer_size = shuffle_buffer_size
+        assert (
+            isinstance(read_ahead, int) and read_ahead >= 0
+        ), "read_ahead should be a non-negative integer"
+        self.read_ahead = read_ahead
+
+        from paddle.distributed import ParallelEnv
+
+        if num_replicas is not None:
+            assert (
+                isinstance(num_replicas, int) and num_replicas > 0
+            ), "num_replicas should be a positive integer"
+            self.nranks = num_replicas
+        else:
+            self.nranks = ParallelEnv().nranks
+
+        if rank is not None:
+            assert (
+                isinstance(rank, int) and rank >= 0
+            ), "rank should be a non-negative integer"
+            self.local_rank = rank
+        else:
+            self.local_rank = ParallelEnv().local_rank
+
+        self.seed = seed
+        self.epoch = 0
+
+    @staticmethod
+    def write(path, records):
+        """
+        Write records into a file in 'record' format.
+
+        Args:
+            path(str): path of the record file.
+            records(iterable): records in bytes.
+
+        Returns:
+            int: number of records written.
+        """
+        num_records = 0
+        with open(path, 'wb', buffering=_READ_BUFFER_SIZE) as f:
+            for record in records:
+                f.write(_RECORD_HEADER.pack(len(record)))
+                f.write(record)
+                num_records += 1
+        return num_records
+
+    def set_epoch(self, epoch):
+        """
+        Sets the epoch number, which is added to :attr:`seed` as the seed
+        of shuffling shards and records. Shards and records are shuffled
+        in the same order if the same epoch number is set.
+
+        .. note::
+            When DataLoader is used with :attr:`num_workers > 0` and
+            :attr:`persistent_workers=True`, dataset in workers is copied
+            once, epoch number should be set before creating the workers.
+
+        Args:
+            epoch(int): epoch number.
+        """
+        self.epoch = epoch
+
+    def _reader_info(self):
+        worker_info = get_worker_info()
+        if worker_info is None:
+            num_workers, worker_id = 1, 0
+        else:
+            num_workers, worker_id = worker_info.num_workers, worker_info.id
+        num_readers = self.nranks * num_workers
+        reader_id = self.local_rank * num_workers + worker_id
+        return num_readers, reader_id
+
+    def _shard_records(self, rng):
+        # NOTE: shard order is shuffled with the same seed in all readers
+        # before partitioning, so the shards are still exclusive
+        files = self.files
+        if self.shuffle_buffer_size > 0:
+            files = [files[i] for i in rng.permutation(len(files))]
+
+        num_readers, reader_id = self._reader_info()
+        if len(files) >= num_readers:
+            for path in files[reader_id::num_readers]:
+                yield from _read_records(path, self.record_format)
+        else:
+            # readers sharing one shard take records in turn
+            path = files[reader_id % len(files)]
+            num_sharing = len(
+                range(reader_id % len(files), num_readers, len(files))
+            )
+            offset = reader_id // len(files)
+            for i, record in enumerate(_read_records(path, self.record_format)):
+                if i % num_sharing == offset:
+                    yield record
+
+    def _read_ahead(self, records):
+        record_queue = queue.Queue(maxsize=self.read_ahead)
+        done_event = threading.Event()
+
+        def _put(item):
+            while not done_event.is_set():
+                try:
+                    record_queue.put(item, timeout=_READ_AHEAD_CHECK_INTERVAL)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _thread_loop():
+            try:
+                for record in records:
+                    if not _put(record):
+                        return
+            except Exception:
+                _put(_ExceptionWrapper())
+                return
+            finally:
+                # close the opened shard file if reading is stopped
+                records.close()
+            _put(_ReadAheadStop())
+
+        thread = threading.Thread(target=_thread_loop)
+        thread.daemon = True
+        thread.start()
+        try:
+            while True:
+                record = record_queue.get()
+                if isinstance(record, _ReadAheadStop):
+                    return
+                if isinstance(record, _ExceptionWrapper):
+                    record.reraise()
+                yield record
+        finally:
+            # NOTE: the generator is closed when iteration is broken, stop
+            # the reading thread, which exits after putting at most one
+            # record as the queue is drained here
+            done_event.set()
+            while True:
+                try:
+                    record_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+    def _shuffle(self, records, rng):
+        buffer = []
+        for record in records:
+            if len(buffer) < self.shuffle_buffer_size:
+                buffer.append(record)
+                continue
+            # replace a random record in buffer by the new one
+            idx = rng.randint(self.shuffle_buffer_size)
+            yield buffer[idx]
+            buffer[idx] = record
+        for idx in rng.permutation(len(buffer)):
+            yield buffer[idx]
+
+    def __iter__(self):
+        rng = np.random.RandomState(self.seed + self.epoch)
+        records = self._shard_records(rng)
+        if self.read_ahead > 0:
+            records = self._read_ahead(records)
+        if self.shuffle_buffer_size > 0:
+            # NOTE: readers shuffle records with different seeds
+            _, reader_id = self._reader_info()
+            records = self._shuffle(
+                records,
+                np.random.RandomState([self.seed + self.epoch, reader_id]),
+            )
+        for record in records:
+            if self.transform is not None:
+                record = self.transform(record)
+            yield record
@@ -206,6 +206,12 @@ class RandomSampler(Sampler):
                 "but got num_samples={}".format(self.num_samples)
             )
 
+        # numpy random state before drawing indices of current iteration
+        # and index number yielded in current iteration, see state_dict
+        self._rng_state = None
+        self._num_yielded = 0
+        self._resume_state = None
+
     @property
     def num_samples(self):
         if self._num_samples is None:
@@ -214,24 +220,86 @@ class RandomSampler(Sampler):
 
     def __iter__(self):
         n = len(self.data_source)
+        resume_state, self._resume_state = self._resume_state, None
+        num_skip = resume_state['num_yielded'] if resume_state else 0
+        self._num_yielded = num_skip
+
         if self.generator:
+            # NOTE: state of generator cannot be restored, indices drawn
+            # before resuming point are skipped by consuming the generator
+            self._rng_state = None
             for i in range(self.num_samples):
                 try:
                     index = next(self.generator)
                 except StopIteration:
                     return
+                if i < num_skip:
+                    continue
+                self._num_yielded += 1
                 yield index
         else:
+            if resume_state and resume_state['rng_state'] is not None:
+                np.random.set_state(resume_state['rng_state'])
+            # NOTE: random state is recorded with python builtin types, so
+            # it will not be converted to Tensor by paddle.save/load
+            state = np.random.get_state()
+            self._rng_state = (state[0], state[1].tolist()) + state[2:]
             if self.replacement:
-                for index in np.random.choice(
+                indices = np.random.choice(
                     np.arange(n), self.num_samples, replace=True
-                ).tolist():
-                    yield index
+                )
             else:
-                for index in np.random.choice(
-                    np.arange(n), n, replace=False
-                ).tolist():
-                    yield index
+                indices = np.random.choice(np.arange(n), n, replace=False)
+            for index in indices[num_skip:].tolist():
+                self._num_yielded += 1
+                yield index
+
+    def state_dict(self):
+        """
+        Get the state of current iteration, which can be used to resume the
+        iteration by :code:`set_state_dict`.
+
+        Returns:
+            dict: state with following keys:
+
+            - rng_state: numpy random state before drawing indices of current
+              iteration, None if iteration not started or :attr:`generator`
+              is set.
+            - num_yielded: index number yielded in current iteration.
+
+        Examples:
+
+            .. code-block:: python
+
+                from paddle.io import RandomSampler
+
+                sampler = RandomSampler(data_source=list(range(10)))
+                sampler_iter = iter(sampler)
+                for _ in range(3):
+                    next(sampler_iter)
+                state = sampler.state_dict()
+
+                sampler.set_state_dict(state)
+                # yield the last 7 indices of the same shuffled order
+                print(list(sampler))
+        """
+        if self._resume_state is not None:
+            return dict(self._resume_state)
+        return {'rng_state': self._rng_state, 'num_yielded': self._num_yielded}
+
+    def set_state_dict(self, state_dict):
+        """
+        Set the state got by :code:`state_dict`, the next iteration will
+        draw the same indices order as the iteration :attr:`state_dict` got
+        from, and skip the indices yielded before without reading them.
+
+        Args:
+            state_dict(dict): state got by :code:`state_dict`.
+        """
+        self._resume_state = {
+            'rng_state': state_dict.get('rng_state', None),
+            'num_yielded': state_dict.get('num_yielded', 0),
+        }
 
     def __len__(self):
         return self.num_samples
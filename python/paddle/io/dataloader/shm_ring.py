@@ -0,0 +1,147 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import queue
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import paddle
+
+from ...framework import core
+
+# NOTE: each field in a slot starts at a 64 bytes boundary, which is
+# the cache line size on most platforms and also satisfies the
+# alignment requirement of all numpy dtypes
+_SLOT_FIELD_ALIGNMENT = 64
+
+
+def _align(offset):
+    return (
+        (offset + _SLOT_FIELD_ALIGNMENT - 1)
+        // _SLOT_FIELD_ALIGNMENT
+        * _SLOT_FIELD_ALIGNMENT
+    )
+
+
+class _SharedMemoryBatch:
+    """
+    Batch descriptor send from worker to main process when the batch
+    data has been written into a slot of :code:`_SharedMemoryRing`,
+    only the slot index and the layout of the fields in slot are
+    transported by the inter-process queue.
+    """
+
+    def __init__(self, worker_id, slot_id, metas):
+        self.worker_id = worker_id
+        self.slot_id = slot_id
+        # list of (offset, shape, dtype str) of each field
+        self.metas = metas
+
+
+class _SharedMemoryRing:
+    """
+    A ring of fixed-size shared memory slots owned by the main process
+    and reused by one DataLoader worker.
+
+    Worker writes the flattened batch into a free slot and sends a
+    :code:`_SharedMemoryBatch` descriptor through the data queue, main
+    process copies data out of the slot and gives the slot back to
+    worker by putting slot index into the free slot queue. As slots
+    are allocated once when the ring is created, there is no shared
+    memory allocation and mmap on batch transporting.
+
+    If the batch cannot be written into the ring (no free slot or batch
+    size exceeds slot size), :code:`write` returns None and worker
+    should fall back to the default transporting path, so the ring
+    never blocks worker.
+
+    Args:
+        num_slots(int): slot number in the ring.
+        slot_size(int): byte size of each slot.
+    """
+
+    def __init__(self, num_slots, slot_size):
+        from paddle.incubate import multiprocessing
+
+        assert num_slots > 0, "num_slots should be a positive value"
+        assert slot_size > 0, "slot_size should be a positive value"
+        self.num_slots = num_slots
+        self.slot_size = slot_size
+        self._slots = [
+            shared_memory.SharedMemory(create=True, size=slot_size)
+            for _ in range(num_slots)
+        ]
+        self._free_slots = multiprocessing.Queue()
+        for slot_id in range(num_slots):
+            self._free_slots.put(slot_id)
+
+    def write(self, worker_id, flat_batch):
+        arrays = []
+        for field in flat_batch:
+            if isinstance(field, (paddle.Tensor, core.eager.Tensor)):
+                field = field.numpy()
+            if not isinstance(field, np.ndarray) or field.dtype.hasobject:
+                return None
+            arrays.append(field)
+
+        nbytes = 0
+        for arr in arrays:
+            nbytes = _align(nbytes) + arr.nbytes
+        if nbytes > self.slot_size:
+            return None
+
+        try:
+            slot_id = self._free_slots.get_nowait()
+        except queue.Empty:
+            return None
+
+        buf = self._slots[slot_id].buf
+        metas = []
+        offset = 0
+        for arr in arrays:
+            offset = _align(offset)
+            dst = np.ndarray(
+                arr.shape, dtype=arr.dtype, buffer=buf, offset=offset
+            )
+            dst[...] = arr
+            metas.append((offset, arr.shape, arr.dtype.str))
+            offset += arr.nbytes
+        return _SharedMemoryBatch(worker_id, slot_id, metas)
+
+    def read(self, shm_batch):
+        buf = self._slots[shm_batch.slot_id].buf
+        tensor_list = []
+        try:
+            for offset, shape, dtype in shm_batch.metas:
+                arr = np.ndarray(shape, dtype=dtype, buffer=buf, offset=offset)
+                # NOTE: LoDTensor.set copies data out of the slot, so the
+                # slot can be reused by worker once all fields are read
+                tensor = core.LoDTensor()
+                tensor.set(arr, core.CPUPlace())
+                tensor_list.append(tensor)
+        finally:
+            self._free_slots.put(shm_batch.slot_id)
+        return tensor_list
+
+    def release(self):
+        self._free_slots.cancel_join_thread()
+        self._free_slots.close()
+        for slot in self._slots:
+            try:
+                slot.close()
+                slot.unlink()
+            except (OSError, BufferError):
+                pass
+        self._slots = []
@@ -276,6 +276,7 @@ def _worker_loop(
     use_shared_memory,
     base_seed,
     shm_cahce_size=0,
+    shm_ring=None,
 ):
     try:
         # NOTE: [ mmap files clear ] When the child process exits unexpectedly,
@@ -374,7 +375,15 @@ def _worker_loop(
                 if isinstance(batch, _WorkerException):
                     out_queue.put((idx, batch, None))
                 batch, structure = _flatten_batch(batch)
-                if use_shared_memory:
+                # NOTE: try to transport batch by the pre-allocated shared
+                # memory ring firstly, fall back to the default path if the
+                # batch cannot be written into the ring
+                shm_batch = None
+                if shm_ring is not None:
+                    shm_batch = shm_ring.write(worker_id, batch)
+                if shm_batch is not None:
+                    out_queue.put((idx, shm_batch, structure))
+                elif use_shared_memory:
 
                     def numpy2lodtensor(arr):
                         lodtensor = core.Tensor()
@@ -55,6 +55,19 @@ def _cleanup_mmap():
     core._cleanup_mmap_fds()
 
 
+class _ExceptionWrapper:
+    """
+    Wraps the exception raised in a background thread, which is put into a
+    queue and raised again with its traceback by the consumer thread.
+    """
+
+    def __init__(self, exc_info=None):
+        self.exc_info = exc_info or sys.exc_info()
+
+    def reraise(self):
+        raise self.exc_info[1].with_traceback(self.exc_info[2])
+
+
 # NOTE used for register a function to be executed at interpreter exit.
 class CleanupFuncRegistrar:
     # Record the cleanup functions that have been executed
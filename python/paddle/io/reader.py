@@ -19,9 +19,11 @@ import multiprocessing
 import sys
 import time
 import warnings
+import weakref
 
 import paddle
 from paddle.fluid.framework import logging
+from paddle.profiler.timer import ReaderRatioAverager
 
 from ..fluid.framework import (
     _current_expected_place,
@@ -36,6 +38,7 @@ from .dataloader.dataloader_iter import (
     _DataLoaderIterSingleProcess,
     _DatasetKind,
 )
+from .dataloader.prefetcher import DevicePrefetchStats
 
 # NOTE: [ avoid hanging & failed quickly ]
 # These value is used in getting data from another process
@@ -45,13 +48,16 @@ USE_PINNED_MEMORY = None
 # AutoTune Flags
 USE_AUTOTUNE = False
 TUNING_STEPS = 500
+ONLINE_AUTOTUNE = False
 
 
-def set_autotune_config(use_autotune, tuning_steps=500):
+def set_autotune_config(use_autotune, tuning_steps=500, online=False):
     global USE_AUTOTUNE
     USE_AUTOTUNE = use_autotune
     global TUNING_STEPS
     TUNING_STEPS = tuning_steps
+    global ONLINE_AUTOTUNE
+    ONLINE_AUTOTUNE = online
 
 
 def use_pinned_memory(*args):
@@ -153,6 +159,10 @@ class AuToTune:
         return sub_dataset
 
     def get_autotune_loader(self):
+        # NOTE: batches of BucketBatchSampler are built from sample
+        # lengths rather than dataset, which cannot be subsampled here
+        if isinstance(self.loader.batch_sampler, paddle.io.BucketBatchSampler):
+            return None
         loader = copy.copy(self.loader)
         batch_size = self.loader.batch_sampler.batch_size
         if isinstance(
@@ -215,6 +225,170 @@ class AuToTune:
         return best_workers
 
 
+class OnlineAuToTune:
+    """
+    Tune num_workers, prefetch_factor and pin_memory of a DataLoader during
+    training by the ratio of time waiting for data in a step, which is
+    recorded by profiler.timer.ReaderRatioHook on every read of the
+    DataLoader.
+
+    The configuration takes effect from the next epoch, since workers and
+    the blocking queue of an iterator cannot be changed in an epoch. When
+    the reader ratio of an epoch is higher than `high_ratio`, more workers,
+    a larger prefetch_factor or pinned memory are tried in order, and a
+    change without `min_gain` speedup of the step cost is reverted. When the
+    reader ratio is lower than `low_ratio`, workers are reduced to release
+    CPU for training, and a change slowing down the step is reverted. A
+    reverted change will not be tried again in the next `patience` tunings
+    unless the reader ratio changes, e.g. the cost of data augmentation
+    varies by epoch.
+    """
+
+    # knobs tried in order when the DataLoader is the bottleneck
+    INCREASE_KNOBS = ('num_workers', 'prefetch_factor', 'pin_memory')
+    DECREASE_KNOBS = ('num_workers',)
+
+    def __init__(
+        self,
+        loader,
+        use_shared_memory=True,
+        high_ratio=0.1,
+        low_ratio=0.02,
+        min_gain=0.05,
+        min_steps=20,
+        patience=3,
+        max_prefetch_factor=16,
+    ):
+        self.loader = loader
+        self.use_shared_memory = use_shared_memory
+        self.high_ratio = high_ratio
+        self.low_ratio = low_ratio
+        self.min_gain = min_gain
+        self.min_steps = min_steps
+        self.patience = patience
+        self.max_num_workers = (
+            int(multiprocessing.cpu_count() / 2)
+            if AuToTune(loader).need_autotune()
+            else 0
+        )
+        self.max_prefetch_factor = max_prefetch_factor
+        self.averager = ReaderRatioAverager()
+        self.history = []
+        # (knob, direction, config, batch_cost) of the last change
+        self._last_change = None
+        # (knob, direction) -> number of tunings to skip and reader ratio
+        self._frozen = {}
+
+    def get_config(self):
+        return {
+            'num_workers': self.loader.num_workers,
+            'prefetch_factor': self.loader.prefetch_factor,
+            'pin_memory': self.loader.pin_memory,
+        }
+
+    def step(self):
+        """
+        Tune the DataLoader by the reader ratio recorded since the last
+        tuning. It is called at the beginning of each epoch.
+        """
+
+        self.averager.new_epoch()
+        if self.averager.num_steps < self.min_steps:
+            return
+
+        ratio = self.averager.get_ratio()
+        batch_cost = self.averager.batch_average()
+        self.averager.reset()
+        config = self.get_config()
+        self.history.append(
+            dict(config, reader_ratio=ratio, batch_cost=batch_cost)
+        )
+        logging.debug(
+            "DataLoader online auto tune: "
+            + str(config)
+            + " reader_ratio: "
+            + str(ratio)
+            + " batch_cost: "
+            + str(batch_cost)
+        )
+
+        for key in list(self._frozen.keys()):
+            count, frozen_ratio = self._frozen[key]
+            if count <= 1 or abs(ratio - frozen_ratio) > self.high_ratio:
+                self._frozen.pop(key)
+            else:
+                self._frozen[key] = (count - 1, frozen_ratio)
+
+        if self._last_change is not None:
+            knob, direction, last_config, last_cost = self._last_change
+            self._last_change = None
+            if direction > 0:
+                reverted = batch_cost > last_cost * (1 - self.min_gain)
+            else:
+                reverted = batch_cost > last_cost * (1 + self.min_gain)
+            if reverted:
+                self._frozen[(knob, direction)] = (self.patience, ratio)
+                self._apply(last_config)
+                return
+
+        if ratio > self.high_ratio:
+            self._try_change(self.INCREASE_KNOBS, 1, config, batch_cost)
+        elif ratio < self.low_ratio:
+            self._try_change(self.DECREASE_KNOBS, -1, config, batch_cost)
+
+    def _next_value(self, knob, direction, config):
+        value = config[knob]
+        if knob == 'num_workers':
+            if direction > 0 and value < self.max_num_workers:
+                return min(self.max_num_workers, max(1, value * 2))
+            if direction < 0 and value > 0:
+                return value - 1
+        elif knob == 'prefetch_factor':
+            if direction > 0 and value < self.max_prefetch_factor:
+                return min(self.max_prefetch_factor, value * 2)
+        elif knob == 'pin_memory':
+            # NOTE: pinned memory only speeds up copying to GPU in
+            # dynamic graph mode
+            if (
+                direction > 0
+                and not value
+                and in_dynamic_mode()
+                and self.loader.places[0].is_gpu_place()
+            ):
+                return True
+        return None
+
+    def _try_change(self, knobs, direction, config, batch_cost):
+        for knob in knobs:
+            if (knob, direction) in self._frozen:
+                continue
+            value = self._next_value(knob, direction, config)
+            if value is None:
+                continue
+            self._last_change = (knob, direction, config, batch_cost)
+            new_config = dict(config)
+            new_config[knob] = value
+            self._apply(new_config)
+            return
+
+    def _apply(self, config):
+        if config == self.get_config():
+            return
+        loader = self.loader
+        loader.num_workers = config['num_workers']
+        loader.prefetch_factor = config['prefetch_factor']
+        loader.pin_memory = config['pin_memory']
+        loader.use_shared_memory = (
+            self.use_shared_memory and loader.num_workers > 0
+        )
+        # workers and blocking queue of persistent workers are created with
+        # the old configuration, restart them
+        if loader._iterator is not None:
+            loader._iterator._try_shutdown_all()
+            loader._iterator = None
+        logging.info("auto_tune dataLoader online config: " + str(config))
+
+
 class DataLoader:
     """
     DataLoader prodives an iterator which iterates given dataset
@@ -313,6 +487,20 @@ class DataLoader:
         worker_init_fn(callable, optional): init function which will be called with
             worker id on each subproces starting if not set as None. Default
             None.
+        shm_slot_size(int, optional): byte size of each slot in the shared memory
+            ring of each worker. If set as a positive number and :attr:`use_shared_memory`
+            is enabled, each worker reuses a ring of pre-allocated shared memory slots
+            to transport batch data instead of allocating a new shared memory tensor for
+            each batch, only slot index is passed through the inter-process queue.
+            Batches larger than this size fall back to the default path. Default 0,
+            which disables the shared memory ring.
+        prefetch_to_device(int, optional): Number of batch data the DataLoader would
+            keep ready on the target place. If set as a positive number, batches
+            are copied to the target place in a background thread asynchronously,
+            which overlaps host-to-device copy with computing, and the time waiting
+            for batch data is recorded, see :code:`device_prefetch_stats`. Only
+            supported in dynamic graph mode. Default 0, which disables prefetching
+            to device.
 
     Returns:
         DataLoader: an iterable object for data iterating, each elemnet of the generated data is a Tensor.
@@ -403,6 +591,8 @@ class DataLoader:
         timeout=0,
         worker_init_fn=None,
         persistent_workers=False,
+        shm_slot_size=0,
+        prefetch_to_device=0,
     ):
         self.return_list = return_list
         self.collate_fn = collate_fn
@@ -443,6 +633,23 @@ class DataLoader:
         if use_shared_memory and num_workers == 0:
             self.use_shared_memory = False
 
+        assert (
+            shm_slot_size >= 0
+        ), "shm_slot_size should be a non-negative value"
+        self.shm_slot_size = shm_slot_size
+
+        assert (
+            prefetch_to_device >= 0
+        ), "prefetch_to_device should be a non-negative value"
+        if prefetch_to_device > 0 and not in_dynamic_mode():
+            warnings.warn(
+                "prefetch_to_device is only supported in dynamic graph mode,"
+                " prefetching to device is disabled."
+            )
+            prefetch_to_device = 0
+        self.prefetch_to_device = prefetch_to_device
+        self._prefetch_stats = DevicePrefetchStats()
+
         assert timeout >= 0, "timeout should be a non-negative value"
         self.timeout = timeout
 
@@ -500,7 +707,14 @@ class DataLoader:
 
         self._persistent_workers = persistent_workers
         self._iterator = None
-        self.num_workers = AuToTune(self).__call__()
+        # NOTE: only a weak reference of the last iterator is held for
+        # state_dict, which does not preclude GC to collect the iterator
+        self._last_iterator = None
+        self._autotuner = None
+        if USE_AUTOTUNE and ONLINE_AUTOTUNE:
+            self._autotuner = OnlineAuToTune(self, use_shared_memory)
+        else:
+            self.num_workers = AuToTune(self).__call__()
 
     def __len__(self):
         if self.dataset_kind == _DatasetKind.ITER:
@@ -512,16 +726,180 @@ class DataLoader:
                 return len(self.dataset)
 
     def __iter__(self):
+        if self._autotuner is not None:
+            self._autotuner.step()
         if self.num_workers == 0:
-            return _DataLoaderIterSingleProcess(self)
+            iterator = _DataLoaderIterSingleProcess(self)
         elif self._persistent_workers:
             if self._iterator is None:
                 self._iterator = _DataLoaderIterMultiProcess(self)
             else:
                 self._iterator._reset()
-            return self._iterator
+            iterator = self._iterator
         else:
-            return _DataLoaderIterMultiProcess(self)
+            iterator = _DataLoaderIterMultiProcess(self)
+        self._last_iterator = weakref.ref(iterator)
+        return iterator
 
     def __call__(self):
         return self.__iter__()
+
+    def get_autotune_config(self):
+        """
+        Get the configuration chosen by online auto-tuning, which is enabled
+        by :code:`paddle.incubate.autotune.set_config` with ``"online": True``
+        in the dataloader configuration. The configuration is tuned at the
+        beginning of each epoch by the ratio of time waiting for data in a
+        step of the last epoch.
+
+        Returns:
+            dict|None: a dict contains ``num_workers``, ``prefetch_factor``,
+            ``pin_memory`` currently used and ``history``, a list of the
+            configurations tuned with their ``reader_ratio`` and
+            ``batch_cost``. None if online auto-tuning is not enabled.
+
+        Examples:
+
+            .. code-block:: python
+
+                import numpy as np
+                import paddle
+                from paddle.io import Dataset, DataLoader
+
+                class RandomDataset(Dataset):
+                    def __getitem__(self, idx):
+                        return np.random.random([32]).astype('float32')
+
+                    def __len__(self):
+                        return 1000
+
+                paddle.incubate.autotune.set_config(
+                    {"dataloader": {"enable": True, "online": True}})
+                loader = DataLoader(RandomDataset(), batch_size=10)
+                for epoch in range(3):
+                    for data in loader:
+                        pass
+                print(loader.get_autotune_config())
+        """
+        if self._autotuner is None:
+            return None
+        config = self._autotuner.get_config()
+        config['history'] = list(self._autotuner.history)
+        return config
+
+    def state_dict(self):
+        """
+        Get the state of the current epoch, which records the state of
+        :attr:`batch_sampler` and the batch number output by the last
+        iterator of this DataLoader. It can be saved with checkpoints and
+        set by :code:`set_state_dict` to resume training from the exact
+        batch after restarting.
+
+        Only map-style dataset with :attr:`batch_sampler` which implements
+        :code:`state_dict`, e.g. :code:`paddle.io.BatchSampler` and
+        :code:`paddle.io.DistributedBatchSampler`, is supported.
+
+        Returns:
+            dict: state of the current epoch.
+
+        Examples:
+
+            .. code-block:: python
+
+                import numpy as np
+                import paddle
+                from paddle.io import Dataset, DataLoader
+
+                class RandomDataset(Dataset):
+                    def __getitem__(self, idx):
+                        return np.array([idx]).astype('int64')
+
+                    def __len__(self):
+                        return 64
+
+                loader = DataLoader(RandomDataset(), batch_size=8, shuffle=True)
+                for i, data in enumerate(loader):
+                    if i == 2:
+                        state = loader.state_dict()
+                        paddle.save(state, 'loader.pdstate')
+                        break
+
+                # after restarting
+                loader = DataLoader(RandomDataset(), batch_size=8, shuffle=True)
+                loader.set_state_dict(paddle.load('loader.pdstate'))
+                # the first 3 batches of the epoch are skipped
+                for data in loader:
+                    print(data)
+        """
+        iterator = self._last_iterator() if self._last_iterator else None
+        if iterator is not None:
+            return iterator.state_dict()
+        if not self.auto_collate_batch or not hasattr(
+            self.batch_sampler, 'state_dict'
+        ):
+            raise RuntimeError(
+                "state_dict is only supported for map-style dataset with "
+                "batch_sampler which implements state_dict, but got "
+                "batch_sampler {}".format(type(self.batch_sampler))
+            )
+        return self.batch_sampler.state_dict()
+
+    def set_state_dict(self, state_dict):
+        """
+        Set the state got by :code:`state_dict`, the next iteration of this
+        DataLoader will resume from the batch after the last output batch
+        recorded in :attr:`state_dict`, the skipped samples will not be read.
+
+        Args:
+            state_dict(dict): state got by :code:`state_dict`.
+        """
+        if not self.auto_collate_batch or not hasattr(
+            self.batch_sampler, 'set_state_dict'
+        ):
+            raise RuntimeError(
+                "set_state_dict is only supported for map-style dataset with "
+                "batch_sampler which implements set_state_dict, but got "
+                "batch_sampler {}".format(type(self.batch_sampler))
+            )
+        self.batch_sampler.set_state_dict(state_dict)
+
+    def device_prefetch_stats(self):
+        """
+        Get the statistics of the time waiting for batch data when
+        :attr:`prefetch_to_device` is enabled, statistics are accumulated
+        over all epochs of this DataLoader.
+
+        Returns:
+            dict: statistics with following keys:
+
+            - num_batches: number of batches got from the prefetch queue.
+            - wait_time: total seconds waited for batch data.
+            - avg_wait_time: average seconds waited for each batch.
+            - max_wait_time: maximum seconds waited for a batch.
+            - empty_ratio: ratio of batches which were not ready when
+              asked for, a value close to 1 means the training is
+              input-bound.
+
+        Examples:
+
+            .. code-block:: python
+
+                import numpy as np
+                import paddle
+                from paddle.io import Dataset, DataLoader
+
+                class RandomDataset(Dataset):
+                    def __getitem__(self, idx):
+                        return np.random.random([784]).astype('float32')
+
+                    def __len__(self):
+                        return 64
+
+                loader = DataLoader(
+                    RandomDataset(), batch_size=8, prefetch_to_device=2
+                )
+                for data in loader:
+                    pass
+                print(loader.device_prefetch_stats()['empty_ratio'])
+        """
+        return self._prefetch_stats.summary()
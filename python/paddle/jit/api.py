@@ -44,6 +44,7 @@ from .dy2static.convert_call_func import (
     add_ignore_module,
 )
 from .dy2static.program_translator import (
+    PROGRAM_CACHE_OPTIONS,
     ProgramTranslator,
     StaticFunction,
     unwrap_decorators,
@@ -255,6 +256,11 @@ def to_static(
             please refer to :code:`paddle.static.BuildStrategy`. The default is None.
         backend(str, Optional): Specifies compilation backend, which can be `CINN` or None. When backend is `CINN`, CINN compiler will be used to speed up training and inference.
         kwargs: Support keys including `property`, set `property` to True if the fucntion is python property.
+            Keys `max_program_cache_size` and `max_program_cache_memory` bound the number and the estimated
+            memory in bytes of traced programs, the least recently used program is evicted when exceeding them.
+            Key `shape_buckets` is a dict of {axis: list of sizes}, the Tensor inputs are padded with zeros
+            along each axis to the smallest size in the list not less than it, so that inputs of various shapes
+            share the traced programs. The decorated function should not be affected by the padded values.
 
 
     Returns:
@@ -280,6 +286,9 @@ def to_static(
 
     """
     property = kwargs.get("property", False)
+    cache_options = {
+        name: kwargs[name] for name in PROGRAM_CACHE_OPTIONS if name in kwargs
+    }
 
     def decorated(python_func):
         """
@@ -297,6 +306,7 @@ def to_static(
                 build_strategy=build_strategy,
                 property=property,
                 backend=backend,
+                **cache_options,
             ),
         )
 
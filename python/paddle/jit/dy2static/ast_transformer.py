@@ -17,7 +17,10 @@
 # as produced by ast.parse from the standard ast module.
 # See details in https://github.com/serge-sans-paille/gast/
 
+import collections
 import os
+import threading
+import time
 
 from . import logging_utils
 from .assert_transformer import AssertTransformer
@@ -60,6 +63,62 @@ def apply_optimization(transformers):
         transformers.insert(3, BreakTransformOptimizer)
 
 
+# NOTE: Transformers whose visit methods only rewrite a node according to
+# itself and its already transformed children, and don't depend on the
+# transformed result of the whole tree. Adjacent ones are fused into a single
+# pass by FusedTransformer.
+FUSIBLE_TRANSFORMERS = (
+    CallTransformer,
+    CastTransformer,
+    DecoratorTransformer,
+    TypeHintTransformer,
+)
+
+
+def _skip_generic_visit(node):
+    return node
+
+
+class FusedTransformer(BaseTransformer):
+    """
+    Applies several transformers in one post-order walk of the AST. A node is
+    visited by the transformers in order after its children are visited by
+    all of them.
+    """
+
+    def __init__(self, transformers, wrapper_root):
+        self.root = wrapper_root.node
+        self.transformers = []
+        for transformer in transformers:
+            transformer = transformer(wrapper_root)
+            # children are visited by FusedTransformer
+            transformer.generic_visit = _skip_generic_visit
+            self.transformers.append(transformer)
+        # {transformer_name: seconds}
+        self.time = collections.defaultdict(float)
+
+    def transform(self):
+        self.visit(self.root)
+
+    def visit(self, node):
+        self.generic_visit(node)
+        nodes = [node]
+        for transformer in self.transformers:
+            start = time.perf_counter()
+            results = []
+            for n in nodes:
+                result = transformer.visit(n)
+                if isinstance(result, (list, tuple)):
+                    results.extend(result)
+                elif result is not None:
+                    results.append(result)
+            nodes = results
+            self.time[type(transformer).__name__] += time.perf_counter() - start
+        if len(nodes) == 1:
+            return nodes[0]
+        return nodes or None
+
+
 class DygraphToStaticAst(BaseTransformer):
     """
     Main class to transform Dygraph to Static Graph
@@ -67,6 +126,11 @@ class DygraphToStaticAst(BaseTransformer):
 
     def __init__(self):
         self.translator_logger = logging_utils.TranslatorLogger()
+        # Accumulated time of each transformer. {transformer_name: seconds}
+        self.transformer_time = collections.defaultdict(float)
+        # NOTE: transformer_time may be shared by DygraphToStaticAst of
+        # several threads, so it is updated and read with this lock.
+        self.transformer_time_lock = threading.Lock()
 
     def get_static_ast(self, root):
         # save root for some analysis may need global AST
@@ -80,11 +144,46 @@ class DygraphToStaticAst(BaseTransformer):
         return self.static_analysis_root
 
     def _apply(self, transformer, node_wrapper, log_level):
+        start = time.perf_counter()
         transformer(node_wrapper).transform()
+        seconds = time.perf_counter() - start
+        with self.transformer_time_lock:
+            self.transformer_time[transformer.__name__] += seconds
         self.translator_logger.log_transformed_code(
             log_level, self.root, transformer.__name__
         )
 
+    def _apply_fused(self, transformers, node_wrapper, log_level):
+        fused_transformer = FusedTransformer(transformers, node_wrapper)
+        fused_transformer.transform()
+        with self.transformer_time_lock:
+            for name, seconds in fused_transformer.time.items():
+                self.transformer_time[name] += seconds
+        self.translator_logger.log_transformed_code(
+            log_level, self.root, transformers[-1].__name__
+        )
+
+    def _group_transformers(self, transformers):
+        """
+        Groups adjacent fusible transformers, returns a list of (transformers,
+        log_level of the last one).
+        """
+        code_level = self.translator_logger.transformed_code_level
+        groups = []
+        for index, transformer in enumerate(transformers):
+            log_level = index + 1
+            if (
+                groups
+                and transformer in FUSIBLE_TRANSFORMERS
+                and groups[-1][0][-1] in FUSIBLE_TRANSFORMERS
+                # keep the code after each transformer for debugging
+                and groups[-1][1] != code_level
+            ):
+                groups[-1] = (groups[-1][0] + [transformer], log_level)
+            else:
+                groups.append(([transformer], log_level))
+        return groups
+
     def transfer_from_node_type(self, node_wrapper):
         self.translator_logger.log(
             1, f"Source code: \n{ast_to_source_code(self.root)}"
@@ -107,14 +206,20 @@ class DygraphToStaticAst(BaseTransformer):
             CallTransformer,  # transform call recursively
             CastTransformer,  # type casting statement
             DecoratorTransformer,  # transform decorators to function call
-            NameloadJstTransformer,
+            # NOTE: TypeHintTransformer is put before NameloadJstTransformer
+            # to be fused with the transformers above. It gives the same result
+            # because NameloadJstTransformer doesn't rely on typehints.
             TypeHintTransformer,  # remove all typehint in gast.Name
+            NameloadJstTransformer,
         ]
 
         apply_optimization(transformers)
 
-        for index, transformer in enumerate(transformers):
-            self._apply(transformer, node_wrapper, log_level=index + 1)
+        for group, log_level in self._group_transformers(transformers):
+            if len(group) == 1:
+                self._apply(group[0], node_wrapper, log_level)
+            else:
+                self._apply_fused(group, node_wrapper, log_level)
 
         self.translator_logger.log_transformed_code(
             logging_utils.LOG_AllTransformer, self.root, "All Transformers"
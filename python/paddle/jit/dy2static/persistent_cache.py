@@ -0,0 +1,662 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import enum
+import hashlib
+import inspect
+import itertools
+import os
+import pickle
+import tempfile
+import threading
+
+import numpy as np
+
+from paddle.fluid import core, framework
+from paddle.fluid.dygraph.base import switch_to_static_graph
+from paddle.nn.layer import layers
+from paddle.utils import flatten, pack_sequence_as
+
+from . import logging_utils
+from .utils import unwrap
+
+__all__ = []
+
+CACHE_DIR_ENV_NAME = 'TRANSLATOR_CACHE_DIR'
+
+# NOTE: Bump it when the layout of cached files changes.
+_CACHE_FORMAT_VERSION = 1
+
+_AST_DIR = 'ast'
+_PROGRAM_DIR = 'program'
+
+# Types of non-Tensor arguments and outputs that are safe to be persisted,
+# values of other types may have different meanings in different processes.
+_BASIC_TYPES = (type(None), bool, int, float, str, bytes)
+
+
+class _VariableRef:
+    """
+    Placeholder of a Variable in the persisted inputs and outputs.
+    """
+
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+
+class _InstanceRef:
+    """
+    Placeholder of the class instance in the persisted inputs.
+    """
+
+    __slots__ = ()
+
+
+class _UnsupportedValue(Exception):
+    pass
+
+
+def _md5(*items):
+    md5 = hashlib.md5()
+    for item in items:
+        md5.update(repr(item).encode('utf-8'))
+        md5.update(b'\0')
+    return md5.hexdigest()
+
+
+def _paddle_version():
+    import paddle
+
+    return (
+        paddle.__version__,
+        getattr(paddle.version, 'commit', ''),
+        _CACHE_FORMAT_VERSION,
+    )
+
+
+def _stable_repr(value):
+    """
+    Returns a representation of value that is identical across processes, and
+    raises _UnsupportedValue if there is no such one.
+    """
+    if isinstance(value, _BASIC_TYPES):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return '{}[{}]'.format(
+            type(value).__name__, ','.join(_stable_repr(v) for v in value)
+        )
+    if isinstance(value, dict):
+        items = sorted(
+            (_stable_repr(k), _stable_repr(v)) for k, v in value.items()
+        )
+        return 'dict{{{}}}'.format(','.join(k + ':' + v for k, v in items))
+    from paddle.static import InputSpec
+
+    if isinstance(value, InputSpec):
+        return repr(value)
+    raise _UnsupportedValue(type(value).__name__)
+
+
+def _build_strategy_repr(build_strategy):
+    if build_strategy is None:
+        return None
+    options = []
+    for name in sorted(dir(build_strategy)):
+        if name.startswith('_'):
+            continue
+        try:
+            value = getattr(build_strategy, name)
+        except Exception:
+            continue
+        if isinstance(value, _BASIC_TYPES):
+            options.append((name, value))
+    return options
+
+
+# Bookkeeping attributes of Layer which don't change the traced program, or
+# are covered by parameters, buffers and sublayers in the key already.
+_LAYER_SKIPPED_ATTRS = {
+    '_full_name',
+    '_helper',
+    '_parameters',
+    '_buffers',
+    '_non_persistable_buffer_names_set',
+    '_sub_layers',
+    '_loaddict_holder',
+    '_op_recorder',
+    '_original_funcs',
+}
+
+
+def _state_repr(value, visiting=None):
+    """
+    Like `_stable_repr`, but also describes functions, classes, modules and
+    plain Python objects by their qualified names and attributes. It is used
+    for the state which is read while tracing, e.g. non-Tensor attributes of
+    Layers and closures and globals of the converted function.
+    """
+    from .program_translator import StaticFunction
+
+    if isinstance(value, _BASIC_TYPES):
+        return repr(value)
+    if isinstance(value, (framework.Variable, core.eager.Tensor)):
+        # Tensors are described by parameters and buffers of the Layer
+        return 'Tensor'
+    if isinstance(value, layers.Layer):
+        # sublayers are walked by `_layer_state`
+        return 'Layer({})'.format(type(value).__qualname__)
+    if isinstance(value, StaticFunction):
+        value = value.dygraph_function
+    if inspect.ismodule(value):
+        return 'module({})'.format(value.__name__)
+    if inspect.ismethod(value):
+        value = value.__func__
+    if inspect.isclass(value) or inspect.isbuiltin(value):
+        return '{}.{}'.format(value.__module__, value.__qualname__)
+    if isinstance(value, (enum.Enum, core.VarDesc.VarType)):
+        return repr(value)
+    if isinstance(value, np.generic):
+        return '{}({!r})'.format(type(value).__name__, value.item())
+
+    if visiting is None:
+        visiting = set()
+    if id(value) in visiting:
+        raise _UnsupportedValue('recursive {}'.format(type(value).__name__))
+    visiting.add(id(value))
+    try:
+        if inspect.isfunction(value):
+            cells = value.__closure__ or ()
+            return '{}.{}({})'.format(
+                value.__module__,
+                value.__qualname__,
+                ','.join(
+                    _state_repr(cell.cell_contents, visiting) for cell in cells
+                ),
+            )
+        if isinstance(value, (list, tuple)):
+            return '{}[{}]'.format(
+                type(value).__name__,
+                ','.join(_state_repr(v, visiting) for v in value),
+            )
+        if isinstance(value, (set, frozenset)):
+            return 'set{{{}}}'.format(
+                ','.join(sorted(_state_repr(v, visiting) for v in value))
+            )
+        if isinstance(value, dict):
+            items = sorted(
+                (_state_repr(k, visiting), _state_repr(v, visiting))
+                for k, v in value.items()
+            )
+            return 'dict{{{}}}'.format(','.join(k + ':' + v for k, v in items))
+        from paddle.static import InputSpec
+
+        if isinstance(value, InputSpec):
+            return repr(value)
+        # NOTE: objects such as ParamAttr and initializers are described by
+        # their attributes, objects without `__dict__` are not supported.
+        if hasattr(value, '__dict__') and not callable(value):
+            return '{}.{}{}'.format(
+                type(value).__module__,
+                type(value).__qualname__,
+                _state_repr(vars(value), visiting),
+            )
+        raise _UnsupportedValue(type(value).__name__)
+    finally:
+        visiting.discard(id(value))
+
+
+def _layer_state(layer):
+    """
+    Returns the non-Tensor attributes of layer and all its sublayers, which
+    distinguish the instances with the same parameters, e.g. Dropout with
+    different `p`.
+    """
+    states = []
+    for name, sublayer in layer.named_sublayers(include_self=True):
+        attrs = []
+        for k, v in sorted(vars(sublayer).items()):
+            if k in _LAYER_SKIPPED_ATTRS:
+                continue
+            try:
+                attrs.append((k, _state_repr(v)))
+            except _UnsupportedValue as e:
+                raise _UnsupportedValue(
+                    "attribute '{}' of {} holds unhashable {}".format(
+                        k, type(sublayer).__qualname__, e
+                    )
+                )
+        states.append((name, type(sublayer).__qualname__, attrs))
+    return states
+
+
+def _function_state(function):
+    """
+    Returns the closure variables and the globals referenced by function.
+    """
+    names = set()
+    codes = [function.__code__]
+    while codes:
+        code = codes.pop()
+        names.update(code.co_names)
+        codes.extend(c for c in code.co_consts if inspect.iscode(c))
+    values = [
+        ('closure ' + name, cell.cell_contents)
+        for name, cell in zip(
+            function.__code__.co_freevars, function.__closure__ or ()
+        )
+    ]
+    values.extend(
+        ('global ' + name, function.__globals__[name])
+        for name in sorted(names)
+        if name in function.__globals__
+    )
+    states = []
+    for name, value in values:
+        try:
+            states.append((name, _state_repr(value)))
+        except _UnsupportedValue as e:
+            raise _UnsupportedValue(
+                "{} of {} holds unhashable {}".format(
+                    name, function.__qualname__, e
+                )
+            )
+    return states
+
+
+def _dump(path, obj):
+    """
+    Writes obj into path atomically, so that concurrent readers never see a
+    partially written file.
+    """
+    dir_name = os.path.dirname(path)
+    os.makedirs(dir_name, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=dir_name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _load(path):
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except Exception as e:
+        logging_utils.warn(
+            "Failed to load dy2static cache file {}: {}".format(path, e)
+        )
+        return None
+
+
+class PersistentCache:
+    """
+    Persists transformed ASTs and traced programs of `@paddle.jit.to_static`
+    into a directory, so that they can be reused by later processes instead
+    of re-transforming the source code and re-tracing the programs.
+
+    The cache is disabled unless a directory is set by `set_cache_dir` or
+    the environment variable `TRANSLATOR_CACHE_DIR`.
+    """
+
+    def __init__(self):
+        self._cache_dir = None
+        self._local = threading.local()
+        # {filepath: (mtime, size, md5)}
+        self._file_hashes = {}
+
+    @property
+    def cache_dir(self):
+        if self._cache_dir is not None:
+            return self._cache_dir or None
+        return os.getenv(CACHE_DIR_ENV_NAME) or None
+
+    @cache_dir.setter
+    def cache_dir(self, cache_dir):
+        assert isinstance(
+            cache_dir, (str, type(None))
+        ), "cache_dir should be str or None, but received {}".format(
+            type(cache_dir).__name__
+        )
+        self._cache_dir = cache_dir
+
+    @property
+    def enabled(self):
+        return self.cache_dir is not None
+
+    def _path(self, kind, key):
+        return os.path.join(self.cache_dir, kind, key + '.pkl')
+
+    def _file_hash(self, filepath):
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        cached = self._file_hashes.get(filepath)
+        if cached is not None and cached[:2] == (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            return cached[2]
+        with open(filepath, 'rb') as f:
+            md5 = hashlib.md5(f.read()).hexdigest()
+        self._file_hashes[filepath] = (stat.st_mtime_ns, stat.st_size, md5)
+        return md5
+
+    # Transformed AST
+
+    def _ast_key(self, func, source_code):
+        # NOTE: The origin information attached to the AST contains the file
+        # path and line numbers, so they are part of the key.
+        return _md5(
+            _paddle_version(),
+            inspect.getsourcefile(func),
+            func.__code__.co_firstlineno,
+            source_code,
+        )
+
+    def load_ast(self, func, source_code):
+        """
+        Returns the transformed AST of func saved by `save_ast`, or None if
+        it is not cached.
+        """
+        if not self.enabled:
+            return None
+        try:
+            key = self._ast_key(func, source_code)
+        except (TypeError, AttributeError):
+            return None
+        root = _load(self._path(_AST_DIR, key))
+        if root is not None:
+            logging_utils.log(
+                3, "Load transformed code of {} from cache.".format(func)
+            )
+        return root
+
+    def save_ast(self, func, source_code, root):
+        if not self.enabled:
+            return
+        try:
+            key = self._ast_key(func, source_code)
+            _dump(self._path(_AST_DIR, key), root)
+        except Exception as e:
+            logging_utils.log(
+                3, "Skip caching transformed code of {}: {}".format(func, e)
+            )
+
+    # Traced program
+
+    @contextlib.contextmanager
+    def record_sources(self):
+        """
+        Collects source files of all the functions converted in this context,
+        a traced program is only reused if none of these files is modified.
+        """
+        stack = getattr(self._local, 'sources_stack', None)
+        if stack is None:
+            stack = self._local.sources_stack = []
+        sources = set()
+        stack.append(sources)
+        try:
+            yield sources
+        finally:
+            stack.pop()
+
+    def record(self, func):
+        stack = getattr(self._local, 'sources_stack', None)
+        if not stack:
+            return
+        try:
+            filepath = inspect.getsourcefile(unwrap(func))
+        except TypeError:
+            filepath = None
+        for sources in stack:
+            # None means the source of a converted function is unknown
+            sources.add(filepath)
+
+    def _program_key(self, cache_key):
+        function = unwrap(cache_key.function_spec.dygraph_function)
+        class_instance = cache_key.class_instance
+        kwargs = cache_key.kwargs
+        return _md5(
+            _paddle_version(),
+            inspect.getsourcefile(function),
+            function.__qualname__,
+            self._file_hash(inspect.getsourcefile(function)),
+            _function_state(function),
+            None
+            if class_instance is None
+            else (
+                type(class_instance).__module__,
+                type(class_instance).__qualname__,
+                # distinguishes the instances of the same Layer class
+                [
+                    (t.name, t.shape, str(t.dtype))
+                    for t in itertools.chain(
+                        class_instance.parameters(), class_instance.buffers()
+                    )
+                ],
+                _layer_state(class_instance),
+            ),
+            _stable_repr(cache_key.input_args_with_spec),
+            _stable_repr(cache_key.input_kwargs_with_spec),
+            kwargs.get('with_hook', False),
+            kwargs.get('is_train', False),
+            kwargs.get('backend', None),
+            _build_strategy_repr(kwargs.get('build_strategy', None)),
+            core._is_fwd_prim_enabled(),
+            core._is_bwd_prim_enabled(),
+        )
+
+    def save_program(self, cache_key, concrete_program, sources):
+        """
+        Saves concrete_program traced for cache_key, sources are the files
+        collected by `record_sources` during tracing.
+        """
+        if not self.enabled:
+            return
+        try:
+            if None in sources:
+                raise _UnsupportedValue('function without source file')
+            if concrete_program.parameters and cache_key.class_instance is None:
+                raise _UnsupportedValue('parameters outside of a Layer')
+            key = self._program_key(cache_key)
+            sources = {path: self._file_hash(path) for path in sources}
+            data = {
+                'sources': sources,
+                'main_program': concrete_program.main_program.desc.serialize_to_string(),
+                'startup_program': concrete_program.startup_program.desc.serialize_to_string(),
+                'inputs': _to_refs(
+                    concrete_program.inputs, cache_key.class_instance
+                ),
+                'outputs': _to_refs(
+                    concrete_program.outputs, cache_key.class_instance
+                ),
+                'parameters': [p.name for p in concrete_program.parameters],
+            }
+            _dump(self._path(_PROGRAM_DIR, key), data)
+        except Exception as e:
+            logging_utils.log(
+                3,
+                "Skip caching traced program of {}: {}".format(
+                    cache_key.function_spec, e
+                ),
+            )
+
+    @switch_to_static_graph
+    def load_program(self, cache_key):
+        """
+        Returns (inputs, outputs, parameters, main_program, startup_program)
+        of the program saved by `save_program`, or None if it is not cached
+        or any of its source files is modified.
+        """
+        if not self.enabled:
+            return None
+        try:
+            key = self._program_key(cache_key)
+        except (_UnsupportedValue, TypeError, AttributeError):
+            return None
+        path = self._path(_PROGRAM_DIR, key)
+        data = _load(path)
+        if data is None:
+            return None
+        # NOTE: A broken or stale cache file is ignored and the program is
+        # traced again, which overwrites the file.
+        try:
+            return self._restore_program(cache_key, data)
+        except Exception as e:
+            logging_utils.warn(
+                "Failed to load dy2static cache file {}: {}".format(path, e)
+            )
+            return None
+
+    def _restore_program(self, cache_key, data):
+        for path, md5 in data['sources'].items():
+            if self._file_hash(path) != md5:
+                return None
+
+        main_program = framework.Program.parse_from_string(data['main_program'])
+        startup_program = framework.Program.parse_from_string(
+            data['startup_program']
+        )
+        main_program.random_seed = framework.default_main_program().random_seed
+        startup_program.random_seed = (
+            framework.default_startup_program().random_seed
+        )
+
+        # NOTE: Parameters are bound by name from the live Layer, a traced
+        # program is not reused if the Layer has been changed.
+        parameters = []
+        if data['parameters']:
+            class_instance = cache_key.class_instance
+            named_tensors = {
+                t.name: t
+                for t in itertools.chain(
+                    class_instance.parameters(), class_instance.buffers()
+                )
+            }
+            block = main_program.global_block()
+            for name in data['parameters']:
+                tensor = named_tensors.get(name)
+                if (
+                    tensor is None
+                    or not block.has_var(name)
+                    or list(block.var(name).shape) != list(tensor.shape)
+                    or block.var(name).dtype != tensor.dtype
+                ):
+                    return None
+                parameters.append(tensor)
+
+        inputs = _from_refs(
+            data['inputs'], main_program, cache_key.class_instance
+        )
+        outputs = _from_refs(
+            data['outputs'], main_program, cache_key.class_instance
+        )
+        logging_utils.log(
+            3,
+            "Load traced program of {} from cache.".format(
+                cache_key.function_spec
+            ),
+        )
+        return inputs, outputs, parameters, main_program, startup_program
+
+
+def _to_refs(structure, class_instance):
+    if structure is None:
+        return None
+    refs = []
+    for value in flatten(structure):
+        if isinstance(value, framework.Variable):
+            refs.append(_VariableRef(value.name))
+        elif class_instance is not None and value is class_instance:
+            refs.append(_InstanceRef())
+        elif isinstance(value, _BASIC_TYPES):
+            refs.append(value)
+        else:
+            raise _UnsupportedValue(type(value).__name__)
+    return pack_sequence_as(structure, refs)
+
+
+def _from_refs(structure, program, class_instance):
+    if structure is None:
+        return None
+    block = program.global_block()
+    values = []
+    for ref in flatten(structure):
+        if isinstance(ref, _VariableRef):
+            values.append(block.var(ref.name))
+        elif isinstance(ref, _InstanceRef):
+            values.append(class_instance)
+        else:
+            values.append(ref)
+    return pack_sequence_as(structure, values)
+
+
+_PERSISTENT_CACHE = PersistentCache()
+
+
+def set_cache_dir(cache_dir):
+    """
+    Sets the directory to persist the transformed code and traced programs of
+    `@paddle.jit.to_static`. Later processes using the same directory load them
+    from disk instead of converting the dygraph functions again, which reduces
+    the start-up time of large models.
+
+    A cached program is reused only if the Paddle version, the source files of
+    the converted functions, the input specs, the build strategy, the closures
+    and globals of the function and the non-Tensor attributes of the Layer
+    and its sublayers are all unchanged. Programs which depend on a state that
+    can not be hashed across processes are not persisted. Parameters of the
+    program are bound by name from the Layer.
+
+    There are two means to set the cache directory:
+
+    1. Call function `set_cache_dir`
+
+    2. Set environment variable `TRANSLATOR_CACHE_DIR`
+
+    **Note**:
+    `set_cache_dir` has a higher priority than the environment variable.
+
+    Args:
+        cache_dir(str|None): The cache directory. If it is None, falls back to
+            the environment variable. If it is an empty string, the cache is
+            disabled.
+
+    Examples:
+        .. code-block:: python
+
+            import paddle
+
+            paddle.jit.set_cache_dir('./to_static_cache')
+
+            net = paddle.jit.to_static(paddle.nn.Linear(10, 10))
+            out = net(paddle.rand([2, 10]))
+            # The traced program is saved in './to_static_cache' and loaded
+            # by the next process.
+    """
+    _PERSISTENT_CACHE.cache_dir = cache_dir
+
+
+def get_cache_dir():
+    return _PERSISTENT_CACHE.cache_dir
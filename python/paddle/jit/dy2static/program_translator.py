@@ -12,14 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
 import collections
+import concurrent.futures
 import inspect
+import itertools
+import os
 import textwrap
 import threading
 import warnings
 import weakref
 
-from paddle.fluid import core, framework
+from paddle.fluid import core, framework, unique_name
 from paddle.fluid.data_feeder import check_type
 from paddle.fluid.dygraph.base import (
     _switch_declarative_mode_guard_,
@@ -28,7 +32,7 @@ from paddle.fluid.dygraph.base import (
 )
 from paddle.framework import in_dynamic_mode
 from paddle.nn.layer import layers
-from paddle.utils import flatten, gast
+from paddle.utils import flatten, gast, map_structure
 
 from . import error, logging_utils
 from .ast_transformer import DygraphToStaticAst
@@ -44,6 +48,7 @@ from .origin_info import (
     update_op_callstack_with_origin_info,
 )
 from .partial_program import PartialProgramLayerHook, partial_program_from
+from .persistent_cache import _PERSISTENT_CACHE
 from .utils import (
     ALREADY_D2S,
     NO_SHAPE_VAR_TYPE,
@@ -67,6 +72,17 @@ MAX_TRACED_PROGRAM_COUNT = 10
 
 CONVERSION_OPTIONS = "__jst_not_to_static"
 
+# The number of threads to transform the callees of converted functions ahead
+# of time, 0 means transforming them when they are called.
+CONVERT_WORKERS_ENV_NAME = 'TRANSLATOR_CONVERT_WORKERS'
+
+# Options of `StaticFunction` to configure the ProgramCache and shape bucketing.
+PROGRAM_CACHE_OPTIONS = [
+    'max_program_cache_size',
+    'max_program_cache_memory',
+    'shape_buckets',
+]
+
 
 def synchronized(func):
     func.__lock__ = threading.Lock()
@@ -78,6 +94,21 @@ def synchronized(func):
     return lock_func
 
 
+class _WorkerNameGenerator(unique_name.UniqueNameGenerator):
+    """
+    Generates names in a convert worker thread. The names are distinguished
+    from the names of other threads by the worker id after the key, since the
+    transformers find the generated names by the key as prefix.
+    """
+
+    def __init__(self, worker_id):
+        super().__init__()
+        self.worker_id = worker_id
+
+    def __call__(self, key):
+        return super().__call__('{}_w{}'.format(key, self.worker_id))
+
+
 class FunctionCache:
     """
     Caches the transformed functions to avoid redundant conversions of the same function.
@@ -89,11 +120,19 @@ class FunctionCache:
         # Caches the converted ast node for same source code. {source_code: ast_root}
         self._code_to_ast_caches = {}
         self._dygraph_to_static = DygraphToStaticAst()
+        # The callees being transformed ahead of time. {source_code: Future}
+        self._prefetch_futures = {}
+        self._prefetch_lock = threading.Lock()
+        self._executor = None
+        # DygraphToStaticAst and UniqueNameGenerator of worker threads
+        self._local = threading.local()
+        self._worker_ids = itertools.count()
 
     def convert_with_cache(self, func):
         """
         Returns the cached static function or converts it when first encounters the function.
         """
+        _PERSISTENT_CACHE.record(func)
         # If hit cache, return it directly.
         static_func = self._converted_static_func_caches.get(func, None)
 
@@ -132,19 +171,130 @@ class FunctionCache:
         #  but actually they are methods in different classes.
         #  Maybe use (__class__, source_code) as key
         if source_code in self._code_to_ast_caches:
-            root_wrapper = self._code_to_ast_caches[source_code]
+            root = self._code_to_ast_caches[source_code]
         else:
-            root = gast.parse(source_code)
-            root = attach_origin_info(root, func)
-            root_wrapper = self._dygraph_to_static.get_static_ast(root)
-            self._code_to_ast_caches[source_code] = root_wrapper
+            root = self._wait_prefetched(source_code)
+            if root is None:
+                root = self._transform(func, source_code)
+                self._prefetch_callees(root, func)
+            self._code_to_ast_caches[source_code] = root
 
         # Get static function from AST
-        static_func, file_name = ast_to_func(root_wrapper.node, func)
+        static_func, file_name = ast_to_func(root, func)
 
-        create_and_update_origin_info_map(root_wrapper.node, static_func)
+        create_and_update_origin_info_map(root, static_func)
         return static_func
 
+    def _transform(self, func, source_code):
+        """
+        Transforms the source code of func into the AST of static function.
+        """
+        root = _PERSISTENT_CACHE.load_ast(func, source_code)
+        if root is None:
+            if threading.current_thread() is threading.main_thread():
+                root = self._get_static_ast(
+                    self._dygraph_to_static, func, source_code
+                )
+            else:
+                # NOTE: Names generated by worker threads neither depend on
+                # nor change the unique_name namespace of the caller.
+                dygraph_to_static, name_generator = self._worker_context()
+                with unique_name._thread_guard(name_generator):
+                    root = self._get_static_ast(
+                        dygraph_to_static, func, source_code
+                    )
+            _PERSISTENT_CACHE.save_ast(func, source_code, root)
+        return root
+
+    def _get_static_ast(self, dygraph_to_static, func, source_code):
+        root = gast.parse(source_code)
+        root = attach_origin_info(root, func)
+        return dygraph_to_static.get_static_ast(root).node
+
+    def _worker_context(self):
+        """
+        Returns the DygraphToStaticAst and the UniqueNameGenerator of current
+        worker thread.
+        """
+        context = getattr(self._local, 'context', None)
+        if context is None:
+            dygraph_to_static = DygraphToStaticAst()
+            dygraph_to_static.transformer_time = (
+                self._dygraph_to_static.transformer_time
+            )
+            dygraph_to_static.transformer_time_lock = (
+                self._dygraph_to_static.transformer_time_lock
+            )
+            name_generator = _WorkerNameGenerator(next(self._worker_ids))
+            context = self._local.context = (dygraph_to_static, name_generator)
+        return context
+
+    def transformer_time(self):
+        """
+        Returns the accumulated time in seconds spent in each AST transformer.
+        """
+        with self._dygraph_to_static.transformer_time_lock:
+            return dict(self._dygraph_to_static.transformer_time)
+
+    def _num_workers(self):
+        return int(os.getenv(CONVERT_WORKERS_ENV_NAME, 0))
+
+    def prefetch_callees(self, func, owner=None):
+        """
+        Transforms the callees of the converted func ahead of time in worker
+        threads, owner is the instance of func if it is a method.
+        """
+        if self._num_workers() <= 0:
+            return
+        try:
+            source_code = func_to_source_code(unwrap(func))
+        except (OSError, TypeError):
+            return
+        root = self._code_to_ast_caches.get(source_code)
+        if root is not None:
+            self._prefetch_callees(root, func, owner)
+
+    def _prefetch_callees(self, root, func, owner=None):
+        num_workers = self._num_workers()
+        if num_workers <= 0:
+            return
+        for callee, callee_owner in _find_callees(root, func, owner):
+            try:
+                source_code = func_to_source_code(callee)
+            except (OSError, TypeError):
+                continue
+            with self._prefetch_lock:
+                if (
+                    source_code in self._code_to_ast_caches
+                    or source_code in self._prefetch_futures
+                ):
+                    continue
+                if self._executor is None:
+                    self._executor = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=num_workers,
+                        thread_name_prefix='dy2static_convert',
+                    )
+                self._prefetch_futures[source_code] = self._executor.submit(
+                    self._prefetch, callee, callee_owner, source_code
+                )
+
+    def _prefetch(self, func, owner, source_code):
+        root = self._transform(func, source_code)
+        self._prefetch_callees(root, func, owner)
+        return root
+
+    def _wait_prefetched(self, source_code):
+        with self._prefetch_lock:
+            future = self._prefetch_futures.pop(source_code, None)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception:
+            # NOTE: Transforms it again in current thread to raise the error
+            # with the context of the caller.
+            return None
+
     def exist(self, func):
         return func in self._converted_static_func_caches
 
@@ -317,6 +467,11 @@ class StaticFunction:
             input_spec(list[InputSpec]): list of InputSpec to specify the `shape/dtype/name` information for each input argument, default None.
             **kwargs(dict): other arguments like `build_strategy` et.al.
         """
+        self._cache_options = {
+            name: kwargs.pop(name)
+            for name in PROGRAM_CACHE_OPTIONS
+            if name in kwargs
+        }
         # save the instance `self` while decorating a method of class.
 
         if inspect.ismethod(function):
@@ -350,7 +505,13 @@ class StaticFunction:
 
         self._input_spec = input_spec
         self._function_spec = FunctionSpec(function, input_spec)
-        self._program_cache = ProgramCache()
+        self._program_cache = ProgramCache(
+            max_size=self._cache_options.get('max_program_cache_size'),
+            max_memory=self._cache_options.get('max_program_cache_memory'),
+        )
+        self._shape_buckets = _check_shape_buckets(
+            self._cache_options.get('shape_buckets')
+        )
         self._descriptor_cache = weakref.WeakKeyDictionary()
         # Note: Hold a reference to ProgramTranslator for switching `enable_to_static`.
         self._program_trans = ProgramTranslator()
@@ -428,7 +589,10 @@ class StaticFunction:
 
     def _clone(self):
         return self.__class__(
-            self.dygraph_function, self._input_spec, **self._kwargs
+            self.dygraph_function,
+            self._input_spec,
+            **self._kwargs,
+            **self._cache_options,
         )
 
     def __call__(self, *args, **kwargs):
@@ -469,6 +633,8 @@ class StaticFunction:
 
         # 2. trace ops from dygraph layers and cache the generated program.
         args, kwargs = self._function_spec.unified_args_and_kwargs(args, kwargs)
+        if self._shape_buckets:
+            args, kwargs = _pad_to_buckets((args, kwargs), self._shape_buckets)
 
         try:
             concrete_program, partial_program_layer = self.get_concrete_program(
@@ -904,6 +1070,155 @@ class StaticFunction:
         return self._function_spec
 
 
+def _check_shape_buckets(shape_buckets):
+    """
+    Checks and normalizes `shape_buckets` into {axis: sorted bucket sizes}.
+    """
+    if shape_buckets is None:
+        return None
+    check_type(shape_buckets, 'shape_buckets', dict, 'to_static')
+    normalized = {}
+    for axis, buckets in shape_buckets.items():
+        assert isinstance(
+            axis, int
+        ), "The axis in shape_buckets should be int, but received {}".format(
+            type_name(axis)
+        )
+        assert len(buckets) > 0 and all(
+            isinstance(size, int) and size > 0 for size in buckets
+        ), "The buckets of axis {} should be positive integers, but received {}".format(
+            axis, buckets
+        )
+        normalized[axis] = sorted(buckets)
+    return normalized
+
+
+def _pad_to_buckets(inputs, shape_buckets):
+    """
+    Pads the Tensors in inputs with zeros at the end of each axis in
+    `shape_buckets`, rounding up its size to the smallest bucket not less
+    than it, so that inputs of different shapes share one traced program.
+    Sizes larger than all the buckets are kept unchanged.
+    """
+    import paddle
+
+    def pad(x):
+        if not isinstance(x, core.eager.Tensor):
+            return x
+        for axis, buckets in shape_buckets.items():
+            if not -len(x.shape) <= axis < len(x.shape):
+                continue
+            size = x.shape[axis]
+            index = bisect.bisect_left(buckets, size)
+            if index == len(buckets) or buckets[index] == size:
+                continue
+            pad_shape = list(x.shape)
+            pad_shape[axis] = buckets[index] - size
+            x = paddle.concat(
+                [x, paddle.zeros(pad_shape, dtype=x.dtype)], axis=axis
+            )
+        return x
+
+    return map_structure(pad, inputs)
+
+
+def _is_jst_call(node, api_name):
+    """
+    Whether node is a call of `_jst.{api_name}` with one argument.
+    """
+    return (
+        isinstance(node, gast.Call)
+        and isinstance(node.func, gast.Attribute)
+        and node.func.attr == api_name
+        and isinstance(node.func.value, gast.Name)
+        and node.func.value.id == '_jst'
+        and len(node.args) == 1
+    )
+
+
+def _strip_load(node):
+    # NameloadJstTransformer surrounds loaded names with `_jst.Ld(...)`
+    while _is_jst_call(node, 'Ld'):
+        node = node.args[0]
+    return node
+
+
+def _resolve_node(node, namespace, self_name, owner):
+    """
+    Resolves the object referred by a Name or Attribute node without running
+    the function, returns None if it is unknown.
+    """
+    node = _strip_load(node)
+    if isinstance(node, gast.Name):
+        if node.id == self_name:
+            return owner
+        return namespace.get(node.id)
+    if isinstance(node, gast.Attribute):
+        value = _resolve_node(node.value, namespace, self_name, owner)
+        if value is None:
+            return None
+        if inspect.ismodule(value):
+            return getattr(value, node.attr, None)
+        if isinstance(value, layers.Layer):
+            sublayer = value._sub_layers.get(node.attr)
+            if sublayer is not None:
+                return sublayer
+        # NOTE: Don't use getattr to avoid running properties.
+        attr = inspect.getattr_static(value, node.attr, None)
+        if isinstance(attr, staticmethod):
+            return attr.__func__
+        if inspect.isfunction(attr) and not inspect.isclass(value):
+            return attr.__get__(value)
+        return attr
+    return None
+
+
+def _find_callees(root, func, owner=None):
+    """
+    Yields (function, owner) of the callees wrapped by `_jst.Call` in the
+    transformed AST of func, which can be resolved without running func.
+    """
+    func = unwrap(func)
+    if inspect.ismethod(func):
+        func, owner = func.__func__, func.__self__
+    if not inspect.isfunction(func):
+        return
+    namespace = dict(func.__globals__)
+    for name, cell in zip(func.__code__.co_freevars, func.__closure__ or ()):
+        try:
+            namespace[name] = cell.cell_contents
+        except ValueError:
+            # the cell is empty
+            pass
+    self_name = None
+    if owner is not None and func.__code__.co_argcount > 0:
+        self_name = func.__code__.co_varnames[0]
+
+    for node in gast.walk(root):
+        if not _is_jst_call(node, 'Call'):
+            continue
+        callee = _resolve_node(node.args[0], namespace, self_name, owner)
+        callee_owner = None
+        if isinstance(callee, layers.Layer):
+            callee_owner = callee
+            callee = inspect.getattr_static(type(callee), 'forward', None)
+        if isinstance(callee, StaticFunction):
+            callee = callee.dygraph_function
+        if inspect.ismethod(callee):
+            callee, callee_owner = callee.__func__, callee.__self__
+        if (
+            not inspect.isfunction(callee)
+            or callee.__name__ == '<lambda>'
+            or inspect.isgeneratorfunction(callee)
+            or is_paddle_func(callee)
+        ):
+            continue
+        options = getattr(callee, CONVERSION_OPTIONS, None)
+        if options is not None and options.not_convert:
+            continue
+        yield callee, callee_owner
+
+
 def _verify_init_in_dynamic_mode(class_instance):
     """
     Verifies the instance is initialized in dynamic mode.
@@ -1022,6 +1337,7 @@ class ConcreteProgram:
         # Transforms dygraph function into static function and caches it.
         dygraph_function = func_spec.dygraph_function
         static_func = convert_to_static(dygraph_function)
+        _FUNCTION_CACHE.prefetch_callees(dygraph_function, class_instance)
         # apply pre\post hook for outermost layer
         hook_helper = HookHelper(
             dygraph_function, class_instance, kwargs.get("with_hook", False)
@@ -1097,6 +1413,26 @@ class ConcreteProgram:
             **kwargs,
         )
 
+    @staticmethod
+    def from_persistent_cache(cache_key):
+        """
+        Loads the main_program traced for cache_key by a previous process from
+        the persistent cache, returns None if it is not cached.
+        """
+        cached = _PERSISTENT_CACHE.load_program(cache_key)
+        if cached is None:
+            return None
+        inputs, outputs, parameters, main_program, startup_program = cached
+        return ConcreteProgram(
+            inputs=inputs,
+            outputs=outputs,
+            parameters=parameters,
+            function=cache_key.function_spec.dygraph_function,
+            main_program=main_program,
+            startup_program=startup_program,
+            **cache_key.kwargs,
+        )
+
 
 class ParametersRecorder:
     def __init__(self):
@@ -1176,12 +1512,33 @@ class ProgramCache:
 
     dy2static_error_file = "to_static.error"
 
-    def __init__(self):
-        # {hash_id : (concrete_program, partial_layer)}
+    def __init__(self, max_size=None, max_memory=None):
+        """
+        Args:
+            max_size(int|None): The maximum number of cached programs, the least
+                recently used one is evicted when exceeding it. Default None means
+                unlimited.
+            max_memory(int|None): The maximum estimated memory in bytes of the
+                cached programs, see `_estimate_memory`. Default None means unlimited.
+        """
+        assert max_size is None or max_size > 0, "max_size should be positive"
+        assert (
+            max_memory is None or max_memory > 0
+        ), "max_memory should be positive"
+        # {hash_id : (concrete_program, partial_layer)}, ordered from the least
+        # recently used to the most recently used.
         self._caches = collections.OrderedDict()
         # trace mostly recent used program
         self._recent_key = None
         self._recent_cache_key = None
+        self._max_size = max_size
+        self._max_memory = max_memory
+        # {hash_id : estimated memory in bytes}
+        self._memory = {}
+        # {hash_id : None}, the recently evicted keys to count retraces, at
+        # most max_size (or MAX_TRACED_PROGRAM_COUNT) ones are kept.
+        self._evicted_keys = collections.OrderedDict()
+        self._stats = collections.Counter()
 
     def _build_once(self, cache_key):
         # TODO(Aurelius84): Need a gloabl FLAGS to enable/disable to_prim
@@ -1189,14 +1546,20 @@ class ProgramCache:
 
         # NOTE(xiongkun): Need a global FLAGS to enable/disable fallback
         enable_fallback = enable_prim
+        concrete_program = ConcreteProgram.from_persistent_cache(cache_key)
         try:
-            concrete_program = ConcreteProgram.from_func_spec(
-                func_spec=cache_key.function_spec,
-                input_spec=cache_key.input_args_with_spec,
-                input_kwargs_spec=cache_key.input_kwargs_with_spec,
-                class_instance=cache_key.class_instance,
-                **cache_key.kwargs,
-            )
+            if concrete_program is None:
+                with _PERSISTENT_CACHE.record_sources() as sources:
+                    concrete_program = ConcreteProgram.from_func_spec(
+                        func_spec=cache_key.function_spec,
+                        input_spec=cache_key.input_args_with_spec,
+                        input_kwargs_spec=cache_key.input_kwargs_with_spec,
+                        class_instance=cache_key.class_instance,
+                        **cache_key.kwargs,
+                    )
+                _PERSISTENT_CACHE.save_program(
+                    cache_key, concrete_program, sources
+                )
         except Exception as e:
             if enable_fallback:
                 warnings.warn(
@@ -1245,11 +1608,23 @@ class ProgramCache:
         item_id = hash(item)
         self._recent_cache_key = item
         self._recent_key = item_id
-        if item_id not in self._caches:
+        if item_id in self._caches:
+            self._stats['hits'] += 1
+            self._caches.move_to_end(item_id)
+        else:
+            self._stats['misses'] += 1
+            if item_id in self._evicted_keys:
+                self._stats['retraces'] += 1
+                del self._evicted_keys[item_id]
             self._caches[item_id] = self._build_once(item)
+            self._memory[item_id] = _estimate_memory(self._caches[item_id][0])
+            self._evict()
             # Note: raise warnings if number of traced program is more than `max_tracing_count`
             current_tracing_count = len(self._caches)
-            if current_tracing_count > MAX_TRACED_PROGRAM_COUNT:
+            if (
+                self._max_size is None
+                and current_tracing_count > MAX_TRACED_PROGRAM_COUNT
+            ):
                 logging_utils.warn(
                     "Current traced program number: {} > `max_tracing_count`:{}. Too much cached programs will bring expensive overhead. "
                     "The reason may be: (1) passing tensors with different shapes, (2) passing python objects instead of tensors.".format(
@@ -1259,6 +1634,47 @@ class ProgramCache:
 
         return self._caches[item_id]
 
+    def _evict(self):
+        """
+        Evicts the least recently used programs until the cache fits in the
+        limits, the most recently used one is always kept.
+        """
+        while len(self._caches) > 1 and (
+            (self._max_size is not None and len(self._caches) > self._max_size)
+            or (self._max_memory is not None and self.memory > self._max_memory)
+        ):
+            item_id, _ = self._caches.popitem(last=False)
+            del self._memory[item_id]
+            self._evicted_keys[item_id] = None
+            self._stats['evictions'] += 1
+        max_evicted_keys = self._max_size or MAX_TRACED_PROGRAM_COUNT
+        while len(self._evicted_keys) > max_evicted_keys:
+            self._evicted_keys.popitem(last=False)
+
+    @property
+    def memory(self):
+        """
+        The estimated memory in bytes of all the cached programs.
+        """
+        return sum(self._memory.values())
+
+    def statistics(self):
+        """
+        Returns the statistics of the cache as a dict, including the number of
+        `hits`, `misses` (programs traced), `retraces` (programs traced again
+        after being evicted recently), `evictions`, the `hit_rate`, and the
+        current `size` and `memory` of the cache.
+        """
+        stats = {
+            name: self._stats[name]
+            for name in ['hits', 'misses', 'retraces', 'evictions']
+        }
+        total = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / total if total else 0.0
+        stats['size'] = len(self._caches)
+        stats['memory'] = self.memory
+        return stats
+
     def get_program_without_cache(self, cache_key):
         return self._build_once(cache_key=cache_key)
 
@@ -1290,6 +1706,30 @@ class ProgramCache:
 
     def clear(self):
         self._caches = collections.OrderedDict()
+        self._memory = {}
+        self._evicted_keys = collections.OrderedDict()
+        self._stats = collections.Counter()
+
+
+def _estimate_memory(concrete_program):
+    """
+    Estimates the memory held by a cached program with the sizes of the
+    non-persistable tensors in its main_program, which are kept alive in the
+    scopes of the partial program layer between runs. Unknown dimensions are
+    counted as 1.
+    """
+    main_program = getattr(concrete_program, 'main_program', None)
+    if main_program is None:
+        return 0
+    memory = 0
+    for var in main_program.list_vars():
+        if var.persistable or var.type != core.VarDesc.VarType.LOD_TENSOR:
+            continue
+        numel = 1
+        for dim in var.shape:
+            numel *= max(dim, 1)
+        memory += numel * core.size_of_dtype(var.dtype)
+    return memory
 
 
 class PrimHooker(PartialProgramLayerHook):
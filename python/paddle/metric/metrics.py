@@ -603,7 +603,8 @@ class Auc(Metric):
     """
     The auc metric is for binary classification.
     Refer to https://en.wikipedia.org/wiki/Receiver_operating_characteristic#Area_under_the_curve.
-    Please notice that the auc metric is implemented with python, which may be a little bit slow.
+    Statistics of predictions are kept in histograms of buckets, which can
+    be merged across metrics by :code:`merge` or ranks by :code:`all_reduce` .
 
     The `auc` function creates four local variables, `true_positives`,
     `true_negatives`, `false_positives` and `false_negatives` that are used to
@@ -697,32 +698,68 @@ class Auc(Metric):
         """
         Update the auc curve with the given predictions and labels.
 
+        Predictions are counted into histograms of buckets in bulk. If both
+        :attr:`preds` and :attr:`labels` are Tensors, buckets are counted on
+        the device of Tensors, and only the histograms are copied to host.
+
         Args:
-            preds (numpy.array): An numpy array in the shape of
+            preds (numpy.array|Tensor): An numpy array or Tensor in the shape of
                 (batch_size, 2), preds[i][j] denotes the probability of
                 classifying the instance i into the class j.
-            labels (numpy.array): an numpy array in the shape of
+            labels (numpy.array|Tensor): an numpy array or Tensor in the shape of
                 (batch_size, 1), labels[i] is either o or 1,
                 representing the label of the instance i.
         """
-        if isinstance(labels, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
+        tensor_types = (paddle.Tensor, paddle.fluid.core.eager.Tensor)
+        if isinstance(preds, tensor_types) and isinstance(labels, tensor_types):
+            self._update_tensor(preds, labels)
+            return
+
+        if isinstance(labels, tensor_types):
             labels = np.array(labels)
         elif not _is_numpy_(labels):
             raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
 
-        if isinstance(preds, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
+        if isinstance(preds, tensor_types):
             preds = np.array(preds)
         elif not _is_numpy_(preds):
             raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
 
-        for i, lbl in enumerate(labels):
-            value = preds[i, 1]
-            bin_idx = int(value * self._num_thresholds)
-            assert bin_idx <= self._num_thresholds
-            if lbl:
-                self._stat_pos[bin_idx] += 1.0
-            else:
-                self._stat_neg[bin_idx] += 1.0
+        labels = labels.reshape([-1]).astype(bool)
+        bin_idx = (preds[: len(labels), 1] * self._num_thresholds).astype(
+            'int64'
+        )
+        if bin_idx.size > 0:
+            assert 0 <= bin_idx.min() and bin_idx.max() <= self._num_thresholds
+        num_pred_buckets = self._num_thresholds + 1
+        stat_pos = np.bincount(bin_idx[labels], minlength=num_pred_buckets)
+        stat_all = np.bincount(bin_idx, minlength=num_pred_buckets)
+        self._stat_pos += stat_pos
+        self._stat_neg += stat_all - stat_pos
+
+    def _update_tensor(self, preds, labels):
+        labels = paddle.cast(
+            paddle.cast(paddle.reshape(labels, [-1]), 'bool'), 'int64'
+        )
+        bin_idx = paddle.cast(
+            preds[: labels.shape[0], 1] * self._num_thresholds, 'int64'
+        )
+        if bin_idx.shape[0] == 0:
+            return
+        num_pred_buckets = self._num_thresholds + 1
+        stat_all = paddle.bincount(bin_idx, minlength=num_pred_buckets)
+        # NOTE: weight the buckets by labels instead of selecting the positive
+        # ones, since bincount ignores minlength for an empty input.
+        stat_pos = paddle.bincount(
+            bin_idx, weights=labels, minlength=num_pred_buckets
+        )
+        # NOTE: bincount grows the histogram for out of range index
+        assert (
+            stat_all.shape[0] == num_pred_buckets
+        ), "preds should be in range [0, 1]"
+        stat_pos = stat_pos.numpy()
+        self._stat_pos += stat_pos
+        self._stat_neg += stat_all.numpy() - stat_pos
 
     @staticmethod
     def trapezoid_area(x1, x2, y1, y2):
@@ -735,24 +772,84 @@ class Auc(Metric):
         Return:
             float: the area under auc curve
         """
-        tot_pos = 0.0
-        tot_neg = 0.0
-        auc = 0.0
-
-        idx = self._num_thresholds
-        while idx >= 0:
-            tot_pos_prev = tot_pos
-            tot_neg_prev = tot_neg
-            tot_pos += self._stat_pos[idx]
-            tot_neg += self._stat_neg[idx]
-            auc += self.trapezoid_area(
-                tot_neg, tot_neg_prev, tot_pos, tot_pos_prev
-            )
-            idx -= 1
+        # accumulate buckets from the highest threshold
+        tot_pos = np.cumsum(self._stat_pos[::-1])
+        tot_neg = np.cumsum(self._stat_neg[::-1])
+        tot_pos_prev = tot_pos - self._stat_pos[::-1]
+        tot_neg_prev = tot_neg - self._stat_neg[::-1]
+        auc = np.sum(
+            self.trapezoid_area(tot_neg, tot_neg_prev, tot_pos, tot_pos_prev)
+        )
 
+        tot_pos = tot_pos[-1]
+        tot_neg = tot_neg[-1]
         return (
-            auc / tot_pos / tot_neg if tot_pos > 0.0 and tot_neg > 0.0 else 0.0
+            float(auc / tot_pos / tot_neg)
+            if tot_pos > 0.0 and tot_neg > 0.0
+            else 0.0
+        )
+
+    def merge(self, other):
+        """
+        Merge the statistics of another Auc metric into this one, so the
+        result is the same as updating with the predictions and labels of
+        both metrics.
+
+        Args:
+            other (Auc): the Auc metric to merge, which should have the same
+                :attr:`num_thresholds` .
+
+        Example:
+            .. code-block:: python
+
+              import numpy as np
+              import paddle
+
+              m1 = paddle.metric.Auc()
+              m2 = paddle.metric.Auc()
+              preds = np.random.random(size=(16, 2))
+              labels = np.random.randint(2, size=(16, 1))
+              m1.update(preds[:8], labels[:8])
+              m2.update(preds[8:], labels[8:])
+
+              m1.merge(m2)
+              res = m1.accumulate()
+        """
+        if not isinstance(other, Auc):
+            raise TypeError(
+                "The 'other' must be Auc, but received {}.".format(type(other))
+            )
+        if other._num_thresholds != self._num_thresholds:
+            raise ValueError(
+                "Cannot merge Auc with num_thresholds {} into Auc with "
+                "num_thresholds {}.".format(
+                    other._num_thresholds, self._num_thresholds
+                )
+            )
+        self._stat_pos += other._stat_pos
+        self._stat_neg += other._stat_neg
+
+    def all_reduce(self, group=None):
+        """
+        Sum the statistics of this metric over all ranks in distributed
+        training, after that :code:`accumulate` returns the global auc on
+        every rank. Only histograms of buckets are communicated instead of
+        the predictions. Only supported in dynamic graph mode.
+
+        Args:
+            group (Group, optional): The communication group, see
+                :code:`paddle.distributed.all_reduce` . Default None, which
+                means the global group.
+        """
+        if paddle.distributed.get_world_size() <= 1:
+            return
+        stats = paddle.to_tensor(
+            np.stack([self._stat_pos, self._stat_neg]), dtype='float64'
         )
+        paddle.distributed.all_reduce(stats, group=group)
+        stats = stats.numpy()
+        self._stat_pos = stats[0]
+        self._stat_neg = stats[1]
 
     def reset(self):
         """
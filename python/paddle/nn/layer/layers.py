@@ -326,8 +326,11 @@ class HookRemoveHelper:
 
     next_hook_id = 0
 
-    def __init__(self, hooks):
+    def __init__(self, hooks, layer=None):
         self._hooks_ref = weakref.ref(hooks)
+        # NOTE: the owner layer is notified to refresh its forward dispatch
+        # once the hook is removed.
+        self._layer_ref = weakref.ref(layer) if layer is not None else None
         self._hook_id = HookRemoveHelper.next_hook_id
         HookRemoveHelper.next_hook_id += 1
 
@@ -335,6 +338,9 @@ class HookRemoveHelper:
         hooks = self._hooks_ref()
         if hooks is not None and self._hook_id in hooks:
             del hooks[self._hook_id]
+        layer = self._layer_ref() if self._layer_ref is not None else None
+        if layer is not None:
+            layer._update_forward_dispatch()
 
 
 class Layer:
@@ -400,6 +406,10 @@ class Layer:
 
         self._forward_pre_hooks = collections.OrderedDict()
         self._forward_post_hooks = collections.OrderedDict()
+        # NOTE: True once the layer is built and has no forward hooks, so that
+        # __call__ can dispatch to forward directly. It is refreshed by
+        # _update_forward_dispatch whenever hooks are registered or removed.
+        self._fast_forward = False
 
         # only used in AMP Training
         self._cast_to_low_precison = True
@@ -606,8 +616,9 @@ class Layer:
                 assert (out0.numpy() == (out1.numpy()) * 2).any()
 
         """
-        hook_remove_helper = HookRemoveHelper(self._forward_post_hooks)
+        hook_remove_helper = HookRemoveHelper(self._forward_post_hooks, self)
         self._forward_post_hooks[hook_remove_helper._hook_id] = hook
+        self._update_forward_dispatch()
         return hook_remove_helper
 
     def register_forward_pre_hook(self, hook):
@@ -661,8 +672,9 @@ class Layer:
                 # hook change the linear's input to input * 2, so out0 is equal to out1.
                 assert (out0.numpy() == out1.numpy()).any()
         """
-        hook_remove_helper = HookRemoveHelper(self._forward_pre_hooks)
+        hook_remove_helper = HookRemoveHelper(self._forward_pre_hooks, self)
         self._forward_pre_hooks[hook_remove_helper._hook_id] = hook
+        self._update_forward_dispatch()
         return hook_remove_helper
 
     def create_parameter(
@@ -1199,6 +1211,13 @@ class Layer:
     def _build_once(self, *args, **kwargs):
         pass
 
+    def _update_forward_dispatch(self):
+        self._fast_forward = (
+            self._built
+            and (not self._forward_pre_hooks)
+            and (not self._forward_post_hooks)
+        )
+
     def _dygraph_call_func(self, *inputs, **kwargs):
         from paddle.distributed import parallel_helper
 
@@ -1225,6 +1244,7 @@ class Layer:
                     )
 
             self._built = True
+            self._update_forward_dispatch()
 
         if in_profiler_mode():
             with profiler.RecordEvent(
@@ -1242,6 +1262,11 @@ class Layer:
         return outputs
 
     def __call__(self, *inputs, **kwargs):
+        # NOTE: a built layer without hooks only runs forward in
+        # _dygraph_call_func, so skip it unless the profiler needs the
+        # RecordEvent.
+        if self._fast_forward and (not in_profiler_mode()):
+            return self.forward(*inputs, **kwargs)
         if (
             (not in_declarative_mode())
             and (not self._forward_pre_hooks)
@@ -1251,6 +1276,8 @@ class Layer:
             and (not in_profiler_mode())
         ):
             self._build_once(*inputs, **kwargs)
+            self._built = True
+            self._update_forward_dispatch()
             return self.forward(*inputs, **kwargs)
         else:
             return self._dygraph_call_func(*inputs, **kwargs)
@@ -240,6 +240,7 @@ def remove_weight_norm(layer, name='weight'):
         if isinstance(hook, WeightNorm) and hook.name == name:
             hook.remove(layer)
             del layer._forward_pre_hooks[k]
+            layer._update_forward_dispatch()
             return layer
 
     raise ValueError(f"weight_norm of '{name}' not found in {layer}")
@@ -19,10 +19,11 @@ from collections.abc import Callable
 import paddle
 
 from .. import _C_ops
-from ..fluid import core, framework
+from ..fluid import core, framework, unique_name
 from ..fluid.dygraph import base as imperative_base
 from ..fluid.framework import Parameter, Variable
 from ..nn.clip import GradientClipBase
+from .adam import GRAD_TYPES
 from .lr import LRScheduler
 from .optimizer import Optimizer
 
@@ -87,6 +88,8 @@ class AdamW(Optimizer):
             different semantics with the original Adam algorithm and may lead to different result.
             The default value is False.
         multi_precision (bool, optional): Whether to use multi-precision during weight updating. Default is false.
+        use_multi_tensor (bool, optional): Whether to use multi-tensor strategy to update all parameters at once.
+            The decoupled weight decay is applied to the parameters before they are updated by a single merged_adam op. Default is false.
         name (str, optional): Normally there is no need for user to set this property.
             For more information, please refer to :ref:`api_guide_Name`.
             The default value is None.
@@ -159,6 +162,7 @@ class AdamW(Optimizer):
         grad_clip=None,
         lazy_mode=False,
         multi_precision=False,
+        use_multi_tensor=False,
         name=None,
     ):
         assert learning_rate is not None
@@ -278,7 +282,15 @@ class AdamW(Optimizer):
         else:
             self._param_groups = self._parameter_list
 
-        self._use_multi_tensor = None
+        self._use_multi_tensor = use_multi_tensor
+        self._param_dict = self._create_multi_tensor_dict()
+        if self._use_multi_tensor:
+            self._moment1_dict = self._create_multi_tensor_dict()
+            self._moment2_dict = self._create_multi_tensor_dict()
+            self._beta1_pow_acc_dict = self._create_multi_tensor_dict()
+            self._beta2_pow_acc_dict = self._create_multi_tensor_dict()
+            self._master_weight_dict = self._create_multi_tensor_dict()
+            self._master_weight_dict['FP32_LODTensor'] = None
         self.regularization = None
         self._auxiliary_vars = {}
         self._already_create_accumulater = set()
@@ -589,7 +601,7 @@ class AdamW(Optimizer):
             )
         else:
             # optimize parameters in groups
-            for param_group in self._param_groups:
+            for idx, param_group in enumerate(self._param_groups):
                 params_grads = defaultdict(lambda: [])
                 for param in param_group['params']:
                     if param.stop_gradient:
@@ -619,9 +631,314 @@ class AdamW(Optimizer):
                     {k: v for k, v in param_group.items() if k != 'params'}
                 )
                 self._apply_optimize(
-                    loss=None, startup_program=None, params_grads=params_grads
+                    loss=None,
+                    startup_program=None,
+                    params_grads=params_grads,
+                    param_group_idx=idx,
                 )
 
+    def _multi_tensor_init(self, target_block, parameters, param_group_idx):
+        """
+        All parameters used for optimizer (such as: parameters, master_weight, moments for adamw) calculations are grouped into a python list by data type (bfloat16, float16, float32).
+
+        Args:
+            target_block: the block in which the loss tensor is present
+            parameters: list of parameter tensors for the optimizer
+        """
+        self._create_accumulators(target_block, parameters)
+        for param in parameters:
+            moment1 = self._get_accumulator_master(self._moment1_acc_str, param)
+            moment2 = self._get_accumulator_master(self._moment2_acc_str, param)
+            beta1_pow_acc = self._get_accumulator_master(
+                self._beta1_pow_acc_str, param
+            )
+            beta2_pow_acc = self._get_accumulator_master(
+                self._beta2_pow_acc_str, param
+            )
+
+            if param.dtype == paddle.float32:
+                key = 'FP32_LODTensor'
+            elif self._is_dtype_fp16_or_bf16(param.dtype):
+                key = 'FP16_LODTensor'
+                if self._multi_precision:
+                    self._master_weight_dict[key][param_group_idx].append(
+                        self._master_weights[param.name]
+                    )
+                else:
+                    self._master_weight_dict[key] = None
+            else:
+                raise ValueError(
+                    "Now multi_tensor_adamw only support fp32, fp16 or bf16 parameters and grad is LOD_TENSOR."
+                )
+            self._param_dict[key][param_group_idx].append(param)
+            self._moment1_dict[key][param_group_idx].append(moment1)
+            self._moment2_dict[key][param_group_idx].append(moment2)
+            self._beta1_pow_acc_dict[key][param_group_idx].append(beta1_pow_acc)
+            self._beta2_pow_acc_dict[key][param_group_idx].append(beta2_pow_acc)
+
+    def _create_multi_tensor_lr(self, param_and_grad):
+        lr = self._create_param_lr(param_and_grad)
+        if self._lr_ratio is None:
+            return lr
+        lr_ratio_ = self._lr_ratio(param_and_grad[0])
+        if lr_ratio_ == 1.0:
+            return lr
+        if framework.in_dygraph_mode():
+            return _C_ops.scale(lr, lr_ratio_, 0.0, True)
+        with paddle.static.default_main_program()._lr_schedule_guard(
+            is_with_opt=True
+        ), framework.name_scope('scale_with_lr_ratio'):
+            return lr * lr_ratio_
+
+    def _append_decoupled_weight_decay(self, target_block, params, lrs):
+        """
+        Scale the parameters by (1 - lr * coeff) before they are updated by
+        merged_adam, which is what the adamw kernel does for every parameter.
+        The scale factor is created once for every distinct learning rate.
+        """
+        factors = {}
+        for param, lr in zip(params, lrs):
+            key = (lr.name, param.dtype)
+            if key not in factors:
+                factors[key] = self._create_decay_factor(
+                    target_block, lr, param.dtype
+                )
+            if framework.in_dygraph_mode():
+                _C_ops.multiply_(param, factors[key])
+            else:
+                target_block.append_op(
+                    type="elementwise_mul",
+                    inputs={"X": param, "Y": factors[key]},
+                    outputs={"Out": param},
+                    attrs={"axis": -1},
+                    stop_gradient=True,
+                )
+
+    def _create_decay_factor(self, target_block, lr, dtype):
+        coeff = self._weight_decay
+        if framework.in_dygraph_mode():
+            if isinstance(coeff, Variable):
+                lr = _C_ops.multiply(lr, coeff)
+                coeff = 1.0
+            factor = _C_ops.scale(lr, -coeff, 1.0, True)
+            if factor.dtype != dtype:
+                factor = _C_ops.cast(factor, dtype)
+            return factor
+
+        def create_var(name, dtype):
+            return target_block.create_var(
+                name=unique_name.generate(name),
+                dtype=dtype,
+                shape=lr.shape,
+                persistable=False,
+                stop_gradient=True,
+            )
+
+        if isinstance(coeff, Variable):
+            decay = create_var("adamw_decay", lr.dtype)
+            target_block.append_op(
+                type="elementwise_mul",
+                inputs={"X": lr, "Y": coeff},
+                outputs={"Out": decay},
+                stop_gradient=True,
+            )
+            lr, coeff = decay, 1.0
+        factor = create_var("adamw_decay_factor", lr.dtype)
+        target_block.append_op(
+            type="scale",
+            inputs={"X": lr},
+            outputs={"Out": factor},
+            attrs={"scale": -coeff, "bias": 1.0, "bias_after_scale": True},
+            stop_gradient=True,
+        )
+        if factor.dtype != dtype:
+            cast_factor = create_var("adamw_decay_factor", dtype)
+            target_block.append_op(
+                type="cast",
+                inputs={"X": factor},
+                outputs={"Out": cast_factor},
+                attrs={"in_dtype": factor.dtype, "out_dtype": dtype},
+                stop_gradient=True,
+            )
+            factor = cast_factor
+        return factor
+
+    def _append_optimize_multi_tensor_op(
+        self,
+        target_block,
+        parameters_and_grads,
+        param_group_idx,
+    ):
+        """
+        For Multi Tensor, append optimize merged_operator to block.
+        """
+        assert isinstance(target_block, framework.Block)
+
+        grad_dict = {'FP32_LODTensor': [], 'FP16_LODTensor': []}
+        lr_dict = {'FP32_LODTensor': [], 'FP16_LODTensor': []}
+
+        if isinstance(parameters_and_grads, list):
+            if framework.in_dygraph_mode():
+                params = [pair[0] for pair in parameters_and_grads]
+                grads_types = core.eager.get_grads_types(params)
+                for index, tp in enumerate(grads_types):
+                    if tp == GRAD_TYPES[0]:
+                        key = 'FP32_LODTensor'
+                    elif tp == GRAD_TYPES[1] or tp == GRAD_TYPES[2]:
+                        key = 'FP16_LODTensor'
+                    else:
+                        continue
+                    grad_dict[key].append(parameters_and_grads[index][1])
+                    lr = self._create_multi_tensor_lr(
+                        parameters_and_grads[index]
+                    )
+                    lr_dict[key].append(lr)
+            else:
+                for param_and_grad in parameters_and_grads:
+                    if param_and_grad[1] is None:
+                        continue
+                    if param_and_grad[0].stop_gradient is False:
+                        key = self._get_multi_tensor_key(param_and_grad)
+                        if key is None:
+                            continue
+                        grad_dict[key].append(param_and_grad[1])
+                        lr = self._create_multi_tensor_lr(param_and_grad)
+                        lr_dict[key].append(lr)
+        else:
+            for param_and_grad in parameters_and_grads['params']:
+                if param_and_grad[1] is None:
+                    continue
+                if param_and_grad[0].stop_gradient is False:
+                    param_grad_dict = {}
+                    param_grad_dict['params'] = param_and_grad
+                    param_grad_dict.update(
+                        {
+                            k: v
+                            for k, v in parameters_and_grads.items()
+                            if k != 'params'
+                        }
+                    )
+                    param_and_grad = self._update_param_group(param_grad_dict)
+                    key = self._get_multi_tensor_key(param_and_grad)
+                    if key is None:
+                        continue
+                    grad_dict[key].append(param_and_grad[1])
+                    lr = self._create_multi_tensor_lr(param_and_grad)
+                    lr_dict[key].append(lr)
+
+        multi_tensor_list = ['FP32_LODTensor', 'FP16_LODTensor']
+        for key in multi_tensor_list:
+            if len(self._param_dict[key][param_group_idx]) > 0:
+                find_master = self._multi_precision and key == 'FP16_LODTensor'
+
+                _beta1 = (
+                    self._beta1
+                    if not isinstance(self._beta1, Variable)
+                    else self._beta1.item(0)
+                )
+                _beta2 = (
+                    self._beta2
+                    if not isinstance(self._beta2, Variable)
+                    else self._beta2.item(0)
+                )
+
+                master_weight = self._master_weight_dict[key]
+                master_weight = (
+                    master_weight[param_group_idx]
+                    if master_weight is not None
+                    else None
+                )
+                # NOTE: the decay is applied to the master weight if exists,
+                # since merged_adam writes the parameter from it.
+                decay_params, decay_lrs = [], []
+                for i, param in enumerate(
+                    self._param_dict[key][param_group_idx]
+                ):
+                    if (
+                        self._apply_decay_param_fun is not None
+                        and not self._apply_decay_param_fun(param.name)
+                    ) or (
+                        not isinstance(self._weight_decay, Variable)
+                        and self._weight_decay == 0.0
+                    ):
+                        continue
+                    decay_params.append(
+                        master_weight[i] if find_master else param
+                    )
+                    decay_lrs.append(lr_dict[key][i])
+
+                if framework.in_dygraph_mode():
+                    found_inf = self._get_auxiliary_var('found_inf')
+                    if found_inf:
+                        if isinstance(found_inf, core.eager.Tensor):
+                            self._set_auxiliary_var('found_inf', True)
+                    else:
+                        if isinstance(found_inf, core.eager.Tensor):
+                            self._set_auxiliary_var('found_inf', False)
+                        self._append_decoupled_weight_decay(
+                            target_block, decay_params, decay_lrs
+                        )
+                        _, _, _, _, _, _ = _C_ops.merged_adam_(
+                            self._param_dict[key][param_group_idx],
+                            grad_dict[key],
+                            lr_dict[key],
+                            self._moment1_dict[key][param_group_idx],
+                            self._moment2_dict[key][param_group_idx],
+                            self._beta1_pow_acc_dict[key][param_group_idx],
+                            self._beta2_pow_acc_dict[key][param_group_idx],
+                            master_weight,
+                            _beta1,
+                            _beta2,
+                            self._epsilon,
+                            find_master,
+                            False,
+                        )
+                else:
+                    self._append_decoupled_weight_decay(
+                        target_block, decay_params, decay_lrs
+                    )
+                    inputs = {
+                        "Param": self._param_dict[key][param_group_idx],
+                        "Grad": grad_dict[key],
+                        "LearningRate": lr_dict[key],
+                        "Moment1": self._moment1_dict[key][param_group_idx],
+                        "Moment2": self._moment2_dict[key][param_group_idx],
+                        "Beta1Pow": self._beta1_pow_acc_dict[key][
+                            param_group_idx
+                        ],
+                        "Beta2Pow": self._beta2_pow_acc_dict[key][
+                            param_group_idx
+                        ],
+                    }
+                    outputs = {
+                        "ParamOut": self._param_dict[key][param_group_idx],
+                        "Moment1Out": self._moment1_dict[key][param_group_idx],
+                        "Moment2Out": self._moment2_dict[key][param_group_idx],
+                        "Beta1PowOut": self._beta1_pow_acc_dict[key][
+                            param_group_idx
+                        ],
+                        "Beta2PowOut": self._beta2_pow_acc_dict[key][
+                            param_group_idx
+                        ],
+                    }
+                    attrs = {
+                        "epsilon": self._epsilon,
+                        "beta1": _beta1,
+                        "beta2": _beta2,
+                    }
+                    if find_master:
+                        inputs["MasterParam"] = master_weight
+                        outputs["MasterParamOut"] = master_weight
+                        attrs["multi_precision"] = find_master
+                    target_block.append_op(
+                        type="merged_adam",
+                        inputs=inputs,
+                        outputs=outputs,
+                        attrs=attrs,
+                        stop_gradient=True,
+                    )
+        return None
+
     def _update_param_group(self, parameters):
         self._beta1 = parameters.get('beta1', self._default_dict['beta1'])
         self._beta2 = parameters.get('beta2', self._default_dict['beta2'])
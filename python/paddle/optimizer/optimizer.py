@@ -268,7 +268,7 @@ class Optimizer:
             self._param_groups = self._parameter_list
 
         # NOTE: Multi Tensor: Pass in all parameters and gradients to the op kernel of the Optimizer at one time for updating for dygraph mode.
-        # Optimizer support list: [ paddle.optimizer.Momentum, paddle.optimizer.Adam].
+        # Optimizer support list: [ paddle.optimizer.Momentum, paddle.optimizer.Adam, paddle.optimizer.AdamW, paddle.optimizer.SGD].
         self._use_multi_tensor = None
 
         self._param_dict = self._create_multi_tensor_dict()
@@ -917,10 +917,12 @@ class Optimizer:
 
         self._create_global_learning_rate()
 
-        # NOTE: Multi Tensor support [ Momentum, Adam ] for dygraph mode
+        # NOTE: Multi Tensor support [ Momentum, Adam, AdamW, SGD ] for dygraph mode
         if self._use_multi_tensor and self.__class__.__name__ in [
             'Momentum',
             'Adam',
+            'AdamW',
+            'SGD',
         ]:
             if (
                 len(self._param_dict['FP32_LODTensor'][param_group_idx]) == 0
@@ -1630,6 +1632,20 @@ class Optimizer:
         """
         pass
 
+    def _get_multi_tensor_key(self, param_and_grad):
+        """
+        Get the key of the multi tensor dicts that the parameter belongs to,
+        or None if the parameter can not be updated by the merged operator.
+        """
+        param, grad = param_and_grad
+        if grad.type != core.VarDesc.VarType.LOD_TENSOR:
+            return None
+        if param.dtype == paddle.float32:
+            return 'FP32_LODTensor'
+        if self._is_dtype_fp16_or_bf16(param.dtype):
+            return 'FP16_LODTensor'
+        return None
+
     def _is_dtype_fp16_or_bf16(self, dtype):
         """
         check the dtype is fp16 or the dtype is bf16
@@ -14,9 +14,10 @@
 
 import warnings
 
+import paddle
 from paddle import _C_ops
 
-from ..fluid import framework
+from ..fluid import core, framework
 from ..fluid.dygraph import no_grad
 from ..fluid.framework import in_dygraph_mode
 from .optimizer import Optimizer
@@ -49,6 +50,10 @@ class SGD(Optimizer):
             some derived class of ``GradientClipBase`` . There are three cliping strategies
             ( :ref:`api_fluid_clip_GradientClipByGlobalNorm` , :ref:`api_fluid_clip_GradientClipByNorm` ,
             :ref:`api_fluid_clip_GradientClipByValue` ). Default None, meaning there is no gradient clipping.
+        multi_precision (bool, optional): Whether to use multi-precision during weight updating. Default is false.
+        use_multi_tensor (bool, optional): Whether to use multi-tensor strategy to update all parameters at once.
+            The parameters are updated by a single merged_momentum op with zero momentum, which needs an extra
+            buffer with the same size as each parameter. Default is false.
         name (str, optional): The default value is None. Normally there is no need for user
                 to set this property. For more information, please refer to
                 :ref:`api_guide_Name` .
@@ -70,6 +75,8 @@ class SGD(Optimizer):
 
     """
 
+    _velocity_acc_str = "velocity"
+
     def __init__(
         self,
         learning_rate=0.001,
@@ -77,6 +84,7 @@ class SGD(Optimizer):
         weight_decay=None,
         grad_clip=None,
         multi_precision=False,
+        use_multi_tensor=False,
         name=None,
     ):
         if learning_rate is None:
@@ -92,6 +100,13 @@ class SGD(Optimizer):
         self._multi_precision = multi_precision
         self._master_weights = {}
 
+        self._use_multi_tensor = use_multi_tensor
+        if self._use_multi_tensor:
+            self._param_dict = self._create_multi_tensor_dict()
+            self._velocity_dict = self._create_multi_tensor_dict()
+            self._master_weight_dict = self._create_multi_tensor_dict()
+            self._master_weight_dict['FP32_LODTensor'] = None
+
     def _create_accumulators(self, block, parameters):
         assert isinstance(block, framework.Block)
         if isinstance(parameters, dict):
@@ -103,6 +118,9 @@ class SGD(Optimizer):
                 continue
             if self._multi_precision and self._is_dtype_fp16_or_bf16(p.dtype):
                 master_p = self._create_master_weight(p)
+                # NOTE: velocity is only used by merged_momentum in multi tensor mode.
+                if self._use_multi_tensor:
+                    self._add_accumulator(self._velocity_acc_str, master_p)
                 self._already_create_accumulater.add(p.name)
                 continue
             if (
@@ -113,6 +131,9 @@ class SGD(Optimizer):
                     "Accumulating with FP16/BF16 in optimizer can lead to poor accuracy or slow convergence."
                     "Consider using multi_precision=True option of the Adam optimizer."
                 )
+            if self._use_multi_tensor:
+                self._add_accumulator(self._velocity_acc_str, p)
+                self._already_create_accumulater.add(p.name)
 
     @no_grad
     def _append_optimize_op(self, block, param_and_grad):
@@ -165,6 +186,130 @@ class SGD(Optimizer):
 
             return sgd_op
 
+    def _multi_tensor_init(self, target_block, parameters, param_group_idx):
+        """
+        All parameters used for optimizer (such as: parameters, master_weight, velocity_acc for merged_momentum) calculations are grouped into a python list by data type (bfloat16, float16, float32).
+
+        Args:
+            target_block: the block in which the loss tensor is present
+            parameters: list of parameter tensors for the optimizer
+        """
+        self._create_accumulators(target_block, parameters)
+        for param in parameters:
+            velocity_acc = self._get_accumulator_master(
+                self._velocity_acc_str, param
+            )
+            if param.dtype == paddle.float32:
+                key = 'FP32_LODTensor'
+            elif self._is_dtype_fp16_or_bf16(param.dtype):
+                key = 'FP16_LODTensor'
+                if self._multi_precision:
+                    self._master_weight_dict[key][param_group_idx].append(
+                        self._master_weights[param.name]
+                    )
+                else:
+                    self._master_weight_dict[key] = None
+            else:
+                raise ValueError(
+                    "Now multi_tensor_sgd only support fp32, fp16 or bf16 parameters and grad is LOD_TENSOR."
+                )
+            self._param_dict[key][param_group_idx].append(param)
+            self._velocity_dict[key][param_group_idx].append(velocity_acc)
+
+    def _append_optimize_multi_tensor_op(
+        self,
+        target_block,
+        parameters_and_grads,
+        param_group_idx,
+    ):
+        """
+        For Multi Tensor, append optimize merged_operator to block.
+        """
+        assert isinstance(target_block, framework.Block)
+
+        grad_dict = {'FP32_LODTensor': [], 'FP16_LODTensor': []}
+        lr_dict = {'FP32_LODTensor': [], 'FP16_LODTensor': []}
+
+        if isinstance(parameters_and_grads, dict):
+            parameters_and_grads = self._update_param_group(
+                parameters_and_grads
+            )
+        for param_and_grad in parameters_and_grads:
+            if param_and_grad[1] is None:
+                continue
+            if param_and_grad[0].stop_gradient is False:
+                key = self._get_multi_tensor_key(param_and_grad)
+                if key is None:
+                    continue
+                grad_dict[key].append(param_and_grad[1])
+                lr = self._create_param_lr(param_and_grad)
+                lr_dict[key].append(lr)
+
+        multi_tensor_list = ['FP32_LODTensor', 'FP16_LODTensor']
+        for key in multi_tensor_list:
+            if len(self._param_dict[key][param_group_idx]) > 0:
+                find_master = self._multi_precision and key == 'FP16_LODTensor'
+
+                master_weight = self._master_weight_dict[key]
+                master_weight = (
+                    master_weight[param_group_idx]
+                    if master_weight is not None
+                    else None
+                )
+                # NOTE: merged_momentum launches a single kernel for all the
+                # parameters only if they share the learning rate.
+                lrs = lr_dict[key]
+                if all(lr is lrs[0] for lr in lrs):
+                    lrs = lrs[:1]
+
+                if in_dygraph_mode():
+                    found_inf = self._get_auxiliary_var('found_inf')
+                    if found_inf:
+                        if isinstance(found_inf, core.eager.Tensor):
+                            self._set_auxiliary_var('found_inf', True)
+                    else:
+                        if isinstance(found_inf, core.eager.Tensor):
+                            self._set_auxiliary_var('found_inf', False)
+                        _, _, _ = _C_ops.merged_momentum_(
+                            self._param_dict[key][param_group_idx],
+                            grad_dict[key],
+                            self._velocity_dict[key][param_group_idx],
+                            lrs,
+                            master_weight,
+                            0.0,
+                            False,
+                            [],
+                            [],
+                            find_master,
+                            1.0,
+                        )
+                else:
+                    inputs = {
+                        "Param": self._param_dict[key][param_group_idx],
+                        "Grad": grad_dict[key],
+                        "Velocity": self._velocity_dict[key][param_group_idx],
+                        "LearningRate": lrs,
+                    }
+                    outputs = {
+                        "ParamOut": self._param_dict[key][param_group_idx],
+                        "VelocityOut": self._velocity_dict[key][
+                            param_group_idx
+                        ],
+                    }
+                    attrs = {"mu": 0.0, "use_nesterov": False}
+                    if find_master:
+                        inputs["MasterParam"] = master_weight
+                        outputs["MasterParamOut"] = master_weight
+                        attrs["multi_precision"] = find_master
+                    target_block.append_op(
+                        type="merged_momentum",
+                        inputs=inputs,
+                        outputs=outputs,
+                        attrs=attrs,
+                        stop_gradient=True,
+                    )
+        return None
+
     def _update_param_group(self, parameters):
         parameters = parameters.get('params')
         return parameters
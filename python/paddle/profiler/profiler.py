@@ -354,6 +354,9 @@ class Profiler:
         profile_memory (bool, optional): If it is True, collect tensor memory allocation and release information. Default: False.
         custom_device_types (list, optional): If targets contain profiler.ProfilerTarget.CUSTOM_DEVICE, custom_device_types select the custom device type for profiling. The default value represents all custom devices will be selected.
         with_flops (bool, optional): If it is True, the flops of the op will be calculated. Default: False.
+        streaming_summary (bool, optional): If it is True, the statistic of each returned profiling result is folded into a running summary when it
+            is returned, so :ref:`summary <api_paddle_profiler_Profiler_summary>` covers all profiling periods of the scheduler rather than the last one,
+            and the event trees of previous periods can be released. Default: False.
 
     Examples:
         1. profiling range [2, 5).
@@ -476,6 +479,7 @@ class Profiler:
         emit_nvtx: Optional[bool] = False,
         custom_device_types: Optional[list] = [],
         with_flops: Optional[bool] = False,
+        streaming_summary: Optional[bool] = False,
     ):
         supported_targets = _get_supported_targets()
         if targets:
@@ -538,6 +542,8 @@ class Profiler:
         self.profile_memory = profile_memory
         self.with_flops = with_flops
         self.emit_nvtx = emit_nvtx
+        self.streaming_summary = streaming_summary
+        self._statistic_data = None
 
     def __enter__(self):
         self.start()
@@ -637,6 +643,7 @@ class Profiler:
             or self.current_state == ProfilerState.RECORD_AND_RETURN
         ):
             self.profiler_result = self.profiler.stop()
+            self._fold_profiler_result()
             if self.on_trace_ready:
                 self.on_trace_ready(self)
         utils._is_profiler_used = False
@@ -798,9 +805,24 @@ class Profiler:
                 self.profiler_result = self.profiler.stop()
                 self.profiler.prepare()
                 self.profiler.start()
+            self._fold_profiler_result()
             if self.on_trace_ready:
                 self.on_trace_ready(self)
 
+    def _fold_profiler_result(self):
+        r'''
+        Fold the statistic of current profiler result into the running summary
+        when ``streaming_summary`` is enabled.
+        '''
+        if not self.streaming_summary or not self.profiler_result:
+            return
+        if self._statistic_data is None:
+            self._statistic_data = StatisticData()
+        self._statistic_data.add(
+            self.profiler_result.get_data(),
+            self.profiler_result.get_extra_info(),
+        )
+
     def export(self, path="", format="json"):
         r"""
         Exports the tracing data to file.
@@ -867,11 +889,16 @@ class Profiler:
         if isinstance(views, SummaryView):
             views = [views]
 
-        if self.profiler_result:
+        if self.streaming_summary:
+            statistic_data = self._statistic_data
+        elif self.profiler_result:
             statistic_data = StatisticData(
                 self.profiler_result.get_data(),
                 self.profiler_result.get_extra_info(),
             )
+        else:
+            statistic_data = None
+        if statistic_data is not None:
             print(
                 _build_table(
                     statistic_data,
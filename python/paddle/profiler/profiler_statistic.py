@@ -11,17 +11,20 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import array
 import collections
 import re
 from enum import Enum
 
+import numpy as np
+
 from paddle.fluid.core import TracerEventType, TracerMemEventType
 from paddle.utils.flops import flops
 
 from .statistic_helper import (
-    intersection_ranges,
-    merge_ranges,
-    merge_self_ranges,
+    _intersection_array,
+    _merge_self_array,
+    _to_list,
     sum_ranges,
 )
 
@@ -45,6 +48,13 @@ _AllTracerEventType = [
 
 _CommunicationOpName = ['allreduce', 'broadcast', 'rpc']
 
+_ModelPerspectiveEventType = [
+    TracerEventType.Forward,
+    TracerEventType.Dataloader,
+    TracerEventType.Backward,
+    TracerEventType.Optimization,
+]
+
 
 class SortedKeys(Enum):
     r"""
@@ -95,6 +105,10 @@ class HostStatisticNode:
 
     def __init__(self, hostnode):
         self.hostnode = hostnode
+        # NOTE: name and type are accessed frequently in analysis, cache
+        # them rather than getting from hostnode every time
+        self.name = hostnode.name
+        self.type = hostnode.type
         self.children_node = []
         self.runtime_node = []
         self.cpu_time = 0
@@ -104,6 +118,8 @@ class HostStatisticNode:
         self.general_gpu_time = 0  # besides kernel, include time of gpu events like memcpy and memset
         self.self_general_gpu_time = 0
         self.flops = 0
+        # whether any ancestor except root is a model perspective node
+        self.under_model_perspective = False
 
     def cal_flops(self):
         if self.hostnode.type == TracerEventType.Operator:
@@ -116,19 +132,27 @@ class HostStatisticNode:
                 )
 
     def cal_statistic(self):
+        for child in self.children_node:
+            child.cal_statistic()
+        for rt in self.runtime_node:
+            rt.cal_statistic()
+        self.cal_self_statistic()
+
+    def cal_self_statistic(self):
+        r'''
+        Calculate statistic metrics from children and runtime nodes, whose
+        statistic metrics have been calculated.
+        '''
         self.cpu_time = self.hostnode.end_ns - self.hostnode.start_ns
         self.self_cpu_time = self.cpu_time
         self.cal_flops()
         for child in self.children_node:
-            child.cal_flops()
-            child.cal_statistic()
             self.gpu_time += child.gpu_time
             self.general_gpu_time += child.general_gpu_time
             self.self_cpu_time -= child.end_ns - child.start_ns
             self.flops += child.flops
 
         for rt in self.runtime_node:
-            rt.cal_statistic()
             self.self_cpu_time -= rt.end_ns - rt.start_ns
             self.gpu_time += rt.gpu_time
             self.self_gpu_time += rt.gpu_time
@@ -336,9 +360,68 @@ def wrap_tree(nodetrees):
     return node_statistic_tree, newresults
 
 
+def walk_tree(nodetrees, summaries):
+    '''
+    Wrap profiler result tree with HostStatisticNode and calculate node statistic metrics
+    in post order, each node is added to summaries by `summary.add_node` as soon as its
+    metrics are calculated, and the root node of each thread by `summary.add_root`.
+
+    Different from wrap_tree, the whole wrapped tree is never held. HostStatisticNode of a
+    subtree under root node (e.g. a ProfileStep) is released after the subtree is added,
+    so the memory is bounded by the largest subtree instead of the whole profiler result.
+    '''
+    for thread_id, rootnode in nodetrees.items():
+        root_statistic_node = HostStatisticNode(rootnode)
+        # stack of (statistic node, iterator of children of the original node)
+        stack = [(root_statistic_node, iter(rootnode.children_node))]
+        while stack:
+            current_statistic_node, children = stack[-1]
+            childnode = next(children, None)
+            if childnode is not None:
+                child_statistic_node = HostStatisticNode(childnode)
+                if len(stack) > 1:
+                    child_statistic_node.under_model_perspective = (
+                        current_statistic_node.under_model_perspective
+                        or current_statistic_node.type
+                        in _ModelPerspectiveEventType
+                    )
+                stack.append(
+                    (child_statistic_node, iter(childnode.children_node))
+                )
+                continue
+
+            stack.pop()
+            for runtimenode in current_statistic_node.hostnode.runtime_node:
+                runtime_statistic_node = HostStatisticNode(runtimenode)
+                runtime_statistic_node.cal_self_statistic()
+                current_statistic_node.runtime_node.append(
+                    runtime_statistic_node
+                )
+            current_statistic_node.cal_self_statistic()
+            if not stack:
+                for summary in summaries:
+                    summary.add_root(current_statistic_node)
+                continue
+            for summary in summaries:
+                summary.add_node(current_statistic_node)
+            # subtrees under root node are not referenced any more
+            if len(stack) > 1:
+                stack[-1][0].children_node.append(current_statistic_node)
+
+
+def _ranges_to_array(ranges):
+    # ranges are collected as flatten int64 array of start and end pairs
+    return np.frombuffer(ranges, dtype=np.int64).reshape(-1, 2)
+
+
 class TimeRangeSummary:
     r"""
     Analyse time ranges for each TracerEventType, and summarize the time.
+
+    Profiler results can be added one by one with `parse`, e.g. results of
+    successive record windows. Time ranges of the last added result are kept
+    in `CPUTimeRange` and `GPUTimeRange`, and the summarized time of all
+    added results is accumulated, so the memory does not grow with them.
     """
 
     def __init__(self):
@@ -350,64 +433,74 @@ class TimeRangeSummary:
         self.GPUTimeRangeSum = collections.defaultdict(
             lambda: collections.defaultdict(int)
         )
+        # time of each event type on all devices, overlapped time is
+        # counted once
+        self.GPUTimeRangeSumAllDevices = collections.defaultdict(int)
         self.call_times = collections.defaultdict(int)
+        self._reset_ranges()
+
+    def _reset_ranges(self):
+        self._cpu_ranges = collections.defaultdict(lambda: array.array('q'))
+        self._gpu_ranges = collections.defaultdict(
+            lambda: collections.defaultdict(lambda: array.array('q'))
+        )  # device_id/type
 
     def parse(self, nodetrees):
         r"""
         Analysis node trees in profiler result, and get time range for different tracer event type.
         """
-        thread2hostnodes = traverse_tree(nodetrees)
-        for threadid, hostnodes in thread2hostnodes.items():
-            CPUTimeRange = collections.defaultdict(list)
-            GPUTimeRange = collections.defaultdict(
-                lambda: collections.defaultdict(
-                    lambda: collections.defaultdict(list)
-                )
-            )  # device_id/type/stream_id
-            for hostnode in hostnodes[1:]:  # skip root node
+        walk_tree(nodetrees, [self])
+        self.finish()
 
-                CPUTimeRange[hostnode.type].append(
-                    (hostnode.start_ns, hostnode.end_ns)
-                )
-                self.call_times[hostnode.type] += 1
-                for runtimenode in hostnode.runtime_node:
-                    CPUTimeRange[runtimenode.type].append(
-                        (runtimenode.start_ns, runtimenode.end_ns)
-                    )
-                    self.call_times[runtimenode.type] += 1
-                    for devicenode in runtimenode.device_node:
-                        GPUTimeRange[devicenode.device_id][devicenode.type][
-                            devicenode.stream_id
-                        ].append((devicenode.start_ns, devicenode.end_ns))
-                        self.call_times[devicenode.type] += 1
-
-            for event_type, time_ranges in CPUTimeRange.items():
-                time_ranges = merge_self_ranges(time_ranges, is_sorted=False)
-                self.CPUTimeRange[event_type] = merge_ranges(
-                    self.CPUTimeRange[event_type], time_ranges, is_sorted=True
+    def add_root(self, root_node):
+        pass
+
+    def add_node(self, hostnode):
+        self._cpu_ranges[hostnode.type].extend(
+            (hostnode.start_ns, hostnode.end_ns)
+        )
+        self.call_times[hostnode.type] += 1
+        for runtimenode in hostnode.hostnode.runtime_node:
+            self._cpu_ranges[runtimenode.type].extend(
+                (runtimenode.start_ns, runtimenode.end_ns)
+            )
+            self.call_times[runtimenode.type] += 1
+            for devicenode in runtimenode.device_node:
+                self._gpu_ranges[devicenode.device_id][devicenode.type].extend(
+                    (devicenode.start_ns, devicenode.end_ns)
                 )
-            for device_id, device_time_ranges in GPUTimeRange.items():
-                for event_type, event_time_ranges in device_time_ranges.items():
-                    for stream_id, time_ranges in event_time_ranges.items():
-                        time_ranges = merge_self_ranges(
-                            time_ranges, is_sorted=False
-                        )
-                        self.GPUTimeRange[device_id][event_type] = merge_ranges(
-                            self.GPUTimeRange[device_id][event_type],
-                            time_ranges,
-                            is_sorted=True,
-                        )
+                self.call_times[devicenode.type] += 1
+
+    def finish(self):
+        r"""
+        Merge time ranges collected from the node trees added, and accumulate the time.
+        """
+        self.CPUTimeRange = collections.defaultdict(list)
+        self.GPUTimeRange = collections.defaultdict(
+            lambda: collections.defaultdict(list)
+        )
+        for event_type, time_ranges in self._cpu_ranges.items():
+            time_ranges = _merge_self_array(_ranges_to_array(time_ranges))
+            self.CPUTimeRange[event_type] = _to_list(time_ranges)
+            self.CPUTimeRangeSum[event_type] += sum_ranges(time_ranges)
 
-        for event_type, time_ranges in self.CPUTimeRange.items():
-            self.CPUTimeRangeSum[event_type] = sum_ranges(time_ranges)
-        for device_id, device_time_ranges in self.GPUTimeRange.items():
+        all_devices_ranges = collections.defaultdict(list)
+        for device_id, device_time_ranges in self._gpu_ranges.items():
             for event_type, time_ranges in device_time_ranges.items():
-                self.GPUTimeRangeSum[device_id][event_type] = sum_ranges(
+                time_ranges = _merge_self_array(_ranges_to_array(time_ranges))
+                self.GPUTimeRange[device_id][event_type] = _to_list(time_ranges)
+                self.GPUTimeRangeSum[device_id][event_type] += sum_ranges(
                     time_ranges
                 )
+                all_devices_ranges[event_type].append(time_ranges)
+        for event_type, time_ranges in all_devices_ranges.items():
+            self.GPUTimeRangeSumAllDevices[event_type] += sum_ranges(
+                _merge_self_array(np.concatenate(time_ranges))
+            )
+        self._reset_ranges()
 
     def get_gpu_devices(self):
-        return self.GPUTimeRange.keys()
+        return self.GPUTimeRangeSum.keys()
 
     def get_gpu_range_sum(self, device_id, event_type):
         return self.GPUTimeRangeSum[device_id][event_type]
@@ -420,6 +513,9 @@ class DistributedSummary:
     r"""
     Analysis communication and computation time range, and their overlap.
     The computation time is all kernel except kernels for communication like nccl.
+
+    Similar to TimeRangeSummary, time ranges of the last added result are kept,
+    and the time and calls of all added results are accumulated.
     """
 
     def __init__(self):
@@ -430,80 +526,99 @@ class DistributedSummary:
         self.overlap_range = []
         self.cpu_calls = 0
         self.gpu_calls = 0
+        self.cpu_communication_time = 0
+        self.gpu_communication_time = 0
+        self.communication_time = 0
+        self.computation_time = 0
+        self.overlap_time = 0
+        self._reset_ranges()
+
+    def _reset_ranges(self):
+        self._cpu_communication_ranges = array.array('q')
+        self._gpu_communication_ranges = array.array('q')
+        self._computation_ranges = array.array('q')
 
     def parse(self, nodetrees):
         '''
         Collect all communication and computation time ranges.
         '''
-        thread2hostnodes = traverse_tree(nodetrees)
-        for threadid, hostnodes in thread2hostnodes.items():
-            for hostnode in hostnodes[1:]:  # skip root node
-                # case 1: TracerEventType is Communication
-                if hostnode.type == TracerEventType.Communication:
-                    self.cpu_communication_range.append(
-                        (hostnode.start_ns, hostnode.end_ns)
-                    )
-                    device_nodes = get_device_nodes(hostnode)
-                    for device_node in device_nodes:
-                        if device_node.type == TracerEventType.Kernel:
-                            self.gpu_communication_range.append(
-                                (device_node.start_ns, device_node.end_ns)
-                            )
+        walk_tree(nodetrees, [self])
+        self.finish()
 
-                # case 2: TracerEventType is Operator but is communication op
-                elif hostnode.type == TracerEventType.Operator and any(
-                    [
-                        name in hostnode.name.lower()
-                        for name in _CommunicationOpName
-                    ]
-                ):
-                    self.cpu_communication_range.append(
-                        (hostnode.start_ns, hostnode.end_ns)
+    def add_root(self, root_node):
+        pass
+
+    def add_node(self, hostnode):
+        # case 1: TracerEventType is Communication
+        # case 2: TracerEventType is Operator but is communication op
+        if hostnode.type == TracerEventType.Communication or (
+            hostnode.type == TracerEventType.Operator
+            and any(
+                [name in hostnode.name.lower() for name in _CommunicationOpName]
+            )
+        ):
+            self._cpu_communication_ranges.extend(
+                (hostnode.start_ns, hostnode.end_ns)
+            )
+            device_nodes = get_device_nodes(hostnode.hostnode)
+            for device_node in device_nodes:
+                if device_node.type == TracerEventType.Kernel:
+                    self._gpu_communication_ranges.extend(
+                        (device_node.start_ns, device_node.end_ns)
                     )
-                    device_nodes = get_device_nodes(hostnode)
-                    for device_node in device_nodes:
-                        if device_node.type == TracerEventType.Kernel:
-                            self.gpu_communication_range.append(
-                                (device_node.start_ns, device_node.end_ns)
+
+        # case 3: Others, filter kernels named with nccl
+        else:
+            for runtimenode in hostnode.hostnode.runtime_node:
+                for devicenode in runtimenode.device_node:
+                    if devicenode.type == TracerEventType.Kernel:
+                        kernel_name = devicenode.name.lower()
+                        if 'nccl' in kernel_name or 'xccl' in kernel_name:
+                            self._gpu_communication_ranges.extend(
+                                (devicenode.start_ns, devicenode.end_ns)
+                            )
+                        else:
+                            self._computation_ranges.extend(
+                                (devicenode.start_ns, devicenode.end_ns)
                             )
 
-                # case 3: Others, filter kernels named with nccl
-                else:
-                    for runtimenode in hostnode.runtime_node:
-                        for devicenode in runtimenode.device_node:
-                            if devicenode.type == TracerEventType.Kernel:
-                                kernel_name = devicenode.name.lower()
-                                if (
-                                    'nccl' in kernel_name
-                                    or 'xccl' in kernel_name
-                                ):
-                                    self.gpu_communication_range.append(
-                                        (devicenode.start_ns, devicenode.end_ns)
-                                    )
-                                else:
-                                    self.computation_range.append(
-                                        (devicenode.start_ns, devicenode.end_ns)
-                                    )
-        self.cpu_calls = len(set(self.cpu_communication_range))
-        self.gpu_calls = len(set(self.gpu_communication_range))
-        self.cpu_communication_range = merge_self_ranges(
-            self.cpu_communication_range, is_sorted=False
+    def finish(self):
+        r"""
+        Merge time ranges collected from the node trees added, and accumulate the time.
+        """
+        cpu_communication_range = _ranges_to_array(
+            self._cpu_communication_ranges
         )
-        self.gpu_communication_range = merge_self_ranges(
-            self.gpu_communication_range, is_sorted=False
+        gpu_communication_range = _ranges_to_array(
+            self._gpu_communication_ranges
         )
-        self.communication_range = merge_ranges(
-            self.cpu_communication_range,
-            self.gpu_communication_range,
-            is_sorted=True,
+        self.cpu_calls += len(np.unique(cpu_communication_range, axis=0))
+        self.gpu_calls += len(np.unique(gpu_communication_range, axis=0))
+        cpu_communication_range = _merge_self_array(cpu_communication_range)
+        gpu_communication_range = _merge_self_array(gpu_communication_range)
+        communication_range = _merge_self_array(
+            np.concatenate([cpu_communication_range, gpu_communication_range])
         )
-        self.computation_range = merge_self_ranges(
-            self.computation_range, is_sorted=False
+        computation_range = _merge_self_array(
+            _ranges_to_array(self._computation_ranges)
         )
-        self.overlap_range = intersection_ranges(
-            self.communication_range, self.computation_range, is_sorted=True
+        overlap_range = _intersection_array(
+            communication_range, computation_range
         )
 
+        self.cpu_communication_time += sum_ranges(cpu_communication_range)
+        self.gpu_communication_time += sum_ranges(gpu_communication_range)
+        self.communication_time += sum_ranges(communication_range)
+        self.computation_time += sum_ranges(computation_range)
+        self.overlap_time += sum_ranges(overlap_range)
+
+        self.cpu_communication_range = _to_list(cpu_communication_range)
+        self.gpu_communication_range = _to_list(gpu_communication_range)
+        self.communication_range = _to_list(communication_range)
+        self.computation_range = _to_list(computation_range)
+        self.overlap_range = _to_list(overlap_range)
+        self._reset_ranges()
+
 
 class EventSummary:
     r"""
@@ -639,54 +754,41 @@ class EventSummary:
         r"""
         Analysis operator event in the nodetress.
         """
-        node_statistic_trees, thread2host_statistic_nodes = wrap_tree(nodetrees)
-        for (
-            threadid,
-            host_statistic_nodes,
-        ) in thread2host_statistic_nodes.items():
-            for host_statistic_node in host_statistic_nodes[
-                1:
-            ]:  # skip root node
-                if host_statistic_node.type == TracerEventType.Operator:
-                    self.add_operator_item(host_statistic_node)
+        walk_tree(nodetrees, [self])
+
+    def add_root(self, root_node):
+        self._add_kernel_items(root_node)
+
+    def add_node(self, host_statistic_node):
+        if host_statistic_node.type == TracerEventType.Operator:
+            self.add_operator_item(host_statistic_node)
+        if (
+            host_statistic_node.type == TracerEventType.UserDefined
+            or host_statistic_node.type == TracerEventType.PythonUserDefined
+        ):
+            if (
+                'memcpy' in host_statistic_node.name.lower()
+                or 'memorycopy' in host_statistic_node.name.lower()
+                or 'memset' in host_statistic_node.name.lower()
+            ):
+                self.add_memory_manipulation_item(host_statistic_node)
+            else:
                 if (
-                    host_statistic_node.type == TracerEventType.UserDefined
-                    or host_statistic_node.type
+                    host_statistic_node.type
                     == TracerEventType.PythonUserDefined
                 ):
-                    if (
-                        'memcpy' in host_statistic_node.name.lower()
-                        or 'memorycopy' in host_statistic_node.name.lower()
-                        or 'memset' in host_statistic_node.name.lower()
-                    ):
-                        self.add_memory_manipulation_item(host_statistic_node)
-                    else:
-                        if (
-                            host_statistic_node.type
-                            == TracerEventType.PythonUserDefined
-                        ):
-                            self.add_userdefined_item(host_statistic_node)
-            self.add_kernel_item(host_statistic_nodes[0])
-
-        for threadid, root_statistic_node in node_statistic_trees.items():
-            deque = collections.deque()
-            deque.append(root_statistic_node)
-            while deque:
-                current_node = deque.popleft()
-                for child in current_node.children_node:
-                    if (
-                        child.type == TracerEventType.Forward
-                        or child.type == TracerEventType.Dataloader
-                        or child.type == TracerEventType.Backward
-                        or child.type == TracerEventType.Optimization
-                    ):
-                        self.add_model_perspective_item(
-                            child
-                        )  # find first model perspective node
-                    else:
-                        if child.type == TracerEventType.ProfileStep:
-                            self.add_model_perspective_item(child)
-                        deque.append(child)
+                    self.add_userdefined_item(host_statistic_node)
+        self._add_kernel_items(host_statistic_node)
+
+        # find first model perspective node
+        if not host_statistic_node.under_model_perspective and (
+            host_statistic_node.type in _ModelPerspectiveEventType
+            or host_statistic_node.type == TracerEventType.ProfileStep
+        ):
+            self.add_model_perspective_item(host_statistic_node)
+
+    def finish(self):
+        pass
 
     def add_forward_item(self, operator_node):
         pass
@@ -761,6 +863,17 @@ class EventSummary:
                     self.kernel_items[name] = EventSummary.DeviceItem(name)
                 self.kernel_items[name].add_item(device_node)
 
+    def _add_kernel_items(self, host_statistic_node):
+        # kernels launched by the node itself, kernels of its children
+        # are added with the children
+        for runtimenode in host_statistic_node.hostnode.runtime_node:
+            for device_node in runtimenode.device_node:
+                if device_node.type == TracerEventType.Kernel:
+                    name = device_node.name
+                    if name not in self.kernel_items:
+                        self.kernel_items[name] = EventSummary.DeviceItem(name)
+                    self.kernel_items[name].add_item(device_node)
+
 
 class MemorySummary:
     r"""
@@ -847,33 +960,60 @@ class MemorySummary:
         r"""
         Analyse memory event in the nodetress.
         """
-        thread2hostnodes = traverse_tree(nodetrees)
-        for threadid, host_nodes in thread2hostnodes.items():
-            for host_node in host_nodes[1:]:  # skip root node
-                if host_node.type == TracerEventType.OperatorInner:
-                    continue
-                if host_node.type == TracerEventType.Operator:
-                    for child in host_node.children_node:
-                        self._analyse_node_memory(host_node.name, child)
-                self._analyse_node_memory(host_node.name, host_node)
+        walk_tree(nodetrees, [self])
+
+    def add_root(self, root_node):
+        pass
+
+    def add_node(self, host_statistic_node):
+        host_node = host_statistic_node.hostnode
+        if host_node.type == TracerEventType.OperatorInner:
+            return
+        if host_node.type == TracerEventType.Operator:
+            for child in host_node.children_node:
+                self._analyse_node_memory(host_node.name, child)
+        self._analyse_node_memory(host_node.name, host_node)
+
+    def finish(self):
+        pass
 
 
 class StatisticData:
     r"""
     Hold all analysed results.
+
+    All summaries are analysed in one pass of the node trees. More profiler
+    results, e.g. results of successive record windows of a long run, can be
+    folded into the statistic with `add`, which keeps per-op and per-layer
+    statistics instead of node trees of the results, so the memory does not
+    grow with the number of results added.
     """
 
-    def __init__(self, node_trees, extra_info):
+    def __init__(self, node_trees=None, extra_info=None):
         self.node_trees = node_trees
-        self.extra_info = extra_info
+        self.extra_info = extra_info if extra_info is not None else {}
         self.time_range_summary = TimeRangeSummary()
         self.event_summary = EventSummary()
         self.distributed_summary = DistributedSummary()
         self.memory_summary = MemorySummary()
-        self.time_range_summary.parse(node_trees)
-        self.event_summary.parse(node_trees)
-        self.distributed_summary.parse(node_trees)
-        self.memory_summary.parse(node_trees)
+        if node_trees is not None:
+            self.add(node_trees)
+
+    def add(self, node_trees, extra_info=None):
+        r"""
+        Fold the statistic of node trees of a profiler result.
+        """
+        summaries = [
+            self.time_range_summary,
+            self.event_summary,
+            self.distributed_summary,
+            self.memory_summary,
+        ]
+        walk_tree(node_trees, summaries)
+        for summary in summaries:
+            summary.finish()
+        if extra_info is not None:
+            self.extra_info = extra_info
 
 
 def _build_table(
@@ -1031,10 +1171,10 @@ def _build_table(
         ) in statistic_data.time_range_summary.CPUTimeRangeSum.items():
             if event_type != TracerEventType.Communication:
                 cpu_type_time[event_type] = value
-        if statistic_data.distributed_summary.cpu_communication_range:
-            cpu_type_time[TracerEventType.Communication] = sum_ranges(
-                statistic_data.distributed_summary.cpu_communication_range
-            )
+        if statistic_data.distributed_summary.cpu_calls:
+            cpu_type_time[
+                TracerEventType.Communication
+            ] = statistic_data.distributed_summary.cpu_communication_time
             cpu_call_times[
                 TracerEventType.Communication
             ] = statistic_data.distributed_summary.cpu_calls
@@ -1062,21 +1202,13 @@ def _build_table(
                     event_type_name
                 ].cpu_time
 
-        gpu_time_range = collections.defaultdict(list)
-        for (
-            device_id,
-            device_time_ranges,
-        ) in statistic_data.time_range_summary.GPUTimeRange.items():
-            for event_type, time_range in device_time_ranges.items():
-                gpu_time_range[event_type] = merge_ranges(
-                    gpu_time_range[event_type], time_range, is_sorted=True
-                )
-        for event_type, time_range in gpu_time_range.items():
-            gpu_type_time[event_type] = sum_ranges(time_range)
-        if statistic_data.distributed_summary.gpu_communication_range:
-            gpu_type_time[TracerEventType.Communication] = sum_ranges(
-                statistic_data.distributed_summary.gpu_communication_range
-            )
+        gpu_type_time.update(
+            statistic_data.time_range_summary.GPUTimeRangeSumAllDevices
+        )
+        if statistic_data.distributed_summary.gpu_calls:
+            gpu_type_time[
+                TracerEventType.Communication
+            ] = statistic_data.distributed_summary.gpu_communication_time
             gpu_call_times[
                 TracerEventType.Communication
             ] = statistic_data.distributed_summary.gpu_calls
@@ -1255,7 +1387,10 @@ def _build_table(
     if views is None or SummaryView.DistributedView in views:
 
         # ----- Print Distribution Summary Report ----- #
-        if statistic_data.distributed_summary.communication_range:
+        if (
+            statistic_data.distributed_summary.cpu_calls
+            or statistic_data.distributed_summary.gpu_calls
+        ):
             headers = [
                 'Name',
                 'Total Time',
@@ -1279,15 +1414,13 @@ def _build_table(
             append(header_sep)
             append(row_format.format(*headers))
             append(header_sep)
-            communication_time = sum_ranges(
-                statistic_data.distributed_summary.communication_range
-            )
-            computation_time = sum_ranges(
-                statistic_data.distributed_summary.computation_range
+            communication_time = (
+                statistic_data.distributed_summary.communication_time
             )
-            overlap_time = sum_ranges(
-                statistic_data.distributed_summary.overlap_range
+            computation_time = (
+                statistic_data.distributed_summary.computation_time
             )
+            overlap_time = statistic_data.distributed_summary.overlap_time
             row_values = [
                 'ProfileStep',
                 format_time(total_time, unit=time_unit),
@@ -0,0 +1,404 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import array
+import glob
+import json
+import os
+import socket
+import timeit
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+from paddle.fluid.core import TracerEventType
+
+from . import utils
+from .timer import Hook, benchmark
+from .utils import wrap_communications, wrap_optimizers
+
+_SAMPLES_MAGIC = b'PADDLE_SAMPLES'
+
+# columns of a sample, time costs are measured in seconds
+SAMPLE_COLUMNS = (
+    'step_id',
+    'step',
+    'reader',
+    'forward',
+    'backward',
+    'optimizer',
+    'communication',
+)
+
+# phases timed by RecordEvent in sampled steps
+_PhaseColumns = {
+    TracerEventType.Forward: SAMPLE_COLUMNS.index('forward'),
+    TracerEventType.Backward: SAMPLE_COLUMNS.index('backward'),
+    TracerEventType.Optimization: SAMPLE_COLUMNS.index('optimizer'),
+    TracerEventType.Communication: SAMPLE_COLUMNS.index('communication'),
+}
+
+
+class SamplingHook(Hook):
+    """
+    A hook for recording the cost of every step and the cost of loading data
+    in it into the SamplingProfiler.
+    """
+
+    def __init__(self, sampling_profiler):
+        self.sampling_profiler = sampling_profiler
+        self.start_reader = None
+
+    def before_reader(self, benchmark):
+        self.start_reader = timeit.default_timer()
+
+    def after_reader(self, benchmark):
+        if self.start_reader is None:
+            return
+        self.sampling_profiler._reader_cost += (
+            timeit.default_timer() - self.start_reader
+        )
+        self.start_reader = None
+
+    def after_step(self, benchmark):
+        self.sampling_profiler._finish_step()
+
+
+class SamplingProfiler:
+    r"""
+    Continuous sampling profiler with low overhead, which is designed to be
+    always on in training jobs to find regressions of step time.
+
+    The cost of every step and the cost of loading data in it are recorded.
+    Every ``sample_interval`` steps, the cost of forward, backward, optimizer
+    and communication of the step are also recorded by :ref:`RecordEvent <api_paddle_profiler_RecordEvent>` ,
+    the phases are nested in the step and may overlap with each other, e.g.
+    communication in backward. The samples of the latest ``window_size``
+    steps are kept in memory for :ref:`percentiles <api_paddle_profiler_SamplingProfiler_percentiles>` ,
+    and all samples are written to compact rolling binary files in ``dir_name``,
+    which can be loaded by :ref:`load_samples <api_paddle_profiler_load_samples>` .
+
+    Args:
+        dir_name (str, optional): Directory to save the sample files. If it is None, samples are only kept in memory. Default: None.
+        worker_name (str, optional): Prefix of the sample files, default is `[hostname]_[pid]`.
+        sample_interval (int, optional): The phases of a step are recorded every ``sample_interval`` steps. Default: 10.
+        window_size (int, optional): The number of the latest steps kept in memory. Default: 10000.
+        flush_interval (int, optional): The number of steps buffered before being written to the file. Default: 100.
+        max_file_size (int, optional): The maximum size in bytes of a sample file, a new file is created when it is exceeded. Default: 16 * 1024 * 1024.
+        max_files (int, optional): The maximum number of sample files kept, the oldest one is removed when it is exceeded. Default: 8.
+
+    Note:
+        The step is finished by :ref:`step <api_paddle_profiler_SamplingProfiler_step>` or :ref:`Profiler.step <api_paddle_profiler_Profiler_step>` ,
+        only one of them should be called in a training loop.
+
+    Examples:
+        .. code-block:: python
+
+            import paddle
+            import paddle.profiler as profiler
+
+            linear = paddle.nn.Linear(10, 10)
+            opt = paddle.optimizer.SGD(parameters=linear.parameters())
+            with profiler.SamplingProfiler(
+                    dir_name='./sample_log', sample_interval=2) as prof:
+                for iter in range(10):
+                    loss = linear(paddle.randn([4, 10])).mean()
+                    loss.backward()
+                    opt.step()
+                    opt.clear_grad()
+                    prof.step()
+            print(prof.percentiles(q=[50, 99], phases=['step', 'forward']))
+    """
+
+    def __init__(
+        self,
+        *,
+        dir_name: Optional[str] = None,
+        worker_name: Optional[str] = None,
+        sample_interval: int = 10,
+        window_size: int = 10000,
+        flush_interval: int = 100,
+        max_file_size: int = 16 * 1024 * 1024,
+        max_files: int = 8,
+    ):
+        assert (
+            isinstance(sample_interval, int) and sample_interval > 0
+        ), "sample_interval should be a positive integer."
+        assert (
+            isinstance(window_size, int) and window_size > 0
+        ), "window_size should be a positive integer."
+        assert (
+            isinstance(flush_interval, int) and flush_interval > 0
+        ), "flush_interval should be a positive integer."
+        assert max_files > 0, "max_files should be a positive integer."
+        self.dir_name = dir_name
+        if dir_name is not None and not worker_name:
+            worker_name = "host_{}pid_{}".format(
+                socket.gethostname(), str(os.getpid())
+            )
+        self.worker_name = worker_name
+        self.sample_interval = sample_interval
+        self.window_size = window_size
+        self.flush_interval = flush_interval
+        self.max_file_size = max_file_size
+        self.max_files = max_files
+
+        self.step_num = 0
+        self._window = np.full(
+            (window_size, len(SAMPLE_COLUMNS)), np.nan, dtype=np.float64
+        )
+        self._num_samples = 0
+        self._pending = array.array('d')
+        self._file = None
+        self._file_index = 0
+        self._hook = SamplingHook(self)
+        self._running = False
+        self._reset_step()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        r"""
+        Start recording.
+        """
+        if self._running:
+            return
+        if self.dir_name is not None:
+            os.makedirs(self.dir_name, exist_ok=True)
+        wrap_optimizers()
+        wrap_communications()
+        benchmark().hooks['sampling_hook'] = self._hook
+        self._running = True
+        self._reset_step()
+
+    def stop(self):
+        r"""
+        Stop recording, the buffered samples are written to the file. The
+        samples in memory are kept for percentiles.
+        """
+        if not self._running:
+            return
+        self._running = False
+        if utils._sampling_profiler is self:
+            utils._sampling_profiler = None
+        if benchmark().hooks.get('sampling_hook') is self._hook:
+            del benchmark().hooks['sampling_hook']
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def step(self, num_samples: Optional[int] = None):
+        r"""
+        Signals the profiler that the next step has started.
+
+        Args:
+            num_samples (int|None, optional): Specifies the batch size of every step of the model
+                that is used to compute throughput. Default: None.
+        """
+        benchmark().step(num_samples)
+
+    def _reset_step(self):
+        self._start_time = timeit.default_timer()
+        self._reader_cost = 0.0
+        self._sampled = self.step_num % self.sample_interval == 0
+        if self._sampled:
+            self._phase_costs = [0.0] * len(SAMPLE_COLUMNS)
+            self._phase_depths = {}
+            self._phase_begins = {}
+        if self._running and self._sampled:
+            utils._sampling_profiler = self
+        elif utils._sampling_profiler is self:
+            utils._sampling_profiler = None
+
+    def _begin_event(self, event_type):
+        # only the outermost event of each phase is timed, since events of
+        # the same type are nested, e.g. forward of sublayers
+        depth = self._phase_depths.get(event_type, 0)
+        self._phase_depths[event_type] = depth + 1
+        if depth == 0:
+            self._phase_begins[event_type] = timeit.default_timer()
+
+    def _end_event(self, event_type):
+        depth = self._phase_depths.get(event_type, 0) - 1
+        if depth < 0:
+            return
+        self._phase_depths[event_type] = depth
+        if depth == 0 and event_type in _PhaseColumns:
+            self._phase_costs[_PhaseColumns[event_type]] += (
+                timeit.default_timer() - self._phase_begins[event_type]
+            )
+
+    def _finish_step(self):
+        if not self._running:
+            return
+        if self._sampled:
+            sample = self._phase_costs
+        else:
+            sample = [np.nan] * len(SAMPLE_COLUMNS)
+        sample[0] = self.step_num
+        sample[1] = timeit.default_timer() - self._start_time
+        sample[2] = self._reader_cost
+        self._window[self._num_samples % self.window_size] = sample
+        self._num_samples += 1
+        if self.dir_name is not None:
+            self._pending.extend(sample)
+            if len(self._pending) >= self.flush_interval * len(SAMPLE_COLUMNS):
+                self.flush()
+        self.step_num += 1
+        self._reset_step()
+
+    def flush(self):
+        r"""
+        Write the buffered samples to the current sample file.
+        """
+        if self.dir_name is None or len(self._pending) == 0:
+            return
+        data = self._pending.tobytes()
+        self._pending = array.array('d')
+        if self._file is not None and (
+            self._file.tell() + len(data) > self.max_file_size
+        ):
+            self._file.close()
+            self._file = None
+            self._file_index += 1
+        if self._file is None:
+            self._open_file()
+        self._file.write(data)
+        self._file.flush()
+
+    def _open_file(self):
+        filename = os.path.join(
+            self.dir_name,
+            '{}_{:06d}.paddle_samples'.format(
+                self.worker_name, self._file_index
+            ),
+        )
+        self._file = open(filename, 'wb')
+        self._file.write(
+            _SAMPLES_MAGIC
+            + b' '
+            + json.dumps(list(SAMPLE_COLUMNS)).encode()
+            + b'\n'
+        )
+        # remove the oldest files out of max_files
+        oldest_index = self._file_index - self.max_files
+        if oldest_index >= 0:
+            oldest = os.path.join(
+                self.dir_name,
+                '{}_{:06d}.paddle_samples'.format(
+                    self.worker_name, oldest_index
+                ),
+            )
+            if os.path.exists(oldest):
+                os.remove(oldest)
+
+    def samples(self):
+        r"""
+        Get the samples of the latest ``window_size`` steps in memory.
+
+        Returns:
+            dict: A dict maps the name of each column in ``SAMPLE_COLUMNS`` to a numpy
+            array, the costs of the phases are NaN in the steps which are not sampled.
+        """
+        if self._num_samples <= self.window_size:
+            window = self._window[: self._num_samples]
+        else:
+            start = self._num_samples % self.window_size
+            window = np.concatenate(
+                [self._window[start:], self._window[:start]]
+            )
+        return {
+            name: window[:, i].copy() for i, name in enumerate(SAMPLE_COLUMNS)
+        }
+
+    def percentiles(
+        self,
+        q: Union[float, Iterable[float]] = (50, 90, 99),
+        phases: Optional[Iterable[str]] = None,
+    ):
+        r"""
+        Get the percentiles of the costs of the latest ``window_size`` steps.
+
+        Args:
+            q (float|list[float], optional): Percentiles to compute, which must be between 0 and 100 inclusive. Default: (50, 90, 99).
+            phases (list[str], optional): The phases to compute, can be chosen from ['step', 'reader', 'forward', 'backward',
+                'optimizer', 'communication']. Default: None, all phases are computed.
+
+        Returns:
+            dict: A dict maps each phase to a dict which maps each percentile to the cost in seconds.
+            The cost is NaN if there is no sample of the phase.
+        """
+        if isinstance(q, (int, float)):
+            q = [q]
+        q = list(q)
+        if phases is None:
+            phases = SAMPLE_COLUMNS[1:]
+        samples = self.samples()
+        result = {}
+        for phase in phases:
+            assert (
+                phase in SAMPLE_COLUMNS[1:]
+            ), "phase should be one of {}, but got {}.".format(
+                SAMPLE_COLUMNS[1:], phase
+            )
+            values = samples[phase]
+            values = values[~np.isnan(values)]
+            if len(values) == 0:
+                result[phase] = {p: float('nan') for p in q}
+            else:
+                result[phase] = dict(zip(q, np.percentile(values, q).tolist()))
+        return result
+
+
+def load_samples(path: str):
+    r"""
+    Load the samples saved by :ref:`SamplingProfiler <api_paddle_profiler_SamplingProfiler>` .
+
+    Args:
+        path (str): A sample file or a directory of sample files. All sample files in the directory are
+            loaded in the order of file names.
+
+    Returns:
+        dict: A dict maps the name of each column to a numpy array.
+    """
+    if os.path.isdir(path):
+        filenames = sorted(glob.glob(os.path.join(path, '*.paddle_samples')))
+    else:
+        filenames = [path]
+    columns = list(SAMPLE_COLUMNS)
+    arrays = []
+    for filename in filenames:
+        with open(filename, 'rb') as f:
+            header = f.readline()
+            assert header.startswith(
+                _SAMPLES_MAGIC
+            ), "{} is not a sample file.".format(filename)
+            columns = json.loads(header[len(_SAMPLES_MAGIC) :].decode())
+            data = np.frombuffer(f.read(), dtype=np.float64)
+        # drop the incomplete sample written when the process is killed
+        num_samples = len(data) // len(columns)
+        arrays.append(
+            data[: num_samples * len(columns)].reshape(-1, len(columns))
+        )
+    if arrays:
+        data = np.concatenate(arrays)
+    else:
+        data = np.empty((0, len(columns)), dtype=np.float64)
+    return {name: data[:, i] for i, name in enumerate(columns)}
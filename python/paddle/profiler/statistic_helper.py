@@ -12,217 +12,117 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
+
+import numpy as np
+
+# NOTE: ranges are represented as list of (start, end) tuples in interfaces,
+# and converted to a (N, 2) numpy array for interval arithmetic. Results of
+# merge, intersection and subtraction are sorted and non-overlapping.
+
+
+def _to_array(ranges):
+    if isinstance(ranges, np.ndarray):
+        return ranges.reshape(-1, 2)
+    if len(ranges) == 0:
+        return np.empty((0, 2), dtype=np.int64)
+    # timestamps in profiling results are integers in nanoseconds
+    dtype = np.float64 if isinstance(ranges[0][0], float) else np.int64
+    return np.fromiter(
+        itertools.chain.from_iterable(ranges),
+        dtype=dtype,
+        count=2 * len(ranges),
+    ).reshape(-1, 2)
+
+
+def _to_list(array):
+    return list(zip(array[:, 0].tolist(), array[:, 1].tolist()))
+
+
+def _merge_self_array(array, is_sorted=False):
+    if len(array) == 0:
+        return array
+    if not is_sorted:
+        array = array[np.argsort(array[:, 0], kind='stable')]
+    starts = array[:, 0]
+    # the end of the merged range that covers each range so far
+    ends = np.maximum.accumulate(array[:, 1])
+    # a range begins a new merged range if it starts after all previous
+    # ranges end, ranges that touch each other are merged
+    is_begin = np.empty(len(array), dtype=bool)
+    is_begin[0] = True
+    np.greater(starts[1:], ends[:-1], out=is_begin[1:])
+    begin_indices = np.flatnonzero(is_begin)
+    end_indices = np.append(begin_indices[1:] - 1, len(array) - 1)
+    return np.stack([starts[begin_indices], ends[end_indices]], axis=1)
+
+
+def _intersection_array(array1, array2):
+    if len(array1) == 0 or len(array2) == 0:
+        return np.empty((0, 2), dtype=np.result_type(array1, array2))
+    # for each range in array1, ranges in array2 overlapping with it are
+    # array2[lower:upper], since ranges in array2 are sorted and disjoint
+    lower = np.searchsorted(array2[:, 1], array1[:, 0], side='right')
+    upper = np.searchsorted(array2[:, 0], array1[:, 1], side='left')
+    counts = np.maximum(upper - lower, 0)
+    indices1 = np.repeat(np.arange(len(array1)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(
+        np.cumsum(counts) - counts, counts
+    )
+    indices2 = np.repeat(lower, counts) + offsets
+    starts = np.maximum(array1[indices1, 0], array2[indices2, 0])
+    ends = np.minimum(array1[indices1, 1], array2[indices2, 1])
+    mask = starts < ends
+    return np.stack([starts[mask], ends[mask]], axis=1)
+
 
 def sum_ranges(ranges):
-    result = 0
-    for time_range in ranges:
-        result += time_range[1] - time_range[0]
-    return result
+    array = _to_array(ranges)
+    if len(array) == 0:
+        return 0
+    return (array[:, 1] - array[:, 0]).sum().item()
 
 
 def merge_self_ranges(src_ranges, is_sorted=False):
-    merged_ranges = []
-    if len(src_ranges) > 0:
-        if not is_sorted:
-            src_ranges.sort(key=lambda x: x[0])
-        cur_indx = 0
-        merged_ranges.append((src_ranges[cur_indx][0], src_ranges[cur_indx][1]))
-        for cur_indx in range(1, len(src_ranges)):
-            if src_ranges[cur_indx][1] > merged_ranges[-1][1]:
-                if src_ranges[cur_indx][0] <= merged_ranges[-1][1]:
-                    merged_ranges[-1] = (
-                        merged_ranges[-1][0],
-                        src_ranges[cur_indx][1],
-                    )
-                else:
-                    merged_ranges.append(
-                        (src_ranges[cur_indx][0], src_ranges[cur_indx][1])
-                    )
-    return merged_ranges
+    return _to_list(_merge_self_array(_to_array(src_ranges), is_sorted))
 
 
 def merge_ranges(range_list1, range_list2, is_sorted=False):
-    merged_ranges = []
     if not is_sorted:
         range_list1 = merge_self_ranges(range_list1)
         range_list2 = merge_self_ranges(range_list2)
-    len1 = len(range_list1)
-    len2 = len(range_list2)
-    if len1 == 0 and len2 == 0:
-        return merged_ranges
-    elif len1 == 0:
+    if len(range_list1) == 0:
         return range_list2
-    elif len2 == 0:
+    if len(range_list2) == 0:
         return range_list1
-    else:
-        indx1 = 0
-        indx2 = 0
-        range1 = range_list1[indx1]
-        range2 = range_list2[indx2]
-        if range1[0] < range2[0]:
-            merged_ranges.append(range1)
-            indx1 += 1
-        else:
-            merged_ranges.append(range2)
-            indx2 += 1
-        while indx1 < len1 and indx2 < len2:
-            range1 = range_list1[indx1]
-            range2 = range_list2[indx2]
-            if range1[0] < range2[0]:
-                if range1[1] > merged_ranges[-1][1]:
-                    if range1[0] <= merged_ranges[-1][1]:
-                        merged_ranges[-1] = (merged_ranges[-1][0], range1[1])
-                    else:
-                        merged_ranges.append((range1[0], range1[1]))
-                    indx1 += 1
-                else:
-                    indx1 += 1
-            else:
-                if range2[1] > merged_ranges[-1][1]:
-                    if range2[0] <= merged_ranges[-1][1]:
-                        merged_ranges[-1] = (merged_ranges[-1][0], range2[1])
-                    else:
-                        merged_ranges.append((range2[0], range2[1]))
-                    indx2 += 1
-                else:
-                    indx2 += 1
-
-        while indx1 < len1:
-            range1 = range_list1[indx1]
-            if range1[1] > merged_ranges[-1][1]:
-                if range1[0] <= merged_ranges[-1][1]:
-                    merged_ranges[-1] = (merged_ranges[-1][0], range1[1])
-                else:
-                    merged_ranges.append((range1[0], range1[1]))
-                indx1 += 1
-            else:
-                indx1 += 1
-        while indx2 < len2:
-            range2 = range_list2[indx2]
-            if range2[1] > merged_ranges[-1][1]:
-                if range2[0] <= merged_ranges[-1][1]:
-                    merged_ranges[-1] = (merged_ranges[-1][0], range2[1])
-                else:
-                    merged_ranges.append((range2[0], range2[1]))
-                indx2 += 1
-            else:
-                indx2 += 1
-    return merged_ranges
+    array = np.concatenate([_to_array(range_list1), _to_array(range_list2)])
+    return _to_list(_merge_self_array(array))
 
 
 def intersection_ranges(range_list1, range_list2, is_sorted=False):
-    result_range = []
     if len(range_list1) == 0 or len(range_list2) == 0:
-        return result_range
+        return []
+    array1 = _to_array(range_list1)
+    array2 = _to_array(range_list2)
     if not is_sorted:
-        range_list1 = merge_self_ranges(range_list1)
-        range_list2 = merge_self_ranges(range_list2)
-
-    len1 = len(range_list1)
-    len2 = len(range_list2)
-    indx1 = 0
-    indx2 = 0
-    range1 = range_list1[indx1]
-    range2 = range_list2[indx2]
-    while indx1 < len1 and indx2 < len2:
-        if range2[1] <= range1[0]:
-            indx2 += 1
-            if indx2 == len2:
-                break
-            range2 = range_list2[indx2]
-
-        elif range2[0] <= range1[0] and range2[1] < range1[1]:
-            assert range2[1] > range1[0]
-            result_range.append((range1[0], range2[1]))
-            range1 = (range2[1], range1[1])
-            indx2 += 1
-            if indx2 == len2:
-                break
-            range2 = range_list2[indx2]
-
-        elif range2[0] <= range1[0]:
-            assert range2[1] >= range1[1]
-            result_range.append(range1)
-            range2 = (range1[1], range2[1])
-            indx1 += 1
-            if indx1 == len1:
-                break
-            range1 = range_list1[indx1]
-
-        elif range2[1] < range1[1]:
-            assert range2[0] > range1[0]
-            result_range.append(range2)
-            range1 = (range2[1], range1[1])
-            indx2 += 1
-            if indx2 == len2:
-                break
-            range2 = range_list2[indx2]
-
-        elif range2[0] < range1[1]:
-            assert range2[1] >= range1[1]
-            result_range.append((range2[0], range1[1]))
-            range2 = (range1[1], range2[1])
-            indx1 += 1
-            if indx1 == len1:
-                break
-            range1 = range_list1[indx1]
-
-        else:
-            assert range2[0] >= range1[1]
-            indx1 += 1
-            if indx1 == len1:
-                break
-            range1 = range_list1[indx1]
-    return result_range
+        array1 = _merge_self_array(array1)
+        array2 = _merge_self_array(array2)
+    return _to_list(_intersection_array(array1, array2))
 
 
 def subtract_ranges(range_list1, range_list2, is_sorted=False):
-    result_range = []
+    array1 = _to_array(range_list1)
+    array2 = _to_array(range_list2)
     if not is_sorted:
-        range_list1 = merge_self_ranges(range_list1)
-        range_list2 = merge_self_ranges(range_list2)
-    if len(range_list1) == 0:
-        return result_range
-    if len(range_list2) == 0:
-        return range_list1
-
-    len1 = len(range_list1)
-    len2 = len(range_list2)
-    indx1 = 0
-    indx2 = 0
-    range1 = range_list1[indx1]
-    range2 = range_list2[indx2]
-
-    while indx1 < len(range_list1):
-        if indx2 == len(range_list2):
-            result_range.append(range1)
-            indx1 += 1
-            if indx1 == len1:
-                break
-            range1 = range_list1[indx1]
-        elif range2[1] <= range1[0]:
-            indx2 += 1
-            if indx2 != len2:
-                range2 = range_list2[indx2]
-        elif range2[0] <= range1[0] and range2[1] < range1[1]:
-            range1 = (range2[1], range1[1])
-            indx2 += 1
-            if indx2 != len2:
-                range2 = range_list2[indx2]
-        elif range2[0] <= range1[0]:
-            assert range2[1] >= range1[1]
-            range2 = (range1[1], range2[1])
-            indx1 += 1
-            if indx1 != len1:
-                range1 = range_list1[indx1]
-        elif range2[0] < range1[1]:
-            assert range2[0] > range1[0]
-            result_range.append((range1[0], range2[0]))
-            range1 = (range2[0], range1[1])
-        else:
-            assert range2[0] >= range1[1]
-            result_range.append(range1)
-            indx1 += 1
-            if indx1 != len1:
-                range1 = range_list1[indx1]
-    return result_range
+        array1 = _merge_self_array(array1)
+        array2 = _merge_self_array(array2)
+    if len(array1) == 0:
+        return []
+    if len(array2) == 0:
+        return _to_list(array1)
+    # subtraction is the intersection with gaps between ranges of array2
+    gap_starts = np.append(array1[0, 0], array2[:, 1])
+    gap_ends = np.append(array2[:, 0], array1[-1, 1])
+    gaps = np.stack([gap_starts, gap_ends], axis=1)
+    gaps = gaps[gap_starts < gap_ends]
+    return _to_list(_intersection_array(array1, gaps))
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import timeit
+import weakref
 from collections import OrderedDict
 
 
@@ -299,6 +300,102 @@ class TimerHook(Hook):
         )
 
 
+class ReaderRatioHook(Hook):
+    """
+    A hook for recording the cost of waiting for data of the DataLoader
+    being iterated, which works without starting the profiler. The cost
+    is recorded into the `_reader_ratio_averager` of the DataLoader
+    iterator if it is set, e.g. by the online auto-tuning of DataLoader.
+    """
+
+    def _get_averager(self, benchmark):
+        reader = (
+            benchmark.current_reader()
+            if benchmark.current_reader is not None
+            else None
+        )
+        return getattr(reader, '_reader_ratio_averager', None)
+
+    def before_reader(self, benchmark):
+        averager = self._get_averager(benchmark)
+        if averager is not None:
+            averager.before_reader()
+
+    def after_reader(self, benchmark):
+        averager = self._get_averager(benchmark)
+        if averager is not None:
+            averager.after_reader()
+
+
+class ReaderRatioAverager:
+    """
+    Record the cost of waiting for data and the cost of a step, which is
+    the interval between the beginning of two successive reads, and count
+    the ratio of reader cost. The first `skip_iter` steps are skipped since
+    the cost of starting workers is not a steady state.
+    """
+
+    def __init__(self, skip_iter=5):
+        self.skip_iter = skip_iter
+        self.reader_cost_averager = TimeAverager()
+        self.batch_cost_averager = TimeAverager()
+        self.reset()
+
+    def reset(self):
+        self.reader_cost_averager.reset()
+        self.batch_cost_averager.reset()
+        self._num_reads = 0
+        self._start_reader = None
+        self._last_start_reader = None
+
+    def new_epoch(self):
+        # the interval between the last read of an epoch and the first read
+        # of the next epoch is not a step
+        self._num_reads = 0
+        self._last_start_reader = None
+
+    def before_reader(self):
+        self._start_reader = timeit.default_timer()
+        if (
+            self._last_start_reader is not None
+            and self._num_reads > self.skip_iter
+        ):
+            self.batch_cost_averager.record(
+                self._start_reader - self._last_start_reader
+            )
+        self._last_start_reader = self._start_reader
+
+    def after_reader(self):
+        if self._start_reader is None:
+            return
+        self._num_reads += 1
+        if self._num_reads > self.skip_iter:
+            self.reader_cost_averager.record(
+                timeit.default_timer() - self._start_reader
+            )
+        self._start_reader = None
+
+    @property
+    def num_steps(self):
+        return self.batch_cost_averager._total_iters
+
+    def reader_average(self):
+        return self.reader_cost_averager.get_average()
+
+    def batch_average(self):
+        return self.batch_cost_averager.get_average()
+
+    def get_ratio(self):
+        """
+        Get the ratio of the cost of waiting for data in a step.
+        """
+
+        batch_avg = self.batch_average()
+        if batch_avg == 0:
+            return 0
+        return min(self.reader_average() / batch_avg, 1.0)
+
+
 class TimeAverager:
     """
     Record the cost of every step and count the average.
@@ -356,8 +453,13 @@ class Benchmark:
 
     def __init__(self):
         self.num_samples = None
-        self.hooks = OrderedDict(timer_hook=TimerHook())
+        self.hooks = OrderedDict(
+            timer_hook=TimerHook(), reader_ratio_hook=ReaderRatioHook()
+        )
         self.current_event = None
+        # NOTE: only a weak reference of the DataLoader iterator being
+        # iterated is held, which does not preclude GC to collect it
+        self.current_reader = None
         self.events = Stack()
 
     def step(self, num_samples=None):
@@ -416,6 +518,7 @@ class Benchmark:
             hook.end(self)
 
     def check_if_need_record(self, reader):
+        self.current_reader = weakref.ref(reader)
         if self.current_event is None:
             return
         if self.current_event.need_record:
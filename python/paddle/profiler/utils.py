@@ -22,6 +22,10 @@ from paddle.fluid.core import TracerEventType, _RecordEvent
 
 _is_profiler_used = False
 _has_optimizer_wrapped = False
+_has_communication_wrapped = False
+# NOTE: the SamplingProfiler which records phase timings of current step, it
+# is only set in the sampled steps so that RecordEvent costs nothing otherwise
+_sampling_profiler = None
 
 _AllowedEventTypeList = [
     TracerEventType.Dataloader,
@@ -31,6 +35,24 @@ _AllowedEventTypeList = [
     TracerEventType.Optimization,
     TracerEventType.PythonOp,
     TracerEventType.PythonUserDefined,
+    TracerEventType.Communication,
+]
+
+_CommunicationFuncNames = [
+    'all_reduce',
+    'all_gather',
+    'all_gather_object',
+    'alltoall',
+    'alltoall_single',
+    'broadcast',
+    'reduce',
+    'reduce_scatter',
+    'scatter',
+    'send',
+    'recv',
+    'isend',
+    'irecv',
+    'barrier',
 ]
 
 
@@ -75,6 +97,7 @@ class RecordEvent(ContextDecorator):
         self.name = name
         self.event_type = event_type
         self.event = None
+        self.sampler = None
 
     def __enter__(self):
         self.begin()
@@ -101,11 +124,14 @@ class RecordEvent(ContextDecorator):
                 result = data1 - data2
                 record_event.end()
         """
+        if _sampling_profiler is not None:
+            self.sampler = _sampling_profiler
+            self.sampler._begin_event(self.event_type)
         if not _is_profiler_used:
             return
         if self.event_type not in _AllowedEventTypeList:
             warn(
-                "Only TracerEvent Type in [{}, {}, {}, {}, {}, {},{}]\
+                "Only TracerEvent Type in [{}, {}, {}, {}, {}, {}, {}, {}]\
                   can be recorded.".format(
                     *_AllowedEventTypeList
                 )
@@ -132,8 +158,12 @@ class RecordEvent(ContextDecorator):
                 result = data1 * data2
                 record_event.end()
         '''
+        if self.sampler is not None:
+            self.sampler._end_event(self.event_type)
+            self.sampler = None
         if self.event:
             self.event.end()
+            self.event = None
 
 
 def load_profiler_result(filename: str):
@@ -164,7 +194,7 @@ def load_profiler_result(filename: str):
 
 
 def in_profiler_mode():
-    return _is_profiler_used
+    return _is_profiler_used or _sampling_profiler is not None
 
 
 def wrap_optimizers():
@@ -192,3 +222,31 @@ def wrap_optimizers():
             if getattr(classobject, 'step', None) is not None:
                 classobject.step = optimizer_warpper(classobject.step)
     _has_optimizer_wrapped = True
+
+
+def wrap_communications():
+    def communication_wrapper(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if in_profiler_mode():
+                with RecordEvent(
+                    func.__name__, event_type=TracerEventType.Communication
+                ):
+                    return func(*args, **kwargs)
+            else:
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    global _has_communication_wrapped
+    if _has_communication_wrapped:
+        return
+    from paddle import distributed
+
+    # NOTE: only the functions called through `paddle.distributed` namespace
+    # are recorded, the ones imported by name before wrapping are not
+    for funcname in _CommunicationFuncNames:
+        func = getattr(distributed, funcname, None)
+        if func is not None:
+            setattr(distributed, funcname, communication_wrapper(func))
+    _has_communication_wrapped = True
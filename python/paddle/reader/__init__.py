@@ -66,6 +66,7 @@ An example implementation for multiple item data reader creator:
 from paddle.reader.decorator import map_readers  # noqa: F401
 from paddle.reader.decorator import shuffle  # noqa: F401
 from paddle.reader.decorator import xmap_readers  # noqa: F401
+from paddle.reader.decorator import multiprocess_xmap_readers  # noqa: F401
 from paddle.reader.decorator import firstn  # noqa: F401
 from paddle.reader.decorator import buffered  # noqa: F401
 from paddle.reader.decorator import compose  # noqa: F401
@@ -14,13 +14,18 @@
 
 import itertools
 import logging
+import mmap
 import multiprocessing
+import queue
 import random
 import sys
+import traceback
 import warnings
 from itertools import zip_longest
 from queue import Queue
-from threading import Thread
+from threading import Event, Semaphore, Thread
+
+import numpy as np
 
 from paddle.fluid.reader import QUEUE_GET_TIMEOUT
 
@@ -496,6 +501,290 @@ def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
     return xreader
 
 
+class _SharedNDArray:
+    """
+    The placeholder of a numpy array whose data is written into a slot of
+    the shared memory by the worker process of multiprocess_xmap_readers.
+    """
+
+    __slots__ = ['offset', 'shape', 'dtype']
+
+    def __init__(self, offset, shape, dtype):
+        self.offset = offset
+        self.shape = shape
+        self.dtype = dtype
+
+
+# NOTE: arrays are 64 bytes aligned in the slot of shared memory
+_SHARED_MEMORY_ALIGNMENT = 64
+
+
+def _flatten_shared_arrays(sample, arrays):
+    # replace numpy arrays in sample by placeholders and collect the arrays,
+    # return the sample with placeholders and the bytes of the arrays
+    if isinstance(sample, np.ndarray) and sample.dtype != np.object_:
+        offset = 0
+        if arrays:
+            last = arrays[-1]
+            offset = last[0] + last[1].nbytes
+            offset = -(-offset // _SHARED_MEMORY_ALIGNMENT) * (
+                _SHARED_MEMORY_ALIGNMENT
+            )
+        # NOTE: np.ascontiguousarray returns 0-d array as 1-d
+        array = np.require(sample, requirements='C')
+        arrays.append((offset, array))
+        return _SharedNDArray(offset, sample.shape, array.dtype.str)
+    elif isinstance(sample, tuple):
+        return tuple(_flatten_shared_arrays(s, arrays) for s in sample)
+    elif isinstance(sample, list):
+        return [_flatten_shared_arrays(s, arrays) for s in sample]
+    elif isinstance(sample, dict):
+        return {k: _flatten_shared_arrays(v, arrays) for k, v in sample.items()}
+    return sample
+
+
+def _restore_shared_arrays(sample, buffer, base):
+    if isinstance(sample, _SharedNDArray):
+        dtype = np.dtype(sample.dtype)
+        count = int(np.prod(sample.shape, dtype=np.int64))
+        array = np.frombuffer(
+            buffer, dtype=dtype, count=count, offset=base + sample.offset
+        )
+        # copy out since the slot will be reused
+        return array.reshape(sample.shape).copy()
+    elif isinstance(sample, tuple):
+        return tuple(_restore_shared_arrays(s, buffer, base) for s in sample)
+    elif isinstance(sample, list):
+        return [_restore_shared_arrays(s, buffer, base) for s in sample]
+    elif isinstance(sample, dict):
+        return {
+            k: _restore_shared_arrays(v, buffer, base)
+            for k, v in sample.items()
+        }
+    return sample
+
+
+def _xmap_worker(mapper, in_queue, out_queue, free_slots, buffer, slot_size):
+    try:
+        while True:
+            task = in_queue.get()
+            if task is None:
+                break
+            order, sample = task
+            result = mapper(sample)
+            slot = None
+            if buffer is not None:
+                arrays = []
+                flatten_result = _flatten_shared_arrays(result, arrays)
+                if arrays and arrays[-1][0] + arrays[-1][1].nbytes <= slot_size:
+                    # there is always a free slot since the number of slots
+                    # equals to the number of samples in flight
+                    slot = free_slots.get()
+                    base = slot * slot_size
+                    for offset, array in arrays:
+                        if array.nbytes == 0:
+                            continue
+                        dst = np.frombuffer(
+                            buffer,
+                            dtype=np.uint8,
+                            count=array.nbytes,
+                            offset=base + offset,
+                        )
+                        dst[:] = array.reshape(-1).view(np.uint8)
+                        del dst
+                    result = flatten_result
+            out_queue.put((order, slot, result))
+        out_queue.put(None)
+    except KeyboardInterrupt:
+        pass
+    except Exception:
+        out_queue.put(traceback.format_exc())
+
+
+def multiprocess_xmap_readers(
+    mapper,
+    reader,
+    process_num,
+    buffer_size,
+    order=True,
+    use_shared_memory=True,
+    shared_memory_size=64 * 1024 * 1024,
+):
+    """
+    Use multi-processes to map samples from reader by a mapper defined by user,
+    which is the multi-process version of ``xmap_readers`` for the mapper bound
+    by GIL.
+
+    The samples are read in a thread of the main process and mapped in ``process_num``
+    worker processes. At most ``buffer_size`` samples are in flight, i.e. read but
+    not yielded yet, so that reading is blocked when the consumer is slow. If
+    ``use_shared_memory`` is True, numpy arrays in the mapped samples, which can
+    be nested in tuple, list and dict, are sent back through shared memory
+    instead of pickle. If ``reader`` raises an error, it is raised again after
+    the samples read before the error are yielded.
+
+    Args:
+        mapper (callable): a function to map the data from reader.
+        reader (callable): a data reader which yields the data.
+        process_num (int): process number to handle original sample.
+        buffer_size (int): the maximum number of samples in flight.
+        order (bool, optional): whether to keep the data order from original reader.
+            Default True.
+        use_shared_memory (bool, optional): whether to send numpy arrays in the
+            mapped samples through shared memory. Default True.
+        shared_memory_size (int, optional): the size in bytes of shared memory,
+            which is divided into ``buffer_size`` slots. The mapped sample whose
+            arrays exceed the size of a slot is sent by pickle. Default 64MB.
+
+    Returns:
+        callable: a decorated reader with data mapping.
+
+    Examples:
+
+        .. code-block:: python
+
+            import numpy as np
+            import paddle
+
+            def reader():
+                for i in range(10):
+                    yield i
+
+            def mapper(x):
+                return np.full([2, 2], x, dtype='float32')
+
+            xreader = paddle.reader.multiprocess_xmap_readers(
+                mapper, reader, process_num=2, buffer_size=4)
+            for data in xreader():
+                print(data)
+    """
+    if sys.platform == 'win32':
+        raise NotImplementedError(
+            "The multiprocess_xmap_readers method is not supported on windows."
+        )
+    assert process_num > 0, "process_num should be a positive integer."
+    assert buffer_size > 0, "buffer_size should be a positive integer."
+
+    def read_worker(in_queue, in_flight, stop_event, reader_errors):
+        try:
+            for i, sample in enumerate(reader()):
+                while not in_flight.acquire(timeout=1):
+                    if stop_event.is_set():
+                        return
+                if stop_event.is_set():
+                    return
+                in_queue.put((i, sample))
+        except Exception as e:
+            # NOTE: raised by xreader after the samples read before the
+            # error are yielded
+            reader_errors.append(e)
+        finally:
+            if not stop_event.is_set():
+                for _ in range(process_num):
+                    in_queue.put(None)
+
+    def xreader():
+        slot_size = shared_memory_size // buffer_size
+        slot_size -= slot_size % _SHARED_MEMORY_ALIGNMENT
+        buffer = None
+        if use_shared_memory and slot_size > 0:
+            # NOTE: anonymous mmap is shared with the forked worker processes
+            buffer = mmap.mmap(-1, slot_size * buffer_size)
+        free_slots = fork_context.Queue()
+        for slot in range(buffer_size):
+            free_slots.put(slot)
+        in_queue = fork_context.Queue()
+        out_queue = fork_context.Queue()
+        in_flight = Semaphore(buffer_size)
+        stop_event = Event()
+        reader_errors = []
+
+        workers = []
+        for _ in range(process_num):
+            worker = fork_context.Process(
+                target=_xmap_worker,
+                args=(
+                    mapper,
+                    in_queue,
+                    out_queue,
+                    free_slots,
+                    buffer,
+                    slot_size,
+                ),
+            )
+            worker.daemon = True
+            worker.start()
+            workers.append(worker)
+        t = Thread(
+            target=read_worker,
+            args=(in_queue, in_flight, stop_event, reader_errors),
+        )
+        t.daemon = True
+        t.start()
+
+        def get_result():
+            while True:
+                try:
+                    result = out_queue.get(timeout=QUEUE_GET_TIMEOUT)
+                    break
+                except queue.Empty:
+                    if any(
+                        not w.is_alive() and w.exitcode != 0 for w in workers
+                    ):
+                        raise RuntimeError(
+                            "multiprocess_xmap_readers worker exited unexpectedly."
+                        )
+            if isinstance(result, str):
+                raise RuntimeError(
+                    "multiprocess_xmap_readers worker failed:\n" + result
+                )
+            if result is None:
+                return None
+            index, slot, sample = result
+            if slot is not None:
+                sample = _restore_shared_arrays(
+                    sample, buffer, slot * slot_size
+                )
+                free_slots.put(slot)
+            return index, sample
+
+        try:
+            finish = 0
+            next_index = 0
+            pending = {}
+            while finish < process_num:
+                result = get_result()
+                if result is None:
+                    finish += 1
+                    continue
+                if not order:
+                    in_flight.release()
+                    yield result[1]
+                    continue
+                pending[result[0]] = result[1]
+                while next_index in pending:
+                    sample = pending.pop(next_index)
+                    next_index += 1
+                    in_flight.release()
+                    yield sample
+            if reader_errors:
+                raise reader_errors[0]
+        finally:
+            stop_event.set()
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+                worker.join()
+            # NOTE: in_queue is not closed since the read thread may be
+            # still blocked in reader
+            for q in (free_slots, in_queue, out_queue):
+                q.cancel_join_thread()
+            free_slots.close()
+            out_queue.close()
+
+    return xreader
+
+
 def multiprocess_reader(readers, use_pipe=True, queue_size=1000):
     """
     This API use python ``multiprocessing`` to read data from ``readers`` parallelly,
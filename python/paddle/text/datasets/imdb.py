@@ -13,13 +13,21 @@
 # limitations under the License.
 
 import collections
+import itertools
 import re
 import string
 import tarfile
 
 import numpy as np
 
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import (
+    _cache_path,
+    _check_exists_and_download,
+    _load_cache,
+    _PackedSequences,
+    _save_cache,
+    _tokens_to_ids,
+)
 from paddle.io import Dataset
 
 __all__ = []
@@ -87,18 +95,45 @@ class Imdb(Dataset):
                 data_file, URL, MD5, 'imdb', download
             )
 
-        # Build a word dictionary from the corpus
-        self.word_idx = self._build_work_dict(cutoff)
-
-        # read dataset into memory
-        self._load_anno()
+        # Build a word dictionary and tokenize the corpus, results are cached
+        # by the archive and cutoff
+        cache_path = _cache_path('imdb', self.data_file, cutoff=cutoff)
+        cache = _load_cache(cache_path)
+        if cache is None:
+            cache = _save_cache(cache_path, self._build_cache(cutoff))
+        self.word_idx = cache['word_idx']
+
+        # documents are memory-mapped from the cache
+        offsets = cache[f'{self.mode}_offsets']
+        self.docs = _PackedSequences(
+            cache[f'{self.mode}_docs'], offsets[:-1], offsets[1:]
+        )
+        self.labels = cache[f'{self.mode}_labels']
+
+    def _build_cache(self, cutoff):
+        # read the archive once for the dictionary and documents of all modes
+        docs = self._tokenize(
+            re.compile(r"aclImdb/(train|test)/(pos|neg)/.*\.txt$")
+        )
+        word_idx = self._build_work_dict(docs, cutoff)
+
+        cache = {'word_idx': word_idx}
+        UNK = word_idx['<unk>']
+        for mode in ['train', 'test']:
+            pos_docs, neg_docs = docs[(mode, 'pos')], docs[(mode, 'neg')]
+            values, offsets = _tokens_to_ids(pos_docs + neg_docs, word_idx, UNK)
+            cache[f'{mode}_docs'] = values
+            cache[f'{mode}_offsets'] = offsets
+            cache[f'{mode}_labels'] = np.repeat(
+                np.array([0, 1], dtype=np.int64),
+                [len(pos_docs), len(neg_docs)],
+            )
+        return cache
 
-    def _build_work_dict(self, cutoff):
-        word_freq = collections.defaultdict(int)
-        pattern = re.compile(r"aclImdb/((train)|(test))/((pos)|(neg))/.*\.txt$")
-        for doc in self._tokenize(pattern):
-            for word in doc:
-                word_freq[word] += 1
+    def _build_work_dict(self, docs, cutoff):
+        word_freq = collections.Counter()
+        for group in docs.values():
+            word_freq.update(itertools.chain.from_iterable(group))
 
         # Not sure if we should prune less-frequent words here.
         word_freq = [x for x in word_freq.items() if x[1] > cutoff]
@@ -110,13 +145,15 @@ class Imdb(Dataset):
         return word_idx
 
     def _tokenize(self, pattern):
-        data = []
+        # documents grouped by the groups of pattern, in order of the archive
+        data = collections.defaultdict(list)
         with tarfile.open(self.data_file) as tarf:
             tf = tarf.next()
             while tf is not None:
-                if bool(pattern.match(tf.name)):
+                match = pattern.match(tf.name)
+                if match:
                     # newline and punctuations removal and ad-hoc tokenization.
-                    data.append(
+                    data[match.groups()].append(
                         tarf.extractfile(tf)
                         .read()
                         .rstrip(b'\n\r')
@@ -128,21 +165,6 @@ class Imdb(Dataset):
 
         return data
 
-    def _load_anno(self):
-        pos_pattern = re.compile(fr"aclImdb/{self.mode}/pos/.*\.txt$")
-        neg_pattern = re.compile(fr"aclImdb/{self.mode}/neg/.*\.txt$")
-
-        UNK = self.word_idx['<unk>']
-
-        self.docs = []
-        self.labels = []
-        for doc in self._tokenize(pos_pattern):
-            self.docs.append([self.word_idx.get(w, UNK) for w in doc])
-            self.labels.append(0)
-        for doc in self._tokenize(neg_pattern):
-            self.docs.append([self.word_idx.get(w, UNK) for w in doc])
-            self.labels.append(1)
-
     def __getitem__(self, idx):
         return (np.array(self.docs[idx]), np.array([self.labels[idx]]))
 
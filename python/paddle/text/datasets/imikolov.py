@@ -17,7 +17,14 @@ import tarfile
 
 import numpy as np
 
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import (
+    _cache_path,
+    _check_exists_and_download,
+    _load_cache,
+    _PackedSequences,
+    _save_cache,
+    _tokens_to_ids,
+)
 from paddle.io import Dataset
 
 __all__ = []
@@ -104,11 +111,31 @@ class Imikolov(Dataset):
                 data_file, URL, MD5, 'imikolov', download
             )
 
-        # Build a word dictionary from the corpus
-        self.word_idx = self._build_work_dict(min_word_freq)
-
-        # read dataset into memory
-        self._load_anno()
+        # Build a word dictionary from the corpus and read dataset, results
+        # are cached by the archive and options
+        cache_path = _cache_path(
+            'imikolov',
+            self.data_file,
+            data_type=self.data_type,
+            window_size=self.window_size,
+            mode=self.mode,
+            min_word_freq=self.min_word_freq,
+        )
+        cache = _load_cache(cache_path)
+        if cache is None:
+            self.word_idx = self._build_work_dict(min_word_freq)
+            cache = _save_cache(cache_path, self._load_anno())
+        self.word_idx = cache['word_idx']
+
+        # data is memory-mapped from the cache, NGRAM data is a 2-D array of
+        # grams and SEQ data are sequences of <s>, words and <e>
+        if self.data_type == 'NGRAM':
+            self.data = cache['data']
+        else:
+            offsets = cache['offsets']
+            self.data = _PackedSequences(
+                cache['data'], offsets[:-1], offsets[1:]
+            )
 
     def word_count(self, f, word_freq=None):
         if word_freq is None:
@@ -145,33 +172,49 @@ class Imikolov(Dataset):
         return word_idx
 
     def _load_anno(self):
-        self.data = []
         with tarfile.open(self.data_file) as tf:
             filename = f'./simple-examples/data/ptb.{self.mode}.txt'
-            f = tf.extractfile(filename)
-
-            UNK = self.word_idx['<unk>']
-            for l in f:
-                if self.data_type == 'NGRAM':
-                    assert self.window_size > -1, 'Invalid gram length'
-                    l = ['<s>'] + l.strip().split() + ['<e>']
-                    if len(l) >= self.window_size:
-                        l = [self.word_idx.get(w, UNK) for w in l]
-                        for i in range(self.window_size, len(l) + 1):
-                            self.data.append(tuple(l[i - self.window_size : i]))
-                elif self.data_type == 'SEQ':
-                    l = l.strip().split()
-                    l = [self.word_idx.get(w, UNK) for w in l]
-                    src_seq = [self.word_idx['<s>']] + l
-                    trg_seq = l + [self.word_idx['<e>']]
-                    if self.window_size > 0 and len(src_seq) > self.window_size:
-                        continue
-                    self.data.append((src_seq, trg_seq))
-                else:
-                    raise AssertionError('Unknow data type')
+            lines = [l.strip().split() for l in tf.extractfile(filename)]
+
+        cache = {'word_idx': self.word_idx}
+        UNK = self.word_idx['<unk>']
+        if self.data_type == 'NGRAM':
+            assert self.window_size > -1, 'Invalid gram length'
+            values, offsets = _tokens_to_ids(
+                lines,
+                self.word_idx,
+                UNK,
+                prefix=[self.word_idx.get('<s>', UNK)],
+                suffix=[self.word_idx.get('<e>', UNK)],
+            )
+            # gather all sliding windows of lines not shorter than window_size
+            num_grams = np.maximum(np.diff(offsets) - self.window_size + 1, 0)
+            starts = np.repeat(offsets[:-1], num_grams) + (
+                np.arange(num_grams.sum())
+                - np.repeat(np.cumsum(num_grams) - num_grams, num_grams)
+            )
+            cache['data'] = values[
+                starts[:, np.newaxis] + np.arange(self.window_size)
+            ]
+        elif self.data_type == 'SEQ':
+            if self.window_size > 0:
+                lines = [l for l in lines if len(l) + 1 <= self.window_size]
+            cache['data'], cache['offsets'] = _tokens_to_ids(
+                lines,
+                self.word_idx,
+                UNK,
+                prefix=[self.word_idx['<s>']],
+                suffix=[self.word_idx['<e>']],
+            )
+        else:
+            raise AssertionError('Unknow data type')
+        return cache
 
     def __getitem__(self, idx):
-        return tuple([np.array(d) for d in self.data[idx]])
+        if self.data_type == 'NGRAM':
+            return tuple([np.array(d) for d in self.data[idx]])
+        seq = self.data[idx]
+        return seq[:-1], seq[1:]
 
     def __len__(self):
         return len(self.data)
@@ -16,7 +16,14 @@ import tarfile
 
 import numpy as np
 
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import (
+    _cache_path,
+    _check_exists_and_download,
+    _load_cache,
+    _PackedSequences,
+    _save_cache,
+    _tokens_to_ids,
+)
 from paddle.io import Dataset
 
 __all__ = []
@@ -107,7 +114,30 @@ class WMT14(Dataset):
         # read dataset into memory
         assert dict_size > 0, "dict_size should be set as positive number"
         self.dict_size = dict_size
-        self._load_data()
+
+        # dictionaries and data are cached by the archive and options
+        cache_path = _cache_path(
+            'wmt14', self.data_file, mode=self.mode, dict_size=self.dict_size
+        )
+        cache = _load_cache(cache_path)
+        if cache is None:
+            cache = _save_cache(cache_path, self._load_data())
+        self.src_dict = cache['src_dict']
+        self.trg_dict = cache['trg_dict']
+
+        # data is memory-mapped from the cache, target sequences are packed
+        # as <s>, words and <e>
+        src_offsets = cache['src_offsets']
+        trg_offsets = cache['trg_offsets']
+        self.src_ids = _PackedSequences(
+            cache['src_ids'], src_offsets[:-1], src_offsets[1:]
+        )
+        self.trg_ids = _PackedSequences(
+            cache['trg_ids'], trg_offsets[:-1], trg_offsets[1:] - 1
+        )
+        self.trg_ids_next = _PackedSequences(
+            cache['trg_ids'], trg_offsets[:-1] + 1, trg_offsets[1:]
+        )
 
     def _load_data(self):
         def __to_dict(fd, size):
@@ -119,9 +149,8 @@ class WMT14(Dataset):
                     break
             return out_dict
 
-        self.src_ids = []
-        self.trg_ids = []
-        self.trg_ids_next = []
+        src_seqs = []
+        trg_seqs = []
         with tarfile.open(self.data_file, mode='r') as f:
             names = [
                 each_item.name
@@ -129,14 +158,14 @@ class WMT14(Dataset):
                 if each_item.name.endswith("src.dict")
             ]
             assert len(names) == 1
-            self.src_dict = __to_dict(f.extractfile(names[0]), self.dict_size)
+            src_dict = __to_dict(f.extractfile(names[0]), self.dict_size)
             names = [
                 each_item.name
                 for each_item in f
                 if each_item.name.endswith("trg.dict")
             ]
             assert len(names) == 1
-            self.trg_dict = __to_dict(f.extractfile(names[0]), self.dict_size)
+            trg_dict = __to_dict(f.extractfile(names[0]), self.dict_size)
 
             file_name = f"{self.mode}/{self.mode}"
             names = [
@@ -150,26 +179,32 @@ class WMT14(Dataset):
                     line_split = line.strip().split('\t')
                     if len(line_split) != 2:
                         continue
-                    src_seq = line_split[0]  # one source sequence
-                    src_words = src_seq.split()
-                    src_ids = [
-                        self.src_dict.get(w, UNK_IDX)
-                        for w in [START] + src_words + [END]
-                    ]
-
-                    trg_seq = line_split[1]  # one target sequence
-                    trg_words = trg_seq.split()
-                    trg_ids = [self.trg_dict.get(w, UNK_IDX) for w in trg_words]
-
-                    # remove sequence whose length > 80 in training mode
-                    if len(src_ids) > 80 or len(trg_ids) > 80:
-                        continue
-                    trg_ids_next = trg_ids + [self.trg_dict[END]]
-                    trg_ids = [self.trg_dict[START]] + trg_ids
+                    src_words = line_split[0].split()  # one source sequence
+                    trg_words = line_split[1].split()  # one target sequence
 
-                    self.src_ids.append(src_ids)
-                    self.trg_ids.append(trg_ids)
-                    self.trg_ids_next.append(trg_ids_next)
+                    # remove sequence whose length > 80 in training mode,
+                    # START and END are added to the source sequence
+                    if len(src_words) + 2 > 80 or len(trg_words) > 80:
+                        continue
+                    src_seqs.append(src_words)
+                    trg_seqs.append(trg_words)
+
+        cache = {'src_dict': src_dict, 'trg_dict': trg_dict}
+        cache['src_ids'], cache['src_offsets'] = _tokens_to_ids(
+            src_seqs,
+            src_dict,
+            UNK_IDX,
+            prefix=[src_dict.get(START, UNK_IDX)],
+            suffix=[src_dict.get(END, UNK_IDX)],
+        )
+        cache['trg_ids'], cache['trg_offsets'] = _tokens_to_ids(
+            trg_seqs,
+            trg_dict,
+            UNK_IDX,
+            prefix=[trg_dict[START]],
+            suffix=[trg_dict[END]],
+        )
+        return cache
 
     def __getitem__(self, idx):
         return (
@@ -21,7 +21,14 @@ from collections import defaultdict
 import numpy as np
 
 import paddle
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import (
+    _cache_path,
+    _check_exists_and_download,
+    _load_cache,
+    _PackedSequences,
+    _save_cache,
+    _tokens_to_ids,
+)
 from paddle.io import Dataset
 
 __all__ = []
@@ -138,14 +145,41 @@ class WMT16(Dataset):
             trg_dict_size, (TOTAL_DE_WORDS if lang == "en" else TOTAL_EN_WORDS)
         )
 
-        # load source and target word dict
-        self.src_dict = self._load_dict(lang, src_dict_size)
-        self.trg_dict = self._load_dict(
-            "de" if lang == "en" else "en", trg_dict_size
+        # word dicts and data are cached by the archive and options
+        cache_path = _cache_path(
+            'wmt16',
+            self.data_file,
+            mode=self.mode,
+            lang=lang,
+            src_dict_size=src_dict_size,
+            trg_dict_size=trg_dict_size,
         )
+        cache = _load_cache(cache_path)
+        if cache is None:
+            # load source and target word dict
+            self.src_dict = self._load_dict(lang, src_dict_size)
+            self.trg_dict = self._load_dict(
+                "de" if lang == "en" else "en", trg_dict_size
+            )
 
-        # load data
-        self.data = self._load_data()
+            # load data
+            cache = _save_cache(cache_path, self._load_data())
+        self.src_dict = cache['src_dict']
+        self.trg_dict = cache['trg_dict']
+
+        # data is memory-mapped from the cache, target sequences are packed
+        # as <s>, words and <e>
+        src_offsets = cache['src_offsets']
+        trg_offsets = cache['trg_offsets']
+        self.src_ids = _PackedSequences(
+            cache['src_ids'], src_offsets[:-1], src_offsets[1:]
+        )
+        self.trg_ids = _PackedSequences(
+            cache['trg_ids'], trg_offsets[:-1], trg_offsets[1:] - 1
+        )
+        self.trg_ids_next = _PackedSequences(
+            cache['trg_ids'], trg_offsets[:-1] + 1, trg_offsets[1:]
+        )
 
     def _load_dict(self, lang, dict_size, reverse=False):
         dict_path = os.path.join(
@@ -201,31 +235,25 @@ class WMT16(Dataset):
         src_col = 0 if self.lang == "en" else 1
         trg_col = 1 - src_col
 
-        self.src_ids = []
-        self.trg_ids = []
-        self.trg_ids_next = []
+        src_seqs = []
+        trg_seqs = []
         with tarfile.open(self.data_file, mode="r") as f:
             for line in f.extractfile(f"wmt16/{self.mode}"):
                 line = line.decode()
                 line_split = line.strip().split("\t")
                 if len(line_split) != 2:
                     continue
-                src_words = line_split[src_col].split()
-                src_ids = (
-                    [start_id]
-                    + [self.src_dict.get(w, unk_id) for w in src_words]
-                    + [end_id]
-                )
-
-                trg_words = line_split[trg_col].split()
-                trg_ids = [self.trg_dict.get(w, unk_id) for w in trg_words]
-
-                trg_ids_next = trg_ids + [end_id]
-                trg_ids = [start_id] + trg_ids
-
-                self.src_ids.append(src_ids)
-                self.trg_ids.append(trg_ids)
-                self.trg_ids_next.append(trg_ids_next)
+                src_seqs.append(line_split[src_col].split())
+                trg_seqs.append(line_split[trg_col].split())
+
+        cache = {'src_dict': self.src_dict, 'trg_dict': self.trg_dict}
+        cache['src_ids'], cache['src_offsets'] = _tokens_to_ids(
+            src_seqs, self.src_dict, unk_id, prefix=[start_id], suffix=[end_id]
+        )
+        cache['trg_ids'], cache['trg_offsets'] = _tokens_to_ids(
+            trg_seqs, self.trg_dict, unk_id, prefix=[start_id], suffix=[end_id]
+        )
+        return cache
 
     def __getitem__(self, idx):
         return (
@@ -12,8 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import hashlib
 import os
+import struct
 
+import numpy as np
 from PIL import Image
 
 import paddle
@@ -63,6 +67,139 @@ def make_dataset(dir, class_to_idx, extensions, is_valid_file=None):
     return images
 
 
+# NOTE: a spilled sample file starts with a header of magic number, image
+# mode (b'' for numpy.ndarray) and shape, followed by the uint8 data at
+# offset _SPILL_DATA_OFFSET, so it can be memory-mapped directly
+_SPILL_MAGIC = b'PDSAMPLE'
+_SPILL_HEADER = struct.Struct('<8s8sQQQQ')
+_SPILL_DATA_OFFSET = 64
+
+
+class _DecodedSampleCache:
+    """
+    Cache of samples decoded by loader of DatasetFolder and ImageFolder,
+    samples are cached before transform, so random transforms still take
+    effect in every epoch. Only samples of numpy.ndarray and PIL.Image are
+    cached.
+
+    Decoded samples are kept in an in-memory LRU cache of at most
+    :attr:`cache_size` bytes, least recently used samples are evicted if
+    the size exceeds. As DataLoader workers are different processes, each
+    worker keeps its own in-memory cache.
+
+    If :attr:`cache_dir` is set, uint8 samples are also written into
+    files in :attr:`cache_dir` once decoded, and samples missing in memory
+    are memory-mapped from these files, so samples decoded by one worker
+    can be used by all workers and following epochs without decoding.
+    Files are written to a temporary name and renamed after written, so
+    it is safe for workers to read and write concurrently. Files are
+    named by the hash of sample path, :attr:`cache_dir` should be cleared
+    if the sample files are changed.
+
+    Args:
+        cache_size(int): max bytes of in-memory cache of each process.
+        cache_dir(str|None): directory of spilled sample files, None means
+            samples are not spilled.
+    """
+
+    def __init__(self, cache_size, cache_dir=None):
+        assert cache_size >= 0, "cache_size should be a non-negative value"
+        self.cache_size = cache_size
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+        self._samples = collections.OrderedDict()
+        self._nbytes = 0
+
+    @staticmethod
+    def _to_array(sample):
+        # NOTE: copy the sample, as it may be modified by transform
+        if isinstance(sample, Image.Image):
+            return np.array(sample), sample.mode
+        if isinstance(sample, np.ndarray):
+            return np.array(sample), ''
+        return None, None
+
+    @staticmethod
+    def _from_array(data, mode):
+        if mode:
+            # NOTE: PIL copies read-only data before modifying in place
+            return Image.fromarray(data, mode)
+        # copy, as transforms may modify the sample in place
+        return np.array(data)
+
+    def _spill_path(self, path):
+        name = hashlib.md5(os.path.abspath(path).encode()).hexdigest()
+        return os.path.join(self.cache_dir, name + '.sample')
+
+    def _load_spilled(self, path):
+        spill_path = self._spill_path(path)
+        try:
+            with open(spill_path, 'rb') as f:
+                header = f.read(_SPILL_HEADER.size)
+        except OSError:
+            return None, None
+        if len(header) < _SPILL_HEADER.size:
+            return None, None
+        magic, mode, ndim, *shape = _SPILL_HEADER.unpack(header)
+        if magic != _SPILL_MAGIC:
+            return None, None
+        shape = tuple(shape[:ndim])
+        data = np.memmap(
+            spill_path,
+            dtype='uint8',
+            mode='r',
+            offset=_SPILL_DATA_OFFSET,
+            shape=shape,
+        )
+        return data, mode.rstrip(b'\0').decode()
+
+    def _spill(self, path, data, mode):
+        if data.dtype != np.uint8 or data.ndim not in [2, 3]:
+            return
+        spill_path = self._spill_path(path)
+        tmp_path = '{}.{}.tmp'.format(spill_path, os.getpid())
+        shape = list(data.shape) + [0] * (3 - data.ndim)
+        header = _SPILL_HEADER.pack(
+            _SPILL_MAGIC, mode.encode(), data.ndim, *shape
+        )
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            f.write(b'\0' * (_SPILL_DATA_OFFSET - len(header)))
+            f.write(np.ascontiguousarray(data).reshape([-1]))
+        os.replace(tmp_path, spill_path)
+
+    def _put(self, path, data, mode):
+        nbytes = data.nbytes
+        if nbytes > self.cache_size:
+            return
+        self._samples[path] = (data, mode)
+        self._nbytes += nbytes
+        while self._nbytes > self.cache_size:
+            _, (evicted, _) = self._samples.popitem(last=False)
+            self._nbytes -= evicted.nbytes
+
+    def load(self, path, loader):
+        cached = self._samples.get(path)
+        if cached is not None:
+            self._samples.move_to_end(path)
+            return self._from_array(*cached)
+
+        if self.cache_dir is not None:
+            data, mode = self._load_spilled(path)
+            if data is not None:
+                return self._from_array(data, mode)
+
+        sample = loader(path)
+        data, mode = self._to_array(sample)
+        if data is None:
+            return sample
+        if self.cache_dir is not None:
+            self._spill(path, data, mode)
+        self._put(path, data, mode)
+        return sample
+
+
 class DatasetFolder(Dataset):
     """A generic data loader where the samples are arranged in this way:
 
@@ -88,6 +225,14 @@ class DatasetFolder(Dataset):
         is_valid_file (Callable, optional): A function that takes path of a file
             and check if the file is a valid file. Both :attr:`extensions` and
             :attr:`is_valid_file` should not be passed. Default: None.
+        cache_size (int, optional): Max bytes of decoded samples cached in memory
+            by each process, samples are cached before :attr:`transform` and
+            evicted in least recently used order. 0 means no in-memory cache.
+            Default: 0.
+        cache_dir (str, optional): Directory to spill decoded uint8 samples to,
+            which are memory-mapped when missing in memory and shared by all
+            DataLoader workers. Should be on local disk and cleared if the
+            sample files are changed. Default: None, which means no spilling.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of DatasetFolder.
@@ -207,6 +352,8 @@ class DatasetFolder(Dataset):
         extensions=None,
         transform=None,
         is_valid_file=None,
+        cache_size=0,
+        cache_dir=None,
     ):
         self.root = root
         self.transform = transform
@@ -226,6 +373,9 @@ class DatasetFolder(Dataset):
 
         self.loader = default_loader if loader is None else loader
         self.extensions = extensions
+        self._cache = None
+        if cache_size > 0 or cache_dir is not None:
+            self._cache = _DecodedSampleCache(cache_size, cache_dir)
 
         self.classes = classes
         self.class_to_idx = class_to_idx
@@ -260,7 +410,10 @@ class DatasetFolder(Dataset):
             tuple: (sample, target) where target is class_index of the target class.
         """
         path, target = self.samples[index]
-        sample = self.loader(path)
+        if self._cache is not None:
+            sample = self._cache.load(path, self.loader)
+        else:
+            sample = self.loader(path)
         if self.transform is not None:
             sample = self.transform(sample)
 
@@ -324,6 +477,14 @@ class ImageFolder(Dataset):
         is_valid_file (Callable, optional): A function that takes path of a file
             and check if the file is a valid file. Both :attr:`extensions` and
             :attr:`is_valid_file` should not be passed. Default: None.
+        cache_size (int, optional): Max bytes of decoded samples cached in memory
+            by each process, samples are cached before :attr:`transform` and
+            evicted in least recently used order. 0 means no in-memory cache.
+            Default: 0.
+        cache_dir (str, optional): Directory to spill decoded uint8 samples to,
+            which are memory-mapped when missing in memory and shared by all
+            DataLoader workers. Should be on local disk and cleared if the
+            sample files are changed. Default: None, which means no spilling.
 
     Returns:
         :ref:`api_paddle_io_Dataset`. An instance of ImageFolder.
@@ -430,6 +591,8 @@ class ImageFolder(Dataset):
         extensions=None,
         transform=None,
         is_valid_file=None,
+        cache_size=0,
+        cache_dir=None,
     ):
         self.root = root
         if extensions is None:
@@ -459,6 +622,9 @@ class ImageFolder(Dataset):
 
         self.loader = default_loader if loader is None else loader
         self.extensions = extensions
+        self._cache = None
+        if cache_size > 0 or cache_dir is not None:
+            self._cache = _DecodedSampleCache(cache_size, cache_dir)
         self.samples = samples
         self.transform = transform
 
@@ -471,7 +637,10 @@ class ImageFolder(Dataset):
             sample of specific index.
         """
         path = self.samples[index]
-        sample = self.loader(path)
+        if self._cache is not None:
+            sample = self._cache.load(path, self.loader)
+        else:
+            sample = self.loader(path)
         if self.transform is not None:
             sample = self.transform(sample)
         return [sample]
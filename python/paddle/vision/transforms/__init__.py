@@ -34,6 +34,13 @@ from .transforms import RandomPerspective  # noqa: F401
 from .transforms import Grayscale  # noqa: F401
 from .transforms import ToTensor  # noqa: F401
 from .transforms import RandomErasing  # noqa: F401
+from .batch_transforms import BatchCompose  # noqa: F401
+from .batch_transforms import BatchRandomResizedCrop  # noqa: F401
+from .batch_transforms import BatchRandomHorizontalFlip  # noqa: F401
+from .batch_transforms import BatchRandomVerticalFlip  # noqa: F401
+from .batch_transforms import BatchColorJitter  # noqa: F401
+from .batch_transforms import BatchToTensor  # noqa: F401
+from .batch_transforms import BatchNormalize  # noqa: F401
 from .functional import to_tensor  # noqa: F401
 from .functional import hflip  # noqa: F401
 from .functional import vflip  # noqa: F401
@@ -74,6 +81,13 @@ __all__ = [  # noqa
     'Grayscale',
     'ToTensor',
     'RandomErasing',
+    'BatchCompose',
+    'BatchRandomResizedCrop',
+    'BatchRandomHorizontalFlip',
+    'BatchRandomVerticalFlip',
+    'BatchColorJitter',
+    'BatchToTensor',
+    'BatchNormalize',
     'to_tensor',
     'hflip',
     'vflip',
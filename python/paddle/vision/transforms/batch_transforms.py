@@ -0,0 +1,713 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import numbers
+
+import numpy as np
+
+import paddle
+
+from . import functional as F
+from .transforms import BaseTransform, Compose, _check_input
+
+__all__ = []
+
+# NOTE: batch transforms work on a batch of RGB images stacked by collate,
+# which is a numpy.ndarray or paddle.Tensor with shape (N, H, W, C) until
+# it is converted by BatchToTensor. Random parameters are drawn for each
+# image, and applied to the whole batch in a vectorized pass.
+
+# weights of RGB channels to compute grayscale
+_GRAY_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+# transform matrices between RGB and YIQ color space
+_RGB_TO_YIQ = np.array(
+    [
+        [0.299, 0.587, 0.114],
+        [0.596, -0.274, -0.322],
+        [0.211, -0.523, 0.312],
+    ],
+    dtype=np.float32,
+)
+_YIQ_TO_RGB = np.linalg.inv(_RGB_TO_YIQ).astype(np.float32)
+
+
+def _check_batch(images):
+    if not (
+        F._is_tensor_image(images)
+        or (isinstance(images, np.ndarray) and images.ndim == 4)
+    ):
+        raise TypeError(
+            "Batch transforms expect a numpy.ndarray or paddle.Tensor with "
+            "shape (N, H, W, C), but got {}".format(type(images))
+        )
+    if len(images.shape) != 4:
+        raise ValueError(
+            "The dim for input batch should be 4, but received {}".format(
+                len(images.shape)
+            )
+        )
+
+
+def _to_batch_param(param, images):
+    # convert the numpy parameters to the same type as images
+    if F._is_tensor_image(images):
+        return paddle.to_tensor(param, place=images.place)
+    return param
+
+
+def _is_uint8(images):
+    if F._is_tensor_image(images):
+        return images.dtype == paddle.uint8
+    return images.dtype == np.uint8
+
+
+def _cast_back(images, dtype):
+    # round and clip the float results back to the dtype of input
+    if F._is_tensor_image(images):
+        if dtype == paddle.uint8:
+            return images.round().clip(0, 255).astype(dtype)
+        return images.astype(dtype)
+    if dtype == np.uint8:
+        return np.clip(np.rint(images), 0, 255).astype(dtype)
+    return images.astype(dtype, copy=False)
+
+
+class BatchCompose(Compose):
+    """
+    Composes several batch transforms together. Adjacent ``BatchToTensor``
+    and ``BatchNormalize`` are fused into a single pass.
+
+    Args:
+        transforms (list|tuple): List/Tuple of batch transforms to compose.
+
+    Returns:
+        A compose object which is callable, __call__ for this BatchCompose
+        object will call each given :attr:`transforms` sequencely.
+
+    Examples:
+
+        .. code-block:: python
+
+            import numpy as np
+            import paddle.vision.transforms as T
+
+            transform = T.BatchCompose([
+                T.BatchRandomResizedCrop(224),
+                T.BatchRandomHorizontalFlip(),
+                T.BatchColorJitter(0.4, 0.4, 0.4),
+                T.BatchToTensor(),
+                T.BatchNormalize(mean=[0.485, 0.456, 0.406],
+                                 std=[0.229, 0.224, 0.225]),
+            ])
+
+            fake_images = (np.random.rand(8, 256, 256, 3) * 255.).astype('uint8')
+            images = transform(fake_images)
+            print(images.shape)
+            # [8, 3, 224, 224]
+    """
+
+    def __init__(self, transforms):
+        fused_transforms = []
+        for t in transforms:
+            if (
+                fused_transforms
+                and isinstance(t, BatchNormalize)
+                and isinstance(fused_transforms[-1], BatchToTensor)
+            ):
+                fused = fused_transforms[-1]._fuse_normalize(t)
+                if fused is not None:
+                    fused_transforms[-1] = fused
+                    continue
+            fused_transforms.append(t)
+        super().__init__(fused_transforms)
+
+
+class BatchRandomResizedCrop(BaseTransform):
+    """Crop each image in the batch to random size and aspect ratio, and resize
+    them to the given size. See ``RandomResizedCrop`` for more details.
+
+    Args:
+        size (int|list|tuple): Target size of output image, with (height, width) shape.
+        scale (list|tuple, optional): Scale range of the cropped image before resizing, relatively to the origin
+            image. Default: (0.08, 1.0).
+        ratio (list|tuple, optional): Range of aspect ratio of the origin aspect ratio cropped. Default: (0.75, 1.33)
+        interpolation (str, optional): Interpolation method, can be chosen from ['nearest', 'bilinear'].
+            Default: 'bilinear'.
+        keys (list[str]|tuple[str], optional): Same as ``BaseTransform``. Default: None.
+
+    Shape:
+        - img(np.ndarray|Paddle.Tensor): The input batch with shape (N x H x W x C).
+        - output(np.ndarray|Paddle.Tensor): A batch with shape (N x size[0] x size[1] x C).
+
+    Returns:
+        A callable object of BatchRandomResizedCrop.
+
+    Examples:
+
+        .. code-block:: python
+
+            import numpy as np
+            from paddle.vision.transforms import BatchRandomResizedCrop
+
+            transform = BatchRandomResizedCrop(224)
+
+            fake_images = (np.random.rand(8, 300, 320, 3) * 255.).astype('uint8')
+
+            fake_images = transform(fake_images)
+            print(fake_images.shape)
+            # (8, 224, 224, 3)
+    """
+
+    def __init__(
+        self,
+        size,
+        scale=(0.08, 1.0),
+        ratio=(3.0 / 4, 4.0 / 3),
+        interpolation='bilinear',
+        keys=None,
+    ):
+        super().__init__(keys)
+        if isinstance(size, int):
+            self.size = (size, size)
+        else:
+            self.size = tuple(size)
+        assert scale[0] <= scale[1], "scale should be of kind (min, max)"
+        assert ratio[0] <= ratio[1], "ratio should be of kind (min, max)"
+        assert interpolation in [
+            'nearest',
+            'bilinear',
+        ], "interpolation should be 'nearest' or 'bilinear'"
+        self.scale = scale
+        self.ratio = ratio
+        self.interpolation = interpolation
+
+    def _get_params(self, inputs, attempts=10):
+        images = inputs[self.keys.index('image')]
+        _check_batch(images)
+        num, height, width = images.shape[:3]
+        area = height * width
+
+        target_area = (
+            np.random.uniform(*self.scale, size=(num, attempts)) * area
+        )
+        log_ratio = tuple(math.log(x) for x in self.ratio)
+        aspect_ratio = np.exp(
+            np.random.uniform(*log_ratio, size=(num, attempts))
+        )
+        ws = np.round(np.sqrt(target_area * aspect_ratio)).astype('int64')
+        hs = np.round(np.sqrt(target_area / aspect_ratio)).astype('int64')
+        valid = (0 < ws) & (ws <= width) & (0 < hs) & (hs <= height)
+        # the first valid attempt of each image
+        first = valid.argmax(axis=1)
+        found = valid.any(axis=1)
+
+        # Fallback to central crop
+        in_ratio = float(width) / float(height)
+        if in_ratio < min(self.ratio):
+            w = width
+            h = int(round(w / min(self.ratio)))
+        elif in_ratio > max(self.ratio):
+            h = height
+            w = int(round(h * max(self.ratio)))
+        else:
+            # return whole image
+            w = width
+            h = height
+
+        index = np.arange(num)
+        w = np.where(found, ws[index, first], w)
+        h = np.where(found, hs[index, first], h)
+        i = np.where(
+            found,
+            (np.random.random(num) * (height - h + 1)).astype('int64'),
+            (height - h) // 2,
+        )
+        j = np.where(
+            found,
+            (np.random.random(num) * (width - w + 1)).astype('int64'),
+            (width - w) // 2,
+        )
+        return i, j, h, w
+
+    def _apply_image(self, images):
+        i, j, h, w = self.params
+        if F._is_tensor_image(images):
+            return self._apply_tensor(images, i, j, h, w)
+        return self._apply_numpy(images, i, j, h, w)
+
+    def _source_coords(self, start, length, out_length):
+        # source coordinates of the center of output pixels, which are
+        # clipped to the crop region
+        coords = (np.arange(out_length, dtype=np.float32) + 0.5)[None, :] * (
+            length / out_length
+        ).astype(np.float32)[:, None] - 0.5
+        coords = np.clip(coords, 0, (length - 1)[:, None]) + start[:, None]
+        return coords
+
+    def _apply_numpy(self, images, i, j, h, w):
+        out_h, out_w = self.size
+        index = np.arange(len(images))[:, None, None]
+        ys = self._source_coords(i, h, out_h)
+        xs = self._source_coords(j, w, out_w)
+        if self.interpolation == 'nearest':
+            y = np.floor(ys + 0.5).astype('int64')
+            x = np.floor(xs + 0.5).astype('int64')
+            return images[index, y[:, :, None], x[:, None, :]]
+
+        y0 = np.floor(ys).astype('int64')
+        x0 = np.floor(xs).astype('int64')
+        y1 = np.minimum(y0 + 1, (i + h - 1)[:, None])
+        x1 = np.minimum(x0 + 1, (j + w - 1)[:, None])
+        wy = (ys - y0).astype(np.float32)[:, :, None, None]
+        wx = (xs - x0).astype(np.float32)[:, None, :, None]
+        # interpolate rows and then columns since bilinear is separable
+        index = index[:, :, 0]
+        rows = images[index, y0] * (1 - wy)
+        rows += images[index, y1] * wy
+        rows_index = np.arange(out_h)[None, :, None]
+        index = index[:, :, None]
+        outputs = rows[index, rows_index, x0[:, None, :]] * (1 - wx)
+        outputs += rows[index, rows_index, x1[:, None, :]] * wx
+        return _cast_back(outputs, images.dtype)
+
+    def _apply_tensor(self, images, i, j, h, w):
+        num, height, width, channels = images.shape
+        out_h, out_w = self.size
+        # affine matrices map the normalized coordinates of output to the
+        # crop region of input
+        theta = np.zeros((num, 2, 3), dtype=np.float32)
+        theta[:, 0, 0] = w / width
+        theta[:, 0, 2] = (2 * j + w) / width - 1
+        theta[:, 1, 1] = h / height
+        theta[:, 1, 2] = (2 * i + h) / height - 1
+        theta = _to_batch_param(theta, images)
+        grid = paddle.nn.functional.affine_grid(
+            theta, [num, channels, out_h, out_w], align_corners=False
+        )
+        outputs = paddle.nn.functional.grid_sample(
+            images.astype('float32').transpose([0, 3, 1, 2]),
+            grid,
+            mode=self.interpolation,
+            padding_mode='border',
+            align_corners=False,
+        )
+        return _cast_back(outputs.transpose([0, 2, 3, 1]), images.dtype)
+
+
+class BatchRandomHorizontalFlip(BaseTransform):
+    """Horizontally flip each image in the batch randomly with a given probability.
+
+    Args:
+        prob (float, optional): Probability of each image being flipped. Should be in [0, 1]. Default: 0.5
+        keys (list[str]|tuple[str], optional): Same as ``BaseTransform``. Default: None.
+
+    Shape:
+        - img(np.ndarray|Paddle.Tensor): The input batch with shape (N x H x W x C).
+        - output(np.ndarray|Paddle.Tensor): A batch with randomly flipped images.
+
+    Returns:
+        A callable object of BatchRandomHorizontalFlip.
+
+    Examples:
+
+        .. code-block:: python
+
+            import numpy as np
+            from paddle.vision.transforms import BatchRandomHorizontalFlip
+
+            transform = BatchRandomHorizontalFlip(0.5)
+
+            fake_images = (np.random.rand(8, 300, 320, 3) * 255.).astype('uint8')
+
+            fake_images = transform(fake_images)
+            print(fake_images.shape)
+            # (8, 300, 320, 3)
+    """
+
+    # the axis to flip in (N, H, W, C)
+    axis = 2
+
+    def __init__(self, prob=0.5, keys=None):
+        super().__init__(keys)
+        assert 0 <= prob <= 1, "probability must be between 0 and 1"
+        self.prob = prob
+
+    def _get_params(self, inputs):
+        images = inputs[self.keys.index('image')]
+        _check_batch(images)
+        return np.random.random(images.shape[0]) < self.prob
+
+    def _apply_image(self, images):
+        flip = self.params
+        if not flip.any():
+            return images
+        if F._is_tensor_image(images):
+            # gather each image from the original or the flipped ones
+            index = np.arange(len(flip)) + flip * len(flip)
+            index = _to_batch_param(index, images)
+            return paddle.gather(
+                paddle.concat([images, paddle.flip(images, axis=[self.axis])]),
+                index,
+            )
+        images = images.copy()
+        images[flip] = np.flip(images[flip], axis=self.axis)
+        return images
+
+
+class BatchRandomVerticalFlip(BatchRandomHorizontalFlip):
+    """Vertically flip each image in the batch randomly with a given probability.
+
+    Args:
+        prob (float, optional): Probability of each image being flipped. Should be in [0, 1]. Default: 0.5
+        keys (list[str]|tuple[str], optional): Same as ``BaseTransform``. Default: None.
+
+    Shape:
+        - img(np.ndarray|Paddle.Tensor): The input batch with shape (N x H x W x C).
+        - output(np.ndarray|Paddle.Tensor): A batch with randomly flipped images.
+
+    Returns:
+        A callable object of BatchRandomVerticalFlip.
+
+    Examples:
+
+        .. code-block:: python
+
+            import numpy as np
+            from paddle.vision.transforms import BatchRandomVerticalFlip
+
+            transform = BatchRandomVerticalFlip(0.5)
+
+            fake_images = (np.random.rand(8, 300, 320, 3) * 255.).astype('uint8')
+
+            fake_images = transform(fake_images)
+            print(fake_images.shape)
+            # (8, 300, 320, 3)
+    """
+
+    axis = 1
+
+
+class BatchColorJitter(BaseTransform):
+    """Randomly change the brightness, contrast, saturation and hue of each RGB
+    image in the batch. See ``ColorJitter`` for more details.
+
+    The adjustments are applied in a random order for each image as ``ColorJitter``,
+    but they are composed into a per image affine transform of colors and applied in
+    one pass, so the intermediate results are not clipped. The hue is rotated in YIQ
+    color space, which approximates the hue adjustment in HSV color space.
+
+    Args:
+        brightness (float, optional): How much to jitter brightness.
+            Chosen uniformly from [max(0, 1 - brightness), 1 + brightness]. Should be non negative numbers. Default: 0.
+        contrast (float, optional): How much to jitter contrast.
+            Chosen uniformly from [max(0, 1 - contrast), 1 + contrast]. Should be non negative numbers. Default: 0.
+        saturation (float, optional): How much to jitter saturation.
+            Chosen uniformly from [max(0, 1 - saturation), 1 + saturation]. Should be non negative numbers. Default: 0.
+        hue (float, optional): How much to jitter hue.
+            Chosen uniformly from [-hue, hue]. Should have 0<= hue <= 0.5. Default: 0.
+        keys (list[str]|tuple[str], optional): Same as ``BaseTransform``. Default: None.
+
+    Shape:
+        - img(np.ndarray|Paddle.Tensor): The input batch with shape (N x H x W x 3), the values are in [0, 255].
+        - output(np.ndarray|Paddle.Tensor): A batch with color jittered images.
+
+    Returns:
+        A callable object of BatchColorJitter.
+
+    Examples:
+
+        .. code-block:: python
+
+            import numpy as np
+            from paddle.vision.transforms import BatchColorJitter
+
+            transform = BatchColorJitter(0.4, 0.4, 0.4, 0.4)
+
+            fake_images = (np.random.rand(8, 224, 224, 3) * 255.).astype('uint8')
+
+            fake_images = transform(fake_images)
+    """
+
+    def __init__(
+        self, brightness=0, contrast=0, saturation=0, hue=0, keys=None
+    ):
+        super().__init__(keys)
+        self.brightness = _check_input(brightness, 'brightness')
+        self.contrast = _check_input(contrast, 'contrast')
+        self.saturation = _check_input(saturation, 'saturation')
+        self.hue = _check_input(
+            hue, 'hue', center=0, bound=(-0.5, 0.5), clip_first_on_zero=False
+        )
+
+    def _get_params(self, inputs):
+        images = inputs[self.keys.index('image')]
+        _check_batch(images)
+        num = images.shape[0]
+        assert images.shape[3] == 3, "BatchColorJitter expects RGB images"
+
+        # the colors of output are `images @ matrix.T + bias`, where bias is
+        # `bias_const + bias_mean @ mean(images)` since contrast depends on
+        # the mean of images
+        matrix = np.tile(np.eye(3, dtype=np.float32), (num, 1, 1))
+        bias_const = np.zeros((num, 3, 1), dtype=np.float32)
+        bias_mean = np.zeros((num, 3, 3), dtype=np.float32)
+        gray = np.tile(_GRAY_WEIGHTS, (3, 1))
+
+        adjustments = []
+        if self.brightness is not None:
+            factors = np.random.uniform(*self.brightness, size=num)
+            adjustments.append(
+                factors[:, None, None] * np.eye(3, dtype=np.float32)
+            )
+        if self.saturation is not None:
+            factors = np.random.uniform(*self.saturation, size=num)[
+                :, None, None
+            ]
+            adjustments.append(
+                factors * np.eye(3, dtype=np.float32) + (1 - factors) * gray
+            )
+        if self.hue is not None:
+            angles = np.random.uniform(*self.hue, size=num) * 2 * np.pi
+            rotation = np.zeros((num, 3, 3), dtype=np.float32)
+            rotation[:, 0, 0] = 1
+            rotation[:, 1, 1] = np.cos(angles)
+            rotation[:, 1, 2] = -np.sin(angles)
+            rotation[:, 2, 1] = np.sin(angles)
+            rotation[:, 2, 2] = np.cos(angles)
+            adjustments.append(_YIQ_TO_RGB @ rotation @ _RGB_TO_YIQ)
+        if self.contrast is not None:
+            # None stands for contrast which is not linear
+            adjustments.append(None)
+            contrast = np.random.uniform(*self.contrast, size=num)[
+                :, None, None
+            ]
+
+        # apply the adjustments in a random order for each image
+        orders = np.argsort(np.random.random((num, len(adjustments))), axis=1)
+        for step in range(len(adjustments)):
+            for k, adjustment in enumerate(adjustments):
+                index = orders[:, step] == k
+                if not index.any():
+                    continue
+                if adjustment is None:
+                    c = contrast[index]
+                    # the mean of grayscale of the current images
+                    gray_const = gray @ bias_const[index]
+                    gray_mean = gray @ (matrix[index] + bias_mean[index])
+                    matrix[index] = c * matrix[index]
+                    bias_const[index] = (
+                        c * bias_const[index] + (1 - c) * gray_const
+                    )
+                    bias_mean[index] = (
+                        c * bias_mean[index] + (1 - c) * gray_mean
+                    )
+                else:
+                    a = adjustment[index]
+                    matrix[index] = a @ matrix[index]
+                    bias_const[index] = a @ bias_const[index]
+                    bias_mean[index] = a @ bias_mean[index]
+        return matrix, bias_const, bias_mean
+
+    def _apply_image(self, images):
+        matrix, bias_const, bias_mean = self.params
+        num = images.shape[0]
+        flat = images.reshape([num, -1, 3]).astype('float32')
+        matrix = _to_batch_param(matrix.transpose([0, 2, 1]), images)
+        bias = _to_batch_param(bias_const.reshape([num, 1, 3]), images)
+        if self.contrast is not None:
+            if F._is_tensor_image(images):
+                mean = flat.mean(axis=1, keepdim=True)
+            else:
+                # reduce by matmul which is much faster than mean along
+                # the strided axis
+                weights = np.full(
+                    (1, flat.shape[1]), 1.0 / flat.shape[1], dtype=np.float32
+                )
+                mean = weights @ flat
+            bias_mean = _to_batch_param(bias_mean.transpose([0, 2, 1]), images)
+            bias = bias + mean @ bias_mean
+        outputs = flat @ matrix + bias
+        if F._is_tensor_image(images):
+            outputs = outputs.clip(0, 255)
+        else:
+            np.clip(outputs, 0, 255, out=outputs)
+        return _cast_back(outputs.reshape(images.shape), images.dtype)
+
+
+class BatchToTensor(BaseTransform):
+    """Convert a batch of images with shape (N x H x W x C) to ``paddle.Tensor``.
+    See ``ToTensor`` for more details.
+
+    Args:
+        data_format (str, optional): Data format of output tensor, should be 'HWC' or
+            'CHW'. Default: 'CHW'.
+        keys (list[str]|tuple[str], optional): Same as ``BaseTransform``. Default: None.
+
+    Shape:
+        - img(np.ndarray|Paddle.Tensor): The input batch with shape (N x H x W x C).
+        - output(Paddle.Tensor): A tensor with shape (N x C x H x W) or (N x H x W x C) according option data_format.
+
+    Returns:
+        A callable object of BatchToTensor.
+
+    Examples:
+
+        .. code-block:: python
+
+            import numpy as np
+            from paddle.vision.transforms import BatchToTensor
+
+            transform = BatchToTensor()
+
+            fake_images = (np.random.rand(8, 224, 224, 3) * 255.).astype('uint8')
+
+            tensor = transform(fake_images)
+            print(tensor.shape)
+            # [8, 3, 224, 224]
+    """
+
+    def __init__(self, data_format='CHW', keys=None):
+        super().__init__(keys)
+        if data_format not in ['CHW', 'HWC']:
+            raise ValueError(
+                f'data_format should be CHW or HWC. Got {data_format}'
+            )
+        self.data_format = data_format
+        # mean and std of the fused BatchNormalize
+        self.mean = None
+        self.std = None
+        self.to_rgb = False
+
+    def _fuse_normalize(self, normalize):
+        if normalize.data_format != self.data_format or self.mean is not None:
+            return None
+        fused = BatchToTensor(self.data_format, self.keys)
+        fused.mean = np.asarray(normalize.mean, dtype=np.float32)
+        fused.std = np.asarray(normalize.std, dtype=np.float32)
+        fused.to_rgb = normalize.to_rgb
+        return fused
+
+    def _apply_image(self, images):
+        _check_batch(images)
+        scale = 1.0 / 255.0 if _is_uint8(images) else 1.0
+        if self.to_rgb:
+            if F._is_tensor_image(images):
+                images = paddle.flip(images, axis=[3])
+            else:
+                images = images[..., ::-1]
+        if self.data_format == 'CHW':
+            images = images.transpose([0, 3, 1, 2])
+            shape = [-1, 1, 1]
+        else:
+            shape = [-1]
+
+        if F._is_tensor_image(images):
+            outputs = images.astype('float32')
+            if self.mean is None:
+                return outputs * scale if scale != 1.0 else outputs
+            scale = _to_batch_param((scale / self.std).reshape(shape), outputs)
+            offset = _to_batch_param(
+                (-self.mean / self.std).reshape(shape), outputs
+            )
+            return outputs * scale + offset
+
+        if self.mean is None:
+            outputs = np.multiply(images, scale, dtype=np.float32, order='C')
+        else:
+            outputs = np.multiply(
+                images,
+                (scale / self.std).reshape(shape),
+                dtype=np.float32,
+                order='C',
+            )
+            outputs += (-self.mean / self.std).reshape(shape)
+        return paddle.to_tensor(outputs)
+
+
+class BatchNormalize(BaseTransform):
+    """Normalize each image in the batch with mean and standard deviation.
+    See ``Normalize`` for more details.
+
+    If it follows ``BatchToTensor`` with the same data_format in ``BatchCompose``,
+    they are fused into a single pass.
+
+    Args:
+        mean (int|float|list|tuple, optional): Sequence of means for each channel.
+        std (int|float|list|tuple, optional): Sequence of standard deviations for each channel.
+        data_format (str, optional): Data format of images in the batch, should be 'HWC' or
+            'CHW'. Default: 'CHW'.
+        to_rgb (bool, optional): Whether to convert to rgb. Default: False.
+        keys (list[str]|tuple[str], optional): Same as ``BaseTransform``. Default: None.
+
+    Shape:
+        - img(np.ndarray|Paddle.Tensor): The input batch with shape (N x C x H x W) or (N x H x W x C).
+        - output(np.ndarray|Paddle.Tensor): A normalized batch.
+
+    Returns:
+        A callable object of BatchNormalize.
+
+    Examples:
+
+        .. code-block:: python
+
+            import paddle
+            from paddle.vision.transforms import BatchNormalize
+
+            normalize = BatchNormalize(mean=[0.5, 0.5, 0.5],
+                                       std=[0.5, 0.5, 0.5])
+
+            fake_images = paddle.rand([8, 3, 224, 224])
+
+            fake_images = normalize(fake_images)
+            print(fake_images.shape)
+            # [8, 3, 224, 224]
+    """
+
+    def __init__(
+        self, mean=0.0, std=1.0, data_format='CHW', to_rgb=False, keys=None
+    ):
+        super().__init__(keys)
+        if isinstance(mean, numbers.Number):
+            mean = [mean, mean, mean]
+
+        if isinstance(std, numbers.Number):
+            std = [std, std, std]
+
+        self.mean = mean
+        self.std = std
+        self.data_format = data_format
+        self.to_rgb = to_rgb
+
+    def _apply_image(self, images):
+        _check_batch(images)
+        if self.data_format == 'CHW':
+            axis = 1
+            shape = [-1, 1, 1]
+        else:
+            axis = 3
+            shape = [-1]
+        if self.to_rgb:
+            if F._is_tensor_image(images):
+                images = paddle.flip(images, axis=[axis])
+            else:
+                images = np.flip(images, axis=axis)
+        mean = np.asarray(self.mean, dtype=np.float32).reshape(shape)
+        std = np.asarray(self.std, dtype=np.float32).reshape(shape)
+        if F._is_tensor_image(images):
+            mean = _to_batch_param(mean, images)
+            std = _to_batch_param(std, images)
+            return (images.astype('float32') - mean) / std
+        return (images.astype(np.float32) - mean) / std
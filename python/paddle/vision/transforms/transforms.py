@@ -78,7 +78,8 @@ def _check_input(
 class Compose:
     """
     Composes several transforms together use for composing list of transforms
-    together for a dataset transform.
+    together for a dataset transform. Adjacent ``ToTensor``, ``Normalize`` and
+    ``Transpose`` are fused into a single pass over the image.
 
     Args:
         transforms (list|tuple): List/Tuple of transforms to compose.
@@ -104,7 +105,7 @@ class Compose:
     """
 
     def __init__(self, transforms):
-        self.transforms = transforms
+        self.transforms = _fuse_transforms(transforms)
 
     def __call__(self, data):
         for f in self.transforms:
@@ -890,6 +891,201 @@ class Transpose(BaseTransform):
         return img.transpose(self.order)
 
 
+def _fold_layout(t, perm, is_tensor):
+    """
+    Returns the axes of the HWC input and whether the output is a tensor
+    after applying ``t``, or None if ``t`` can not be fused.
+    """
+    if type(t) not in (ToTensor, Normalize, Transpose) or tuple(t.keys) != (
+        'image',
+    ):
+        return None
+
+    if isinstance(t, Transpose):
+        if sorted(t.order) != [0, 1, 2]:
+            return None
+        return tuple(perm[i] for i in t.order), is_tensor
+
+    if t.data_format not in ('CHW', 'HWC'):
+        return None
+
+    if isinstance(t, ToTensor):
+        if t.data_format == 'CHW' and not is_tensor:
+            perm = tuple(perm[i] for i in (2, 0, 1))
+        elif t.data_format == 'HWC' and is_tensor:
+            perm = tuple(perm[i] for i in (1, 2, 0))
+        return perm, True
+
+    # mean and std must be broadcast along the channel axis
+    if perm[0 if t.data_format == 'CHW' else 2] != 2:
+        return None
+    # to_rgb reverses the last axis of numpy images
+    if t.to_rgb and not is_tensor and perm[2] != 2:
+        return None
+    return perm, is_tensor
+
+
+def _fuse_transforms(transforms):
+    fused_transforms = []
+    chain = []
+    perm, is_tensor = (0, 1, 2), False
+
+    def flush():
+        if len(chain) > 1:
+            fused_transforms.append(_FusedImageTransform(list(chain)))
+        else:
+            fused_transforms.extend(chain)
+        chain.clear()
+
+    for t in transforms:
+        layout = _fold_layout(t, perm, is_tensor)
+        if layout is None and chain:
+            flush()
+            perm, is_tensor = (0, 1, 2), False
+            layout = _fold_layout(t, perm, is_tensor)
+        if layout is None:
+            fused_transforms.append(t)
+        else:
+            chain.append(t)
+            perm, is_tensor = layout
+    flush()
+
+    if isinstance(transforms, tuple):
+        return tuple(fused_transforms)
+    return fused_transforms
+
+
+class _FusedImageTransform:
+    """
+    A chain of ``ToTensor``, ``Normalize`` and ``Transpose`` folded by
+    ``Compose``.
+
+    The chain is a per-channel affine map followed by a permutation of the
+    axes, so the output of a numpy or PIL image is computed in a single
+    multiply into the output array and an inplace add, instead of making a
+    float copy of the image in each transform. Other inputs are passed to
+    the original transforms.
+    """
+
+    def __init__(self, transforms):
+        self.transforms = transforms
+        self.perm = (0, 1, 2)
+        self.is_tensor = False
+        for t in transforms:
+            self.perm, self.is_tensor = _fold_layout(
+                t, self.perm, self.is_tensor
+            )
+        # (channels, dtype) -> (scale, offset, flip, dtype)
+        self._plans = {}
+
+    def _get_plan(self, channels, dtype):
+        key = (channels, dtype)
+        if key in self._plans:
+            return self._plans[key]
+
+        scale = np.ones(channels)
+        offset = np.zeros(channels)
+        flip = False
+        is_tensor = False
+        plan = None
+        for t in self.transforms:
+            if isinstance(t, ToTensor):
+                # only the first ToTensor converts the image
+                if not is_tensor and dtype == np.uint8:
+                    scale, offset = scale / 255.0, offset / 255.0
+                    dtype = np.dtype(np.float32)
+                is_tensor = True
+            elif isinstance(t, Normalize):
+                mean = np.asarray(t.mean, dtype=np.float64).ravel()
+                std = np.asarray(t.std, dtype=np.float64).ravel()
+                if mean.size not in (1, channels) or std.size not in (
+                    1,
+                    channels,
+                ):
+                    break
+                if is_tensor:
+                    # mean and std are float32 tensors
+                    if dtype != np.float32:
+                        break
+                else:
+                    if t.to_rgb:
+                        scale, offset = scale[::-1], offset[::-1]
+                        flip = not flip
+                    dtype = np.result_type(dtype, np.float32)
+                scale, offset = scale / std, (offset - mean) / std
+        else:
+            plan = (scale, offset, flip, dtype)
+
+        if plan is not None:
+            shape = [1, 1, 1]
+            shape[self.perm.index(2)] = channels
+            plan = (
+                scale.astype(dtype).reshape(shape),
+                offset.astype(dtype).reshape(shape),
+                flip,
+                dtype,
+            )
+        self._plans[key] = plan
+        return plan
+
+    def _apply_image(self, img):
+        if F._is_pil_image(img):
+            img = np.asarray(img)
+            if img.dtype != np.uint8:
+                return None
+        elif not isinstance(img, np.ndarray):
+            return None
+
+        if img.ndim == 2 and not isinstance(self.transforms[0], Normalize):
+            img = img[:, :, np.newaxis]
+        if img.ndim != 3:
+            return None
+
+        plan = self._get_plan(img.shape[2], img.dtype)
+        if plan is None:
+            return None
+        scale, offset, flip, dtype = plan
+
+        if flip:
+            img = img[..., ::-1]
+        img = img.transpose(self.perm)
+        out = np.empty(img.shape, dtype=dtype)
+        if np.issubdtype(dtype, np.floating):
+            np.multiply(img, scale, out=out, casting='unsafe')
+            if offset.any():
+                out += offset
+        else:
+            # no scaling without normalization or uint8 ToTensor
+            np.copyto(out, img)
+
+        if self.is_tensor:
+            return paddle.to_tensor(out)
+        return out
+
+    def _apply_transforms(self, inputs):
+        for t in self.transforms:
+            inputs = t(inputs)
+        return inputs
+
+    def __call__(self, inputs):
+        if isinstance(inputs, tuple):
+            if len(inputs) == 0:
+                return self._apply_transforms(inputs)
+            img, others = inputs[0], inputs[1:]
+        else:
+            img, others = inputs, ()
+
+        output = self._apply_image(img)
+        if output is None:
+            return self._apply_transforms(inputs)
+        if others:
+            return (output,) + others
+        return output
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__.__name__, self.transforms)
+
+
 class BrightnessTransform(BaseTransform):
     """Adjust brightness of the image.
 
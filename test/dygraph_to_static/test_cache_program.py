@@ -168,5 +168,69 @@ class TestToOutputWithCache(unittest.TestCase):
             self.assertEqual(ret.numpy(), 5050)
 
 
+def scale_and_sum(x):
+    return x * 2, paddle.sum(x)
+
+
+class TestBoundedProgramCache(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def test_lru_eviction(self):
+        static_func = to_static(scale_and_sum, max_program_cache_size=2)
+        for batch_size in [1, 2, 1, 3, 2]:
+            out, _ = static_func(paddle.ones([batch_size, 4]))
+            self.assertEqual(out.shape, [batch_size, 4])
+
+        stats = static_func.program_cache.statistics()
+        self.assertEqual(stats['size'], 2)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 4)
+        # [2, 4] is evicted by [3, 4] and traced again
+        self.assertEqual(stats['retraces'], 1)
+        self.assertEqual(stats['evictions'], 2)
+        self.assertAlmostEqual(stats['hit_rate'], 0.2)
+
+    def test_evicted_keys_bound(self):
+        static_func = to_static(scale_and_sum, max_program_cache_size=2)
+        for batch_size in range(1, 7):
+            static_func(paddle.ones([batch_size, 4]))
+        program_cache = static_func.program_cache
+        self.assertEqual(program_cache.statistics()['evictions'], 4)
+        # only the recently evicted keys are kept to count retraces
+        self.assertEqual(len(program_cache._evicted_keys), 2)
+        static_func(paddle.ones([4, 4]))
+        self.assertEqual(program_cache.statistics()['retraces'], 1)
+
+    def test_memory_bound(self):
+        static_func = to_static(scale_and_sum, max_program_cache_memory=1)
+        for batch_size in [1, 2, 3]:
+            static_func(paddle.ones([batch_size, 4]))
+        stats = static_func.program_cache.statistics()
+        # the most recently used program is always kept
+        self.assertEqual(stats['size'], 1)
+        self.assertEqual(stats['evictions'], 2)
+        self.assertGreater(stats['memory'], 0)
+
+    def test_shape_buckets(self):
+        static_func = to_static(scale_and_sum, shape_buckets={0: [4, 8]})
+        for batch_size in [3, 1, 4, 6]:
+            x = paddle.rand([batch_size, 4])
+            out, total = static_func(x)
+            expected_size = 4 if batch_size <= 4 else 8
+            self.assertEqual(out.shape, [expected_size, 4])
+            np.testing.assert_allclose(
+                out.numpy()[:batch_size], x.numpy() * 2, rtol=1e-6
+            )
+            np.testing.assert_allclose(out.numpy()[batch_size:], 0.0, rtol=1e-6)
+            np.testing.assert_allclose(
+                total.numpy(), x.numpy().sum(), rtol=1e-5
+            )
+        # sizes beyond the largest bucket are not padded
+        out, _ = static_func(paddle.rand([9, 4]))
+        self.assertEqual(out.shape, [9, 4])
+        self.assertEqual(static_func.get_traced_count(), 3)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,181 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.jit.dy2static.persistent_cache import _PERSISTENT_CACHE
+from paddle.jit.dy2static.program_translator import ConcreteProgram
+from paddle.jit.dy2static.utils import func_to_source_code
+
+
+class SimpleNet(paddle.nn.Layer):
+    def __init__(self):
+        super().__init__()
+        self.linear = paddle.nn.Linear(10, 3)
+
+    def forward(self, x, use_relu=True):
+        out = self.linear(x)
+        if use_relu:
+            out = paddle.nn.functional.relu(out)
+        return out, paddle.mean(out)
+
+
+class ActNet(paddle.nn.Layer):
+    def __init__(self, act, p=0.0):
+        super().__init__()
+        self.act = act
+        self.linear = paddle.nn.Linear(10, 3)
+        self.dropout = paddle.nn.Dropout(p=p)
+
+    def forward(self, x):
+        out = self.dropout(self.linear(x))
+        if self.act == 'relu':
+            return paddle.nn.functional.relu(out)
+        return paddle.tanh(out)
+
+
+class TestPersistentCache(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        paddle.jit.set_cache_dir(self.temp_dir.name)
+        self.x = paddle.rand([4, 10])
+
+    def tearDown(self):
+        paddle.jit.set_cache_dir(None)
+        self.temp_dir.cleanup()
+
+    def test_warm_start(self):
+        net = paddle.jit.to_static(SimpleNet())
+        out, loss = net(self.x)
+        self.assertEqual(
+            sorted(os.listdir(self.temp_dir.name)), ['ast', 'program']
+        )
+
+        forward = SimpleNet.forward
+        self.assertIsNotNone(
+            _PERSISTENT_CACHE.load_ast(forward, func_to_source_code(forward))
+        )
+
+        # drop the in-memory programs to simulate a new process
+        net.forward.program_cache.clear()
+        cache_key = net.forward.program_cache._recent_cache_key
+        cached = ConcreteProgram.from_persistent_cache(cache_key)
+        self.assertIsNotNone(cached)
+        self.assertEqual(
+            sorted(p.name for p in cached.parameters),
+            sorted(p.name for p in net.parameters()),
+        )
+
+        warm_out, warm_loss = net(self.x)
+        np.testing.assert_allclose(warm_out.numpy(), out.numpy(), rtol=1e-6)
+        np.testing.assert_allclose(warm_loss.numpy(), loss.numpy(), rtol=1e-6)
+
+        # gradients flow into the parameters of the live Layer
+        warm_loss.backward()
+        self.assertIsNotNone(net.linear.weight.grad)
+
+    def test_cache_miss(self):
+        net = paddle.jit.to_static(SimpleNet())
+        net(self.x)
+        cache_key = net.forward.program_cache._recent_cache_key
+        program_dir = os.path.join(self.temp_dir.name, 'program')
+
+        # programs of different inputs and Layers are cached separately
+        net(self.x, use_relu=False)
+        self.assertEqual(len(os.listdir(program_dir)), 2)
+        other = paddle.jit.to_static(SimpleNet())
+        other(self.x)
+        self.assertEqual(len(os.listdir(program_dir)), 3)
+
+        paddle.jit.set_cache_dir('')
+        self.assertIsNone(ConcreteProgram.from_persistent_cache(cache_key))
+        paddle.jit.set_cache_dir(self.temp_dir.name)
+        self.assertIsNotNone(ConcreteProgram.from_persistent_cache(cache_key))
+
+    def test_broken_cache_file(self):
+        net = paddle.jit.to_static(SimpleNet())
+        out, _ = net(self.x)
+        program_dir = os.path.join(self.temp_dir.name, 'program')
+        (file_name,) = os.listdir(program_dir)
+        path = os.path.join(program_dir, file_name)
+
+        def corrupt_program(data):
+            data['main_program'] = b'broken'
+            return pickle.dumps(data)
+
+        def drop_sources(data):
+            del data['sources']
+            return pickle.dumps(data)
+
+        def truncate(data):
+            return pickle.dumps(data)[:16]
+
+        with open(path, 'rb') as f:
+            data = pickle.load(f)
+        for corrupt in [corrupt_program, drop_sources, truncate]:
+            with open(path, 'wb') as f:
+                f.write(corrupt(dict(data)))
+            # the broken file is ignored and the program is traced again
+            net.forward.program_cache.clear()
+            cache_key = net.forward.program_cache._recent_cache_key
+            self.assertIsNone(ConcreteProgram.from_persistent_cache(cache_key))
+            retraced_out, _ = net(self.x)
+            np.testing.assert_allclose(
+                retraced_out.numpy(), out.numpy(), rtol=1e-6
+            )
+            self.assertIsNotNone(
+                ConcreteProgram.from_persistent_cache(cache_key)
+            )
+
+    def test_python_attributes(self):
+        # same parameter names, only differ in Python attributes
+        def build(*args):
+            with paddle.utils.unique_name.guard():
+                net = ActNet(*args)
+            net.set_state_dict(base.state_dict())
+            return paddle.jit.to_static(net)
+
+        base = ActNet('relu')
+        relu_net = build('relu')
+        tanh_net = build('tanh')
+        relu_out = relu_net(self.x)
+        tanh_out = tanh_net(self.x)
+        np.testing.assert_allclose(
+            tanh_out.numpy(),
+            paddle.tanh(base.linear(self.x)).numpy(),
+            rtol=1e-6,
+        )
+        self.assertFalse(np.allclose(relu_out.numpy(), tanh_out.numpy()))
+
+        program_dir = os.path.join(self.temp_dir.name, 'program')
+        self.assertEqual(len(os.listdir(program_dir)), 2)
+
+        # attributes of sublayers are part of the key
+        cache_key = relu_net.forward.program_cache._recent_cache_key
+        key = _PERSISTENT_CACHE._program_key(cache_key)
+        relu_net.dropout.p = 0.5
+        self.assertNotEqual(_PERSISTENT_CACHE._program_key(cache_key), key)
+        relu_net.dropout.p = 0.0
+        self.assertEqual(_PERSISTENT_CACHE._program_key(cache_key), key)
+
+
+if __name__ == '__main__':
+    unittest.main()
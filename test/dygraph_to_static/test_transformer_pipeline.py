@@ -0,0 +1,193 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import concurrent.futures
+import os
+import re
+import unittest
+from functools import wraps
+
+import numpy as np
+
+import paddle
+from paddle.jit.dy2static import ast_transformer
+from paddle.jit.dy2static.origin_info import attach_origin_info
+from paddle.jit.dy2static.program_translator import FunctionCache
+from paddle.jit.dy2static.utils import (
+    ast_to_source_code,
+    func_to_source_code,
+    unwrap,
+)
+from paddle.utils import gast, unique_name
+
+
+def deco(func):
+    @wraps(func)
+    def inner(*args, **kwargs):
+        return func(*args, **kwargs) + 1
+
+    return inner
+
+
+def helper(x: paddle.Tensor) -> paddle.Tensor:
+    return paddle.nn.functional.relu(x) * float(2)
+
+
+def another_helper(x):
+    return helper(x) + int(x.shape[0])
+
+
+@deco
+def dyfunc(x: paddle.Tensor, y=None) -> paddle.Tensor:
+    z = helper(x) + another_helper(int(3) * x)
+    assert x is not None and y is None
+    return bool(z is not None) and z
+
+
+def branchy(x):
+    if x.mean() > 0:
+        x = x + 1
+    else:
+        x = x - 1
+    for i in range(3):
+        x = x + i
+    return x
+
+
+class SimpleNet(paddle.nn.Layer):
+    def __init__(self):
+        super().__init__()
+        self.linear = paddle.nn.Linear(4, 4)
+
+    def forward(self, x):
+        return another_helper(self.linear(x))
+
+
+def transform(func):
+    func = unwrap(func)
+    root = gast.parse(func_to_source_code(func))
+    root = attach_origin_info(root, func)
+    with unique_name.guard():
+        dygraph_to_static = ast_transformer.DygraphToStaticAst()
+        root = dygraph_to_static.get_static_ast(root).node
+    return ast_to_source_code(root), dygraph_to_static
+
+
+class TestFusedTransformers(unittest.TestCase):
+    def test_same_as_unfused(self):
+        for func in [dyfunc, helper, another_helper, SimpleNet.forward]:
+            fused_code, dygraph_to_static = transform(func)
+            self.assertIn('CallTransformer', dygraph_to_static.transformer_time)
+            self.assertIn(
+                'TypeHintTransformer', dygraph_to_static.transformer_time
+            )
+
+            fusible_transformers = ast_transformer.FUSIBLE_TRANSFORMERS
+            ast_transformer.FUSIBLE_TRANSFORMERS = ()
+            try:
+                unfused_code, _ = transform(func)
+            finally:
+                ast_transformer.FUSIBLE_TRANSFORMERS = fusible_transformers
+            self.assertEqual(fused_code, unfused_code)
+
+    def test_group_transformers(self):
+        dygraph_to_static = ast_transformer.DygraphToStaticAst()
+        transformers = [
+            ast_transformer.LoopTransformer,
+            ast_transformer.CallTransformer,
+            ast_transformer.CastTransformer,
+            ast_transformer.DecoratorTransformer,
+            ast_transformer.TypeHintTransformer,
+        ]
+        groups = dygraph_to_static._group_transformers(transformers)
+        self.assertEqual(groups, [(transformers[:1], 1), (transformers[1:], 5)])
+
+        # the code after each transformer can still be logged
+        paddle.jit.set_code_level(3)
+        try:
+            groups = dygraph_to_static._group_transformers(transformers)
+        finally:
+            paddle.jit.set_code_level(None)
+        self.assertEqual(
+            groups,
+            [
+                (transformers[:1], 1),
+                (transformers[1:3], 3),
+                (transformers[3:], 5),
+            ],
+        )
+
+
+class TestPrefetchCallees(unittest.TestCase):
+    def setUp(self):
+        os.environ['TRANSLATOR_CONVERT_WORKERS'] = '2'
+
+    def tearDown(self):
+        del os.environ['TRANSLATOR_CONVERT_WORKERS']
+
+    def test_prefetch(self):
+        function_cache = FunctionCache()
+        function_cache.convert_with_cache(SimpleNet.forward)
+        function_cache.prefetch_callees(SimpleNet.forward, SimpleNet())
+
+        futures = function_cache._prefetch_futures
+        source_code = func_to_source_code(another_helper)
+        self.assertIn(source_code, futures)
+        # callees of the prefetched functions are prefetched recursively
+        futures[source_code].result()
+        self.assertIn(func_to_source_code(helper), futures)
+        # functions of paddle are not converted
+        self.assertNotIn(func_to_source_code(paddle.nn.Linear.forward), futures)
+
+        function_cache.convert_with_cache(another_helper)
+        self.assertNotIn(source_code, function_cache._prefetch_futures)
+        self.assertIn(source_code, function_cache._code_to_ast_caches)
+
+    def test_unique_names(self):
+        function_cache = FunctionCache()
+        source_code = func_to_source_code(branchy)
+
+        def convert(_):
+            root = function_cache._transform(branchy, source_code)
+            code = ast_to_source_code(root)
+            return re.findall(r'def (\w+)\(', code)
+
+        with unique_name.guard():
+            with concurrent.futures.ThreadPoolExecutor(4) as executor:
+                results = list(executor.map(convert, range(16)))
+            # the namespace of the caller is not used by worker threads
+            self.assertEqual(unique_name.generate('true_fn'), 'true_fn_0')
+
+        names = collections.Counter(
+            name for result in results for name in result if name != 'branchy'
+        )
+        self.assertTrue(any(name.startswith('true_fn') for name in names))
+        self.assertEqual(
+            [name for name, count in names.items() if count > 1], []
+        )
+
+    def test_to_static(self):
+        paddle.disable_static()
+        net = SimpleNet()
+        x = paddle.rand([2, 4])
+        static_net = paddle.jit.to_static(SimpleNet())
+        static_net.set_state_dict(net.state_dict())
+        np.testing.assert_allclose(
+            static_net(x).numpy(), net(x).numpy(), rtol=1e-6
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+#   Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.vision import transforms
+
+
+class TestBatchTransforms(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(2023)
+        self.images = (np.random.rand(4, 40, 50, 3) * 255).astype('uint8')
+
+    def get_images(self):
+        return self.images
+
+    def to_numpy(self, images):
+        if isinstance(images, paddle.Tensor):
+            return images.numpy()
+        return images
+
+    def test_random_resized_crop(self):
+        images = self.get_images()
+        transform = transforms.BatchRandomResizedCrop(
+            (40, 50), scale=(1.0, 1.0), ratio=(1.25, 1.25)
+        )
+        np.testing.assert_array_equal(
+            self.to_numpy(transform(images)), self.images
+        )
+
+        transform = transforms.BatchRandomResizedCrop((20, 30))
+        outputs = self.to_numpy(transform(images))
+        self.assertEqual(outputs.shape, (4, 20, 30, 3))
+        self.assertEqual(outputs.dtype, np.uint8)
+        i, j, h, w = transform.params
+        self.assertTrue(np.all((i >= 0) & (i + h <= 40)))
+        self.assertTrue(np.all((j >= 0) & (j + w <= 50)))
+
+        transform = transforms.BatchRandomResizedCrop(
+            16, interpolation='nearest'
+        )
+        self.assertEqual(self.to_numpy(transform(images)).shape, (4, 16, 16, 3))
+
+    def test_flip(self):
+        images = self.get_images()
+        outputs = transforms.BatchRandomHorizontalFlip(1.0)(images)
+        np.testing.assert_array_equal(
+            self.to_numpy(outputs), self.images[:, :, ::-1]
+        )
+
+        transform = transforms.BatchRandomVerticalFlip(0.5)
+        outputs = self.to_numpy(transform(images))
+        for n, flip in enumerate(transform.params):
+            expected = self.images[n, ::-1] if flip else self.images[n]
+            np.testing.assert_array_equal(outputs[n], expected)
+
+    def test_color_jitter(self):
+        images = self.get_images()
+        outputs = transforms.BatchColorJitter()(images)
+        np.testing.assert_array_equal(self.to_numpy(outputs), self.images)
+
+        transform = transforms.BatchColorJitter(brightness=0.5)
+        outputs = self.to_numpy(transform(images)).astype('float32')
+        factors = transform.params[0][:, 0, 0]
+        expected = np.clip(
+            np.rint(self.images * factors[:, None, None, None]), 0, 255
+        )
+        self.assertLessEqual(np.abs(outputs - expected).max(), 1)
+
+        transform = transforms.BatchColorJitter(saturation=(0.0, 0.0))
+        outputs = self.to_numpy(transform(images)).astype('float32')
+        # all channels are grayscale when saturation is 0
+        self.assertLessEqual(np.abs(outputs[..., 0] - outputs[..., 1]).max(), 1)
+
+        transform = transforms.BatchColorJitter(0.4, 0.4, 0.4, 0.1)
+        outputs = self.to_numpy(transform(images))
+        self.assertEqual(outputs.shape, self.images.shape)
+        self.assertEqual(outputs.dtype, np.uint8)
+
+    def test_to_tensor_normalize(self):
+        images = self.get_images()
+        mean = [0.485, 0.456, 0.406]
+        std = [0.229, 0.224, 0.225]
+        transform = transforms.BatchCompose(
+            [
+                transforms.BatchToTensor(),
+                transforms.BatchNormalize(mean, std, to_rgb=True),
+            ]
+        )
+        # BatchToTensor and BatchNormalize are fused
+        self.assertEqual(len(transform.transforms), 1)
+        outputs = transform(images)
+        self.assertTrue(isinstance(outputs, paddle.Tensor))
+        self.assertEqual(outputs.shape, [4, 3, 40, 50])
+
+        expected = transforms.BatchNormalize(mean, std, to_rgb=True)(
+            transforms.BatchToTensor()(images)
+        )
+        np.testing.assert_allclose(
+            outputs.numpy(), expected.numpy(), rtol=1e-5, atol=1e-5
+        )
+
+        transform = transforms.BatchCompose(
+            [
+                transforms.BatchToTensor('HWC'),
+                transforms.BatchNormalize(0.5, 0.5, data_format='HWC'),
+            ]
+        )
+        np.testing.assert_allclose(
+            transform(images).numpy(),
+            (self.images / 255.0 - 0.5) / 0.5,
+            rtol=1e-5,
+            atol=1e-5,
+        )
+
+    def test_compose(self):
+        images = self.get_images()
+        labels = np.arange(4)
+        transform = transforms.BatchCompose(
+            [
+                transforms.BatchRandomResizedCrop(32, keys=('image',)),
+                transforms.BatchRandomHorizontalFlip(keys=('image',)),
+                transforms.BatchColorJitter(0.4, 0.4, 0.4, keys=('image',)),
+                transforms.BatchToTensor(keys=('image',)),
+                transforms.BatchNormalize(
+                    [127.5, 127.5, 127.5], [127.5, 127.5, 127.5]
+                ),
+            ]
+        )
+        outputs, outputs_labels = transform((images, labels))
+        self.assertEqual(outputs.shape, [4, 3, 32, 32])
+        np.testing.assert_array_equal(outputs_labels, labels)
+
+    def test_exception(self):
+        with self.assertRaises(TypeError):
+            transforms.BatchRandomHorizontalFlip()(self.images[0])
+        with self.assertRaises(AssertionError):
+            transforms.BatchRandomResizedCrop(32, interpolation='bicubic')
+        with self.assertRaises(ValueError):
+            transforms.BatchToTensor('NCHW')
+
+
+class TestBatchTransformsTensor(TestBatchTransforms):
+    def get_images(self):
+        return paddle.to_tensor(self.images)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import random
 import shutil
 import tempfile
@@ -20,8 +21,9 @@ import unittest
 
 import numpy as np
 
+import paddle
 from paddle import Model
-from paddle.hapi.callbacks import config_callbacks
+from paddle.hapi.callbacks import ModelCheckpoint, config_callbacks
 from paddle.static import InputSpec
 from paddle.vision.datasets import MNIST
 from paddle.vision.models import LeNet
@@ -130,5 +132,82 @@ class TestCallbacks(unittest.TestCase):
         self.run_callback()
 
 
+class TestModelCheckpoint(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.save_dir = tempfile.mkdtemp()
+        self.async_save = False
+
+    def tearDown(self):
+        shutil.rmtree(self.save_dir)
+
+    def run_checkpoint(self, epochs, keep_last=None):
+        net = paddle.nn.Linear(4, 2)
+        model = Model(net)
+        optim = paddle.optimizer.Adam(0.01, parameters=net.parameters())
+        model.prepare(optimizer=optim, loss=paddle.nn.MSELoss())
+
+        cbk = ModelCheckpoint(
+            save_dir=self.save_dir,
+            async_save=self.async_save,
+            max_in_flight=2,
+            keep_last=keep_last,
+        )
+        cbk.set_model(model)
+        cbk.on_train_begin()
+        weights = []
+        for epoch in range(epochs):
+            cbk.on_epoch_begin(epoch)
+            x = np.random.random([8, 4]).astype('float32')
+            y = np.random.random([8, 2]).astype('float32')
+            model.train_batch([x], [y])
+            weights.append(net.weight.numpy())
+            cbk.on_epoch_end(epoch)
+            # in-place update after saving does not change the checkpoint
+            model.train_batch([x], [y])
+        cbk.on_train_end()
+        return weights
+
+    def check_checkpoint(self, path, weight):
+        state_dict = paddle.load(path + '.pdparams')
+        np.testing.assert_array_equal(state_dict['weight'].numpy(), weight)
+        self.assertTrue(os.path.exists(path + '.pdopt'))
+
+    def test_save(self):
+        weights = self.run_checkpoint(3)
+        for epoch in range(3):
+            self.check_checkpoint(
+                os.path.join(self.save_dir, str(epoch)), weights[epoch]
+            )
+        self.assertTrue(
+            os.path.exists(os.path.join(self.save_dir, 'final.pdparams'))
+        )
+        self.assertFalse(
+            any(name.endswith('.tmp') for name in os.listdir(self.save_dir))
+        )
+
+    def test_keep_last(self):
+        weights = self.run_checkpoint(4, keep_last=2)
+        files = sorted(os.listdir(self.save_dir))
+        self.assertEqual(
+            files,
+            [
+                '2.pdopt',
+                '2.pdparams',
+                '3.pdopt',
+                '3.pdparams',
+                'final.pdopt',
+                'final.pdparams',
+            ],
+        )
+        self.check_checkpoint(os.path.join(self.save_dir, '3'), weights[3])
+
+
+class TestModelCheckpointAsync(TestModelCheckpoint):
+    def setUp(self):
+        super().setUp()
+        self.async_save = True
+
+
 if __name__ == '__main__':
     unittest.main()
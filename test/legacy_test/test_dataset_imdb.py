@@ -12,10 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import os
+import tarfile
+import tempfile
 import unittest
 
 import numpy as np
 
+from paddle.dataset.common import _cache_path
 from paddle.text.datasets import Imdb
 
 
@@ -47,5 +52,52 @@ class TestImdbTest(unittest.TestCase):
         self.assertTrue(int(label) in [0, 1])
 
 
+class TestImdbCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_file = os.path.join(self.temp_dir.name, 'imdb.tar.gz')
+        docs = {
+            'train/pos': [b'Good movie, good actors!', b'good good'],
+            'train/neg': [b'Bad movie.', b'bad actors\n'],
+            'test/pos': [b'good'],
+            'test/neg': [b'bad, bad bad'],
+        }
+        with tarfile.open(self.data_file, 'w:gz') as tf:
+            for name, texts in docs.items():
+                for i, text in enumerate(texts):
+                    info = tarfile.TarInfo(f'aclImdb/{name}/{i}_1.txt')
+                    info.size = len(text)
+                    tf.addfile(info, io.BytesIO(text))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_main(self):
+        imdb = Imdb(data_file=self.data_file, mode='train', cutoff=1)
+        # good: 5, bad: 5, movie: 2, actors: 2
+        self.assertEqual(
+            imdb.word_idx,
+            {b'bad': 0, b'good': 1, b'actors': 2, b'movie': 3, '<unk>': 4},
+        )
+        self.assertTrue(
+            os.path.exists(_cache_path('imdb', self.data_file, cutoff=1))
+        )
+
+        expected = [([1, 3, 1, 2], 0), ([1, 1], 0), ([0, 3], 1), ([0, 2], 1)]
+        # the second build is loaded from the cache
+        for _ in range(2):
+            imdb = Imdb(data_file=self.data_file, mode='train', cutoff=1)
+            self.assertEqual(len(imdb), 4)
+            for i, (doc, label) in enumerate(expected):
+                data, data_label = imdb[i]
+                self.assertEqual(data.dtype, np.int64)
+                np.testing.assert_array_equal(data, doc)
+                np.testing.assert_array_equal(data_label, [label])
+
+        imdb = Imdb(data_file=self.data_file, mode='test', cutoff=1)
+        self.assertEqual(len(imdb), 2)
+        np.testing.assert_array_equal(imdb[1][0], [0, 0, 0])
+
+
 if __name__ == '__main__':
     unittest.main()
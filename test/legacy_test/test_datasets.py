@@ -85,6 +85,62 @@ class TestFolderDatasets(unittest.TestCase):
         for _ in loader:
             pass
 
+    def test_cache(self):
+        cache_dir = os.path.join(self.empty_dir, 'cache')
+        for cache_size, cache_dir in [(1 << 20, None), (0, cache_dir)]:
+            loaded = []
+
+            def loader(path):
+                loaded.append(path)
+                return cv2.imread(path)
+
+            dataset_folder = DatasetFolder(
+                self.data_dir,
+                loader=loader,
+                cache_size=cache_size,
+                cache_dir=cache_dir,
+            )
+            image_folder = ImageFolder(
+                self.data_dir,
+                loader=loader,
+                cache_size=cache_size,
+                cache_dir=cache_dir,
+            )
+            for epoch in range(3):
+                for i in range(len(dataset_folder)):
+                    path, label = dataset_folder.samples[i]
+                    img, target = dataset_folder[i]
+                    self.assertEqual(target, label)
+                    np.testing.assert_array_equal(img, cv2.imread(path))
+                    # modifying sample does not change cached one
+                    img[...] = 0
+
+                    img = image_folder[i][0]
+                    np.testing.assert_array_equal(img, cv2.imread(path))
+
+            if cache_dir is None:
+                self.assertEqual(len(loaded), 8)
+            else:
+                # spilled samples are shared by datasets
+                self.assertEqual(len(loaded), 4)
+                self.assertEqual(len(os.listdir(cache_dir)), 4)
+
+    def test_cache_lru(self):
+        loaded = []
+
+        def loader(path):
+            loaded.append(path)
+            return cv2.imread(path)
+
+        # only 2 samples of 32 * 32 * 3 bytes can be cached
+        dataset_folder = DatasetFolder(
+            self.data_dir, loader=loader, cache_size=32 * 32 * 3 * 2
+        )
+        for i in [0, 1, 0, 2, 0, 1]:
+            dataset_folder[i]
+        paths = [dataset_folder.samples[i][0] for i in [0, 1, 2, 1]]
+        self.assertEqual(loaded, paths)
+
     def test_errors(self):
         with self.assertRaises(RuntimeError):
             ImageFolder(self.empty_dir)
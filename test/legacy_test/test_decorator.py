@@ -17,6 +17,8 @@ import sys
 import time
 import unittest
 
+import numpy as np
+
 import paddle.reader
 
 __all__ = []
@@ -153,6 +155,98 @@ class TestXmap(unittest.TestCase):
                             self.assertEqual(e, mapper(idx))
 
 
+class TestMultiProcessXmap(unittest.TestCase):
+    def mapper(self, x):
+        return {
+            'image': np.full([3, 8, 8], x, dtype='float32'),
+            'label': np.array([x]),
+            'index': np.array(x),
+            'info': (x, [np.arange(x)]),
+        }
+
+    def check_sample(self, sample, x):
+        np.testing.assert_array_equal(
+            sample['image'], np.full([3, 8, 8], x, dtype='float32')
+        )
+        np.testing.assert_array_equal(sample['label'], np.array([x]))
+        # 0-d array keeps its shape
+        self.assertEqual(sample['index'].shape, ())
+        self.assertEqual(int(sample['index']), x)
+        self.assertEqual(sample['info'][0], x)
+        np.testing.assert_array_equal(sample['info'][1][0], np.arange(x))
+
+    def test_xmap(self):
+        if sys.platform == 'win32':
+            return
+        for order in (True, False):
+            for use_shared_memory in (True, False):
+                for size in (1, 4):
+                    reader = paddle.reader.multiprocess_xmap_readers(
+                        self.mapper,
+                        reader_creator_10(0),
+                        2,
+                        size,
+                        order,
+                        use_shared_memory,
+                        shared_memory_size=4096,
+                    )
+                    for n in range(2):
+                        result = list(reader())
+                        labels = [int(r['label'][0]) for r in result]
+                        if not order:
+                            labels.sort()
+                        self.assertEqual(labels, list(range(10)))
+                        for r in result:
+                            self.check_sample(r, int(r['label'][0]))
+
+    def test_xmap_break(self):
+        if sys.platform == 'win32':
+            return
+        reader = paddle.reader.multiprocess_xmap_readers(
+            self.mapper, reader_creator_10(0), 2, 2
+        )
+        for i, sample in enumerate(reader()):
+            self.check_sample(sample, i)
+            if i == 3:
+                break
+
+    def test_xmap_exception(self):
+        if sys.platform == 'win32':
+            return
+
+        def mapper(x):
+            if x == 5:
+                raise ValueError("mapper failed")
+            return x
+
+        reader = paddle.reader.multiprocess_xmap_readers(
+            mapper, reader_creator_10(0), 2, 2
+        )
+        with self.assertRaises(RuntimeError):
+            list(reader())
+
+    def test_reader_exception(self):
+        if sys.platform == 'win32':
+            return
+
+        def failed_reader():
+            for i in range(10):
+                if i == 5:
+                    raise ValueError("reader failed")
+                yield i
+
+        for order in (True, False):
+            reader = paddle.reader.multiprocess_xmap_readers(
+                self.mapper, failed_reader, 2, 2, order
+            )
+            labels = []
+            with self.assertRaisesRegex(ValueError, "reader failed"):
+                for sample in reader():
+                    labels.append(int(sample['label'][0]))
+            # samples read before the error are yielded
+            self.assertEqual(sorted(labels), list(range(5)))
+
+
 class TestMultiProcessReader(unittest.TestCase):
     def setup(self):
         self.samples = []
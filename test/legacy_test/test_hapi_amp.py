@@ -34,7 +34,7 @@ from paddle.vision.models import LeNet
     not fluid.is_compiled_with_cuda(), 'CPU testing is not supported'
 )
 class TestHapiWithAmp(unittest.TestCase):
-    def get_model(self, amp_config):
+    def get_model(self, amp_config, to_static=False):
         net = LeNet()
         inputs = InputSpec([None, 1, 28, 28], "float32", 'x')
         labels = InputSpec([None, 1], "int64", "y")
@@ -46,6 +46,7 @@ class TestHapiWithAmp(unittest.TestCase):
             optimizer=optim,
             loss=CrossEntropyLoss(reduction="sum"),
             amp_configs=amp_config,
+            to_static=to_static,
         )
         return model
 
@@ -85,6 +86,31 @@ class TestHapiWithAmp(unittest.TestCase):
         }
         self.run_amp(amp_config)
 
+    def test_to_static(self):
+        paddle.disable_static()
+        paddle.set_device('gpu')
+        amp_level = {
+            "level": "O1",
+            "init_loss_scaling": 128,
+            "incr_every_n_steps": 1,
+        }
+        scaler_states = []
+        for to_static in [False, True]:
+            paddle.seed(2021)
+            model = self.get_model(amp_level, to_static)
+            self.run_model(model)
+            # the loss scaling is updated in the compiled train step
+            self.assertEqual(
+                model._adapter._static_train_step is not None, to_static
+            )
+            states = dict(model._adapter._checkpoint_states('lenet_amp'))
+            scaler_states.append(states['lenet_amp.pdscaler'])
+
+        expect, result = scaler_states
+        np.testing.assert_allclose(expect['scale'], result['scale'])
+        self.assertEqual(expect['incr_count'], result['incr_count'])
+        self.assertEqual(expect['decr_count'], result['decr_count'])
+
     def test_save_load(self):
         paddle.disable_static()
         paddle.set_device('gpu')
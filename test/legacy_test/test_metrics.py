@@ -356,6 +356,50 @@ class TestAuc(unittest.TestCase):
         m.reset()
         self.assertEqual(m.accumulate(), 0.0)
 
+    def test_auc_bulk(self):
+        np.random.seed(2023)
+        n = 65536
+        preds = np.random.random(size=(n, 1)).astype('float32')
+        preds = np.concatenate((1 - preds, preds), axis=1)
+        labels = np.random.randint(2, size=(n, 1))
+
+        m_numpy = paddle.metric.Auc()
+        m_numpy.update(preds, labels)
+        m_tensor = paddle.metric.Auc()
+        m_tensor.update(paddle.to_tensor(preds), paddle.to_tensor(labels))
+        np.testing.assert_array_equal(m_numpy._stat_pos, m_tensor._stat_pos)
+        np.testing.assert_array_equal(m_numpy._stat_neg, m_tensor._stat_neg)
+        self.assertAlmostEqual(m_numpy.accumulate(), m_tensor.accumulate())
+
+        # merge of metrics updated by parts equals to updating all
+        m_parts = [paddle.metric.Auc() for _ in range(4)]
+        for i, m in enumerate(m_parts):
+            m.update(preds[i::4], labels[i::4])
+            if i > 0:
+                m_parts[0].merge(m)
+        self.assertAlmostEqual(m_parts[0].accumulate(), m_numpy.accumulate())
+
+    def test_auc_single_class(self):
+        preds = np.array([[0.9, 0.1], [0.4, 0.6], [0.2, 0.8]], 'float32')
+        for label in [0, 1]:
+            labels = np.full((3, 1), label, 'int64')
+            m_numpy = paddle.metric.Auc()
+            m_numpy.update(preds, labels)
+            m_tensor = paddle.metric.Auc()
+            m_tensor.update(paddle.to_tensor(preds), paddle.to_tensor(labels))
+            np.testing.assert_array_equal(m_numpy._stat_pos, m_tensor._stat_pos)
+            np.testing.assert_array_equal(m_numpy._stat_neg, m_tensor._stat_neg)
+            self.assertEqual(m_tensor._stat_pos.sum(), 3 * label)
+            self.assertEqual(m_tensor._stat_neg.sum(), 3 * (1 - label))
+            self.assertEqual(m_tensor.accumulate(), 0.0)
+
+    def test_auc_merge_error(self):
+        m = paddle.metric.Auc()
+        with self.assertRaises(ValueError):
+            m.merge(paddle.metric.Auc(num_thresholds=200))
+        with self.assertRaises(TypeError):
+            m.merge(paddle.metric.Accuracy())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1113,6 +1113,154 @@ class TestModelWithLRScheduler(unittest.TestCase):
         )
 
 
+class LogsRecorder(paddle.callbacks.Callback):
+    def __init__(self):
+        self.batch_logs = []
+        self.epoch_logs = []
+
+    def on_train_batch_end(self, step, logs=None):
+        self.batch_logs.append(dict(logs))
+
+    def on_epoch_end(self, epoch, logs=None):
+        self.epoch_logs.append(dict(logs))
+
+
+class IterableTensorDataset(paddle.io.IterableDataset):
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __iter__(self):
+        yield from zip(self.x, self.y)
+
+
+class TestModelLogSyncInterval(unittest.TestCase):
+    def run_fit(self, log_sync_interval, iterable=False):
+        paddle.disable_static(paddle.CPUPlace())
+        paddle.seed(2023)
+        np.random.seed(2023)
+        x = np.random.random(size=(40, 20)).astype(np.float32)
+        y = np.random.randint(0, 10, size=(40, 1)).astype(np.int64)
+        if iterable:
+            # len of DataLoader of IterableDataset raises an error
+            dataset = paddle.io.DataLoader(
+                IterableTensorDataset(x, y), batch_size=4, return_list=True
+            )
+        else:
+            dataset = paddle.io.TensorDataset([x, y])
+
+        net = MyModel()
+        inputs = [InputSpec([None, 20], 'float32', 'x')]
+        labels = [InputSpec([None, 1], 'int64', 'label')]
+        model = Model(net, inputs, labels)
+        optim = paddle.optimizer.SGD(
+            learning_rate=0.01, parameters=model.parameters()
+        )
+        model.prepare(optim, CrossEntropyLoss(), Accuracy())
+        recorder = LogsRecorder()
+        model.fit(
+            dataset,
+            batch_size=4,
+            epochs=2,
+            shuffle=False,
+            verbose=0,
+            callbacks=[recorder],
+            log_sync_interval=log_sync_interval,
+        )
+        return recorder, model
+
+    def test_log_sync_interval(self):
+        expect, _ = self.run_fit(1)
+        recorder, model = self.run_fit(3)
+        self.assertEqual(model._log_sync_interval, 1)
+
+        for e, r in zip(expect.epoch_logs, recorder.epoch_logs):
+            np.testing.assert_allclose(e['loss'], r['loss'], rtol=1e-6)
+            np.testing.assert_allclose(e['acc'], r['acc'], rtol=1e-6)
+
+        # logs are updated every 3 steps and at the last step of an epoch
+        for step, r in enumerate(recorder.batch_logs[:10]):
+            if (step + 1) % 3 == 0 or step == 9:
+                e = expect.batch_logs[step]
+                np.testing.assert_allclose(e['loss'], r['loss'], rtol=1e-6)
+                np.testing.assert_allclose(e['acc'], r['acc'], rtol=1e-6)
+            elif step > 2:
+                last = recorder.batch_logs[step - step % 3 - 1]
+                self.assertEqual(last['loss'], r['loss'])
+
+    def test_iterable_dataset(self):
+        # data loader without length is synchronized after the last step
+        expect, _ = self.run_fit(1, iterable=True)
+        recorder, _ = self.run_fit(3, iterable=True)
+        self.assertEqual(len(recorder.batch_logs), 20)
+        for e, r in zip(expect.epoch_logs, recorder.epoch_logs):
+            np.testing.assert_allclose(e['loss'], r['loss'], rtol=1e-6)
+            np.testing.assert_allclose(e['acc'], r['acc'], rtol=1e-6)
+
+    def test_invalid_log_sync_interval(self):
+        paddle.disable_static(paddle.CPUPlace())
+        model = Model(MyModel())
+        model.prepare(
+            paddle.optimizer.SGD(parameters=model.parameters()),
+            CrossEntropyLoss(),
+        )
+        with self.assertRaises(AssertionError):
+            model.fit(MyDataset(), batch_size=4, log_sync_interval=0)
+
+
+class TestModelToStatic(unittest.TestCase):
+    def run_fit(self, to_static, accumulate_grad_batches=1):
+        paddle.disable_static(paddle.CPUPlace())
+        paddle.seed(2023)
+        np.random.seed(2023)
+        x = np.random.random(size=(40, 20)).astype(np.float32)
+        y = np.random.randint(0, 10, size=(40, 1)).astype(np.int64)
+        dataset = paddle.io.TensorDataset([x, y])
+
+        net = MyModel()
+        inputs = [InputSpec([None, 20], 'float32', 'x')]
+        labels = [InputSpec([None, 1], 'int64', 'label')]
+        model = Model(net, inputs, labels)
+        optim = paddle.optimizer.Adam(
+            learning_rate=0.01, parameters=model.parameters()
+        )
+        model.prepare(
+            optim, CrossEntropyLoss(), Accuracy(), to_static=to_static
+        )
+        recorder = LogsRecorder()
+        model.fit(
+            dataset,
+            batch_size=4,
+            epochs=2,
+            shuffle=False,
+            verbose=0,
+            callbacks=[recorder],
+            accumulate_grad_batches=accumulate_grad_batches,
+        )
+        return recorder, model
+
+    def test_to_static(self):
+        for accumulate_grad_batches in [3, 1]:
+            expect, _ = self.run_fit(False, accumulate_grad_batches)
+            recorder, model = self.run_fit(True, accumulate_grad_batches)
+            # micro-batches of gradient accumulation are also compiled
+            self.assertIsNotNone(model._adapter._static_train_step)
+            for e, r in zip(expect.batch_logs, recorder.batch_logs):
+                np.testing.assert_allclose(e['loss'], r['loss'], rtol=1e-5)
+                np.testing.assert_allclose(e['acc'], r['acc'], rtol=1e-5)
+
+    def test_accumulate_grad_batches(self):
+        _, expect = self.run_fit(False, 3)
+        _, model = self.run_fit(True, 3)
+        # no gradients are left after the last update of the epoch
+        self.assertIsNone(model._adapter._accumulated_grads)
+        expect_params = dict(expect.network.named_parameters())
+        for name, param in model.network.named_parameters():
+            np.testing.assert_allclose(
+                expect_params[name].numpy(), param.numpy(), rtol=1e-5
+            )
+
+
 class TestRaiseError(unittest.TestCase):
     def test_input_without_name(self):
         net = MyModel()
@@ -288,6 +288,43 @@ class TestTransformsCV2(unittest.TestCase):
         assert isinstance(tensor, paddle.Tensor)
         np.testing.assert_equal(tensor.shape, (3, 50, 100))
 
+    def test_fused_transforms(self):
+        mean = [123.675, 116.28, 103.53]
+        std = [58.395, 57.120, 57.375]
+        fake_img = self.create_image((50, 100, 3))
+        for get_transforms in [
+            lambda: [
+                transforms.ToTensor(),
+                transforms.Normalize(
+                    [0.485, 0.456, 0.406], [0.229, 0.224, 0.225]
+                ),
+            ],
+            lambda: [
+                transforms.Normalize(mean, std, data_format='HWC', to_rgb=True),
+                transforms.Transpose(),
+            ],
+            lambda: [
+                transforms.Transpose(),
+                transforms.Normalize(mean, std),
+                transforms.ToTensor(data_format='HWC'),
+            ],
+        ]:
+            trans = transforms.Compose(get_transforms())
+            # ToTensor, Normalize and Transpose are fused
+            self.assertEqual(len(trans.transforms), 1)
+            self.do_transform(trans)
+
+            expected = fake_img
+            for t in get_transforms():
+                expected = t(expected)
+            converted_img, label = trans((fake_img, 1))
+            self.assertEqual(label, 1)
+            self.assertEqual(type(converted_img), type(expected))
+            self.assertEqual(converted_img.dtype, expected.dtype)
+            np.testing.assert_allclose(
+                np.array(converted_img), np.array(expected), rtol=1e-5
+            )
+
     def test_keys(self):
         fake_img1 = self.create_image((200, 150, 3))
         fake_img2 = self.create_image((200, 150, 3))
@@ -502,6 +539,16 @@ class TestTransformsTensor(TestTransformsCV2):
         trans = transforms.Compose([normalize])
         self.do_transform(trans)
 
+    def test_fused_transforms(self):
+        trans = transforms.Compose(
+            [transforms.ToTensor(), transforms.Normalize(mean=0.5, std=0.5)]
+        )
+        # tensor images are passed to the original transforms
+        fake_img = paddle.rand((3, 50, 100))
+        np.testing.assert_allclose(
+            trans(fake_img).numpy(), (fake_img.numpy() - 0.5) / 0.5, rtol=1e-5
+        )
+
     def test_color_jitter(self):
         trans = transforms.Compose([transforms.ColorJitter(1.1, 2.2, 0.8, 0.1)])
         self.do_transform(trans)